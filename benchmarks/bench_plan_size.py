@@ -0,0 +1,92 @@
+"""
+Benchmark for validation plans with a very large number of steps.
+
+Building a plan (which numbers each new step), interrogating it, and getting the results of each
+step through the accessor methods (e.g., `n_passed()`) should all take time that is linear in the
+number of steps. This script times these operations for plans where every step is distinct, so
+that every step is evaluated, and prints the time per step, which should stay roughly constant
+as the plans grow.
+
+Plans generated from a configuration often repeat the same checks; such steps are only evaluated
+once (the repeats get the results of the first step with the same fingerprint). The time taken
+to interrogate plans that cycle through a small number of distinct checks is reported separately,
+since it mostly measures this deduplication rather than the evaluation of the steps.
+
+Run with:
+
+    python benchmarks/bench_plan_size.py
+"""
+
+import time
+
+import polars as pl
+
+import pointblank as pb
+
+N_STEPS_DISTINCT = [2_500, 5_000, 10_000, 20_000]
+N_STEPS_REPEATED = [12_500, 25_000, 50_000, 100_000]
+N_DISTINCT_STEPS = 10
+
+
+def build_plan(tbl: pl.DataFrame, n_steps: int, n_distinct: int | None) -> pb.Validate:
+
+    validation = pb.Validate(tbl)
+
+    for k in range(n_steps):
+        value = k if n_distinct is None else k % n_distinct
+        validation = validation.col_vals_gt(columns="a", value=value)
+
+    return validation
+
+
+def main():
+
+    tbl = pl.DataFrame({"a": range(100)})
+
+    print("Plans with distinct steps (every step is evaluated)")
+    print(
+        f"{'steps':>8} {'build (us/step)':>16} {'interrogate (us/step)':>22} {'access (us/step)':>17}"
+    )
+
+    for n_steps in N_STEPS_DISTINCT:
+
+        start = time.perf_counter()
+        validation = build_plan(tbl, n_steps=n_steps, n_distinct=None)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validation.interrogate(collect_extracts=False)
+        interrogate_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(1, n_steps + 1):
+            validation.n_passed(i=i, scalar=True)
+            validation.f_failed(i=i, scalar=True)
+        access_s = time.perf_counter() - start
+
+        print(
+            f"{n_steps:>8} {build_s / n_steps * 1e6:>16.1f} "
+            f"{interrogate_s / n_steps * 1e6:>22.1f} {access_s / n_steps * 1e6:>17.1f}"
+        )
+
+    print()
+    print(f"Plans repeating {N_DISTINCT_STEPS} distinct steps (the repeats are deduplicated)")
+    print(f"{'steps':>8} {'build (us/step)':>16} {'interrogate (us/step)':>22}")
+
+    for n_steps in N_STEPS_REPEATED:
+
+        start = time.perf_counter()
+        validation = build_plan(tbl, n_steps=n_steps, n_distinct=N_DISTINCT_STEPS)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        validation.interrogate(collect_extracts=False)
+        interrogate_s = time.perf_counter() - start
+
+        print(
+            f"{n_steps:>8} {build_s / n_steps * 1e6:>16.1f} {interrogate_s / n_steps * 1e6:>22.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
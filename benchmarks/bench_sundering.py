@@ -0,0 +1,60 @@
+"""
+Benchmark for `Validate.get_sundered_data()`.
+
+The sundering step reduces the per-step pass/fail bitmaps horizontally into a single row mask and
+then filters the target table once, so its cost should grow linearly with the number of validation
+steps. This script times the sundering of a large table for an increasing number of steps and
+prints the time per step, which should stay roughly constant.
+
+Run with:
+
+    python benchmarks/bench_sundering.py
+"""
+
+import time
+
+import numpy as np
+import polars as pl
+
+import pointblank as pb
+
+N_ROWS = 1_000_000
+N_STEPS = [10, 20, 40, 80]
+N_REPEATS = 3
+
+
+def make_validation(tbl: pl.DataFrame, n_steps: int) -> pb.Validate:
+
+    validation = pb.Validate(tbl)
+
+    for i in range(n_steps):
+        validation = validation.col_vals_gt(columns=f"x{i % 10}", value=-(i + 1) * 0.001)
+
+    return validation.interrogate(collect_extracts=False)
+
+
+def main():
+
+    rng = np.random.default_rng(23)
+    tbl = pl.DataFrame({f"x{j}": rng.normal(size=N_ROWS) for j in range(10)})
+
+    print(f"{'steps':>6} {'total (s)':>10} {'per step (ms)':>14}")
+
+    for n_steps in N_STEPS:
+
+        validation = make_validation(tbl=tbl, n_steps=n_steps)
+
+        timings = []
+        for _ in range(N_REPEATS):
+            start = time.perf_counter()
+            validation.get_sundered_data(type="pass")
+            validation.get_sundered_data(type="fail")
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+
+        print(f"{n_steps:>6} {best:>10.3f} {best / n_steps * 1000:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Microbenchmarks for the per-step table metadata overhead during interrogation.
+
+Before a validation step is evaluated, the table is wrapped with Narwhals, the step's column is
+checked for existence and for a compatible data type (both of which collect the table's schema),
+and some steps need the table type or the row count. With a `_TableContext`, this metadata is
+computed once per table and shared by all steps. This script measures the time per step spent on
+that metadata work with and without a shared context, for small tables of increasing width.
+
+Run with:
+
+    python benchmarks/bench_table_context.py
+"""
+
+import time
+
+import numpy as np
+import polars as pl
+
+from pointblank._utils import _TableContext, _column_test_prep, _get_tbl_type
+from pointblank.validate import get_row_count
+
+N_ROWS = 100
+N_COLUMNS = [10, 100, 500]
+N_REPEATS = 3
+
+
+def metadata_without_context(tbl, columns):
+
+    for column in columns:
+        _get_tbl_type(data=tbl)
+        _column_test_prep(df=tbl, column=column, allowed_types=["numeric"])
+        get_row_count(data=tbl)
+
+
+def metadata_with_context(tbl, columns):
+
+    tbl_context = _TableContext(data_tbl=tbl)
+
+    for column in columns:
+        tbl_context.tbl_type
+        _column_test_prep(df=tbl, column=column, allowed_types=["numeric"], tbl_context=tbl_context)
+        tbl_context.get_row_count()
+
+
+def time_per_step(fn, tbl, columns) -> float:
+
+    timings = []
+    for _ in range(N_REPEATS):
+        start = time.perf_counter()
+        fn(tbl, columns)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) / len(columns) * 1e6
+
+
+def main():
+
+    print(f"{'table':>8} {'columns':>8} {'no context (us/step)':>21} {'context (us/step)':>18}")
+
+    for n_columns in N_COLUMNS:
+
+        tbl_pl = pl.DataFrame({f"c{j}": np.arange(N_ROWS) for j in range(n_columns)})
+
+        for tbl_name, tbl in [("polars", tbl_pl), ("pandas", tbl_pl.to_pandas())]:
+
+            columns = list(tbl.columns)
+
+            without_context = time_per_step(metadata_without_context, tbl, columns)
+            with_context = time_per_step(metadata_with_context, tbl, columns)
+
+            print(f"{tbl_name:>8} {n_columns:>8} {without_context:>21.1f} {with_context:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
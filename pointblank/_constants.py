@@ -83,6 +83,15 @@ ROW_BASED_VALIDATION_TYPES = [
     "col_vals_not_null",
 ]
 
+# Validation types whose results can differ with the data types of the columns for the same values
+# (e.g., between NumPy-backed and Arrow-backed Pandas columns, through the regular expression
+# engine, native expressions, and native data types)
+DTYPE_DEPENDENT_VALIDATION_TYPES = [
+    "col_vals_regex",
+    "col_vals_expr",
+    "col_schema_match",
+]
+
 IBIS_BACKENDS = ["duckdb", "mysql", "postgres", "sqlite", "parquet", "memtable"]
 
 VALIDATION_REPORT_FIELDS = [
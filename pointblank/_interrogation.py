@@ -1,17 +1,26 @@
 from __future__ import annotations
 from dataclasses import dataclass
 
+import weakref
 from typing import Any
 
 import narwhals as nw
 from narwhals.typing import FrameT
-from narwhals.dependencies import is_pandas_dataframe, is_polars_dataframe
+from narwhals.dependencies import (
+    is_pandas_dataframe,
+    is_pandas_series,
+    is_polars_dataframe,
+    is_polars_lazyframe,
+    is_polars_series,
+)
 
 from pointblank._utils import (
+    _TableContext,
     _column_test_prep,
     _column_subset_test_prep,
     _convert_to_narwhals,
     _get_tbl_type,
+    _is_lib_present,
 )
 from pointblank.thresholds import _threshold_check
 from pointblank._constants import IBIS_BACKENDS
@@ -41,7 +50,8 @@ class Interrogator:
         - 'ge' for greater than or equal to
         - 'le' for less than or equal to
     set
-        The set of values to compare against. Used in the following interrogations:
+        The set of values to compare against (a list or a `_ReferenceSet`). Used in the following
+        interrogations:
         - 'isin' for values in the set
         - 'notin' for values not in the set
     pattern
@@ -66,6 +76,10 @@ class Interrogator:
         The type of table to use for the assertion. This is used to determine the backend for the
         assertion. The default is 'local' but it can also be any of the table types in the
         `IBIS_BACKENDS` constant.
+    tbl_context
+        The context of the table. If provided, checks against literal values on a
+        dictionary-encoded or low-cardinality column are evaluated once per distinct value of the
+        column (see `_get_distinct_values_expr()`).
 
     Returns
     -------
@@ -77,13 +91,31 @@ class Interrogator:
     column: str = None
     columns_subset: list[str] = None
     compare: float | int | list[float | int] = None
-    set: list[float | int] = None
+    set: list[float | int] | _ReferenceSet = None
     pattern: str = None
     low: float | int | list[float | int] = None
     high: float | int | list[float | int] = None
     inclusive: tuple[bool, bool] = None
     na_pass: bool = False
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
+
+    def _on_distinct_values(
+        self, expr: nw.Expr, dictionary_encoded_only: bool = True, as_strings: bool = False
+    ) -> nw.Expr:
+
+        # Checks that compare against other columns can't be evaluated on the distinct values of
+        # the target column alone
+        if any(isinstance(value, Column) for value in (self.compare, self.low, self.high)):
+            return expr
+
+        return _get_distinct_values_expr(
+            expr=expr,
+            column=self.column,
+            tbl_context=self.tbl_context,
+            dictionary_encoded_only=dictionary_encoded_only,
+            as_strings=as_strings,
+        )
 
     def gt(self) -> FrameT | Any:
 
@@ -136,7 +168,7 @@ class Interrogator:
                     if isinstance(self.compare, Column)
                     else nw.lit(False)
                 ),
-                pb_is_good_3=nw.col(self.column) > compare_expr,
+                pb_is_good_3=self._on_distinct_values(nw.col(self.column) > compare_expr),
             )
             .with_columns(
                 pb_is_good_3=(
@@ -203,7 +235,7 @@ class Interrogator:
                     if isinstance(self.compare, Column)
                     else nw.lit(False)
                 ),
-                pb_is_good_3=nw.col(self.column) < compare_expr,
+                pb_is_good_3=self._on_distinct_values(nw.col(self.column) < compare_expr),
             )
             .with_columns(
                 pb_is_good_3=(
@@ -283,10 +315,12 @@ class Interrogator:
                     pb_is_good_4=nw.col(self.column) - compare_expr,
                 )
 
+                # The difference is compared to zero on its own (comparing it to a boolean
+                # column is always false for Arrow-backed columns)
                 tbl = tbl.with_columns(
                     pb_is_good_=nw.col("pb_is_good_1")
                     | nw.col("pb_is_good_2")
-                    | (nw.col("pb_is_good_4") == 0 & ~nw.col("pb_is_good_3").is_null())
+                    | (nw.col("pb_is_good_4") == 0)
                 )
 
             else:
@@ -317,7 +351,9 @@ class Interrogator:
                 ),
             )
 
-            tbl = tbl.with_columns(pb_is_good_3=nw.col(self.column) == compare_expr)
+            tbl = tbl.with_columns(
+                pb_is_good_3=self._on_distinct_values(nw.col(self.column) == compare_expr)
+            )
 
             tbl = tbl.with_columns(
                 pb_is_good_3=(
@@ -429,7 +465,7 @@ class Interrogator:
                         pb_is_good_2=nw.col("pb_is_good_2") & ~nw.col("pb_is_good_1")
                     )
 
-                if is_polars_dataframe(self.x.to_native()):
+                if _is_polars_frame(self.x.to_native()):
 
                     # There may be Null values in the pb_is_good_2 column, change those to
                     # True if na_pass is True, False otherwise
@@ -474,7 +510,7 @@ class Interrogator:
                         pb_is_good_1=nw.col("pb_is_good_1") & ~nw.col("pb_is_good_2")
                     )
 
-                if is_polars_dataframe(self.x.to_native()):
+                if _is_polars_frame(self.x.to_native()):
 
                     if self.na_pass:
 
@@ -505,7 +541,7 @@ class Interrogator:
                         & ~nw.col("pb_is_good_2")
                     )
 
-                if is_polars_dataframe(self.x.to_native()):
+                if _is_polars_frame(self.x.to_native()):
 
                     if self.na_pass:
 
@@ -517,6 +553,17 @@ class Interrogator:
                             )
                         )
 
+                elif self.na_pass:
+
+                    # Comparisons with missing values in Arrow-backed Pandas columns give missing
+                    # values (rather than `True`, as in NumPy-backed columns), so the rows with
+                    # missing values are passed explicitly
+                    tbl = tbl.with_columns(
+                        pb_is_good_3=nw.col("pb_is_good_3").fill_null(False)
+                        | nw.col("pb_is_good_1")
+                        | nw.col("pb_is_good_2")
+                    )
+
                 return (
                     tbl.with_columns(pb_is_good_=nw.col("pb_is_good_3"))
                     .drop("pb_is_good_1", "pb_is_good_2", "pb_is_good_3")
@@ -547,7 +594,7 @@ class Interrogator:
                         .to_native()
                     )
 
-                elif is_polars_dataframe(self.x.to_native()):
+                elif _is_polars_frame(self.x.to_native()):
 
                     tbl = self.x.with_columns(
                         pb_is_good_1=nw.col(self.column).is_null(),  # val is Null in Column
@@ -618,7 +665,7 @@ class Interrogator:
                     if isinstance(self.compare, Column)
                     else nw.lit(False)
                 ),
-                pb_is_good_3=nw.col(self.column) >= compare_expr,
+                pb_is_good_3=self._on_distinct_values(nw.col(self.column) >= compare_expr),
             )
             .with_columns(
                 pb_is_good_3=(
@@ -683,7 +730,7 @@ class Interrogator:
                     if isinstance(self.compare, Column)
                     else nw.lit(False)
                 ),
-                pb_is_good_3=nw.col(self.column) <= compare_expr,
+                pb_is_good_3=self._on_distinct_values(nw.col(self.column) <= compare_expr),
             )
             .with_columns(
                 pb_is_good_3=(
@@ -811,14 +858,22 @@ class Interrogator:
         )
 
         if self.inclusive[0]:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) >= low_val)
+            tbl = tbl.with_columns(
+                pb_is_good_5=self._on_distinct_values(nw.col(self.column) >= low_val)
+            )
         else:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) > low_val)
+            tbl = tbl.with_columns(
+                pb_is_good_5=self._on_distinct_values(nw.col(self.column) > low_val)
+            )
 
         if self.inclusive[1]:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) <= high_val)
+            tbl = tbl.with_columns(
+                pb_is_good_6=self._on_distinct_values(nw.col(self.column) <= high_val)
+            )
         else:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) < high_val)
+            tbl = tbl.with_columns(
+                pb_is_good_6=self._on_distinct_values(nw.col(self.column) < high_val)
+            )
 
         tbl = tbl.with_columns(
             pb_is_good_5=(
@@ -995,14 +1050,22 @@ class Interrogator:
         )
 
         if self.inclusive[0]:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) < low_val)
+            tbl = tbl.with_columns(
+                pb_is_good_5=self._on_distinct_values(nw.col(self.column) < low_val)
+            )
         else:
-            tbl = tbl.with_columns(pb_is_good_5=nw.col(self.column) <= low_val)
+            tbl = tbl.with_columns(
+                pb_is_good_5=self._on_distinct_values(nw.col(self.column) <= low_val)
+            )
 
         if self.inclusive[1]:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) > high_val)
+            tbl = tbl.with_columns(
+                pb_is_good_6=self._on_distinct_values(nw.col(self.column) > high_val)
+            )
         else:
-            tbl = tbl.with_columns(pb_is_good_6=nw.col(self.column) >= high_val)
+            tbl = tbl.with_columns(
+                pb_is_good_6=self._on_distinct_values(nw.col(self.column) >= high_val)
+            )
 
         tbl = tbl.with_columns(
             pb_is_good_5=nw.when(nw.col("pb_is_good_5").is_null())
@@ -1043,29 +1106,33 @@ class Interrogator:
 
         # Ibis backends ---------------------------------------------
 
+        set_values = _get_set_values(set=self.set, x=self.x, tbl_type=self.tbl_type)
+
         if self.tbl_type in IBIS_BACKENDS:
 
-            return self.x.mutate(pb_is_good_=self.x[self.column].isin(self.set))
+            return self.x.mutate(pb_is_good_=self.x[self.column].isin(set_values))
 
         # Local backends (Narwhals) ---------------------------------
 
         return self.x.with_columns(
-            pb_is_good_=nw.col(self.column).is_in(self.set),
+            pb_is_good_=self._on_distinct_values(nw.col(self.column).is_in(set_values)),
         ).to_native()
 
     def notin(self) -> FrameT | Any:
 
         # Ibis backends ---------------------------------------------
 
+        set_values = _get_set_values(set=self.set, x=self.x, tbl_type=self.tbl_type)
+
         if self.tbl_type in IBIS_BACKENDS:
 
-            return self.x.mutate(pb_is_good_=self.x[self.column].notin(self.set))
+            return self.x.mutate(pb_is_good_=self.x[self.column].notin(set_values))
 
         # Local backends (Narwhals) ---------------------------------
 
         return (
             self.x.with_columns(
-                pb_is_good_=nw.col(self.column).is_in(self.set),
+                pb_is_good_=self._on_distinct_values(nw.col(self.column).is_in(set_values)),
             )
             .with_columns(pb_is_good_=~nw.col("pb_is_good_"))
             .to_native()
@@ -1093,9 +1160,13 @@ class Interrogator:
         return (
             self.x.with_columns(
                 pb_is_good_1=nw.col(self.column).is_null() & self.na_pass,
-                pb_is_good_2=nw.when(~nw.col(self.column).is_null())
-                .then(nw.col(self.column).str.contains(pattern=self.pattern))
-                .otherwise(False),
+                pb_is_good_2=self._on_distinct_values(
+                    nw.when(~nw.col(self.column).is_null())
+                    .then(nw.col(self.column).str.contains(pattern=self.pattern))
+                    .otherwise(False),
+                    dictionary_encoded_only=False,
+                    as_strings=True,
+                ),
             )
             .with_columns(pb_is_good_=nw.col("pb_is_good_1") | nw.col("pb_is_good_2"))
             .drop("pb_is_good_1", "pb_is_good_2")
@@ -1140,8 +1211,6 @@ class Interrogator:
 
         if self.tbl_type in IBIS_BACKENDS:
 
-            import ibis
-
             tbl = self.x
 
             # Get the column subset to use for the test
@@ -1150,12 +1219,7 @@ class Interrogator:
             else:
                 columns_subset = self.columns_subset
 
-            # Create a subset of the table with only the columns of interest and count the
-            # number of times each unique row (or portion thereof) appears
-            tbl = tbl.group_by(columns_subset).mutate(pb_count_=ibis._.count())
-
-            # Passing rows will have the value `1` (no duplicates, so True), otherwise False applies
-            return tbl.mutate(pb_is_good_=tbl["pb_count_"] == 1).drop("pb_count_")
+            return _get_duplicated_rows_ibis(tbl=tbl, columns=list(columns_subset))
 
         # Local backends (Narwhals) ---------------------------------
 
@@ -1163,15 +1227,28 @@ class Interrogator:
 
         # Get the column subset to use for the test
         if self.columns_subset is None:
-            columns_subset = tbl.columns
+            columns_subset = tbl.collect_schema().names()
         else:
             columns_subset = self.columns_subset
 
-        # Create a subset of the table with only the columns of interest
-        subset_tbl = tbl.select(columns_subset)
+        # A lazy table can't produce a series of duplicate flags without first being collected;
+        # for a Polars LazyFrame, the duplicated rows are found from the row hashes (in partitions
+        # that are spilled to disk if there are many candidate rows) and the table is kept lazy,
+        # otherwise count the number of times each unique row (or portion thereof) appears
+        # within a window over the columns of interest
+        if isinstance(tbl, nw.LazyFrame):
+
+            if is_polars_lazyframe(tbl.to_native()):
+                return _get_duplicated_rows_polars_lazy(
+                    tbl=tbl.to_native(), columns=list(columns_subset)
+                )
+
+            tbl = tbl.with_columns(pb_is_good_=nw.len().over(*columns_subset) == 1)
+
+            return tbl.to_native()
 
-        # Check for duplicates in the subset table, creating a series of booleans
-        pb_is_good_series = subset_tbl.is_duplicated()
+        # Check for duplicates in the subset of columns, creating a series of booleans
+        pb_is_good_series = _get_duplicated_rows(tbl=tbl, columns=list(columns_subset))
 
         # Add the series to the input table
         tbl = tbl.with_columns(pb_is_good_=~pb_is_good_series)
@@ -1202,6 +1279,10 @@ class ColValsCompareOne:
         The allowed data types for the column.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1218,6 +1299,7 @@ class ColValsCompareOne:
     assertion_method: str
     allowed_types: list[str]
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1227,7 +1309,15 @@ class ColValsCompareOne:
             #  - check if the `column=` exists
             #  - check if the `column=` type is compatible with the test
             tbl = _column_test_prep(
-                df=self.data_tbl, column=self.column, allowed_types=self.allowed_types
+                df=self.data_tbl,
+                column=self.column,
+                allowed_types=self.allowed_types,
+                tbl_context=self.tbl_context,
+            )
+
+            # Only keep the columns used by the step (see `_select_step_columns()`)
+            tbl = _select_step_columns(
+                tbl=tbl, columns=_get_step_columns(column=self.column, values=self.value)
             )
 
         # TODO: For Ibis backends, check if the column exists and if the column type is compatible;
@@ -1244,6 +1334,7 @@ class ColValsCompareOne:
                 compare=self.value,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).gt()
         elif self.assertion_method == "lt":
             self.test_unit_res = Interrogator(
@@ -1252,6 +1343,7 @@ class ColValsCompareOne:
                 compare=self.value,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).lt()
         elif self.assertion_method == "eq":
             self.test_unit_res = Interrogator(
@@ -1260,6 +1352,7 @@ class ColValsCompareOne:
                 compare=self.value,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).eq()
         elif self.assertion_method == "ne":
             self.test_unit_res = Interrogator(
@@ -1268,6 +1361,7 @@ class ColValsCompareOne:
                 compare=self.value,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).ne()
         elif self.assertion_method == "ge":
             self.test_unit_res = Interrogator(
@@ -1276,6 +1370,7 @@ class ColValsCompareOne:
                 compare=self.value,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).ge()
         elif self.assertion_method == "le":
             self.test_unit_res = Interrogator(
@@ -1284,6 +1379,7 @@ class ColValsCompareOne:
                 compare=self.value,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).le()
         elif self.assertion_method == "null":
             self.test_unit_res = Interrogator(
@@ -1291,6 +1387,7 @@ class ColValsCompareOne:
                 column=self.column,
                 compare=self.value,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).null()
         elif self.assertion_method == "not_null":
             self.test_unit_res = Interrogator(
@@ -1298,6 +1395,7 @@ class ColValsCompareOne:
                 column=self.column,
                 compare=self.value,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).not_null()
         else:
             raise ValueError(
@@ -1317,15 +1415,13 @@ class ColValsCompareOne:
         return self.test_unit_res
 
     def test(self):
-        # Get the number of failing test units by counting instances of `False` in the `pb_is_good_`
+        # Get the number of failing test units by summing instances of `False` in the `pb_is_good_`
         # column and then determine if the test passes overall by comparing the number of failing
         # test units to the threshold for failing test units
 
-        results_list = nw.from_native(self.test_unit_res)["pb_is_good_"].to_list()
+        n_failed = _get_test_unit_counts(tbl=self.test_unit_res)["n_failed"]
 
-        return _threshold_check(
-            failing_test_units=results_list.count(False), threshold=self.threshold
-        )
+        return _threshold_check(failing_test_units=n_failed, threshold=self.threshold)
 
 
 @dataclass
@@ -1357,6 +1453,10 @@ class ColValsCompareTwo:
         The allowed data types for the column.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1375,6 +1475,7 @@ class ColValsCompareTwo:
     assertion_method: str
     allowed_types: list[str]
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1384,7 +1485,16 @@ class ColValsCompareTwo:
             #  - check if the `column=` exists
             #  - check if the `column=` type is compatible with the test
             tbl = _column_test_prep(
-                df=self.data_tbl, column=self.column, allowed_types=self.allowed_types
+                df=self.data_tbl,
+                column=self.column,
+                allowed_types=self.allowed_types,
+                tbl_context=self.tbl_context,
+            )
+
+            # Only keep the columns used by the step (see `_select_step_columns()`)
+            tbl = _select_step_columns(
+                tbl=tbl,
+                columns=_get_step_columns(column=self.column, values=[self.value1, self.value2]),
             )
 
         # TODO: For Ibis backends, check if the column exists and if the column type is compatible;
@@ -1403,6 +1513,7 @@ class ColValsCompareTwo:
                 inclusive=self.inclusive,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).between()
         elif self.assertion_method == "outside":
             self.test_unit_res = Interrogator(
@@ -1413,6 +1524,7 @@ class ColValsCompareTwo:
                 inclusive=self.inclusive,
                 na_pass=self.na_pass,
                 tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).outside()
         else:
             raise ValueError(
@@ -1425,15 +1537,180 @@ class ColValsCompareTwo:
         return self.test_unit_res
 
     def test(self):
-        # Get the number of failing test units by counting instances of `False` in the `pb_is_good_`
+        # Get the number of failing test units by summing instances of `False` in the `pb_is_good_`
         # column and then determine if the test passes overall by comparing the number of failing
         # test units to the threshold for failing test units
 
-        results_list = nw.from_native(self.test_unit_res)["pb_is_good_"].to_list()
+        n_failed = _get_test_unit_counts(tbl=self.test_unit_res)["n_failed"]
+
+        return _threshold_check(failing_test_units=n_failed, threshold=self.threshold)
 
-        return _threshold_check(
-            failing_test_units=results_list.count(False), threshold=self.threshold
-        )
+
+# The prepared (distinct and non-missing) values of the reference sets, keyed by the identity of
+# the objects given as `set=`; entries are removed when those objects are garbage collected
+_REFERENCE_SET_CACHE: dict[int, dict[str, Any]] = {}
+
+
+@dataclass
+class _ReferenceSet:
+    """
+    A set of values given as a table or a Series, used for set membership checks.
+
+    Large reference sets (e.g., millions of valid IDs) are better given as a single-column table
+    or a Series than as a list: membership is then checked with a hash semi-join (or anti-join)
+    against the distinct values of the set instead of through a (potentially huge) list of
+    literal values. For Ibis tables, a reference set that isn't an Ibis table itself is uploaded
+    once to the table's backend as an in-memory (temporary) table so that the membership test
+    runs inside the database. An Ibis table used as a reference set should be in the same backend
+    as the target table.
+
+    The distinct values of the set are prepared once and cached for the object given as the set,
+    so they are reused by all steps that use the object (in any validation within the process).
+    The object is assumed not to change while it's in use.
+
+    Parameters
+    ----------
+    data
+        A Polars or pandas Series, a Polars or pandas DataFrame with a single column, or an Ibis
+        table with a single column.
+    """
+
+    data: Any
+
+    def __post_init__(self):
+
+        self.is_ibis = "ibis.expr.types.relations.Table" in str(type(self.data))
+
+        if self.is_ibis:
+            columns = list(self.data.columns)
+        else:
+            data_nw = nw.from_native(self.data, allow_series=True)
+            columns = [data_nw.name] if isinstance(data_nw, nw.Series) else data_nw.columns
+
+        if len(columns) != 1:
+            raise ValueError(
+                "A table used as a `set=` of values must have exactly one column, "
+                f"but it has {len(columns)} columns."
+            )
+
+        self.name = columns[0]
+
+    def __str__(self) -> str:
+
+        if self.name is None:
+            return "reference set"
+
+        return f"reference set '{self.name}'"
+
+    def _get_cache(self) -> dict[str, Any]:
+
+        key = id(self.data)
+
+        if key not in _REFERENCE_SET_CACHE:
+            _REFERENCE_SET_CACHE[key] = {}
+            weakref.finalize(self.data, _REFERENCE_SET_CACHE.pop, key, None)
+
+        return _REFERENCE_SET_CACHE[key]
+
+    def _get_distinct_values(self) -> nw.Series:
+
+        # Get the distinct, non-missing values of the set as a Narwhals Series (fetching them from
+        # the database if the set is an Ibis table)
+        if self.is_ibis:
+            data = self.data.filter(self.data[self.name].notnull()).distinct()
+            try:
+                data = data.to_polars()
+            except ImportError:  # pragma: no cover
+                data = data.to_pandas()
+        else:
+            data = self.data
+
+        data_nw = nw.from_native(data, allow_series=True)
+
+        if isinstance(data_nw, nw.DataFrame):
+            data_nw = data_nw[data_nw.columns[0]]
+
+        return data_nw.drop_nulls().unique()
+
+    def get_series(self, polars: bool) -> Any:
+        """
+        Get the distinct, non-missing values of the set as a Polars or pandas Series.
+        """
+
+        backend = "polars" if polars else "pandas"
+        cache = self._get_cache()
+
+        if backend not in cache:
+
+            values = cache.get("values")
+            if values is None:
+                values = cache["values"] = self._get_distinct_values()
+
+            series = values.to_native()
+
+            if polars and not is_polars_series(series):
+                import polars as pl
+
+                series = pl.from_pandas(series)
+
+            elif not polars and not is_pandas_series(series):
+                series = series.to_pandas()
+
+            cache[backend] = series
+
+        return cache[backend]
+
+    def get_ibis_column(self) -> Any:
+        """
+        Get the distinct, non-missing values of the set as an Ibis column expression.
+        """
+
+        if self.is_ibis:
+            data = self.data.filter(self.data[self.name].notnull()).distinct()
+            return data[self.name]
+
+        cache = self._get_cache()
+
+        # The in-memory table is uploaded to a backend the first time that it's used in one of
+        # the backend's queries and it stays there for as long as the table object exists
+        if "ibis" not in cache:
+
+            import ibis
+
+            series = self.get_series(polars=_is_lib_present(lib_name="polars"))
+            cache["ibis"] = ibis.memtable(series.to_frame(name="pb_set_value_"))
+
+        return cache["ibis"]["pb_set_value_"]
+
+
+def _get_set_values(set: list[Any] | _ReferenceSet, x: Any, tbl_type: str) -> Any:
+    """
+    Get the values of a `set=` in the form that is used for a membership test on the table `x`.
+    """
+
+    if not isinstance(set, _ReferenceSet):
+        return set
+
+    if tbl_type in IBIS_BACKENDS:
+        return set.get_ibis_column()
+
+    return set.get_series(polars=_is_polars_frame(x.to_native()))
+
+
+def _is_reference_set_data(set: Any) -> bool:
+    """
+    Determine whether a `set=` value is a table or a Series (to be used as a `_ReferenceSet`).
+    """
+
+    if "ibis.expr.types.relations.Table" in str(type(set)):
+        return True
+
+    return (
+        is_polars_series(set)
+        or is_pandas_series(set)
+        or is_polars_dataframe(set)
+        or is_pandas_dataframe(set)
+    )
 
 
 @dataclass
@@ -1448,7 +1725,7 @@ class ColValsCompareSet:
     column
         The column to check.
     values
-        A set of values to check against.
+        A set of values to check against (a list or a `_ReferenceSet`).
     threshold
         The maximum number of failing test units to allow.
     inside
@@ -1458,6 +1735,10 @@ class ColValsCompareSet:
         The allowed data types for the column.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1468,11 +1749,12 @@ class ColValsCompareSet:
 
     data_tbl: FrameT
     column: str
-    values: list[float | int]
+    values: list[float | int] | _ReferenceSet
     threshold: int
     inside: bool
     allowed_types: list[str]
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1482,9 +1764,15 @@ class ColValsCompareSet:
             #  - check if the `column=` exists
             #  - check if the `column=` type is compatible with the test
             tbl = _column_test_prep(
-                df=self.data_tbl, column=self.column, allowed_types=self.allowed_types
+                df=self.data_tbl,
+                column=self.column,
+                allowed_types=self.allowed_types,
+                tbl_context=self.tbl_context,
             )
 
+            # Only keep the columns used by the step (see `_select_step_columns()`)
+            tbl = _select_step_columns(tbl=tbl, columns=_get_step_columns(column=self.column))
+
         # TODO: For Ibis backends, check if the column exists and if the column type is compatible;
         #       for now, just pass the table as is
         if self.tbl_type in IBIS_BACKENDS:
@@ -1494,26 +1782,32 @@ class ColValsCompareSet:
         # `True` indicates a passing test unit
         if self.inside:
             self.test_unit_res = Interrogator(
-                x=tbl, column=self.column, set=self.values, tbl_type=self.tbl_type
+                x=tbl,
+                column=self.column,
+                set=self.values,
+                tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).isin()
         else:
             self.test_unit_res = Interrogator(
-                x=tbl, column=self.column, set=self.values, tbl_type=self.tbl_type
+                x=tbl,
+                column=self.column,
+                set=self.values,
+                tbl_type=self.tbl_type,
+                tbl_context=self.tbl_context,
             ).notin()
 
     def get_test_results(self):
         return self.test_unit_res
 
     def test(self):
-        # Get the number of failing test units by counting instances of `False` in the `pb_is_good_`
+        # Get the number of failing test units by summing instances of `False` in the `pb_is_good_`
         # column and then determine if the test passes overall by comparing the number of failing
         # test units to the threshold for failing test units
 
-        results_list = nw.from_native(self.test_unit_res)["pb_is_good_"].to_list()
+        n_failed = _get_test_unit_counts(tbl=self.test_unit_res)["n_failed"]
 
-        return _threshold_check(
-            failing_test_units=results_list.count(False), threshold=self.threshold
-        )
+        return _threshold_check(failing_test_units=n_failed, threshold=self.threshold)
 
 
 @dataclass
@@ -1537,6 +1831,10 @@ class ColValsRegex:
         The allowed data types for the column.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1552,6 +1850,7 @@ class ColValsRegex:
     threshold: int
     allowed_types: list[str]
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1561,9 +1860,15 @@ class ColValsRegex:
             #  - check if the `column=` exists
             #  - check if the `column=` type is compatible with the test
             tbl = _column_test_prep(
-                df=self.data_tbl, column=self.column, allowed_types=self.allowed_types
+                df=self.data_tbl,
+                column=self.column,
+                allowed_types=self.allowed_types,
+                tbl_context=self.tbl_context,
             )
 
+            # Only keep the columns used by the step (see `_select_step_columns()`)
+            tbl = _select_step_columns(tbl=tbl, columns=_get_step_columns(column=self.column))
+
         # TODO: For Ibis backends, check if the column exists and if the column type is compatible;
         #       for now, just pass the table as is
         if self.tbl_type in IBIS_BACKENDS:
@@ -1577,21 +1882,20 @@ class ColValsRegex:
             pattern=self.pattern,
             na_pass=self.na_pass,
             tbl_type=self.tbl_type,
+            tbl_context=self.tbl_context,
         ).regex()
 
     def get_test_results(self):
         return self.test_unit_res
 
     def test(self):
-        # Get the number of failing test units by counting instances of `False` in the `pb_is_good_`
+        # Get the number of failing test units by summing instances of `False` in the `pb_is_good_`
         # column and then determine if the test passes overall by comparing the number of failing
         # test units to the threshold for failing test units
 
-        results_list = nw.from_native(self.test_unit_res)["pb_is_good_"].to_list()
+        n_failed = _get_test_unit_counts(tbl=self.test_unit_res)["n_failed"]
 
-        return _threshold_check(
-            failing_test_units=results_list.count(False), threshold=self.threshold
-        )
+        return _threshold_check(failing_test_units=n_failed, threshold=self.threshold)
 
 
 @dataclass
@@ -1609,6 +1913,10 @@ class ColValsExpr:
         The maximum number of failing test units to allow.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1621,6 +1929,7 @@ class ColValsExpr:
     expr: str
     threshold: int
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1635,7 +1944,10 @@ class ColValsExpr:
                 expression_type = "pandas"
 
             # Determine whether this is a Pandas or Polars table
-            tbl_type = _get_tbl_type(data=self.data_tbl)
+            if self.tbl_context is not None:
+                tbl_type = self.tbl_context.tbl_type
+            else:
+                tbl_type = _get_tbl_type(data=self.data_tbl)
 
             df_lib_name = "polars" if "polars" in tbl_type else "pandas"
 
@@ -1679,6 +1991,10 @@ class ColExistsHasType:
         The type of assertion ('exists' for column existence).
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1692,6 +2008,7 @@ class ColExistsHasType:
     threshold: int
     assertion_method: str
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1709,7 +2026,14 @@ class ColExistsHasType:
 
         if self.assertion_method == "exists":
 
-            res = int(self.column in tbl.columns)
+            if self.tbl_context is not None:
+                columns = self.tbl_context.get_column_names()
+            elif self.tbl_type in IBIS_BACKENDS:
+                columns = tbl.columns
+            else:
+                columns = tbl.collect_schema().names()
+
+            res = int(self.column in columns)
 
         self.test_unit_res = res
 
@@ -1732,6 +2056,10 @@ class RowsDistinct:
         The maximum number of failing test units to allow.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1744,6 +2072,7 @@ class RowsDistinct:
     columns_subset: list[str] | None
     threshold: int
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
@@ -1752,7 +2081,9 @@ class RowsDistinct:
             # Convert the DataFrame to a format that narwhals can work with, and:
             #  - check if the `column=` exists
             #  - check if the `column=` type is compatible with the test
-            tbl = _column_subset_test_prep(df=self.data_tbl, columns_subset=self.columns_subset)
+            tbl = _column_subset_test_prep(
+                df=self.data_tbl, columns_subset=self.columns_subset, tbl_context=self.tbl_context
+            )
 
         # TODO: For Ibis backends, check if the column exists and if the column type is compatible;
         #       for now, just pass the table as is
@@ -1881,6 +2212,10 @@ class RowCountMatch:
         The maximum number of failing test units to allow.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1894,15 +2229,21 @@ class RowCountMatch:
     inverse: bool
     threshold: int
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
         from pointblank.validate import get_row_count
 
+        if self.tbl_context is not None:
+            row_count = self.tbl_context.get_row_count()
+        else:
+            row_count = get_row_count(data=self.data_tbl)
+
         if not self.inverse:
-            res = get_row_count(data=self.data_tbl) == self.count
+            res = row_count == self.count
         else:
-            res = get_row_count(data=self.data_tbl) != self.count
+            res = row_count != self.count
 
         self.test_unit_res = res
 
@@ -1927,6 +2268,10 @@ class ColCountMatch:
         The maximum number of failing test units to allow.
     tbl_type
         The type of table to use for the assertion.
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
 
     Returns
     -------
@@ -1940,15 +2285,21 @@ class ColCountMatch:
     inverse: bool
     threshold: int
     tbl_type: str = "local"
+    tbl_context: _TableContext | None = None
 
     def __post_init__(self):
 
         from pointblank.validate import get_column_count
 
+        if self.tbl_context is not None:
+            column_count = len(self.tbl_context.get_column_names())
+        else:
+            column_count = get_column_count(data=self.data_tbl)
+
         if not self.inverse:
-            res = get_column_count(data=self.data_tbl) == self.count
+            res = column_count == self.count
         else:
-            res = get_column_count(data=self.data_tbl) != self.count
+            res = column_count != self.count
 
         self.test_unit_res = res
 
@@ -1957,31 +2308,643 @@ class ColCountMatch:
 
 
 @dataclass
-class NumberOfTestUnits:
+class FusedRowChecks:
     """
-    Count the number of test units in a column.
+    Evaluate several row-based validation steps against the same table in a single pass.
+
+    Every step's boolean expression is compiled into a single `select()` (which also keeps the
+    columns of the checked tables, when these are needed) so that the table is only scanned once,
+    regardless of the number of steps. The results for each step are identical to those obtained
+    by evaluating the step on its own with the `ColValsCompareOne`, `ColValsCompareTwo`,
+    `ColValsCompareSet`, and `ColValsRegex` classes.
+
+    Parameters
+    ----------
+    data_tbl
+        A data table.
+    steps
+        A list of dictionaries (one per validation step) with the keys `assertion_method`,
+        `column`, `values`, `inclusive`, `na_pass`, and `allowed_types`. Each step must be one
+        that is supported by `_is_fusable_row_check()`.
+    collect_tbl_checked
+        Whether to produce, for each step, a copy of the table with a `pb_is_good_` column (this
+        is required for collecting extracts and for sundering the data).
+    tbl_context
+        The context of the table, which holds metadata (e.g., the schema) that is shared by the
+        validation steps evaluated on the table. If `None`, the metadata is obtained from the
+        table directly.
+    extract_columns
+        For a lazy table, the columns to keep in the checked tables (besides the columns used by
+        each step), so that only these are collected. If `None`, all columns are kept. The checked
+        tables of eager tables only have the columns used by each step (see
+        `_select_step_columns()`).
+
+    For a Polars LazyFrame, nothing is collected when the plan is created. The plan's queries are
+    collected either by `get_test_results()` or, together with those of other plans, by
+    `_collect_fused_row_checks()`; checked tables remain lazy unless they are collected there.
+
+    Returns
+    -------
+    list[dict]
+        A list of dictionaries (one per step) with the keys `n`, `n_passed`, `n_failed`,
+        `all_passed`, and `tbl_checked`.
     """
 
-    df: FrameT
-    column: str
+    data_tbl: FrameT
+    steps: list[dict]
+    collect_tbl_checked: bool = False
+    tbl_context: _TableContext | None = None
+    extract_columns: list[str] | None = None
+
+    def __post_init__(self):
+
+        # Convert the DataFrame to a format that narwhals can work with, and, for every step:
+        #  - check if the `column=` exists
+        #  - check if the `column=` type is compatible with the test
+        if self.tbl_context is None:
+            self.tbl_context = _TableContext(data_tbl=self.data_tbl)
+
+        tbl = self.tbl_context.get_nw_tbl()
+
+        for step in self.steps:
+            _column_test_prep(
+                df=self.data_tbl,
+                column=step["column"],
+                allowed_types=step["allowed_types"],
+                tbl_context=self.tbl_context,
+            )
+
+        if not self.steps:
+            self.test_unit_res = []
+            return
+
+        # Give each step's `pb_is_good_` column a unique name within the compiled plan
+        good_cols = [f"pb_is_good_{i}_" for i in range(len(self.steps))]
+
+        step_exprs = [
+            _get_row_check_expr_nw(
+                assertion_method=step["assertion_method"],
+                column=step["column"],
+                values=step["values"],
+                inclusive=step["inclusive"],
+                na_pass=step["na_pass"],
+                tbl_context=self.tbl_context,
+            )
+            for step in self.steps
+        ]
+
+        # Get the columns to keep in the checked table of each step: the columns used by the
+        # step and, for a lazy table, the columns requested for the extracts (all columns by
+        # default); these are kept in the order of the table's columns
+        columns = self.tbl_context.get_column_names()
+
+        self.checked_columns = []
+
+        for step in self.steps:
+
+            step_columns = _get_step_columns(column=step["column"], values=step["values"])
+
+            if isinstance(tbl, nw.LazyFrame) and self.extract_columns is None:
+                step_columns = columns
+            elif isinstance(tbl, nw.LazyFrame):
+                step_columns = step_columns + self.extract_columns
+
+            self.checked_columns.append([column for column in columns if column in step_columns])
+
+        if self.collect_tbl_checked:
+
+            # Evaluate all step expressions in one pass and keep the boolean columns around so
+            # that the per-step checked tables can be split off from it; only the columns of the
+            # checked tables are kept
+            used_columns = [
+                column
+                for column in columns
+                if any(column in checked_columns for checked_columns in self.checked_columns)
+            ]
+
+            tbl_all = tbl.select(
+                *used_columns, **{good_col: expr for good_col, expr in zip(good_cols, step_exprs)}
+            )
+            count_exprs = [nw.col(good_col) for good_col in good_cols]
+
+        else:
+            tbl_all = tbl
+            count_exprs = step_exprs
+
+        # Get the number of passing and failing test units for every step in one aggregation;
+        # missing results (which can arise in some backends) are counted as neither passing nor
+        # failing, just as they would be in the per-step evaluation
+        agg_exprs = {"pb_n_": nw.len()}
+
+        for i, expr in enumerate(count_exprs):
+            agg_exprs[f"pb_n_passed_{i}_"] = (expr == True).sum()  # noqa
+            agg_exprs[f"pb_n_failed_{i}_"] = (expr == False).sum()  # noqa
+
+        self.good_cols = good_cols
+        self.tbl_all = tbl_all
+        self.counts_query = tbl_all.select(**agg_exprs)
+
+        # For a lazy table (i.e., a Polars LazyFrame), the queries are kept as they are so that
+        # they can be collected together with those of other plans (see
+        # `_collect_fused_row_checks()`)
+        if isinstance(self.counts_query, nw.LazyFrame):
+            self.test_unit_res = None
+            return
+
+        self.test_unit_res = self._get_step_results(
+            counts=self.counts_query.rows(named=True)[0], tbl_all=tbl_all
+        )
+
+    def _get_step_results(self, counts: dict[str, Any], tbl_all: Any) -> list[dict]:
+
+        n = int(counts["pb_n_"])
+
+        test_unit_res = []
+
+        for i, good_col in enumerate(self.good_cols):
+
+            n_passed = int(counts[f"pb_n_passed_{i}_"] or 0)
+            n_failed = int(counts[f"pb_n_failed_{i}_"] or 0)
+
+            if self.collect_tbl_checked:
+                tbl_checked = (
+                    tbl_all.select(self.checked_columns[i] + [good_col])
+                    .rename({good_col: "pb_is_good_"})
+                    .to_native()
+                )
+            else:
+                tbl_checked = None
+
+            test_unit_res.append(
+                {
+                    "n": n,
+                    "n_passed": n_passed,
+                    "n_failed": n_failed,
+                    "all_passed": n_passed == n,
+                    "tbl_checked": tbl_checked,
+                }
+            )
+
+        return test_unit_res
+
+    def get_test_results(self):
+
+        if self.test_unit_res is None:
+            _collect_fused_row_checks(plans=[self])
+
+        return self.test_unit_res
+
+
+def _collect_fused_row_checks(plans: list[FusedRowChecks], collect_tbl_checked: bool = False):
+    """
+    Collect the lazy queries of several fused plans together.
+
+    All of the count queries of the plans (and, optionally, the tables with the `pb_is_good_`
+    columns) are collected with a single call of `pl.collect_all()`, which allows Polars to share
+    any common scans of the source data across the queries and to apply projection and predicate
+    pushdown to them. Plans over eager tables have already been evaluated and are left as they
+    are.
+
+    Parameters
+    ----------
+    plans
+        A list of `FusedRowChecks` objects.
+    collect_tbl_checked
+        Whether to also collect the tables with the `pb_is_good_` columns. If `False`, the checked
+        tables of lazy plans are left as lazy queries.
+    """
+
+    lazy_plans = [plan for plan in plans if plan.test_unit_res is None]
+
+    if not lazy_plans:
+        return
+
+    import polars as pl
+
+    queries = []
+
+    for plan in lazy_plans:
+
+        queries.append(plan.counts_query.to_native())
+
+        if collect_tbl_checked and plan.collect_tbl_checked:
+            queries.append(plan.tbl_all.to_native())
+
+    collected = iter(pl.collect_all(queries))
+
+    for plan in lazy_plans:
+
+        counts = next(collected).rows(named=True)[0]
+
+        if collect_tbl_checked and plan.collect_tbl_checked:
+            tbl_all = nw.from_native(next(collected))
+        else:
+            tbl_all = plan.tbl_all
+
+        plan.test_unit_res = plan._get_step_results(counts=counts, tbl_all=tbl_all)
+
+
+def _get_step_columns(column: str | list[str] | None, values: Any = None) -> list[str]:
+    """
+    Get the names of the columns used by a row-based validation step.
+
+    These are the step's own column(s) and any columns that the step's values refer to (e.g., the
+    column in `value=col("y")`).
+    """
+
+    if isinstance(column, str):
+        columns = [column]
+    else:
+        columns = list(column or [])
+
+    for value in values if isinstance(values, (list, tuple)) else [values]:
+        if isinstance(value, ColumnLiteral) and value.name not in columns:
+            columns.append(value.name)
+
+    return columns
+
+
+def _select_step_columns(tbl: FrameT, columns: list[str]) -> FrameT:
+    """
+    Project a table down to the columns used by a validation step.
+
+    The result of a row-based step is its table with the `pb_is_good_` column added. For eager
+    tables, the step only keeps its own columns (adding a column to a Pandas DataFrame copies all
+    of its columns, which adds up for wide tables and many steps) and extracts of failing rows are
+    later taken from the full table by position (see `_get_failing_rows()`). Lazy tables are left
+    as they are since their queries are only projected to the needed columns when collected.
+    """
+
+    if isinstance(tbl, nw.DataFrame):
+        return tbl.select(columns)
+
+    return tbl
+
+
+def _has_table_dependent_null_handling(assertion_method: str, values: Any) -> bool:
+    """
+    Determine whether the results of a row-based check depend on the whole table being checked.
+
+    The `ne` checks, and `eq` checks against another column, handle missing values differently
+    depending on whether the checked columns have any missing values in the table (and the
+    handling also depends on the backend), so a row's result can depend on the other rows.
+    """
+
+    return assertion_method == "ne" or (assertion_method == "eq" and isinstance(values, Column))
+
+
+def _is_fusable_row_check(assertion_method: str, values: Any) -> bool:
+    """
+    Determine whether a row-based check can be evaluated within a `FusedRowChecks` plan.
+
+    Checks that have special handling depending on the backend or on the presence of missing
+    values in the data (see `_has_table_dependent_null_handling()`) and set membership checks
+    against a reference set (see `_ReferenceSet`) are not fused and should be evaluated on their
+    own.
+    """
+
+    if _has_table_dependent_null_handling(assertion_method=assertion_method, values=values):
+        return False
+
+    if assertion_method in ["gt", "lt", "ge", "le", "eq", "between", "outside"]:
+        return True
+
+    # The values of a reference set depend on the backend of the table
+    if isinstance(values, _ReferenceSet):
+        return False
+
+    return assertion_method in ["in_set", "not_in_set", "regex", "null", "not_null"]
+
+
+# The row-based checks that can be decided from the statistics of their columns (see
+# `_is_row_check_passed_by_stats()`)
+_STATS_ROW_CHECKS = ["gt", "ge", "lt", "le", "eq", "between", "outside", "null", "not_null"]
+
+
+def _is_row_check_passed_by_stats(
+    assertion_method: str,
+    values: Any,
+    inclusive: tuple[bool, bool] | None,
+    na_pass: bool,
+    column_stats: dict[str, Any],
+    n_rows: int,
+) -> bool:
+    """
+    Determine whether every test unit of a row-based check passes, given the column's statistics.
+
+    The statistics are those of `_TableContext.get_column_stats()`. A `col_vals_not_null()` check
+    passes if there are no missing values and a `col_vals_null()` check passes if all values are
+    missing. The comparison checks against numeric values (`gt`, `ge`, `lt`, `le`, `eq`,
+    `between`, and `outside`) pass if the minimum and maximum values of the (numeric) column
+    satisfy the comparison and any missing values pass through `na_pass=`. Columns with `NaN`
+    values are never decided by their statistics since `NaN` compares differently across
+    backends. `False` means the check can't be decided and is to be evaluated row by row (not
+    that it fails).
+    """
+
+    if n_rows == 0:
+        return False
+
+    null_count = column_stats["null_count"]
+
+    if assertion_method == "not_null":
+        return null_count == 0
+
+    if assertion_method == "null":
+        return null_count == n_rows
+
+    if assertion_method not in _STATS_ROW_CHECKS:
+        return False
+
+    def _is_number(value: Any) -> bool:
+        return isinstance(value, (int, float)) and not isinstance(value, bool) and value == value
+
+    compare_values = list(values) if assertion_method in ["between", "outside"] else [values]
+
+    if not all(_is_number(value) for value in compare_values):
+        return False
+
+    # The minimum and maximum values are only available for numeric columns (with at least one
+    # non-missing value)
+    min_val, max_val = column_stats["min"], column_stats["max"]
+
+    if min_val is None or max_val is None or column_stats["nan_count"] > 0:
+        return False
 
-    def get_test_units(self, tbl_type: str) -> int:
+    if null_count > 0 and not na_pass:
+        return False
+
+    if assertion_method == "gt":
+        return min_val > values
+    if assertion_method == "ge":
+        return min_val >= values
+    if assertion_method == "lt":
+        return max_val < values
+    if assertion_method == "le":
+        return max_val <= values
+    if assertion_method == "eq":
+        return min_val == values and max_val == values
+
+    low, high = compare_values
+
+    if assertion_method == "between":
+        return (min_val >= low if inclusive[0] else min_val > low) and (
+            max_val <= high if inclusive[1] else max_val < high
+        )
 
-        if tbl_type == "pandas" or tbl_type == "polars":
+    # For `outside`, all values being below the range (or all above it) is enough
+    return (max_val < low if inclusive[0] else max_val <= low) or (
+        min_val > high if inclusive[1] else min_val >= high
+    )
 
-            # Convert the DataFrame to a format that narwhals can work with and:
-            #  - check if the column exists
-            dfn = _column_test_prep(
-                df=self.df, column=self.column, allowed_types=None, check_exists=False
+
+def _get_row_check_expr_nw(
+    assertion_method: str,
+    column: str,
+    values: Any,
+    inclusive: tuple[bool, bool] | None,
+    na_pass: bool,
+    tbl_context: _TableContext | None = None,
+) -> nw.Expr:
+    """
+    Get a Narwhals expression that evaluates to `True` for each passing test unit of a step.
+
+    The expressions mirror the local (Narwhals) code paths of the `Interrogator` methods so that
+    the same results are obtained when many steps are evaluated together. If the table's context
+    is provided, checks against literal values on a dictionary-encoded or low-cardinality column
+    are evaluated on the column's distinct values (see `_get_distinct_values_expr()`).
+    """
+
+    compares_columns = any(
+        isinstance(value, Column)
+        for value in (values if isinstance(values, (list, tuple)) else (values,))
+    )
+
+    if (
+        tbl_context is not None
+        and assertion_method not in ["null", "not_null"]
+        and not compares_columns
+    ):
+        return _get_distinct_values_expr(
+            expr=_get_row_check_expr_nw(
+                assertion_method=assertion_method,
+                column=column,
+                values=values,
+                inclusive=inclusive,
+                na_pass=na_pass,
+            ),
+            column=column,
+            tbl_context=tbl_context,
+            dictionary_encoded_only=assertion_method != "regex",
+            as_strings=assertion_method == "regex",
+        )
+
+    def _fill_false(expr: nw.Expr) -> nw.Expr:
+        return nw.when(expr.is_null()).then(nw.lit(False)).otherwise(expr)
+
+    col_expr = nw.col(column)
+
+    if assertion_method in ["gt", "lt", "ge", "le", "eq"]:
+
+        compare_expr = _get_compare_expr_nw(compare=values)
+
+        if assertion_method == "gt":
+            cmp_res = col_expr > compare_expr
+        elif assertion_method == "lt":
+            cmp_res = col_expr < compare_expr
+        elif assertion_method == "ge":
+            cmp_res = col_expr >= compare_expr
+        elif assertion_method == "le":
+            cmp_res = col_expr <= compare_expr
+        else:
+            cmp_res = col_expr == compare_expr
+
+        return (
+            (col_expr.is_null() & na_pass)
+            | (
+                nw.col(values.name).is_null() & na_pass
+                if isinstance(values, Column)
+                else nw.lit(False)
             )
+            | _fill_false(cmp_res)
+        )
+
+    if assertion_method in ["between", "outside"]:
+
+        low, high = values
 
-            return len(dfn)
+        low_val = _get_compare_expr_nw(compare=low)
+        high_val = _get_compare_expr_nw(compare=high)
 
-        if tbl_type in IBIS_BACKENDS:
+        low_is_null = nw.col(low.name).is_null() if isinstance(low, Column) else nw.lit(False)
+        high_is_null = nw.col(high.name).is_null() if isinstance(high, Column) else nw.lit(False)
+
+        any_null_passes = (col_expr.is_null() | low_is_null | high_is_null) & nw.lit(na_pass)
+
+        if assertion_method == "between":
+
+            low_res = col_expr >= low_val if inclusive[0] else col_expr > low_val
+            high_res = col_expr <= high_val if inclusive[1] else col_expr < high_val
+
+            return any_null_passes | (_fill_false(low_res) & _fill_false(high_res))
+
+        low_res = col_expr < low_val if inclusive[0] else col_expr <= low_val
+        high_res = col_expr > high_val if inclusive[1] else col_expr >= high_val
+
+        return any_null_passes | (
+            (_fill_false(low_res) & ~high_is_null) | (_fill_false(high_res) & ~low_is_null)
+        )
+
+    if assertion_method == "in_set":
+        return col_expr.is_in(values)
+
+    if assertion_method == "not_in_set":
+        return ~col_expr.is_in(values)
+
+    if assertion_method == "regex":
+        return (col_expr.is_null() & na_pass) | nw.when(~col_expr.is_null()).then(
+            col_expr.str.contains(pattern=values)
+        ).otherwise(False)
+
+    if assertion_method == "null":
+        return col_expr.is_null()
+
+    if assertion_method == "not_null":
+        return ~col_expr.is_null()
+
+    raise ValueError(f"The `{assertion_method}` check cannot be fused.")  # pragma: no cover
+
+
+def _get_distinct_values_expr(
+    expr: nw.Expr,
+    column: str,
+    tbl_context: _TableContext | None,
+    dictionary_encoded_only: bool = False,
+    as_strings: bool = False,
+) -> nw.Expr:
+    """
+    Get an expression that evaluates a column predicate once per distinct value of the column.
+
+    The predicate `expr` must depend only on the values of `column` (i.e., it's evaluated
+    row-by-row and doesn't involve other columns). For a dictionary-encoded or low-cardinality
+    column (see `_TableContext.get_distinct_values()`), the predicate is evaluated on the distinct
+    values of the column and the returned expression maps the results back to the rows by a
+    membership test against the passing values (which, for dictionary-encoded columns, is
+    resolved through the category codes). Rows with missing values get the result that the
+    predicate gives for a missing value. The returned expression gives the same results as `expr`;
+    if the column isn't eligible, `expr` itself is returned.
+
+    With `dictionary_encoded_only=True`, only `Categorical`/`Enum` (and pandas `category`)
+    columns are eligible. This is meant for predicates that are cheap to evaluate on strings
+    (e.g., comparisons and set membership), for which a membership test isn't any faster. With
+    `as_strings=True`, the predicate is evaluated on the distinct values of a dictionary-encoded
+    column as strings, which allows string predicates (e.g., regex matching) on such columns.
+    """
+
+    if tbl_context is None:
+        return expr
+
+    distinct_values = tbl_context.get_distinct_values(column=column)
+
+    if distinct_values is None:
+        return expr
+
+    is_dictionary_encoded = isinstance(distinct_values.schema[column], (nw.Categorical, nw.Enum))
+
+    if dictionary_encoded_only and not is_dictionary_encoded:
+        return expr
+
+    col_expr = nw.col(column)
+
+    # String predicates are evaluated on the categories as strings (Polars doesn't support
+    # string operations on `Categorical`/`Enum` columns); missing values are kept as such since
+    # pandas would cast them to the string 'nan'
+    if as_strings and is_dictionary_encoded:
+        distinct_values = distinct_values.with_columns(
+            nw.when(~col_expr.is_null()).then(col_expr.cast(nw.String))
+        )
 
-            # Get the count of test units and convert to a native format
-            # TODO: check whether pandas or polars is available
-            return self.df.count().to_polars()
+    distinct_res = distinct_values.with_columns(pb_is_good_=expr)
+
+    passing_values = distinct_res.filter(
+        ~col_expr.is_null() & (nw.col("pb_is_good_") == True)  # noqa
+    )[column].to_list()
+
+    null_res = distinct_res.filter(col_expr.is_null())["pb_is_good_"].to_list()
+
+    is_in_expr = col_expr.is_in(passing_values)
+
+    # Without missing values in the column, the membership test alone gives the results
+    if not null_res:
+        return is_in_expr
+
+    # A missing result (`None`, or `NaN` in pandas) for missing values is kept as such
+    if null_res[0] is None or null_res[0] != null_res[0]:
+        return nw.when(~col_expr.is_null()).then(is_in_expr)
+
+    return nw.when(col_expr.is_null()).then(nw.lit(bool(null_res[0]))).otherwise(is_in_expr)
+
+
+def _get_test_unit_counts(tbl: FrameT | Any, tbl_type: str = "local") -> dict[str, int]:
+    """
+    Get the number of test units, and the numbers of passing and failing test units.
+
+    The counts are obtained by aggregating the `pb_is_good_` column of a results table within the
+    table's backend, so no values are materialized in Python (for Ibis tables, this is a single
+    aggregate query). Missing values in the column are
+    counted as neither passing nor failing test units (but they still count as test units).
+
+    Parameters
+    ----------
+    tbl
+        A table that has a boolean `pb_is_good_` column.
+    tbl_type
+        The type of table (`"local"` or any of the table types in `IBIS_BACKENDS`).
+
+    Returns
+    -------
+    dict[str, int]
+        A dictionary with the keys `n`, `n_passed`, `n_failed`, and `all_passed`.
+    """
+
+    if tbl_type in IBIS_BACKENDS:
+
+        import ibis
+
+        # Compile the counting into a single aggregate query, so that only one small row of
+        # results is transferred from the database
+        counts = (
+            tbl.aggregate(
+                n=ibis._.count(),
+                n_passed=(tbl.pb_is_good_ == True).ifelse(1, 0).sum(),  # noqa
+                n_failed=(tbl.pb_is_good_ == False).ifelse(1, 0).sum(),  # noqa
+            )
+            .to_pyarrow()
+            .to_pylist()[0]
+        )
+
+    else:
+
+        # Running the aggregation through a lazy frame makes this work for both eager and lazy
+        # (e.g., Polars LazyFrame) tables; only the single row of counts is collected
+        counts = (
+            nw.from_native(tbl)
+            .lazy()
+            .select(
+                n=nw.len(),
+                n_passed=(nw.col("pb_is_good_") == True).sum(),  # noqa
+                n_failed=(nw.col("pb_is_good_") == False).sum(),  # noqa
+            )
+            .collect()
+            .rows(named=True)[0]
+        )
+
+    # The sums are missing for tables without any rows
+    n = int(counts["n"])
+    n_passed = int(counts["n_passed"] or 0)
+    n_failed = int(counts["n_failed"] or 0)
+
+    return {"n": n, "n_passed": n_passed, "n_failed": n_failed, "all_passed": n_passed == n}
 
 
 def _get_compare_expr_nw(compare: Any) -> Any:
@@ -1992,8 +2955,199 @@ def _get_compare_expr_nw(compare: Any) -> Any:
     return compare
 
 
+def _is_polars_frame(x: Any) -> bool:
+    # Polars DataFrames and LazyFrames take the same code paths in the comparison methods
+    return is_polars_dataframe(x) or is_polars_lazyframe(x)
+
+
+# Finding duplicated rows in a Polars LazyFrame: the maximum number of candidate rows (i.e., rows
+# whose hash is shared with another row) that are checked in memory at once, and the maximum
+# number of partitions that the candidate rows are spilled to on disk when there are more of them
+_ROWS_DISTINCT_MAX_CANDIDATE_ROWS = 10_000_000
+_ROWS_DISTINCT_MAX_PARTITIONS = 256
+
+
+def _get_row_hashes(tbl: nw.DataFrame) -> nw.Series | None:
+    """
+    Get a 64-bit hash of each row of a Polars or pandas DataFrame.
+
+    Rows that are equal (in the sense of `is_duplicated()`, where missing values are equal to
+    each other) have the same hash. `None` is returned for other kinds of DataFrames.
+    """
+
+    native = tbl.to_native()
+
+    if is_polars_dataframe(native):
+
+        import polars as pl
+
+        return nw.from_native(
+            native.select(pl.struct(pl.all()).hash()).to_series(), series_only=True
+        )
+
+    if is_pandas_dataframe(native):
+
+        import pandas as pd
+
+        # The hashes of `0.0` and `-0.0` differ in pandas although the values are equal
+        floats = [column for column in native.columns if native[column].dtype.kind == "f"]
+        if floats:
+            native = native.assign(**{column: native[column] + 0.0 for column in floats})
+
+        return nw.from_native(pd.util.hash_pandas_object(native, index=False), series_only=True)
+
+    return None
+
+
+def _get_duplicated_rows(tbl: nw.DataFrame, columns: list[str]) -> nw.Series:
+    """
+    Determine which rows of a table are duplicated in a subset of columns.
+
+    For more than one column, the columns of each row are hashed into a single 64-bit key and
+    rows with unique keys are known to be unique; only the (usually few) rows with duplicated keys
+    are compared in full, which resolves any hash collisions. This avoids building a hash table
+    over all of the columns of every row, which is slow and memory-hungry for wide tables.
+
+    Parameters
+    ----------
+    tbl
+        A Narwhals DataFrame.
+    columns
+        The columns that make up the rows to compare.
+
+    Returns
+    -------
+    nw.Series
+        A boolean Series that is `True` for each row that has a duplicate.
+    """
+
+    subset_tbl = tbl.select(columns)
+
+    row_hashes = _get_row_hashes(subset_tbl) if len(columns) > 1 else None
+
+    if row_hashes is None:
+        return subset_tbl.is_duplicated()
+
+    is_candidate = row_hashes.is_duplicated()
+    candidate_idx = is_candidate.arg_true()
+
+    if len(candidate_idx) == 0:
+        return is_candidate
+
+    return is_candidate.scatter(candidate_idx, subset_tbl.filter(is_candidate).is_duplicated())
+
+
+def _get_duplicated_rows_polars_lazy(tbl: Any, columns: list[str]) -> Any:
+    """
+    Add a `pb_is_good_` column to a Polars LazyFrame that is `False` for duplicated rows.
+
+    The rows are hashed into a 64-bit key and the keys that appear more than once are found with
+    a grouped count (which Polars' streaming engine can do out of core). The candidate rows with
+    those keys are then compared in full to find the rows that are actually duplicated; if there
+    are more candidate rows than `_ROWS_DISTINCT_MAX_CANDIDATE_ROWS`, they are spilled to a
+    temporary Parquet file and checked in partitions (by their keys) one at a time, since equal
+    rows have equal keys and always land in the same partition. The returned table is lazy, with
+    the duplicated rows marked through their row numbers.
+    """
+
+    import os
+    import tempfile
+
+    import polars as pl
+
+    keyed = tbl.with_row_index(name="pb_row_").with_columns(pb_key_=pl.struct(columns).hash())
+
+    duplicated_keys = (
+        keyed.group_by("pb_key_")
+        .agg(pl.len().alias("pb_count_"))
+        .filter(pl.col("pb_count_") > 1)
+        .collect(streaming=True)
+    )
+
+    candidates = keyed.filter(pl.col("pb_key_").is_in(duplicated_keys["pb_key_"])).select(
+        "pb_row_", "pb_key_", *columns
+    )
+
+    def get_duplicated_row_numbers(candidates: pl.DataFrame) -> pl.Series:
+        return candidates.filter(candidates.select(columns).is_duplicated())["pb_row_"]
+
+    n_candidates = duplicated_keys["pb_count_"].sum()
+
+    if n_candidates <= _ROWS_DISTINCT_MAX_CANDIDATE_ROWS:
+
+        duplicated_rows = get_duplicated_row_numbers(candidates.collect(streaming=True))
+
+    else:
+
+        n_partitions = min(
+            -(-n_candidates // _ROWS_DISTINCT_MAX_CANDIDATE_ROWS), _ROWS_DISTINCT_MAX_PARTITIONS
+        )
+
+        duplicated_rows = []
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+
+            # Spill the candidate rows to disk in a single pass over the table, then read back
+            # and check one partition of them at a time; versions of Polars that can't stream
+            # the query to disk collect each partition from the table instead (with one pass
+            # over the table per partition)
+            path = os.path.join(tmp_dir, "candidates.parquet")
+
+            try:
+                candidates.sink_parquet(path)
+                candidates = pl.scan_parquet(path)
+            except pl.exceptions.InvalidOperationError:
+                pass
+
+            for i in range(n_partitions):
+                partition = candidates.filter(pl.col("pb_key_") % n_partitions == i).collect(
+                    streaming=True
+                )
+                duplicated_rows.append(get_duplicated_row_numbers(partition))
+
+        duplicated_rows = pl.concat(duplicated_rows)
+
+    return (
+        tbl.with_row_index(name="pb_row_")
+        .with_columns(pb_is_good_=~pl.col("pb_row_").is_in(duplicated_rows))
+        .drop("pb_row_")
+    )
+
+
+def _get_duplicated_rows_ibis(tbl: Any, columns: list[str]) -> Any:
+    """
+    Add a `pb_is_good_` column to an Ibis table that is `False` for duplicated rows.
+
+    The duplicated rows are found with a `GROUP BY ... HAVING COUNT(*) > 1` query on the columns,
+    which is joined back to the table. Nullable columns are joined with a null-safe equality
+    (`IS NOT DISTINCT FROM`) so that missing values match each other, as they do in the grouping.
+    """
+
+    schema = tbl.schema()
+
+    duplicated = (
+        tbl.group_by(columns)
+        .aggregate(pb_count_=tbl.count())
+        .filter(lambda t: t.pb_count_ > 1)
+        .select(*columns, pb_duplicated_=True)
+    )
+
+    predicates = [
+        (
+            tbl[column].identical_to(duplicated[column])
+            if schema[column].nullable
+            else tbl[column] == duplicated[column]
+        )
+        for column in columns
+    ]
+
+    joined = tbl.left_join(duplicated, predicates).select(*tbl.columns, "pb_duplicated_")
+
+    return joined.mutate(pb_is_good_=joined.pb_duplicated_.isnull()).drop("pb_duplicated_")
+
+
 def _column_has_null_values(table: FrameT, column: str) -> bool:
-    null_count = (table.select(column).null_count())[column][0]
+    null_count = table.lazy().select(nw.col(column).null_count()).collect()[column][0]
 
     if null_count is None or null_count == 0:
         return False
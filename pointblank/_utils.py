@@ -3,6 +3,7 @@ from __future__ import annotations
 import re
 import inspect
 
+from dataclasses import dataclass
 from typing import Any
 
 import narwhals as nw
@@ -10,7 +11,7 @@ from narwhals.typing import FrameT
 from great_tables import GT
 from great_tables.gt import _get_column_of_values
 
-from pointblank._constants import ASSERTION_TYPE_METHOD_MAP, GENERAL_COLUMN_TYPES
+from pointblank._constants import ASSERTION_TYPE_METHOD_MAP, GENERAL_COLUMN_TYPES, IBIS_BACKENDS
 
 
 def _get_tbl_type(data: FrameT | Any) -> str:
@@ -103,6 +104,341 @@ def _check_any_df_lib(method_used: str) -> None:
         )
 
 
+def _is_arrow_data(data: Any) -> bool:
+    """
+    Determine whether the data is a PyArrow table, record batch, record batch reader, or dataset.
+    """
+
+    import sys
+
+    # PyArrow data can only exist if PyArrow has been imported
+    pa = sys.modules.get("pyarrow")
+
+    if pa is None:
+        return False
+
+    if isinstance(data, (pa.Table, pa.RecordBatch, pa.RecordBatchReader)):
+        return True
+
+    ds = sys.modules.get("pyarrow.dataset")
+
+    return ds is not None and isinstance(data, ds.Dataset)
+
+
+def _convert_arrow_data(data: Any) -> Any:
+    """
+    Convert PyArrow data to a Polars DataFrame or LazyFrame (or a pandas DataFrame).
+
+    PyArrow tables, record batches, and record batch readers are handed off to Polars as a
+    DataFrame, which (for most data types) reuses the Arrow buffers without copying them; Arrow
+    string and dictionary-encoded columns become Polars `String` and `Categorical` columns. A
+    PyArrow dataset is scanned lazily as a Polars LazyFrame, so that only the parts of the dataset
+    that are needed are read. A record batch reader is a stream, so its batches are consumed by the
+    conversion. If Polars isn't available, the data is converted to a pandas DataFrame with
+    Arrow-backed columns (keeping the Arrow data types). Any other data is returned as is.
+    """
+
+    if not _is_arrow_data(data):
+        return data
+
+    import pyarrow as pa
+
+    if isinstance(data, pa.RecordBatchReader):
+        data = data.read_all()
+
+    if _is_lib_present(lib_name="polars"):
+
+        import polars as pl
+
+        if isinstance(data, (pa.Table, pa.RecordBatch)):
+            return pl.from_arrow(data)
+
+        return pl.scan_pyarrow_dataset(data)
+
+    import pandas as pd
+
+    if not isinstance(data, (pa.Table, pa.RecordBatch)):
+        data = data.to_table()
+
+    return data.to_pandas(types_mapper=pd.ArrowDtype)
+
+
+# The file formats that can be used as data sources, keyed by file extension
+_FILE_DATA_FORMATS = {
+    ".parquet": "parquet",
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".csv": "csv",
+}
+
+
+def _get_file_data_format(data: Any) -> str | None:
+    """
+    Get the format of a file-path data source (`None` if the data isn't a path to such files).
+    """
+
+    import pathlib
+
+    if not isinstance(data, (str, pathlib.Path)):
+        return None
+
+    return _FILE_DATA_FORMATS.get(pathlib.Path(data).suffix.lower())
+
+
+def _find_files(path: str) -> list[str]:
+    """
+    Get the (sorted) paths of the files matching a path or a glob pattern.
+    """
+
+    import glob
+    import pathlib
+
+    if any(char in path for char in "*?["):
+        return sorted(glob.glob(path, recursive=True))
+
+    return [path] if pathlib.Path(path).is_file() else []
+
+
+def _scan_file_data(data: Any) -> Any:
+    """
+    Open a file-path data source lazily.
+
+    A path (or a glob pattern, e.g., `"data/*.parquet"`) to Parquet, Arrow IPC/Feather, or CSV
+    files is scanned as a Polars LazyFrame, so that only the columns and row groups needed by a
+    query are read from the files (Arrow IPC files are memory-mapped). If Polars isn't available,
+    the files are opened as a PyArrow dataset instead. Any other data is returned as is.
+    """
+
+    file_format = _get_file_data_format(data)
+
+    if file_format is None:
+        return data
+
+    path = str(data)
+
+    # Check up front that the files exist, since a scan only reads them when it's collected
+    file_paths = _find_files(path)
+
+    if not file_paths:
+        raise FileNotFoundError(f"No files were found at the path `{path}`.")
+
+    if _is_lib_present(lib_name="polars"):
+
+        import polars as pl
+
+        if file_format == "parquet":
+            return pl.scan_parquet(path)
+        if file_format == "ipc":
+            return pl.scan_ipc(path, memory_map=True)
+        return pl.scan_csv(path)
+
+    if _is_lib_present(lib_name="pyarrow"):
+
+        import pyarrow.dataset as ds
+
+        return ds.dataset(file_paths, format=file_format)
+
+    raise ImportError(
+        "Using a file path as the data source requires either the Polars or the PyArrow library "
+        "to be installed."
+    )
+
+
+def _get_parquet_file_paths(data: Any) -> list[str] | None:
+    """
+    Get the paths of the Parquet files that a table is read from.
+
+    This applies to a path (or a glob pattern) to local Parquet files. `None` is returned for all
+    other data (including Ibis tables created with `read_parquet()`, since Ibis doesn't expose
+    the files that such tables are read from).
+    """
+
+    if _get_file_data_format(data) == "parquet":
+        return _find_files(str(data)) or None
+
+    return None
+
+
+@dataclass
+class _ParquetMetadata:
+    """
+    The metadata in the footers of Parquet files: row counts and column statistics.
+
+    Every Parquet file has a footer with the number of rows in each of its row groups and,
+    usually, the minimum and maximum values and the number of missing values of each column in
+    each row group. These answer some questions about a table without reading any of its data
+    (e.g., its row count, or whether a column has any missing values). The footers are read with
+    PyArrow when first needed and only plain Python values are kept.
+
+    Attributes
+    ----------
+    file_paths
+        The paths of the Parquet files, in the order in which their rows appear in the table.
+    """
+
+    file_paths: list[str]
+
+    def __post_init__(self):
+
+        self.row_groups = None
+        self.column_stats = {}
+
+    def get_row_groups(self) -> list[dict[str, Any]]:
+        """
+        Get the row groups of the files, in table order, each with its file path (`"path"`), its
+        index in the file (`"index"`), the row number of its first row in the table
+        (`"row_offset"`, 0-indexed), and its number of rows (`"n_rows"`).
+        """
+
+        if self.row_groups is None:
+            self._read_footers()
+
+        return self.row_groups
+
+    def get_row_count(self) -> int:
+        """
+        Get the number of rows in the table.
+        """
+
+        return sum(row_group["n_rows"] for row_group in self.get_row_groups())
+
+    def get_row_group_stats(self, column: str) -> list[dict[str, Any]] | None:
+        """
+        Get the statistics of a column for each row group.
+
+        The statistics are in the form used by `_TableContext.get_column_stats()`. The minimum and
+        maximum values are only kept for integer and decimal columns: the statistics of
+        floating-point columns leave out `NaN` values (so the lack of `NaN` values can't be
+        established from them) and the statistics of other types of columns aren't needed by the
+        checks that use them. `None` is returned if the column isn't a top-level column of every
+        file or if any row group lacks a count of missing values.
+        """
+
+        if self.row_groups is None:
+            self._read_footers()
+
+        return self.column_stats.get(column)
+
+    def get_column_stats(self, column: str) -> dict[str, Any] | None:
+        """
+        Get the statistics of a column for the whole table, combined from those of the row
+        groups (`None` if they aren't available).
+        """
+
+        row_group_stats = self.get_row_group_stats(column)
+
+        if row_group_stats is None:
+            return None
+
+        # Row groups without any non-missing values don't have minimum or maximum values
+        stats_with_values = [
+            (stats, row_group)
+            for stats, row_group in zip(row_group_stats, self.get_row_groups())
+            if stats["null_count"] < row_group["n_rows"]
+        ]
+
+        if stats_with_values and all(
+            stats["min"] is not None and stats["max"] is not None for stats, _ in stats_with_values
+        ):
+            min_val = min(stats["min"] for stats, _ in stats_with_values)
+            max_val = max(stats["max"] for stats, _ in stats_with_values)
+        else:
+            min_val = max_val = None
+
+        return {
+            "min": min_val,
+            "max": max_val,
+            "null_count": sum(stats["null_count"] for stats in row_group_stats),
+            "nan_count": 0,
+        }
+
+    def _read_footers(self):
+
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        row_groups = []
+        column_stats = None
+        row_offset = 0
+
+        for path in self.file_paths:
+
+            metadata = pq.read_metadata(path)
+            arrow_schema = metadata.schema.to_arrow_schema()
+
+            # Only top-level columns (with a single leaf column in the file) are used
+            leaf_indices = {metadata.schema.column(j).path: j for j in range(metadata.num_columns)}
+
+            file_stats = {}
+
+            for field in arrow_schema:
+
+                if field.name not in leaf_indices:
+                    continue
+
+                keep_min_max = pa.types.is_integer(field.type) or pa.types.is_decimal(field.type)
+
+                stats_list = []
+
+                for k in range(metadata.num_row_groups):
+
+                    stats = metadata.row_group(k).column(leaf_indices[field.name]).statistics
+
+                    if stats is None or not stats.has_null_count:
+                        stats_list = None
+                        break
+
+                    has_min_max = keep_min_max and stats.has_min_max
+
+                    stats_list.append(
+                        {
+                            "min": stats.min if has_min_max else None,
+                            "max": stats.max if has_min_max else None,
+                            "null_count": stats.null_count,
+                            "nan_count": 0,
+                        }
+                    )
+
+                if stats_list is not None:
+                    file_stats[field.name] = stats_list
+
+            # A column only has statistics if it has them in every file
+            if column_stats is None:
+                column_stats = file_stats
+            else:
+                column_stats = {
+                    column: stats_list + file_stats[column]
+                    for column, stats_list in column_stats.items()
+                    if column in file_stats
+                }
+
+            for k in range(metadata.num_row_groups):
+
+                n_rows = metadata.row_group(k).num_rows
+
+                row_groups.append(
+                    {"path": path, "index": k, "row_offset": row_offset, "n_rows": n_rows}
+                )
+
+                row_offset += n_rows
+
+        self.row_groups = row_groups
+        self.column_stats = column_stats or {}
+
+
+def _process_input_data(data: Any) -> Any:
+    """
+    Prepare the data given to `Validate` (or to the table utility functions) for use.
+
+    File-path data sources are scanned lazily and PyArrow data is handed off to Polars (see
+    `_scan_file_data()` and `_convert_arrow_data()`); DataFrames and Ibis tables are returned as
+    is.
+    """
+
+    return _convert_arrow_data(_scan_file_data(data))
+
+
 def _is_value_a_df(value: Any) -> bool:
     try:
         ns = nw.get_native_namespace(value)
@@ -152,7 +488,7 @@ def _convert_to_narwhals(df: FrameT) -> nw.DataFrame:
     return nw.from_native(df)
 
 
-def _check_column_exists(dfn: nw.DataFrame, column: str) -> None:
+def _check_column_exists(dfn: nw.DataFrame, column: str, schema: nw.Schema | None = None) -> None:
     """
     Check if a column exists in a DataFrame.
 
@@ -162,6 +498,8 @@ def _check_column_exists(dfn: nw.DataFrame, column: str) -> None:
         A Narwhals DataFrame.
     column
         The column to check for existence.
+    schema
+        The schema of the DataFrame, if it's already known.
 
     Raises
     ------
@@ -169,7 +507,10 @@ def _check_column_exists(dfn: nw.DataFrame, column: str) -> None:
         When the column is not found in the DataFrame.
     """
 
-    if column not in dfn.columns:
+    if schema is None:
+        schema = dfn.collect_schema()
+
+    if column not in schema:
         raise ValueError(f"Column '{column}' not found in DataFrame.")
 
 
@@ -264,7 +605,9 @@ def _get_column_dtype(
     return column_dtype_str
 
 
-def _check_column_type(dfn: nw.DataFrame, column: str, allowed_types: list[str]) -> None:
+def _check_column_type(
+    dfn: nw.DataFrame, column: str, allowed_types: list[str], schema: nw.Schema | None = None
+) -> None:
     """
     Check if a column is of a certain data type.
 
@@ -274,6 +617,8 @@ def _check_column_type(dfn: nw.DataFrame, column: str, allowed_types: list[str])
         A Narwhals DataFrame.
     column
         The column to check for data type.
+    schema
+        The schema of the DataFrame, if it's already known.
     dtype
         The data type to check for. These are shorthand types and the following are supported:
         - `"numeric"`: Numeric data types (`int`, `float`)
@@ -288,8 +633,11 @@ def _check_column_type(dfn: nw.DataFrame, column: str, allowed_types: list[str])
         When the column is not of the specified data type.
     """
 
+    if schema is None:
+        schema = dfn.collect_schema()
+
     # Get the data type of the column as a lowercase string
-    column_dtype = str(dfn.collect_schema().get(column)).lower()
+    column_dtype = str(schema.get(column)).lower()
 
     # If `allowed_types` is empty, raise a ValueError
     if not allowed_types:
@@ -315,36 +663,360 @@ def _check_column_type(dfn: nw.DataFrame, column: str, allowed_types: list[str])
         raise TypeError(f"Column '{column}' is a duration.")
 
 
+# Thresholds for evaluating predicates on the distinct values of a column (see
+# `_TableContext.get_distinct_values()`) on string columns that are not dictionary-encoded: the
+# minimum number of rows in the table, the number of leading rows used to quickly rule out
+# high-cardinality columns, and the maximum number of distinct values (as a fraction of the
+# number of rows)
+_DISTINCT_VALUES_MIN_ROWS = 10_000
+_DISTINCT_VALUES_SAMPLE_SIZE = 100_000
+_DISTINCT_VALUES_MAX_FRACTION = 0.05
+
+
+@dataclass
+class _TableContext:
+    """
+    Metadata of a table that is computed once and shared by the validation steps.
+
+    Getting the type of a table, wrapping it with Narwhals, and collecting its schema take a
+    noticeable amount of time compared to evaluating a validation step on a small (and
+    especially on a wide) table. During an interrogation, a context is created for the target
+    table and for each table produced by a `pre=` function; each piece of metadata is computed
+    when first needed and then reused by every step evaluated on that table. The context
+    assumes that the table isn't modified in place while it's in use.
+
+    Attributes
+    ----------
+    data_tbl
+        The table.
+    tbl_type
+        The type of the table (as obtained by `_get_tbl_type()`). This is determined from the
+        table if not provided.
+    parquet_paths
+        The paths of the Parquet files that the table is read from, if any (see
+        `_get_parquet_file_paths()`). The metadata in the footers of these files is then used for
+        the row count and column statistics of the table.
+    """
+
+    data_tbl: FrameT | Any
+    tbl_type: str | None = None
+    parquet_paths: list[str] | None = None
+
+    def __post_init__(self):
+
+        if self.tbl_type is None:
+            self.tbl_type = _get_tbl_type(data=self.data_tbl)
+
+        self.nw_tbl = None
+        self.schema = None
+        self.row_count = None
+        self.distinct_values = {}
+        self.column_stats = {}
+        self.parquet_metadata = None
+
+    def get_nw_tbl(self) -> nw.DataFrame | nw.LazyFrame:
+        """
+        Get the table wrapped as a Narwhals DataFrame (or LazyFrame).
+        """
+
+        if self.nw_tbl is None:
+            self.nw_tbl = _convert_to_narwhals(df=self.data_tbl)
+
+        return self.nw_tbl
+
+    def get_schema(self) -> nw.Schema | Any:
+        """
+        Get the schema of the table (a mapping of column names to data types).
+
+        For Ibis tables, this is the Ibis schema of the table.
+        """
+
+        if self.schema is None:
+            if self.tbl_type in IBIS_BACKENDS:
+                self.schema = self.data_tbl.schema()
+            else:
+                self.schema = self.get_nw_tbl().collect_schema()
+
+        return self.schema
+
+    def get_column_names(self) -> list[str]:
+        """
+        Get the names of the table's columns.
+        """
+
+        return list(self.get_schema())
+
+    def get_parquet_metadata(self) -> _ParquetMetadata | None:
+        """
+        Get the metadata of the Parquet files that the table is read from (`None` if the table
+        isn't read from Parquet files or if PyArrow isn't available).
+        """
+
+        if self.parquet_paths is None or not _is_lib_present(lib_name="pyarrow"):
+            return None
+
+        if self.parquet_metadata is None:
+            self.parquet_metadata = _ParquetMetadata(file_paths=self.parquet_paths)
+
+        return self.parquet_metadata
+
+    def get_row_count(self) -> int:
+        """
+        Get the number of rows in the table.
+
+        For a table read from Parquet files, the row count is taken from the files' footers.
+        """
+
+        from pointblank.validate import get_row_count
+
+        if self.row_count is None:
+
+            parquet_metadata = self.get_parquet_metadata()
+
+            if parquet_metadata is not None:
+                self.row_count = parquet_metadata.get_row_count()
+            else:
+                self.row_count = get_row_count(data=self.data_tbl)
+
+        return self.row_count
+
+    def get_column_stats(self, columns: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Get summary statistics of columns: the minimum and maximum values, and the counts of
+        missing values and of `NaN` values.
+
+        The statistics of any columns that aren't cached yet are computed together, in a single
+        aggregation over the table (which is also used to get the row count, if it's not known
+        yet). The minimum and maximum values are only computed for numeric columns (they are
+        `None` otherwise, and also for columns without any non-missing values) and the `NaN`
+        values are only counted for floating-point columns. `NaN` values that are also treated as
+        missing values (as in pandas columns with NumPy types) are not counted. Columns that are
+        not in the table are left out of the returned dictionary.
+
+        For a table read from Parquet files, the statistics in the files' footers are used where
+        they are available (see `_ParquetMetadata.get_column_stats()`), so that these columns
+        aren't read at all.
+        """
+
+        schema = self.get_schema()
+
+        new_columns = [
+            column
+            for column in dict.fromkeys(columns)
+            if column in schema and column not in self.column_stats
+        ]
+
+        parquet_metadata = self.get_parquet_metadata()
+
+        if parquet_metadata is not None:
+
+            for column in new_columns:
+
+                column_stats = parquet_metadata.get_column_stats(column)
+
+                # Floating-point columns are left to the aggregation, which counts any `NaN`
+                # values (the footers don't have their minimum and maximum values)
+                dtype = schema[column]
+                is_float = (
+                    dtype.is_floating() if self.tbl_type in IBIS_BACKENDS else dtype.is_float()
+                )
+
+                if column_stats is not None and not is_float:
+                    self.column_stats[column] = column_stats
+
+            new_columns = [column for column in new_columns if column not in self.column_stats]
+
+        if new_columns:
+            self.column_stats.update(self._compute_column_stats(columns=new_columns))
+
+        return {
+            column: self.column_stats[column] for column in columns if column in self.column_stats
+        }
+
+    def _compute_column_stats(self, columns: list[str]) -> dict[str, dict[str, Any]]:
+
+        schema = self.get_schema()
+
+        # The aggregations are named by the position of their column so that they can't clash
+        # with each other (or with the row count)
+        if self.tbl_type in IBIS_BACKENDS:
+
+            tbl = self.data_tbl
+
+            aggs = {"n_rows": tbl.count()}
+
+            for k, column in enumerate(columns):
+
+                dtype = schema[column]
+
+                aggs[f"null_count_{k}"] = tbl[column].isnull().sum()
+
+                if dtype.is_numeric():
+                    aggs[f"min_{k}"] = tbl[column].min()
+                    aggs[f"max_{k}"] = tbl[column].max()
+
+                if dtype.is_floating():
+                    aggs[f"nan_count_{k}"] = tbl[column].isnan().sum()
+
+            stats = tbl.aggregate(**aggs).to_pyarrow().to_pylist()[0]
+
+        else:
+
+            tbl = self.get_nw_tbl()
+
+            aggs = [nw.len().alias("n_rows")]
+
+            for k, column in enumerate(columns):
+
+                dtype = schema[column]
+                col_expr = nw.col(column)
+
+                aggs.append(col_expr.null_count().alias(f"null_count_{k}"))
+
+                if dtype.is_numeric():
+                    aggs.append(col_expr.min().alias(f"min_{k}"))
+                    aggs.append(col_expr.max().alias(f"max_{k}"))
+
+                if dtype.is_float():
+                    aggs.append(
+                        (col_expr.is_nan() & ~col_expr.is_null()).sum().alias(f"nan_count_{k}")
+                    )
+
+            stats_tbl = tbl.select(*aggs)
+
+            if isinstance(stats_tbl, nw.LazyFrame):
+                stats_tbl = stats_tbl.collect()
+
+            stats = stats_tbl.rows(named=True)[0]
+
+        if self.row_count is None:
+            self.row_count = int(stats["n_rows"])
+
+        return {
+            column: {
+                "min": stats.get(f"min_{k}"),
+                "max": stats.get(f"max_{k}"),
+                # The sum of an empty Ibis column is a missing value
+                "null_count": int(stats[f"null_count_{k}"] or 0),
+                "nan_count": int(stats.get(f"nan_count_{k}") or 0),
+            }
+            for k, column in enumerate(columns)
+        }
+
+    def get_distinct_values(self, column: str) -> nw.DataFrame | None:
+        """
+        Get the distinct values of a dictionary-encoded or low-cardinality column.
+
+        A predicate on such a column can be evaluated once per distinct value instead of once per
+        row. The distinct values (including a missing value, if there is one) are returned as a
+        single-column Narwhals DataFrame for Polars `Categorical`/`Enum` columns, pandas
+        `category` columns, and for string columns (in tables that aren't small) with few
+        distinct values relative to the number of rows. `None` is returned for all other
+        columns, for tables that are not eager, and for Ibis tables. The result is cached for
+        each column.
+        """
+
+        if column not in self.distinct_values:
+            self.distinct_values[column] = self._find_distinct_values(column=column)
+
+        return self.distinct_values[column]
+
+    def _find_distinct_values(self, column: str) -> nw.DataFrame | None:
+
+        if self.tbl_type in IBIS_BACKENDS:
+            return None
+
+        tbl = self.get_nw_tbl()
+
+        # Getting the distinct values of a lazy table requires collecting its query, which is
+        # left to the query engine
+        if not isinstance(tbl, nw.DataFrame):
+            return None
+
+        dtype = self.get_schema()[column]
+
+        if not isinstance(dtype, (nw.String, nw.Categorical, nw.Enum)):
+            return None
+
+        # The distinct values of a dictionary-encoded column are cheap to get (they are a subset
+        # of the categories) and there can't be more of them than there are rows, so these
+        # columns are always eligible
+        if not isinstance(dtype, nw.String):
+            return tbl.select(nw.col(column).unique())
+
+        n_rows = len(tbl)
+
+        if n_rows < _DISTINCT_VALUES_MIN_ROWS:
+            return None
+
+        max_distinct = n_rows * _DISTINCT_VALUES_MAX_FRACTION
+
+        # Rule out high-cardinality string columns from the leading rows before getting the
+        # distinct values of the entire column
+        sample = tbl[column].head(_DISTINCT_VALUES_SAMPLE_SIZE)
+
+        if sample.n_unique() > min(len(sample) * _DISTINCT_VALUES_MAX_FRACTION, max_distinct):
+            return None
+
+        distinct_values = tbl.select(nw.col(column).unique())
+
+        if len(distinct_values) > max_distinct:
+            return None
+
+        return distinct_values
+
+
 def _column_test_prep(
-    df: FrameT, column: str, allowed_types: list[str] | None, check_exists: bool = True
+    df: FrameT,
+    column: str,
+    allowed_types: list[str] | None,
+    check_exists: bool = True,
+    tbl_context: _TableContext | None = None,
 ) -> nw.DataFrame:
 
-    # Convert the DataFrame to a format that narwhals can work with.
-    dfn = _convert_to_narwhals(df=df)
+    # Convert the DataFrame to a format that narwhals can work with (reusing the wrapped table
+    # and its schema from the table's context, if there is one)
+    if tbl_context is not None:
+        dfn = tbl_context.get_nw_tbl()
+        schema = tbl_context.get_schema()
+    else:
+        dfn = _convert_to_narwhals(df=df)
+        schema = None
 
     # Check if the column exists
     if check_exists:
-        _check_column_exists(dfn=dfn, column=column)
+        _check_column_exists(dfn=dfn, column=column, schema=schema)
 
     # Check if the column is of the allowed types. Raise a TypeError if not.
     if allowed_types:
-        _check_column_type(dfn=dfn, column=column, allowed_types=allowed_types)
+        _check_column_type(dfn=dfn, column=column, allowed_types=allowed_types, schema=schema)
 
     return dfn
 
 
 def _column_subset_test_prep(
-    df: FrameT, columns_subset: list[str] | None, check_exists: bool = True
+    df: FrameT,
+    columns_subset: list[str] | None,
+    check_exists: bool = True,
+    tbl_context: _TableContext | None = None,
 ) -> nw.DataFrame:
 
-    # Convert the DataFrame to a format that narwhals can work with.
-    dfn = _convert_to_narwhals(df=df)
+    # Convert the DataFrame to a format that narwhals can work with
+    if tbl_context is not None:
+        dfn = tbl_context.get_nw_tbl()
+        schema = tbl_context.get_schema()
+    else:
+        dfn = _convert_to_narwhals(df=df)
+        schema = None
 
     # Check whether all columns exist
     if check_exists and columns_subset:
 
+        if schema is None:
+            schema = dfn.collect_schema()
+
         for column in columns_subset:
-            _check_column_exists(dfn=dfn, column=column)
+            _check_column_exists(dfn=dfn, column=column, schema=schema)
 
     return dfn
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import narwhals as nw
 
-from typing import Callable
+from typing import Any, Callable
 from pointblank.thresholds import Thresholds
 from pointblank.column import Column, ColumnSelector
 
@@ -78,10 +78,13 @@ def _check_value_float_int(value: float | int | any):
         raise ValueError("`value=` must be a float, integer, or reference to a column.")
 
 
-def _check_set_types(set: list[float | int | str]):
+def _check_set_types(set: list[float | int | str] | Any):
     """
     Check that input value of the `set=` parameter is a list of floats, integers, or strings.
 
+    A reference set (i.e., a table or Series of values, see `_ReferenceSet`) is not checked here
+    since its values are only obtained when the validation step is evaluated.
+
     Parameters
     ----------
     set
@@ -92,6 +95,11 @@ def _check_set_types(set: list[float | int | str]):
     ValueError
         When `set` is not a list of floats or integers.
     """
+    from pointblank._interrogation import _ReferenceSet
+
+    if isinstance(set, _ReferenceSet):
+        return
+
     if not all(isinstance(value, (float, int, str)) for value in set):
         raise ValueError("`set=` must be a list of floats, integers, or strings.")
 
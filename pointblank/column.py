@@ -216,7 +216,7 @@ class ColumnSelectorNarwhals(Column):
         # Convert the native table to a Narwhals DataFrame
         dfn = nw.from_native(table)
         # Use the selector to select columns and return their names
-        columns = dfn.select(self.exprs.exprs).columns
+        columns = dfn.select(self.exprs.exprs).collect_schema().names()
         return columns
 
 
@@ -7,7 +7,7 @@ import narwhals as nw
 from narwhals.typing import FrameT
 from typing import Any
 
-from pointblank._utils import _get_tbl_type, _select_df_lib
+from pointblank._utils import _get_tbl_type, _process_input_data, _select_df_lib
 
 
 __all__ = [
@@ -46,7 +46,10 @@ class DataScan:
     Parameters
     ----------
     data
-        The data to scan and summarize.
+        The data to scan and summarize. This could be a DataFrame object, an Ibis table object,
+        PyArrow data, or a path to Parquet, Arrow IPC/Feather, or CSV files (possibly with a glob
+        pattern, e.g., `"data/*.parquet"`). Files are scanned with Polars and then read in full,
+        since every row is used in the summary.
     tbl_name
         Optionally, the name of the table could be provided as `tbl_name`.
 
@@ -65,6 +68,14 @@ class DataScan:
 
     def __post_init__(self):
 
+        # Scan file-path data sources and hand off PyArrow data to Polars (or pandas)
+        self.data = _process_input_data(self.data)
+
+        # Every column is profiled over all rows, so a Polars LazyFrame (e.g., a scanned file) is
+        # collected first
+        if "polars" in str(type(self.data)) and hasattr(self.data, "collect"):
+            self.data = self.data.collect()
+
         # Determine if the data is a DataFrame that could be handled by Narwhals,
         # or an Ibis Table
         self.tbl_type = _get_tbl_type(data=self.data)
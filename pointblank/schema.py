@@ -4,7 +4,7 @@ import copy
 
 from dataclasses import dataclass
 
-from pointblank._utils import _get_tbl_type, _is_lib_present
+from pointblank._utils import _get_tbl_type, _is_lib_present, _process_input_data
 from pointblank._constants import IBIS_BACKENDS
 
 __all__ = ["Schema"]
@@ -189,6 +189,8 @@ class Schema:
         if self.columns is not None:
             self._validate_schema_inputs()
         if self.tbl is not None:
+            # File-path data sources and PyArrow data are handled as they would be in `Validate`
+            self.tbl = _process_input_data(self.tbl)
             self._collect_schema_from_table()
 
         # Get the table type and store as an attribute (only if a table is provided)
@@ -216,7 +218,7 @@ class Schema:
 
         elif table_type == "polars":
 
-            schema_dict = dict(self.tbl.schema.items())
+            schema_dict = dict(self.tbl.collect_schema().items())
             schema_dict = {k: str(v) for k, v in schema_dict.items()}
             self.columns = list(schema_dict.items())
 
@@ -6,15 +6,26 @@ import copy
 import base64
 import commonmark
 import datetime
+import hashlib
 import inspect
 import json
+import multiprocessing
+import os
+import pickle
+import random
 import re
+import tempfile
+import threading
 
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from statistics import NormalDist
 from typing import Callable, Literal, Any
 from zipfile import ZipFile
 
 import narwhals as nw
+from narwhals.dependencies import is_pandas_dataframe, is_polars_dataframe, is_polars_lazyframe
 from narwhals.typing import FrameT
 from great_tables import GT, html, loc, style, google_font, from_column, vals
 
@@ -23,6 +34,7 @@ from pointblank._constants import (
     COMPATIBLE_DTYPES,
     METHOD_CATEGORY_MAP,
     IBIS_BACKENDS,
+    DTYPE_DEPENDENT_VALIDATION_TYPES,
     ROW_BASED_VALIDATION_TYPES,
     VALIDATION_REPORT_FIELDS,
     SVG_ICONS_FOR_ASSERTION_TYPES,
@@ -47,17 +59,30 @@ from pointblank._interrogation import (
     ColSchemaMatch,
     RowCountMatch,
     ColCountMatch,
-    NumberOfTestUnits,
     RowsDistinct,
+    FusedRowChecks,
+    _STATS_ROW_CHECKS,
+    _collect_fused_row_checks,
+    _ReferenceSet,
+    _get_row_check_expr_nw,
+    _get_step_columns,
+    _get_test_unit_counts,
+    _has_table_dependent_null_handling,
+    _is_fusable_row_check,
+    _is_reference_set_data,
+    _is_row_check_passed_by_stats,
 )
 from pointblank._utils import (
+    _TableContext,
     _check_any_df_lib,
     _check_invalid_fields,
     _format_to_integer_value,
     _get_fn_name,
+    _get_parquet_file_paths,
     _get_tbl_type,
     _is_lib_present,
     _is_value_a_df,
+    _process_input_data,
     _select_df_lib,
 )
 from pointblank._utils_check_args import (
@@ -375,6 +400,10 @@ def preview(
     requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a Polars or
     Pandas DataFrame, the availability of Ibis is not needed.
 
+    PyArrow data and paths to Parquet, Arrow IPC/Feather, or CSV files can also be used, in the
+    same way as with `Validate` (see its *Supported Input Table Types* section). Only the row
+    count and the rows shown in the preview are read from files.
+
     Examples
     --------
     It's easy to preview a table using the `preview()` function. Here's an example using the
@@ -470,12 +499,21 @@ def _generate_display_table(
     row_number_list: list[int] | None = None,
 ) -> GT:
 
+    # Scan file-path data sources and hand off Arrow data to Polars (or pandas)
+    data = _process_input_data(data)
+
     # Make a copy of the data to avoid modifying the original
     data = copy.deepcopy(data)
 
+    # Get the column names (without resolving the schema of a Polars LazyFrame twice)
+    if "polars" in str(type(data)) and hasattr(data, "collect_schema"):
+        column_names = data.collect_schema().names()
+    else:
+        column_names = list(data.columns)
+
     # Does the data table already have a leading row number column?
-    if "_row_num_" in data.columns:
-        if data.columns[0] == "_row_num_":
+    if "_row_num_" in column_names:
+        if column_names[0] == "_row_num_":
             has_leading_row_num_col = True
         else:
             has_leading_row_num_col = False
@@ -582,18 +620,31 @@ def _generate_display_table(
 
         if tbl_type == "polars":
 
-            n_rows = int(data.height)
+            # For a LazyFrame (e.g., a scanned dataset), only the row count and the displayed rows
+            # are collected
+            is_lazy = isinstance(data, pl.LazyFrame)
+
+            if is_lazy:
+                n_rows = int(data.select(pl.len()).collect().item())
+            else:
+                n_rows = int(data.height)
 
             # If n_head + n_tail is greater than the row count, display the entire table
             if n_head + n_tail >= n_rows:
                 full_dataset = True
 
+                if is_lazy:
+                    data = data.collect()
+
                 if row_number_list is None:
                     row_number_list = range(1, n_rows + 1)
 
             else:
                 data = pl.concat([data.head(n=n_head), data.tail(n=n_tail)])
 
+                if is_lazy:
+                    data = data.collect()
+
                 if row_number_list is None:
                     row_number_list = list(range(1, n_head + 1)) + list(
                         range(n_rows - n_tail + 1, n_rows + 1)
@@ -843,6 +894,10 @@ def missing_vals_tbl(data: FrameT | Any) -> GT:
     tables requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a
     Polars or Pandas DataFrame, the availability of Ibis is not needed.
 
+    PyArrow data and paths to Parquet, Arrow IPC/Feather, or CSV files can also be used, in the
+    same way as with `Validate` (see its *Supported Input Table Types* section). All rows of
+    files are read to count the missing values.
+
     The Missing Values Table
     ------------------------
     The missing values table shows the proportion of missing values in each column of the input
@@ -879,6 +934,14 @@ def missing_vals_tbl(data: FrameT | Any) -> GT:
     sector. Many columns have no missing values at all, and those sectors are colored light blue.
     """
 
+    # Scan file-path data sources and hand off Arrow data to Polars (or pandas)
+    data = _process_input_data(data)
+
+    # The missing values are counted over all rows, so a Polars LazyFrame (e.g., a scanned
+    # dataset) is collected first
+    if "polars" in str(type(data)) and hasattr(data, "collect"):
+        data = data.collect()
+
     # Make a copy of the data to avoid modifying the original
     data = copy.deepcopy(data)
 
@@ -1379,6 +1442,10 @@ def get_column_count(data: FrameT | Any) -> int:
     tables requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a
     Polars or Pandas DataFrame, the availability of Ibis is not needed.
 
+    PyArrow data and paths to Parquet, Arrow IPC/Feather, or CSV files can also be used, in the
+    same way as with `Validate` (see its *Supported Input Table Types* section). Only the schema
+    of files is read.
+
     Examples
     --------
     To get the number of columns in a table, we can use the `get_column_count()` function. Here's an
@@ -1406,11 +1473,13 @@ def get_column_count(data: FrameT | Any) -> int:
     `8` for the `small_table` dataset.
     """
 
+    data = _process_input_data(data)
+
     if "ibis.expr.types.relations.Table" in str(type(data)):
         return len(data.columns)
 
     elif "polars" in str(type(data)):
-        return len(data.columns)
+        return len(data.collect_schema())
 
     elif "pandas" in str(type(data)):
         return data.shape[1]
@@ -1456,6 +1525,10 @@ def get_row_count(data: FrameT | Any) -> int:
     tables requires the Ibis library (`v9.5.0` or above) to be installed. If the input table is a
     Polars or Pandas DataFrame, the availability of Ibis is not needed.
 
+    PyArrow data and paths to Parquet, Arrow IPC/Feather, or CSV files can also be used, in the
+    same way as with `Validate` (see its *Supported Input Table Types* section). The rows of
+    files are counted without reading their values.
+
     Examples
     --------
     Getting the number of rows in a table is easily done by using the `get_row_count()` function.
@@ -1484,6 +1557,8 @@ def get_row_count(data: FrameT | Any) -> int:
     for the `game_revenue` dataset.
     """
 
+    data = _process_input_data(data)
+
     if "ibis.expr.types.relations.Table" in str(type(data)):
 
         # Determine whether Pandas or Polars is available to get the row count
@@ -1499,6 +1574,12 @@ def get_row_count(data: FrameT | Any) -> int:
             return int(data.count().to_polars())
 
     elif "polars" in str(type(data)):
+
+        # A Polars LazyFrame only has a row count once it's collected, so only the count itself
+        # is computed and collected
+        if "LazyFrame" in str(type(data)):
+            return int(nw.from_native(data).select(nw.len()).collect().item())
+
         return int(data.height)
 
     elif "pandas" in str(type(data)):
@@ -1522,7 +1603,11 @@ class _ValidationInfo:
     step_id
         The ID of the step (if a step creates multiple steps). Unused.
     sha1
-        The SHA-1 hash of the step. Unused.
+        The SHA-1 hash of the step. This is a fingerprint of the parts of the step that determine
+        its results (the assertion type, the column, the values, the inclusivity, the `na_pass=`
+        setting, and the `pre=` function), which is set during interrogation. Steps with the same
+        fingerprint are only evaluated once. It's `None` if the step has values that can't be
+        fingerprinted (the step is then always evaluated).
     assertion_type
         The type of assertion. This is the method name of the validation (e.g., `"col_vals_gt"`).
     column
@@ -1554,6 +1639,12 @@ class _ValidationInfo:
         The fraction of test units that passed. The calculation is `n_passed / n`.
     f_failed
         The fraction of test units that failed. The calculation is `n_failed / n`.
+    n_sampled
+        The number of test units in the random sample that the step was evaluated on (if the
+        step's results were estimated from a sample).
+    f_failed_ci
+        The confidence interval (as a tuple of the lower and upper bounds) for the fraction of
+        failing test units (if the step's results were estimated from a sample).
     warn
         Whether the number of failing test units is beyond the warning threshold.
     stop
@@ -1563,7 +1654,12 @@ class _ValidationInfo:
     tbl_checked
         The data table in its native format that has been checked for the validation step. It wil
         include a new column called `pb_is_good_` that is a boolean column that indicates whether
-        the row passed the validation or not.
+        the row passed the validation or not. This is only kept for lazy tables (Polars LazyFrames
+        and Ibis tables), which hold a query rather than data; for other tables, the results are
+        kept in `checked_rows` instead.
+    checked_rows
+        A compact record (one bit per row) of the rows that passed the validation step. The checked
+        table is rebuilt from the target table (and any `pre=` function) when it's needed.
     extract
         The extracted rows from the table that failed the validation step.
     time_processed
@@ -1595,10 +1691,13 @@ class _ValidationInfo:
     n_failed: int | None = None
     f_passed: int | None = None
     f_failed: int | None = None
+    n_sampled: int | None = None
+    f_failed_ci: tuple[float, float] | None = None
     warn: bool | None = None
     stop: bool | None = None
     notify: bool | None = None
     tbl_checked: FrameT | None = None
+    checked_rows: _CheckedRows | None = None
     extract: FrameT | None = None
     val_info: dict[str, any] | None = None
     time_processed: str | None = None
@@ -1608,6 +1707,296 @@ class _ValidationInfo:
         return self.val_info
 
 
+@dataclass
+class _PreProcessingCache:
+    """
+    A cache of pre-processed tables for the length of one interrogation.
+
+    Tables produced by the `pre=` functions of validation steps are memoized by the identity of
+    the function object, so that steps sharing a `pre=` function only compute the pre-processed
+    table once. The column type checks made on the pre-processed tables are memoized as well. If
+    a memory cap is set, the least recently used tables are evicted to keep the total estimated
+    size of the cached tables under the cap. The cache can be used from several threads.
+
+    Attributes
+    ----------
+    data_tbl
+        The target table.
+    max_bytes
+        The maximum total size (in bytes) of the cached tables. If `None`, there is no cap. A
+        table that is larger than the cap by itself isn't cached at all (so `0` disables caching).
+    tbl_context
+        The context of the target table, if one already exists (otherwise it's created when
+        first needed).
+    """
+
+    data_tbl: FrameT | Any
+    max_bytes: int | None = None
+    tbl_context: _TableContext | None = None
+
+    def __post_init__(self):
+
+        self.tbls = OrderedDict()
+        self.tbl_sizes = {}
+        self.tbl_contexts = {}
+        self.dtype_checks = set()
+
+        # The `pre=` functions are kept here so that their `id()` values stay unique for the
+        # length of the interrogation
+        self.pre_fns = {}
+
+        self.lock = threading.Lock()
+        self.key_locks = {}
+
+    def get_tbl(self, pre: Callable | None) -> FrameT | Any:
+        """
+        Get the table for a `pre=` function, computing it if it isn't cached.
+        """
+
+        if pre is None:
+            return self.data_tbl
+
+        key = id(pre)
+
+        with self.lock:
+            self.pre_fns[key] = pre
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        # Holding the lock for the key while computing the table ensures that concurrent steps
+        # that share the `pre=` function wait for (rather than repeat) its computation
+        with key_lock:
+
+            with self.lock:
+                if key in self.tbls:
+                    self.tbls.move_to_end(key)
+                    return self.tbls[key]
+
+            tbl = _apply_pre_processing(data_tbl=self.data_tbl, pre=pre)
+
+            tbl_size = _get_tbl_nbytes(tbl)
+
+            with self.lock:
+
+                if self.max_bytes is not None and tbl_size > self.max_bytes:
+                    return tbl
+
+                self.tbls[key] = tbl
+                self.tbl_sizes[key] = tbl_size
+
+                # Evict the least recently used tables until the cached tables fit under the cap
+                if self.max_bytes is not None:
+                    while sum(self.tbl_sizes.values()) > self.max_bytes:
+                        evicted_key, _ = self.tbls.popitem(last=False)
+                        del self.tbl_sizes[evicted_key]
+                        self.tbl_contexts.pop(evicted_key, None)
+
+            return tbl
+
+    def get_tbl_context(self, pre: Callable | None) -> _TableContext:
+        """
+        Get the context (with the shared metadata) of the table for a `pre=` function.
+
+        The context of a pre-processed table is kept for as long as the table itself is cached.
+        """
+
+        tbl = self.get_tbl(pre)
+
+        with self.lock:
+
+            if pre is None:
+                if self.tbl_context is None or self.tbl_context.data_tbl is not tbl:
+                    self.tbl_context = _TableContext(data_tbl=tbl)
+                return self.tbl_context
+
+            key = id(pre)
+
+            tbl_context = self.tbl_contexts.get(key)
+
+            if tbl_context is None or tbl_context.data_tbl is not tbl:
+                tbl_context = _TableContext(data_tbl=tbl)
+                if key in self.tbls:
+                    self.tbl_contexts[key] = tbl_context
+
+            return tbl_context
+
+    def is_dtype_checked(self, pre: Callable | None, column: str, allowed_types: list[str]) -> bool:
+        """
+        Determine whether a column type check already passed for the table of a `pre=` function.
+        """
+
+        with self.lock:
+            return (id(pre), column, tuple(allowed_types)) in self.dtype_checks
+
+    def set_dtype_checked(self, pre: Callable | None, column: str, allowed_types: list[str]):
+        """
+        Record that a column type check passed for the table of a `pre=` function.
+        """
+
+        with self.lock:
+            self.dtype_checks.add((id(pre), column, tuple(allowed_types)))
+
+
+def _get_tbl_nbytes(tbl: FrameT | Any) -> int:
+    """
+    Estimate the size of a table in memory (in bytes).
+
+    Lazy tables (Polars LazyFrames and Ibis tables) don't hold any data, so their size is `0`.
+    """
+
+    if is_polars_dataframe(tbl):
+        return int(tbl.estimated_size())
+
+    if is_pandas_dataframe(tbl):
+        return int(tbl.memory_usage(index=True, deep=True).sum())
+
+    return 0
+
+
+@dataclass
+class _CheckedRows:
+    """
+    The results of a row-based validation step as packed bitmaps.
+
+    Rather than keeping a copy of the checked table (the target table plus the `pb_is_good_`
+    column) for every step, only the `pb_is_good_` values are kept, with one bit per row. A
+    validity bitmap marks the rows with missing `pb_is_good_` values (if there are any). The rows
+    are those of the table that the step was evaluated on (i.e., the table after any `pre=`
+    function was applied).
+
+    Attributes
+    ----------
+    n_rows
+        The number of rows in the checked table.
+    bits
+        The packed `pb_is_good_` values (missing values are packed as `False`).
+    validity
+        The packed validity bitmap (`1` for a row with a `pb_is_good_` value), or `None` if no
+        values are missing.
+    """
+
+    n_rows: int
+    bits: Any
+    validity: Any | None = None
+
+    @classmethod
+    def from_results_tbl(cls, results_tbl: FrameT | Any) -> _CheckedRows:
+        """
+        Pack the `pb_is_good_` column of a checked table.
+        """
+
+        import numpy as np
+
+        pb_is_good_ = nw.from_native(results_tbl)["pb_is_good_"]
+
+        if pb_is_good_.null_count() > 0:
+            validity = np.packbits(~pb_is_good_.is_null().to_numpy().astype(bool))
+        else:
+            validity = None
+
+        bits = np.packbits(pb_is_good_.fill_null(False).to_numpy().astype(bool))
+
+        return cls(n_rows=len(pb_is_good_), bits=bits, validity=validity)
+
+    def get_is_good(self) -> Any:
+        """
+        Unpack the `pb_is_good_` values as a NumPy array (missing values are unpacked as `False`).
+        """
+
+        import numpy as np
+
+        return np.unpackbits(self.bits, count=self.n_rows).astype(bool)
+
+    def get_validity(self) -> Any | None:
+        """
+        Unpack the validity bitmap as a NumPy array (or get `None` if no values are missing).
+        """
+
+        import numpy as np
+
+        if self.validity is None:
+            return None
+
+        return np.unpackbits(self.validity, count=self.n_rows).astype(bool)
+
+    @classmethod
+    def all_passed(cls, n_rows: int) -> _CheckedRows:
+        """
+        Get the bitmaps of a step where every row passed.
+        """
+
+        import numpy as np
+
+        return cls(n_rows=n_rows, bits=np.packbits(np.ones(n_rows, dtype=bool)))
+
+    def pad_rows(self, n_rows: int) -> _CheckedRows:
+        """
+        Extend the bitmaps to `n_rows` rows, with the added rows having missing values.
+        """
+
+        import numpy as np
+
+        if n_rows == self.n_rows:
+            return self
+
+        n_bytes = (n_rows + 7) // 8
+
+        # The unused bits of the last byte are always zero, so the bitmaps can be padded with
+        # zero bytes (the added rows are then `False` and not valid)
+        bits = np.zeros(n_bytes, dtype=np.uint8)
+        bits[: len(self.bits)] = self.bits
+
+        validity = np.zeros(n_bytes, dtype=np.uint8)
+
+        if self.validity is None:
+            validity[: len(self.bits)] = np.packbits(np.ones(self.n_rows, dtype=bool))
+        else:
+            validity[: len(self.validity)] = self.validity
+
+        return _CheckedRows(n_rows=n_rows, bits=bits, validity=validity)
+
+
+@dataclass
+class _FirstStopTracker:
+    """
+    Tracks the first validation step that exceeded its `stop` threshold during interrogation.
+
+    This is used by `interrogate(stop_on_first_stop=True)` so that the steps following the first
+    stopping step are not evaluated. Steps can report their results from several threads, so the
+    step number is only updated while holding a lock.
+
+    Attributes
+    ----------
+    i
+        The step number of the first step (in the order of the validation plan) that exceeded its
+        `stop` threshold, or `None` if no such step has been found so far.
+    """
+
+    i: int | None = None
+
+    def __post_init__(self):
+
+        self.lock = threading.Lock()
+
+    def record(self, validation: _ValidationInfo):
+        """
+        Record the results of an interrogated step.
+        """
+
+        if not validation.stop:
+            return
+
+        with self.lock:
+            if self.i is None or validation.i < self.i:
+                self.i = validation.i
+
+    def should_skip(self, validation: _ValidationInfo) -> bool:
+        """
+        Determine whether a step comes after the first stopping step (and can be skipped).
+        """
+
+        return self.i is not None and validation.i > self.i
+
+
 @dataclass
 class Validate:
     """
@@ -1636,8 +2025,9 @@ class Validate:
     Parameters
     ----------
     data
-        The table to validate, which could be a DataFrame object or an Ibis table object. Read the
-        *Supported Input Table Types* section for details on the supported table types.
+        The table to validate, which could be a DataFrame object, an Ibis table object, or a path
+        to Parquet, Arrow IPC/Feather, or CSV files. Read the *Supported Input Table Types* section
+        for details on the supported table types.
     tbl_name
         A optional name to assign to the input table object. If no value is provided, a name will
         be generated based on whatever information is available. This table name will be displayed
@@ -1675,6 +2065,28 @@ class Validate:
     the Ibis library v9.5.0 and above to be installed. If the input table is a Polars or Pandas
     DataFrame, the Ibis library is not required.
 
+    PyArrow data can be used directly as the target table: a `pyarrow.Table`, `RecordBatch`, or
+    `RecordBatchReader` is handed off to Polars as a DataFrame without copying the Arrow buffers
+    (keeping Arrow string and dictionary-encoded columns as Polars `String` and `Categorical`
+    columns), and a `pyarrow.dataset.Dataset` is scanned lazily as a Polars LazyFrame (see below).
+    If Polars isn't installed, the data is converted to a Pandas DataFrame with Arrow-backed
+    columns. A `RecordBatchReader` is read in full with its `read_all()` method when the
+    `Validate` object is created, so the whole stream is loaded into memory (and consumed).
+
+    The target table can also be given as a path to Parquet, Arrow IPC/Feather, or CSV files, as a
+    string or a `pathlib.Path` object (e.g., `"data/sales.parquet"`). The path may contain a glob
+    pattern (e.g., `"data/*.parquet"`) to validate several files as one table. The files are
+    scanned lazily as a Polars LazyFrame (Arrow IPC files are memory-mapped), so that each
+    row-based step only reads the columns it needs from the files, rather than the whole table
+    being loaded into memory beforehand (see below). If Polars isn't installed, the files are
+    opened as a PyArrow dataset and converted as described above.
+
+    A Polars LazyFrame (e.g., one obtained from `pl.scan_parquet()` or `pl.scan_csv()`) can also
+    be used as the target table. The table stays lazy during interrogation: the checks of the
+    row-based validation steps are collected together with `pl.collect_all()`, so that Polars can
+    share the scan of the data across the steps, and the rows of data extracts are only collected
+    when `collect_extracts=True`.
+
     Examples
     --------
     ## Creating a validation plan and interrogating
@@ -1753,6 +2165,14 @@ class Validate:
 
     def __post_init__(self):
 
+        # Keep the paths of any Parquet files that the table is read from, since the metadata in
+        # their footers can answer some validation steps without reading the data
+        parquet_paths = _get_parquet_file_paths(self.data)
+
+        # Scan file-path data sources lazily and hand off Arrow data (PyArrow tables, record batch
+        # readers, and datasets) to Polars
+        self.data = _process_input_data(self.data)
+
         # Check input of the `thresholds=` argument
         _check_thresholds(thresholds=self.thresholds)
 
@@ -1768,6 +2188,18 @@ class Validate:
 
         self.validation_info = []
 
+        # The state of an incremental interrogation (with `interrogate(watermark_col=)`)
+        self.incremental_state = None
+
+        # The steps whose results were merged with the state of a previous incremental run
+        self._incremental_merged_steps = []
+
+        # The metadata of the target table (its type, schema, etc.), computed when first needed
+        if parquet_paths is not None:
+            self._tbl_context = _TableContext(data_tbl=self.data, parquet_paths=parquet_paths)
+        else:
+            self._tbl_context = None
+
     def _repr_html_(self) -> str:
 
         return self.get_tabular_report()._repr_html_()  # pragma: no cover
@@ -3049,7 +3481,7 @@ class Validate:
     def col_vals_in_set(
         self,
         columns: str | list[str] | Column | ColumnSelector | ColumnSelectorNarwhals,
-        set: list[float | int],
+        set: list[float | int] | Any,
         pre: Callable | None = None,
         thresholds: int | float | bool | tuple | dict | Thresholds = None,
         active: bool = True,
@@ -3069,7 +3501,14 @@ class Validate:
             selectors to specify one or more columns. If multiple columns are supplied or resolved,
             there will be a separate validation step generated for each column.
         set
-            A list of values to compare against.
+            A list of values to compare against. For a large set of values (e.g., a list of valid
+            IDs), this can instead be a Polars or pandas Series, or a table (a Polars or pandas
+            DataFrame or an Ibis table) with a single column of values. Membership is then checked
+            with a hash join against the distinct values of the set instead of through a list of
+            literal values. With an Ibis table as the target, a set that isn't an Ibis table is
+            uploaded once to the table's backend as a temporary table (an Ibis table given as the
+            set should be in the same backend as the target table). The distinct values of the set
+            are cached, and reused by all validation steps that use the same object as the set.
         pre
             A pre-processing function or lambda to apply to the data table for the validation step.
         thresholds
@@ -3150,6 +3589,11 @@ class Validate:
         assertion_type = _get_fn_name()
 
         _check_column(column=columns)
+
+        # A table or Series of values is used as a reference set
+        if _is_reference_set_data(set):
+            set = _ReferenceSet(data=set)
+
         _check_set_types(set=set)
         _check_pre(pre=pre)
         _check_thresholds(thresholds=thresholds)
@@ -3188,7 +3632,7 @@ class Validate:
     def col_vals_not_in_set(
         self,
         columns: str | list[str] | Column | ColumnSelector | ColumnSelectorNarwhals,
-        set: list[float | int],
+        set: list[float | int] | Any,
         pre: Callable | None = None,
         thresholds: int | float | bool | tuple | dict | Thresholds = None,
         active: bool = True,
@@ -3208,7 +3652,14 @@ class Validate:
             selectors to specify one or more columns. If multiple columns are supplied or resolved,
             there will be a separate validation step generated for each column.
         set
-            A list of values to compare against.
+            A list of values to compare against. For a large set of values (e.g., a list of valid
+            IDs), this can instead be a Polars or pandas Series, or a table (a Polars or pandas
+            DataFrame or an Ibis table) with a single column of values. Membership is then checked
+            with a hash join against the distinct values of the set instead of through a list of
+            literal values. With an Ibis table as the target, a set that isn't an Ibis table is
+            uploaded once to the table's backend as a temporary table (an Ibis table given as the
+            set should be in the same backend as the target table). The distinct values of the set
+            are cached, and reused by all validation steps that use the same object as the set.
         pre
             A pre-processing function or lambda to apply to the data table for the validation step.
         thresholds
@@ -3288,6 +3739,11 @@ class Validate:
         assertion_type = _get_fn_name()
 
         _check_column(column=columns)
+
+        # A table or Series of values is used as a reference set
+        if _is_reference_set_data(set):
+            set = _ReferenceSet(data=set)
+
         _check_set_types(set=set)
         _check_pre(pre=pre)
         _check_thresholds(thresholds=thresholds)
@@ -4498,6 +4954,18 @@ class Validate:
         sample_n: int | None = None,
         sample_frac: int | float | None = None,
         sample_limit: int = 5000,
+        fuse_steps: bool = False,
+        workers: int | None = None,
+        worker_type: Literal["thread", "process"] = "thread",
+        pre_cache_max_bytes: int | None = None,
+        batch_size: int | None = None,
+        stop_on_first_stop: bool = False,
+        test_sample_n: int | None = None,
+        test_sample_conf_level: float = 0.95,
+        watermark_col: str | None = None,
+        incremental_state: dict[str, Any] | None = None,
+        extract_columns: str | list[str] | None = None,
+        use_column_stats: bool = True,
     ) -> Validate:
         """
         Execute each validation step against the table and store the results.
@@ -4510,6 +4978,8 @@ class Validate:
         option is set to `True` (the default). We can control the number of rows collected using the
         `get_first_n=`, `sample_n=`, and `sample_frac=` options. The `sample_limit=` option will
         enforce a hard limit on the number of rows collected when using the `sample_frac=` option.
+        For Ibis tables (e.g., DuckDB or SQLite tables), the selection and limiting of the failing
+        rows is done with a query in the database, so that only the extracted rows are fetched.
 
         After interrogation is complete, the `Validate` object will have gathered information, and
         we can use methods like `n_passed()`, `f_failed()`, etc., to understand how the table
@@ -4547,6 +5017,145 @@ class Validate:
         sample_limit
             A value that limits the possible number of rows returned when sampling non-passing rows
             using the `sample_frac=` option.
+        fuse_steps
+            An option to evaluate the row-based validation steps together, in a single pass over
+            the table, instead of one step at a time. Steps that share the same `pre=` function
+            are evaluated together on the pre-processed table (which is then only computed once).
+            The results are the same as those obtained with the default step-by-step evaluation.
+            This option currently applies to Polars and Pandas DataFrames (a Polars LazyFrame is
+            always evaluated in this way); `col_vals_ne()` steps and `col_vals_eq()` steps that
+            compare against another column are always evaluated on their own.
+        workers
+            The number of threads to use for interrogating the validation steps concurrently. By
+            default (`None`), the steps are interrogated one after the other. Since the steps are
+            independent and Polars releases the GIL during its computations, using several
+            workers can speed up the interrogation of validation plans with many steps. The
+            results (including the processing time of each step) are stored for each step just
+            as they would be with serial execution. Ibis tables are always interrogated serially
+            since the connections of their backends cannot be shared across threads.
+        worker_type
+            The type of workers to use when `workers=` is greater than `1`. With `"thread"` (the
+            default), the steps are interrogated on a pool of threads. With `"process"`, the steps
+            are interrogated in a pool of worker processes, which is useful for Pandas DataFrames
+            (since Pandas computations hold the GIL, threads won't help much there). The table is
+            written once to an Arrow IPC file that each worker process memory-maps and uses as a
+            Pandas DataFrame with Arrow-backed columns (without copying the data), and only the
+            counts and the row numbers of extracted rows are sent back. Steps with a `pre=`
+            function, steps whose results depend on the column data types (`col_vals_expr()`,
+            `col_vals_regex()`, and `col_schema_match()`), and any steps that can't be pickled are
+            interrogated in the main process. This option requires the PyArrow library and applies
+            only to Pandas DataFrames; other tables are interrogated as with `"thread"`. Since
+            worker processes are started by spawning, a script using this option must guard its
+            entry point with `if __name__ == "__main__":`.
+        pre_cache_max_bytes
+            During interrogation, the table produced by a `pre=` function is computed once and
+            shared by all steps that use the same function object (these steps also share the
+            column type checks made on that table). This option sets a cap (in bytes) on the total
+            estimated size of the pre-processed tables that are kept around; when the cap is
+            exceeded, the least recently used tables are evicted (and recomputed if needed again).
+            The default of `None` means that there is no cap, and `0` disables the caching.
+        batch_size
+            An option to interrogate the table in batches of `batch_size` rows, so that only one
+            batch is held in memory at a time. This is meant for tables that are larger than the
+            available memory, and it's best used with a Polars LazyFrame that scans a file (e.g.,
+            with `pl.scan_parquet()` or `pl.scan_csv()`). Every step is evaluated on each batch and
+            the counts of test units are merged, giving the same results as interrogating the
+            whole table (`rows_distinct()` steps track the occurrences of distinct rows across
+            batches, so their memory use depends on the number of distinct rows). Extracts keep
+            the row numbers of the failing rows in the whole table. A LazyFrame is read only once:
+            its rows are streamed to a temporary Arrow IPC file by the streaming engine of Polars
+            and the batches are taken from that (memory-mapped) file. Steps with a `pre=` function
+            (which may depend on all rows of the table) and `col_vals_ne()` steps (and
+            `col_vals_eq()` steps against another column), whose handling of missing values
+            depends on the whole table, are evaluated on the whole table rather than in batches.
+            The checked tables are not collected in this mode (so `get_sundered_data()` can't be
+            used) and the `workers=` option is not used. Ibis tables are always interrogated in
+            full by their backends, so this option has no effect for them.
+        stop_on_first_stop
+            An option to stop the interrogation once a validation step has exceeded its `stop`
+            threshold. The steps following that step (in the order of the validation plan) are
+            then not evaluated and they appear in the validation report as inactive steps (without
+            any results). This can greatly reduce the time taken for validation plans that gate the
+            use of a table, especially if the cheaper steps are placed first. When using
+            `workers=`, the steps that were already running when the stopping step finished are
+            allowed to complete but their results are discarded, so the results are always the
+            same as those of serial execution. With `worker_type="process"` or `batch_size=`, all
+            steps are evaluated and the results of the steps following the stopping step are then
+            discarded. This option can't be used with `watermark_col=`.
+        test_sample_n
+            An option to estimate the results of the row-based validation steps from a random
+            sample of `test_sample_n` rows (taken after any `pre=` function is applied), instead of
+            evaluating them on the whole table. For each step, the fraction of failing test units
+            is estimated along with a confidence interval (a Wilson score interval) and, if that
+            interval straddles any of the step's threshold levels (i.e., it can't be determined
+            from the sample whether a level is exceeded), the step is evaluated on the whole table
+            instead. The estimated counts of test units are scaled up to the number of rows in the
+            table and the confidence interval can be obtained with `f_failed_ci()`. This can give
+            quick answers for large database tables (and Parquet files) where most steps are far
+            from their thresholds. Note that a step without any thresholds is never evaluated on
+            the whole table in this mode, that no extracts or checked tables are collected for the
+            sampled steps, and that this option can't be used with `batch_size=`. If the table
+            doesn't have more than `test_sample_n` rows, every step is evaluated on the whole table.
+        test_sample_conf_level
+            The confidence level of the intervals for the fraction of failing test units when using
+            `test_sample_n=`. This is `0.95` by default.
+        watermark_col
+            For incremental interrogation of a table that only grows by appending rows, the name of
+            a column with values that increase with each appended row (e.g., an ID or a timestamp).
+            After interrogation, the state of every step is available in the `incremental_state`
+            attribute of the `Validate` object; it holds the largest value of the watermark column
+            and the cumulative counts of test units. Passing that state back (through
+            `incremental_state=`) in the next run means that only the rows with larger values of
+            the watermark column are evaluated: their counts are added to those of the previous
+            runs and the threshold levels are determined from the totals. Rows appended later must
+            have values larger than the watermark, since any rows with the same value as the
+            watermark are taken as already evaluated. For `rows_distinct()` steps, the state
+            includes 64-bit hashes of the rows seen so far (computed by the table's engine), so
+            that new rows duplicating older rows are caught; if the engine or its version changes,
+            these steps are evaluated on the whole table. The steps that check the table's
+            structure are evaluated on the new rows. Any steps that were added or changed since
+            the previous run are evaluated on the whole table, as are `col_vals_ne()` steps and
+            `col_vals_eq()` steps comparing to another column (their handling of missing values
+            depends on the whole table). For the other steps, the extracts only have the failing
+            new rows (their row numbers refer to the whole table) and the checked tables aren't
+            kept, so the data can't be sundered with `get_sundered_data()`. The steps with `pre=`
+            functions (which are applied to the new rows, so they should operate row by row) and
+            `rows_distinct()` steps don't have extracts. This option can't be used with
+            `test_sample_n=` or `stop_on_first_stop=True`.
+        incremental_state
+            The state from a previous incremental interrogation (the `incremental_state` attribute
+            of the `Validate` object after interrogating with `watermark_col=`). The state can be
+            saved between runs with the `pickle` module. If `None`, the whole table is evaluated
+            and a new state is created.
+        extract_columns
+            The columns to include in the extracts of failing rows. By default (`None`), extracts
+            have all of the table's columns. With a column name or a list of column names, the
+            extract of each step only has the columns used by the step (i.e., the column being
+            checked and any column it's compared to) and the given columns; an empty list keeps
+            only the columns used by the steps. For wide tables, this greatly reduces the memory
+            taken by the extracts and, for Polars LazyFrames and Ibis tables, the amount of data
+            read to collect them. The row numbers of the failing rows (the `_row_num_` column)
+            are always included. Regardless of this option, each row-based step is evaluated on
+            only the columns it uses.
+        use_column_stats
+            An option to decide row-based steps from summary statistics of their columns before
+            evaluating them row by row. The minimum and maximum values and the counts of missing
+            values of the checked columns are computed with a single aggregation over the table
+            (and over each table produced by a `pre=` function), which is cheap for a database
+            or a Parquet file compared to evaluating every row. A step is then known to pass for
+            every row if, for example, the minimum value of the column is greater than the value
+            in `col_vals_gt()`, or if the column has no missing values in `col_vals_not_null()`.
+            The statistics are used for `col_vals_gt()`, `col_vals_ge()`, `col_vals_lt()`,
+            `col_vals_le()`, `col_vals_eq()`, `col_vals_between()`, and `col_vals_outside()`
+            steps that compare a numeric column against numbers (columns with `NaN` values are
+            excluded), and for `col_vals_null()` and `col_vals_not_null()` steps. Steps that are
+            decided in this way have the same results (including their empty extracts and checked
+            tables) as when evaluated row by row; all other steps are evaluated as usual. For a
+            path to Parquet files, the row count and the statistics of integer and decimal columns
+            are taken from the metadata in the files' footers, so that the steps they decide (and
+            `row_count_match()` steps) don't read any data; the other eligible steps are checked
+            against the statistics of each row group and only the row groups that can't be
+            decided are read and evaluated. This is `True` by default.
 
         Returns
         -------
@@ -4605,353 +5214,345 @@ class Validate:
                 "The `sample_n=` and `sample_frac=` arguments cannot both be provided."
             )
 
-        data_tbl = self.data
-
-        # Determine if the table is a DataFrame or a DB table
-        tbl_type = _get_tbl_type(data=data_tbl)
-
-        self.time_start = datetime.datetime.now(datetime.timezone.utc)
+        # Raise if `workers` is not a positive integer
+        if workers is not None and (
+            isinstance(workers, bool) or not isinstance(workers, int) or workers < 1
+        ):
+            raise ValueError("The `workers=` argument must be a positive integer.")
 
-        # Expand `validation_info` by evaluating any column expressions in `column`
-        # (the `_evaluate_column_exprs()` method will eval and expand as needed)
-        self._evaluate_column_exprs(validation_info=self.validation_info)
+        # Raise if `pre_cache_max_bytes` is not a non-negative integer
+        if pre_cache_max_bytes is not None and (
+            isinstance(pre_cache_max_bytes, bool)
+            or not isinstance(pre_cache_max_bytes, int)
+            or pre_cache_max_bytes < 0
+        ):
+            raise ValueError("The `pre_cache_max_bytes=` argument must be a non-negative integer.")
 
-        for validation in self.validation_info:
+        # Raise if `batch_size` is not a positive integer
+        if batch_size is not None and (
+            isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1
+        ):
+            raise ValueError("The `batch_size=` argument must be a positive integer.")
 
-            # Set the `i` value for the validation step (this is 1-indexed)
-            index_value = self.validation_info.index(validation) + 1
-            validation.i = index_value
+        # Raise if `worker_type` is not one of the supported types
+        if worker_type not in ["thread", "process"]:
+            raise ValueError('The `worker_type=` argument must be either "thread" or "process".')
 
-            start_time = datetime.datetime.now(datetime.timezone.utc)
+        _check_boolean_input(param=stop_on_first_stop, param_name="stop_on_first_stop")
 
-            # Skip the validation step if it is not active but still record the time of processing
-            if not validation.active:
-                end_time = datetime.datetime.now(datetime.timezone.utc)
-                validation.proc_duration_s = (end_time - start_time).total_seconds()
-                validation.time_processed = end_time.isoformat(timespec="milliseconds")
-                continue
+        # Raise if `test_sample_n` is not a positive integer
+        if test_sample_n is not None and (
+            isinstance(test_sample_n, bool)
+            or not isinstance(test_sample_n, int)
+            or test_sample_n < 1
+        ):
+            raise ValueError("The `test_sample_n=` argument must be a positive integer.")
 
-            # Skip the validation step if `eval_error` is `True` and record the time of processing
-            if validation.eval_error:
-                end_time = datetime.datetime.now(datetime.timezone.utc)
-                validation.proc_duration_s = (end_time - start_time).total_seconds()
-                validation.time_processed = end_time.isoformat(timespec="milliseconds")
-                validation.active = False
-                continue
+        # Raise if `test_sample_conf_level` is not a number between `0` and `1` (exclusive)
+        if (
+            isinstance(test_sample_conf_level, bool)
+            or not isinstance(test_sample_conf_level, (int, float))
+            or not 0 < test_sample_conf_level < 1
+        ):
+            raise ValueError(
+                "The `test_sample_conf_level=` argument must be a number between `0` and `1`."
+            )
 
-            # Make a copy of the table for this step
-            data_tbl_step = data_tbl
+        # Raise if both sampled and batched interrogation are requested
+        if test_sample_n is not None and batch_size is not None:
+            raise ValueError(
+                "The `test_sample_n=` and `batch_size=` arguments cannot both be provided."
+            )
 
-            # ------------------------------------------------
-            # Pre-processing stage
-            # ------------------------------------------------
+        # Raise if the incremental state is provided without a watermark column (or with a state
+        # from a different watermark column)
+        if incremental_state is not None and watermark_col is None:
+            raise ValueError(
+                "The `watermark_col=` argument must be provided with `incremental_state=`."
+            )
 
-            # Determine whether any pre-processing functions are to be applied to the table
-            if validation.pre is not None:
+        if incremental_state is not None and incremental_state["watermark_col"] != watermark_col:
+            raise ValueError(
+                f"The `incremental_state=` was created with the watermark column "
+                f"`{incremental_state['watermark_col']}`, not `{watermark_col}`."
+            )
 
-                # Read the text of the pre-processing function
-                pre_text = _pre_processing_funcs_to_str(validation.pre)
+        # Raise if both sampled and incremental interrogation are requested
+        if test_sample_n is not None and watermark_col is not None:
+            raise ValueError(
+                "The `test_sample_n=` and `watermark_col=` arguments cannot both be provided."
+            )
 
-                # Determine if the pre-processing function is a lambda function; return a boolean
-                is_lambda = re.match(r"^lambda", pre_text) is not None
+        # Raise if stopping early is requested with incremental interrogation (a step's `stop`
+        # level depends on its cumulative counts, so no step can be skipped)
+        if stop_on_first_stop and watermark_col is not None:
+            raise ValueError(
+                "The `stop_on_first_stop=True` and `watermark_col=` arguments cannot both be "
+                "provided."
+            )
 
-                # If the pre-processing function is a lambda function, then check if there is
-                # a keyword argument called `dfn` in the lamda signature; if so, that's a cue
-                # to use a Narwhalified version of the table
-                if is_lambda:
+        # Raise if `extract_columns` is not a column name or a list of column names
+        if isinstance(extract_columns, str):
+            extract_columns = [extract_columns]
 
-                    # Get the signature of the lambda function
-                    sig = inspect.signature(validation.pre)
+        if extract_columns is not None and (
+            not isinstance(extract_columns, list)
+            or not all(isinstance(col, str) for col in extract_columns)
+        ):
+            raise ValueError(
+                "The `extract_columns=` argument must be a column name or a list of column names."
+            )
 
-                    # Check if the lambda function has a keyword argument called `dfn`
-                    if "dfn" in sig.parameters:
+        if not isinstance(use_column_stats, bool):
+            raise ValueError("The `use_column_stats=` argument must be a boolean value.")
 
-                        # Convert the table to a Narwhals DataFrame
-                        data_tbl_step = nw.from_native(data_tbl_step)
+        data_tbl = self.data
 
-                        # Apply the pre-processing function to the table
-                        data_tbl_step = validation.pre(dfn=data_tbl_step)
+        # Determine if the table is a DataFrame or a DB table; the table's metadata is gathered
+        # once per interrogation and shared by all steps (and by the reporting methods)
+        tbl_context = _TableContext(
+            data_tbl=data_tbl, parquet_paths=self._get_tbl_context().parquet_paths
+        )
+        tbl_type = tbl_context.tbl_type
 
-                        # Convert the table back to its original format
-                        data_tbl_step = nw.to_native(data_tbl_step)
+        self._tbl_context = tbl_context
 
-                    else:
-                        # Apply the pre-processing function to the table
-                        data_tbl_step = validation.pre(data_tbl_step)
+        # Raise if any of the columns requested for the extracts are not in the table
+        if extract_columns is not None:
 
-                # If the pre-processing function is a function, apply it to the table
-                elif isinstance(validation.pre, Callable):
+            missing_columns = [
+                col for col in extract_columns if col not in tbl_context.get_column_names()
+            ]
 
-                    data_tbl_step = validation.pre(data_tbl_step)
+            if missing_columns:
+                raise ValueError(
+                    f"The `extract_columns=` argument has columns that are not in the table: "
+                    f"{missing_columns}."
+                )
 
-            assertion_type = validation.assertion_type
-            column = validation.column
-            value = validation.values
-            inclusive = validation.inclusive
-            na_pass = validation.na_pass
-            threshold = validation.thresholds
+        self.time_start = datetime.datetime.now(datetime.timezone.utc)
 
-            assertion_method = ASSERTION_TYPE_METHOD_MAP[assertion_type]
-            assertion_category = METHOD_CATEGORY_MAP[assertion_method]
-            compatible_dtypes = COMPATIBLE_DTYPES.get(assertion_method, [])
+        self._incremental_merged_steps = []
 
-            validation.n = NumberOfTestUnits(df=data_tbl_step, column=column).get_test_units(
-                tbl_type=tbl_type
-            )
+        # For incremental interrogation, only the rows appended since the previous run are
+        # evaluated (the whole table is kept for any steps that need to be evaluated in full)
+        full_data_tbl = data_tbl
+        no_new_rows = False
 
-            if tbl_type not in IBIS_BACKENDS:
-                tbl_type = "local"
+        if watermark_col is not None:
 
-            if assertion_category == "COMPARE_ONE":
+            _check_watermark_column(data_tbl=data_tbl, tbl_type=tbl_type, column=watermark_col)
 
-                results_tbl = ColValsCompareOne(
-                    data_tbl=data_tbl_step,
-                    column=column,
-                    value=value,
-                    na_pass=na_pass,
-                    threshold=threshold,
-                    assertion_method=assertion_method,
-                    allowed_types=compatible_dtypes,
-                    tbl_type=tbl_type,
-                ).get_test_results()
-
-            if assertion_category == "COMPARE_TWO":
-
-                results_tbl = ColValsCompareTwo(
-                    data_tbl=data_tbl_step,
-                    column=column,
-                    value1=value[0],
-                    value2=value[1],
-                    inclusive=inclusive,
-                    na_pass=na_pass,
-                    threshold=threshold,
-                    assertion_method=assertion_method,
-                    allowed_types=compatible_dtypes,
+            if incremental_state is not None:
+                data_tbl = _filter_rows_after_watermark(
+                    data_tbl=data_tbl,
                     tbl_type=tbl_type,
-                ).get_test_results()
-
-            if assertion_category == "COMPARE_SET":
+                    column=watermark_col,
+                    watermark=incremental_state["watermark"],
+                )
 
-                inside = True if assertion_method == "in_set" else False
+            n_new_rows = get_row_count(data_tbl)
 
-                results_tbl = ColValsCompareSet(
-                    data_tbl=data_tbl_step,
-                    column=column,
-                    values=value,
-                    threshold=threshold,
-                    inside=inside,
-                    allowed_types=compatible_dtypes,
-                    tbl_type=tbl_type,
-                ).get_test_results()
+            # Without any new rows, the results come entirely from the previous run
+            no_new_rows = incremental_state is not None and n_new_rows == 0
 
-            if assertion_category == "COMPARE_REGEX":
+        # Tables produced by `pre=` functions are shared by all steps using the same function
+        pre_cache = _PreProcessingCache(
+            data_tbl=data_tbl,
+            max_bytes=pre_cache_max_bytes,
+            tbl_context=tbl_context if data_tbl is self.data else None,
+        )
 
-                results_tbl = ColValsRegex(
-                    data_tbl=data_tbl_step,
-                    column=column,
-                    pattern=value,
-                    na_pass=na_pass,
-                    threshold=threshold,
-                    allowed_types=compatible_dtypes,
-                    tbl_type=tbl_type,
-                ).get_test_results()
+        # Expand `validation_info` by evaluating any column expressions in `column`
+        # (the `_evaluate_column_exprs()` method will eval and expand as needed)
+        self._evaluate_column_exprs(validation_info=self.validation_info, pre_cache=pre_cache)
 
-            if assertion_category == "COMPARE_EXPR":
+        # A Polars LazyFrame is kept lazy throughout the interrogation; its row-based steps are
+        # always fused so that their queries can be collected together
+        is_lazy_tbl = "LazyFrame" in str(type(data_tbl))
 
-                results_tbl = ColValsExpr(
-                    data_tbl=data_tbl_step,
-                    expr=value,
-                    threshold=threshold,
-                    tbl_type=tbl_type,
-                ).get_test_results()
+        # Interrogating the table in batches of rows applies to Polars and Pandas tables
+        use_batches = batch_size is not None and tbl_type in ["polars", "pandas"]
 
-            if assertion_category == "ROWS_DISTINCT":
+        # Decide the row-based steps that pass for every row from the statistics of their columns;
+        # these steps aren't evaluated row by row
+        if use_column_stats and not no_new_rows:
+            stats_results = self._evaluate_steps_on_statistics(pre_cache=pre_cache)
+        else:
+            stats_results = {}
 
-                results_tbl = RowsDistinct(
-                    data_tbl=data_tbl_step,
-                    columns_subset=column,
-                    threshold=threshold,
-                    tbl_type=tbl_type,
-                ).get_test_results()
+        fused_results = dict(stats_results)
 
-            if assertion_category == "COL_EXISTS_HAS_TYPE":
+        # For a Polars LazyFrame that scans Parquet files, the steps that can't be decided from
+        # the statistics of the whole table are evaluated on only the row groups that can't be
+        # decided from their own statistics (in the files' footers)
+        if (
+            use_column_stats
+            and not no_new_rows
+            and not use_batches
+            and data_tbl is self.data
+            and is_polars_lazyframe(data_tbl)
+            and tbl_context.get_parquet_metadata() is not None
+        ):
+            fused_results.update(
+                self._evaluate_steps_on_row_groups(
+                    tbl_context=tbl_context,
+                    collect_extracts=collect_extracts,
+                    extract_columns=extract_columns,
+                    skip_steps=set(stats_results),
+                )
+            )
 
-                result_bool = ColExistsHasType(
-                    data_tbl=data_tbl_step,
-                    column=column,
-                    threshold=threshold,
-                    assertion_method="exists",
+        # When sampling, estimate the results of the row-based steps from a random sample; the
+        # steps that can't be decided from their sample are evaluated on the whole table below
+        if test_sample_n is not None:
+            fused_results.update(
+                self._evaluate_steps_on_samples(
                     tbl_type=tbl_type,
-                ).get_test_results()
-
-                validation.all_passed = result_bool
-                validation.n = 1
-                validation.n_passed = result_bool
-                validation.n_failed = 1 - result_bool
-
-                results_tbl = None
+                    test_sample_n=test_sample_n,
+                    conf_level=test_sample_conf_level,
+                    pre_cache=pre_cache,
+                    skip_steps=set(fused_results),
+                )
+            )
 
-            if assertion_category == "COL_SCHEMA_MATCH":
+        # Steps that are the same as an earlier step (apart from their thresholds and reporting
+        # options) aren't evaluated; they get the results of the earlier step
+        duplicate_steps = _get_duplicate_steps(
+            validation_info=self.validation_info, skip_steps=set(fused_results)
+        )
 
-                result_bool = ColSchemaMatch(
-                    data_tbl=data_tbl_step,
-                    schema=value["schema"],
-                    complete=value["complete"],
-                    in_order=value["in_order"],
-                    case_sensitive_colnames=value["case_sensitive_colnames"],
-                    case_sensitive_dtypes=value["case_sensitive_dtypes"],
-                    full_match_dtypes=value["full_match_dtypes"],
-                    threshold=threshold,
-                ).get_test_results()
+        steps = [
+            validation
+            for validation in self.validation_info
+            if id(validation) not in duplicate_steps
+        ]
 
-                schema_validation_info = _get_schema_validation_info(
+        # If fusing steps, evaluate all eligible row-based steps ahead of time with a single
+        # pass over the table (or over the pre-processed table, for steps sharing a `pre=`)
+        if (fuse_steps or is_lazy_tbl) and tbl_type in ["polars", "pandas"] and not use_batches:
+            fused_results.update(
+                self._evaluate_fused_steps(
                     data_tbl=data_tbl,
-                    schema=value["schema"],
-                    passed=result_bool,
-                    complete=value["complete"],
-                    in_order=value["in_order"],
-                    case_sensitive_colnames=value["case_sensitive_colnames"],
-                    case_sensitive_dtypes=value["case_sensitive_dtypes"],
-                    full_match_dtypes=value["full_match_dtypes"],
+                    collect_tbl_checked=collect_tbl_checked or collect_extracts,
+                    collect_extracts=collect_extracts,
+                    extract_columns=extract_columns,
+                    pre_cache=pre_cache,
+                    skip_steps=set(fused_results) | set(duplicate_steps),
                 )
+            )
 
-                # Add the schema validation info to the validation object
-                validation.val_info = schema_validation_info
+        # Set the `i` value for each validation step (this is 1-indexed)
+        for i, validation in enumerate(self.validation_info, start=1):
+            validation.i = i
+
+        step_kwargs = {
+            "data_tbl": data_tbl,
+            "tbl_type": tbl_type,
+            "fused_results": fused_results,
+            "pre_cache": pre_cache,
+            "collect_extracts": collect_extracts,
+            "collect_tbl_checked": collect_tbl_checked,
+            "get_first_n": get_first_n,
+            "sample_n": sample_n,
+            "sample_frac": sample_frac,
+            "sample_limit": sample_limit,
+            "extract_columns": extract_columns,
+            "stop_tracker": _FirstStopTracker() if stop_on_first_stop else None,
+        }
 
-                validation.all_passed = result_bool
-                validation.n = 1
-                validation.n_passed = int(result_bool)
-                validation.n_failed = 1 - result_bool
+        if no_new_rows:
 
-                results_tbl = None
+            # The steps get the results of the previous run when merging the incremental state
+            pass
 
-            if assertion_category == "ROW_COUNT_MATCH":
+        elif use_batches:
 
-                result_bool = RowCountMatch(
-                    data_tbl=data_tbl_step,
-                    count=value["count"],
-                    inverse=value["inverse"],
-                    threshold=threshold,
-                    tbl_type=tbl_type,
-                ).get_test_results()
+            batch_steps = []
 
-                validation.all_passed = result_bool
-                validation.n = 1
-                validation.n_passed = int(result_bool)
-                validation.n_failed = 1 - result_bool
+            # The steps decided from the statistics of their columns don't need any batches, and
+            # the steps whose results can't be merged exactly across batches are evaluated on the
+            # whole table
+            for validation in steps:
+                if id(validation) in stats_results or not _is_batchable_step(validation):
+                    self._interrogate_step(validation=validation, **step_kwargs)
+                else:
+                    batch_steps.append(validation)
+
+            self._interrogate_in_batches(
+                steps=batch_steps,
+                data_tbl=data_tbl,
+                tbl_type=tbl_type,
+                batch_size=batch_size,
+                collect_extracts=collect_extracts,
+                get_first_n=get_first_n,
+                sample_n=sample_n,
+                sample_frac=sample_frac,
+                sample_limit=sample_limit,
+                extract_columns=extract_columns,
+            )
 
-                results_tbl = None
+        # Pandas tables can be interrogated in worker processes, which sidesteps the GIL
+        elif (
+            workers is not None
+            and workers > 1
+            and worker_type == "process"
+            and tbl_type == "pandas"
+        ):
 
-            if assertion_category == "COL_COUNT_MATCH":
+            self._interrogate_steps_in_processes(
+                steps=steps, workers=workers, step_kwargs=step_kwargs
+            )
 
-                result_bool = ColCountMatch(
-                    data_tbl=data_tbl_step,
-                    count=value["count"],
-                    inverse=value["inverse"],
-                    threshold=threshold,
-                    tbl_type=tbl_type,
-                ).get_test_results()
+        # Ibis tables are always interrogated serially since the connections of their backends
+        # cannot be shared across threads
+        elif workers is not None and workers > 1 and tbl_type not in IBIS_BACKENDS:
+
+            # Each step only modifies its own `_ValidationInfo` object, so the results are the
+            # same as those of serial execution; `map()` is used to surface any errors in the
+            # order of the steps
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(
+                    executor.map(
+                        lambda validation: self._interrogate_step(
+                            validation=validation, **step_kwargs
+                        ),
+                        steps,
+                    )
+                )
 
-                validation.all_passed = result_bool
-                validation.n = 1
-                validation.n_passed = int(result_bool)
-                validation.n_failed = 1 - result_bool
-
-                results_tbl = None
-
-            if assertion_category not in [
-                "COL_EXISTS_HAS_TYPE",
-                "COL_SCHEMA_MATCH",
-                "ROW_COUNT_MATCH",
-                "COL_COUNT_MATCH",
-            ]:
-
-                # Extract the `pb_is_good_` column from the table as a results list
-                if tbl_type in IBIS_BACKENDS:
-                    results_list = (
-                        results_tbl.select("pb_is_good_").to_pandas()["pb_is_good_"].to_list()
-                    )
-
-                else:
-                    results_list = nw.from_native(results_tbl)["pb_is_good_"].to_list()
-
-                validation.all_passed = all(results_list)
-                validation.n = len(results_list)
-                validation.n_passed = results_list.count(True)
-                validation.n_failed = results_list.count(False)
-
-            # Calculate fractions of passing and failing test units
-            # - `f_passed` is the fraction of test units that passed
-            # - `f_failed` is the fraction of test units that failed
-            for attr in ["passed", "failed"]:
-                setattr(
-                    validation,
-                    f"f_{attr}",
-                    _convert_abs_count_to_fraction(
-                        value=getattr(validation, f"n_{attr}"), test_units=validation.n
-                    ),
-                )
-
-            # Determine if the number of failing test units is beyond the threshold value
-            # for each of the severity levels
-            # - `warn` is the threshold for a warning
-            # - `stop` is the threshold for stopping
-            # - `notify` is the threshold for notifying
-            for level in ["warn", "stop", "notify"]:
-                setattr(
-                    validation,
-                    level,
-                    threshold._threshold_result(
-                        fraction_failing=validation.f_failed, test_units=validation.n, level=level
-                    ),
-                )
-
-            # Include the results table that has a new column called `pb_is_good_`; that
-            # is a boolean column that indicates whether the row passed the validation or not
-            if collect_tbl_checked and results_tbl is not None:
-                validation.tbl_checked = results_tbl
-
-            # If this is a row-based validation step, then extract the rows that failed
-            # TODO: Add support for extraction of rows for Ibis backends
-            if (
-                collect_extracts
-                and assertion_type in ROW_BASED_VALIDATION_TYPES
-                and tbl_type not in IBIS_BACKENDS
-            ):
-
-                # Add row numbers to the results table
-                validation_extract_nw = (
-                    nw.from_native(results_tbl)
-                    .with_row_index(name="_row_num_")
-                    .filter(nw.col("pb_is_good_") == False)  # noqa
-                    .drop("pb_is_good_")
-                )
-
-                # Add 1 to the row numbers to make them 1-indexed
-                validation_extract_nw = validation_extract_nw.with_columns(nw.col("_row_num_") + 1)
-
-                # Apply any sampling or limiting to the number of rows to extract
-                if get_first_n is not None:
-                    validation_extract_nw = validation_extract_nw.head(get_first_n)
-                elif sample_n is not None:
-                    validation_extract_nw = validation_extract_nw.sample(n=sample_n)
-                elif sample_frac is not None:
-                    validation_extract_nw = validation_extract_nw.sample(fraction=sample_frac)
-
-                    # Ensure a limit is set on the number of rows to extract
-                    if len(validation_extract_nw) > sample_limit:
-                        validation_extract_nw = validation_extract_nw.head(sample_limit)
+        else:
 
-                validation.extract = nw.to_native(validation_extract_nw)
+            for validation in steps:
+                self._interrogate_step(validation=validation, **step_kwargs)
+
+        if not no_new_rows:
+            for validation in self.validation_info:
+                if id(validation) in duplicate_steps:
+                    _copy_step_results(source=duplicate_steps[id(validation)], target=validation)
+
+        # Merge the results for the new rows with the state of the previous run
+        if watermark_col is not None:
+            self._update_incremental_state(
+                full_data_tbl=full_data_tbl,
+                n_new_rows=n_new_rows,
+                watermark_col=watermark_col,
+                incremental_state=incremental_state,
+                step_kwargs=step_kwargs,
+            )
 
-            # Get the end time for this step
-            end_time = datetime.datetime.now(datetime.timezone.utc)
+        # Discard the results of any steps that were evaluated after the first stopping step
+        # (steps running concurrently, or in worker processes or batches, aren't skipped early)
+        if stop_on_first_stop:
 
-            # Calculate the duration of processing for this step
-            validation.proc_duration_s = (end_time - start_time).total_seconds()
+            first_stop_i = next(
+                (validation.i for validation in self.validation_info if validation.stop), None
+            )
 
-            # Set the time of processing for this step, this should be UTC time is ISO 8601 format
-            validation.time_processed = end_time.isoformat(timespec="milliseconds")
+            if first_stop_i is not None:
+                for validation in self.validation_info:
+                    if validation.i > first_stop_i:
+                        _set_step_not_evaluated(validation=validation)
 
         self.time_end = datetime.datetime.now(datetime.timezone.utc)
 
@@ -5457,6 +6058,61 @@ class Validate:
             return result[i]
         return result
 
+    def f_failed_ci(
+        self, i: int | list[int] | None = None, scalar: bool = False
+    ) -> dict[int, tuple[float, float] | None] | tuple[float, float] | None:
+        """
+        Provides a dictionary of the confidence intervals for the fraction of failing test units.
+
+        When interrogating with the `test_sample_n=` option of `interrogate()`, the results of the
+        row-based validation steps are estimated from a random sample of rows. For each such step,
+        the fraction of failing test units (available through `f_failed()`) is an estimate and this
+        method provides its confidence interval as a tuple of the lower and upper bounds. The
+        value is `None` for any steps that were evaluated on the whole table (because they are
+        not row-based, because the table is small, or because their interval straddled one of
+        their threshold levels).
+
+        Parameters
+        ----------
+        i
+            The validation step number(s) from which the confidence interval is obtained. Can be
+            provided as a list of integers or a single integer. If `None`, all steps are included.
+        scalar
+            If `True` and `i=` is a scalar, return the value as a scalar instead of a dictionary.
+
+        Returns
+        -------
+        dict[int, tuple[float, float] | None] | tuple[float, float] | None
+            A dictionary of the confidence intervals for each validation step or a scalar value.
+
+        Examples
+        --------
+        In the example below, we'll interrogate a table of 10,000 rows using samples of 1,000 rows.
+        The first step has a fraction of failing test units that is far below its `warn` threshold
+        so its results are estimated from the sample. The second step is evaluated on the whole
+        table since its interval straddles the threshold.
+
+        ```{python}
+        import pointblank as pb
+        import polars as pl
+
+        tbl = pl.DataFrame({"a": range(10000)})
+
+        validation = (
+            pb.Validate(data=tbl, thresholds=pb.Thresholds(warn_at=0.1))
+            .col_vals_gt(columns="a", value=9)
+            .col_vals_gt(columns="a", value=1000)
+            .interrogate(test_sample_n=1000)
+        )
+
+        validation.f_failed_ci()
+        ```
+        """
+        result = self._get_validation_dict(i, "f_failed_ci")
+        if scalar and isinstance(i, int):
+            return result[i]
+        return result
+
     def warn(
         self, i: int | list[int] | None = None, scalar: bool = False
     ) -> dict[int, bool] | bool:
@@ -6049,6 +6705,15 @@ class Validate:
             if validation.assertion_type in ROW_BASED_VALIDATION_TYPES and validation.active
         ]
 
+        # After an incremental interrogation, the steps that were merged with the state of the
+        # previous run don't have results for every row
+        if any(validation.i in self._incremental_merged_steps for validation in validation_info):
+            raise ValueError(
+                "The data can't be sundered after an incremental interrogation (with "
+                "`incremental_state=`) since the results of the steps only cover the new rows. "
+                "Interrogate without `incremental_state=` to sunder the data."
+            )
+
         # TODO: ensure that the stored evaluation tables across all steps have not been mutated
         # from the original table (via any `pre=` functions)
 
@@ -6062,51 +6727,50 @@ class Validate:
             if type == "fail":
                 return self.data[0:0]
 
-        # Get an indexed version of the data
-        # TODO: add argument for user to specify the index column name
-        index_name = "pb_index_"
+        # Rather than joining the checked tables of the steps, combine the steps' results into a
+        # single mask (or, for Ibis tables, a single predicate) and filter the table once; a row
+        # passes if it passed every step and fails if it failed at least one step
+        if self._get_tbl_context().tbl_type in IBIS_BACKENDS:
 
-        data_nw = nw.from_native(self.data).with_row_index(name=index_name)
+            import ibis
 
-        # Get all validation step result tables and join together the `pb_is_good_` columns
-        # ensuring that the columns are named uniquely (e.g., `pb_is_good_1`, `pb_is_good_2`, ...)
-        # and that the index is reset
-        for i, validation in enumerate(validation_info):
+            predicates = [
+                _get_ibis_base_predicate(
+                    tbl_checked=validation.tbl_checked, base_tbl=self.data, i=validation.i
+                )
+                for validation in validation_info
+            ]
 
-            results_tbl = nw.from_native(validation.tbl_checked)
+            # If the results of any step can't be inlined as a predicate on the target table
+            # (its expression has a structure that isn't supported), the checked tables are
+            # joined to the target table instead
+            if any(predicate is None for predicate in predicates):
+                return _get_ibis_sundered_data_by_join(
+                    base_tbl=self.data, validation_info=validation_info, type=type
+                )
 
-            # Add row numbers to the results table
-            results_tbl = results_tbl.with_row_index(name=index_name)
+            predicate = ibis.and_(*predicates)
 
-            # Add numerical suffix to the `pb_is_good_` column to make it unique
-            results_tbl = results_tbl.select([index_name, "pb_is_good_"]).rename(
-                {"pb_is_good_": f"pb_is_good_{i}"}
-            )
+            return self.data.filter(predicate if type == "pass" else ~predicate)
 
-            # Add the results table to the list of tables
-            if i == 0:
-                labeled_tbl_nw = results_tbl
-            else:
-                labeled_tbl_nw = labeled_tbl_nw.join(results_tbl, on=index_name, how="left")
+        mask = self._get_sundering_mask(validation_info=validation_info, type=type)
 
-        # Get list of columns that are the `pb_is_good_` columns
-        pb_is_good_cols = [f"pb_is_good_{i}" for i in range(len(validation_steps_i))]
+        data_nw = nw.from_native(self.data)
 
-        # Determine the rows that passed all validation steps by checking if all `pb_is_good_`
-        # columns are `True`
-        labeled_tbl_nw = (
-            labeled_tbl_nw.with_columns(pb_is_good_all=nw.all_horizontal(pb_is_good_cols))
-            .join(data_nw, on=index_name, how="left")
-            .drop(index_name)
-        )
+        if isinstance(data_nw, nw.LazyFrame):
 
-        bool_val = True if type == "pass" else False
+            import polars as pl
 
-        sundered_tbl = (
-            labeled_tbl_nw.filter(nw.col("pb_is_good_all") == bool_val)
-            .drop(pb_is_good_cols + ["pb_is_good_all"])
-            .to_native()
-        )
+            return self.data.filter(pl.lit(pl.Series(mask)))
+
+        sundered_tbl = data_nw.filter(
+            nw.new_series(
+                "pb_is_good_all",
+                mask,
+                nw.Boolean,
+                backend=nw.get_native_namespace(data_nw),
+            )
+        ).to_native()
 
         return sundered_tbl
 
@@ -6200,7 +6864,7 @@ class Validate:
         df_lib = _select_df_lib(preference="polars")
 
         # Get information on the input data table
-        tbl_info = _get_tbl_type(data=self.data)
+        tbl_info = self._get_tbl_context().tbl_type
 
         # Get the thresholds object
         thresholds = self.thresholds
@@ -6432,7 +7096,10 @@ class Validate:
             # If the assertion type is a comparison of a set of values; strip the leading and
             # trailing square brackets and single quotes
             elif assertion_type[i] in ["col_vals_in_set", "col_vals_not_in_set"]:
-                values_upd.append(str(value)[1:-1].replace("'", ""))
+                if isinstance(value, _ReferenceSet):
+                    values_upd.append(str(value).replace("'", ""))
+                else:
+                    values_upd.append(str(value)[1:-1].replace("'", ""))
 
             # Certain assertion types don't have an associated value, so use an em dash for those
             elif assertion_type[i] in [
@@ -7026,13 +7693,14 @@ class Validate:
         # Get the `val_info` dictionary for the step
         val_info = self.validation_info[i - 1].val_info
 
-        # Get the column position in the table
+        # Get the column position in the table (the column names are resolved once from the
+        # table's schema, which avoids resolving the schema of a LazyFrame for each column)
         if column is not None:
+            column_list = self._get_tbl_context().get_column_names()
             if isinstance(column, str):
-                column_list = list(self.data.columns)
                 column_position = column_list.index(column) + 1
             elif isinstance(column, list):
-                column_position = [list(self.data.columns).index(col) + 1 for col in column]
+                column_position = [column_list.index(col) + 1 for col in column]
             else:
                 column_position = None
         else:
@@ -7096,407 +7764,3430 @@ class Validate:
 
         return step_report
 
-    def _add_validation(self, validation_info):
+    def _interrogate_step(
+        self,
+        validation: _ValidationInfo,
+        data_tbl: FrameT | Any,
+        tbl_type: str,
+        fused_results: dict[int, dict[str, Any]],
+        collect_extracts: bool,
+        collect_tbl_checked: bool,
+        get_first_n: int | None,
+        sample_n: int | None,
+        sample_frac: int | float | None,
+        sample_limit: int,
+        extract_columns: list[str] | None = None,
+        pre_cache: _PreProcessingCache | None = None,
+        stop_tracker: _FirstStopTracker | None = None,
+    ):
         """
-        Add a validation to the list of validations.
+        Interrogate a single validation step and store its results.
+
+        This evaluates the step (or takes its results from `fused_results=`, if the step was part
+        of a fused plan), determines the threshold levels that were exceeded, collects the
+        extract of failing rows, and records the time of processing. Only the step's own
+        `_ValidationInfo` object is modified, so steps can be interrogated concurrently.
 
         Parameters
         ----------
-        validation_info
-            Information about the validation to add.
+        validation
+            The validation step to interrogate.
+        data_tbl
+            The target table.
+        tbl_type
+            The type of the target table.
+        fused_results
+            The results of the steps that were evaluated ahead of time (as part of fused plans or
+            on random samples), keyed by the `id()` of the steps' `_ValidationInfo` objects.
+        collect_extracts, collect_tbl_checked, get_first_n, sample_n, sample_frac, sample_limit
+            The options of the same name in `interrogate()`.
+        extract_columns
+            The option of the same name in `interrogate()`, as a list of column names.
+        pre_cache
+            The cache of pre-processed tables for the interrogation (if any).
+        stop_tracker
+            The tracker of the first step that exceeded its `stop` threshold, used when
+            interrogating with `stop_on_first_stop=True`.
         """
 
-        # Get the largest value of `i_o` in the `validation_info`
-        max_i_o = max([validation.i_o for validation in self.validation_info], default=0)
+        start_time = datetime.datetime.now(datetime.timezone.utc)
 
-        # Set the `i_o` attribute to the largest value of `i_o` plus 1
-        validation_info.i_o = max_i_o + 1
-
-        self.validation_info.append(validation_info)
+        # Skip the validation step if it is not active but still record the time of processing
+        if not validation.active:
+            end_time = datetime.datetime.now(datetime.timezone.utc)
+            validation.proc_duration_s = (end_time - start_time).total_seconds()
+            validation.time_processed = end_time.isoformat(timespec="milliseconds")
+            return
 
-        return self
+        # Skip the validation step if `eval_error` is `True` and record the time of processing
+        if validation.eval_error:
+            end_time = datetime.datetime.now(datetime.timezone.utc)
+            validation.proc_duration_s = (end_time - start_time).total_seconds()
+            validation.time_processed = end_time.isoformat(timespec="milliseconds")
+            validation.active = False
+            return
 
-    def _evaluate_column_exprs(self, validation_info):
-        """
-        Evaluate any column expressions stored in the `column` attribute and expand those validation
-        steps into multiple. Errors in evaluation (such as no columns matched) will be caught and
-        recorded in the `eval_error` attribute.
+        # Skip the validation step if an earlier step has exceeded its `stop` threshold
+        if stop_tracker is not None and stop_tracker.should_skip(validation):
+            _set_step_not_evaluated(validation=validation)
+            end_time = datetime.datetime.now(datetime.timezone.utc)
+            validation.proc_duration_s = (end_time - start_time).total_seconds()
+            validation.time_processed = end_time.isoformat(timespec="milliseconds")
+            return
 
-        Parameters
-        ----------
-        validation_info
-            Information about the validation to evaluate and expand.
-        """
+        assertion_type = validation.assertion_type
 
-        # Create a list to store the expanded validation steps
-        expanded_validation_info = []
+        if id(validation) in fused_results:
 
-        # Iterate over the validation steps
-        for i, validation in enumerate(validation_info):
+            # The test units for this step were already evaluated as part of a fused plan
+            fused_res = fused_results[id(validation)]
 
-            # Get the column expression
-            column_expr = validation.column
+            validation.all_passed = fused_res["all_passed"]
+            validation.n = fused_res["n"]
+            validation.n_passed = fused_res["n_passed"]
+            validation.n_failed = fused_res["n_failed"]
+            validation.n_sampled = fused_res.get("n_sampled")
+            validation.f_failed_ci = fused_res.get("f_failed_ci")
 
-            # If the value is not a Column object, then skip the evaluation and append
-            # the validation step to the list of expanded validation steps
-            if not isinstance(column_expr, Column):
-                expanded_validation_info.append(validation)
-                continue
+            results_tbl = fused_res["tbl_checked"]
+            tbl_step = fused_res.get("tbl_step")
+            checked_rows = fused_res.get("checked_rows")
+            failing_rows = fused_res.get("failing_rows")
 
-            # Evaluate the column expression
-            try:
+        else:
 
-                # Get the table for this step, it can either be:
-                # 1. the target table itself
-                # 2. the target table modified by a `pre` attribute
+            validation.n_sampled = None
+            validation.f_failed_ci = None
 
-                if validation.pre is None:
-                    table = self.data
-                else:
-                    table = validation.pre(self.data)
+            results_tbl, tbl_step = self._evaluate_step(
+                validation=validation, data_tbl=data_tbl, tbl_type=tbl_type, pre_cache=pre_cache
+            )
+            checked_rows = None
+            failing_rows = None
+
+        # Calculate the fractions of passing and failing test units and determine the threshold
+        # levels that were exceeded
+        _set_fractions_and_threshold_levels(validation=validation)
+
+        if stop_tracker is not None:
+            stop_tracker.record(validation)
+
+        # Keep the results of the `pb_is_good_` column, a boolean column that indicates whether
+        # the row passed the validation or not; for tables that hold data, these are packed into
+        # bitmaps (the checked table is rebuilt from the target table when needed) whereas lazy
+        # tables are kept as they are (since they only hold a query)
+        validation.tbl_checked = None
+        validation.checked_rows = None
+
+        if collect_tbl_checked and checked_rows is not None:
+            validation.checked_rows = checked_rows
+        elif collect_tbl_checked and results_tbl is not None:
+            if is_polars_dataframe(results_tbl) or is_pandas_dataframe(results_tbl):
+                validation.checked_rows = _CheckedRows.from_results_tbl(results_tbl=results_tbl)
+            else:
+                validation.tbl_checked = results_tbl
 
-                # Get the columns from the table as a list
-                columns = list(table.columns)
+        # A step without any failing test units has an empty extract, which is taken from the first
+        # zero rows of a lazy results table so that its query doesn't go over the whole table
+        if (
+            results_tbl is not None
+            and validation.n_failed == 0
+            and (is_polars_lazyframe(results_tbl) or tbl_type in IBIS_BACKENDS)
+        ):
+            extract_tbl = results_tbl.head(0)
+        else:
+            extract_tbl = results_tbl
 
-                # Evaluate the column expression
-                if isinstance(column_expr, ColumnSelectorNarwhals):
-                    columns_resolved = ColumnSelectorNarwhals(column_expr).resolve(table=table)
-                else:
-                    columns_resolved = column_expr.resolve(columns=columns, table=table)
+        # If this is a row-based validation step, then extract the rows that failed
+        if (
+            collect_extracts
+            and assertion_type in ROW_BASED_VALIDATION_TYPES
+            and tbl_type in IBIS_BACKENDS
+            and results_tbl is not None
+        ):
 
-            except Exception:  # pragma: no cover
-                validation.eval_error = True
+            # For Ibis tables, the extract is obtained with a query that selects the failing rows
+            # (and applies any sampling or limiting) in the backend so that only the extracted
+            # rows are fetched
+            validation.extract = _get_ibis_failing_rows(
+                results_tbl=extract_tbl,
+                get_first_n=get_first_n,
+                sample_n=sample_n,
+                sample_frac=sample_frac,
+                sample_limit=sample_limit,
+                columns=_get_extract_columns(
+                    validation=validation, extract_columns=extract_columns
+                ),
+            )
 
-            # If no columns were resolved, then create a patched validation step with the
-            # `eval_error` and `column` attributes set
-            if not columns_resolved:
-                validation.eval_error = True
-                validation.column = str(column_expr)
+        elif (
+            collect_extracts
+            and assertion_type in ROW_BASED_VALIDATION_TYPES
+            and results_tbl is not None
+        ):
 
-                expanded_validation_info.append(validation)
-                continue
+            # Get the failing rows along with their row numbers (unless they were already
+            # obtained when evaluating the step)
+            if failing_rows is not None:
+                validation_extract_nw = failing_rows
+            else:
+                validation_extract_nw = _get_failing_rows(
+                    results_tbl=extract_tbl,
+                    source_tbl=tbl_step,
+                    columns=_get_extract_columns(
+                        validation=validation, extract_columns=extract_columns
+                    ),
+                )
 
-            # For each column resolved, create a new validation step and add it to the list of
-            # expanded validation steps
-            for column in columns_resolved:
+            # Apply any sampling or limiting to the number of rows to extract
+            if get_first_n is not None:
+                validation_extract_nw = validation_extract_nw.head(get_first_n)
+            elif sample_n is not None:
+                validation_extract_nw = validation_extract_nw.sample(n=sample_n)
+            elif sample_frac is not None:
+                validation_extract_nw = validation_extract_nw.sample(fraction=sample_frac)
 
-                new_validation = copy.deepcopy(validation)
+                # Ensure a limit is set on the number of rows to extract
+                if len(validation_extract_nw) > sample_limit:
+                    validation_extract_nw = validation_extract_nw.head(sample_limit)
 
-                new_validation.column = column
+            validation.extract = nw.to_native(validation_extract_nw)
 
-                expanded_validation_info.append(new_validation)
+        # Get the end time for this step
+        end_time = datetime.datetime.now(datetime.timezone.utc)
 
-        # Replace the `validation_info` attribute with the expanded version
-        self.validation_info = expanded_validation_info
+        # Calculate the duration of processing for this step
+        validation.proc_duration_s = (end_time - start_time).total_seconds()
 
-        return self
+        # Set the time of processing for this step, this should be UTC time is ISO 8601 format
+        validation.time_processed = end_time.isoformat(timespec="milliseconds")
 
-    def _get_validation_dict(self, i: int | list[int] | None, attr: str) -> dict[int, int]:
+    def _interrogate_steps_in_processes(
+        self, steps: list[_ValidationInfo], workers: int, step_kwargs: dict[str, Any]
+    ):
         """
-        Utility function to get a dictionary of validation attributes for each validation step.
+        Interrogate the validation steps of a Pandas table in a pool of worker processes.
+
+        The target table is exported once to an uncompressed Arrow IPC file that the worker
+        processes memory-map and wrap in Arrow-backed Pandas columns, so the table is neither
+        pickled nor copied into each worker. Each worker process interrogates its share of the
+        steps and sends back only the step results (with the packed `pb_is_good_` values, when the
+        checked tables are collected) and the row numbers of the extracted rows; the extracts are
+        then rebuilt from the target table. Steps that can't be sent to a worker process (those
+        with a `pre=` function, those already evaluated in a fused plan, inactive steps, steps
+        whose results depend on the column data types, and steps that can't be pickled) are
+        interrogated in the main process.
 
         Parameters
         ----------
-        i
-            The validation step number(s) from which the attribute values are obtained.
-            If `None`, all steps are included.
-        attr
-            The attribute name to retrieve from each validation step.
-
-        Returns
-        -------
-        dict[int, int]
-            A dictionary of the attribute values for each validation step.
+        steps
+            The validation steps to interrogate.
+        workers
+            The number of worker processes.
+        step_kwargs
+            The keyword arguments for `_interrogate_step()`.
         """
-        if isinstance(i, int):
-            i = [i]
 
-        if i is None:
-            return {validation.i: getattr(validation, attr) for validation in self.validation_info}
+        if not _is_lib_present(lib_name="pyarrow"):
+            raise ImportError(
+                "The PyArrow library is not installed but is required when specifying "
+                '`worker_type="process"`.'
+            )
 
-        return {
-            validation.i: getattr(validation, attr)
-            for validation in self.validation_info
-            if validation.i in i
-        }
+        import pyarrow as pa
 
+        data_tbl = step_kwargs["data_tbl"]
 
-def _validation_info_as_dict(validation_info: _ValidationInfo) -> dict:
-    """
-    Convert a `_ValidationInfo` object to a dictionary.
+        process_steps = []
+        main_steps = []
 
-    Parameters
-    ----------
-    validation_info
-        The `_ValidationInfo` object to convert to a dictionary.
+        for validation in steps:
 
-    Returns
-    -------
-    dict
-        A dictionary representing the `_ValidationInfo` object.
-    """
+            if (
+                validation.active
+                and not validation.eval_error
+                and validation.pre is None
+                and validation.assertion_type not in DTYPE_DEPENDENT_VALIDATION_TYPES
+                and id(validation) not in step_kwargs["fused_results"]
+            ):
 
-    # Define the fields to include in the validation information
-    validation_info_fields = [
-        "i",
-        "assertion_type",
-        "column",
-        "values",
-        "inclusive",
-        "na_pass",
-        "pre",
-        "label",
-        "brief",
-        "active",
-        "eval_error",
-        "all_passed",
-        "n",
-        "n_passed",
-        "n_failed",
-        "f_passed",
-        "f_failed",
-        "warn",
-        "stop",
-        "notify",
-        "extract",
-        "proc_duration_s",
-    ]
+                # Send a copy of the step without any results from a previous interrogation
+                validation_copy = copy.copy(validation)
+                validation_copy.tbl_checked = None
+                validation_copy.checked_rows = None
+                validation_copy.extract = None
 
-    # Filter the validation information to include only the selected fields
-    validation_info_filtered = [
-        {field: getattr(validation, field) for field in validation_info_fields}
-        for validation in validation_info
-    ]
+                try:
+                    pickle.dumps(validation_copy)
+                except Exception:
+                    main_steps.append(validation)
+                    continue
 
-    # Transform the validation information into a dictionary of lists so that it
-    # can be used to create a DataFrame
-    validation_info_dict = {field: [] for field in validation_info_fields}
+                process_steps.append((validation, validation_copy))
 
-    for validation in validation_info_filtered:
-        for field in validation_info_fields:
-            validation_info_dict[field].append(validation[field])
+            else:
+                main_steps.append(validation)
 
-    return validation_info_dict
+        # Not every Pandas table can be represented in Arrow (e.g., when there are object columns
+        # with mixed types), so fall back to interrogating all steps in the main process
+        try:
+            arrow_tbl = pa.Table.from_pandas(data_tbl, preserve_index=False)
+        except pa.ArrowException:
+            process_steps = []
+            main_steps = steps
+
+        if not process_steps:
+            for validation in main_steps:
+                self._interrogate_step(validation=validation, **step_kwargs)
+            return
+
+        # Options for `_interrogate_step()` that are shared by all steps in the worker processes
+        process_kwargs = {
+            k: v
+            for k, v in step_kwargs.items()
+            if k not in ["data_tbl", "tbl_type", "fused_results", "pre_cache", "stop_tracker"]
+        }
 
+        # Distribute the steps across the workers in a round-robin fashion
+        chunks = [process_steps[k::workers] for k in range(workers)]
+        chunks = [chunk for chunk in chunks if chunk]
 
-def _get_assertion_icon(icon: list[str], length_val: int = 30) -> list[str]:
+        with tempfile.TemporaryDirectory() as tmp_dir:
 
-    # For each icon, get the assertion icon SVG test from SVG_ICONS_FOR_ASSERTION_TYPES dictionary
-    icon_svg = [SVG_ICONS_FOR_ASSERTION_TYPES.get(icon) for icon in icon]
+            ipc_path = os.path.join(tmp_dir, "data.arrow")
 
-    # Replace the width and height in the SVG string
-    for i in range(len(icon_svg)):
-        icon_svg[i] = _replace_svg_dimensions(icon_svg[i], height_width=length_val)
+            with pa.OSFile(ipc_path, "wb") as sink:
+                with pa.ipc.new_file(sink, arrow_tbl.schema) as writer:
+                    writer.write_table(arrow_tbl)
 
-    return icon_svg
+            # Worker processes are spawned (rather than forked) since forking a process that has
+            # already started the thread pools of Polars or Arrow can deadlock
+            with ProcessPoolExecutor(
+                max_workers=len(chunks), mp_context=multiprocessing.get_context("spawn")
+            ) as executor:
 
+                futures = [
+                    executor.submit(
+                        _interrogate_steps_in_process,
+                        ipc_path,
+                        [validation_copy for _, validation_copy in chunk],
+                        process_kwargs,
+                    )
+                    for chunk in chunks
+                ]
 
-def _replace_svg_dimensions(svg: list[str], height_width: int | float) -> list[str]:
+                # Use the main process for the steps that stay here while the workers run
+                for validation in main_steps:
+                    self._interrogate_step(validation=validation, **step_kwargs)
 
-    svg = re.sub(r'width="[0-9]*?px', f'width="{height_width}px', svg)
-    svg = re.sub(r'height="[0-9]*?px', f'height="{height_width}px', svg)
+                for chunk, future in zip(chunks, futures):
 
-    return svg
+                    for (validation, _), step_res in zip(chunk, future.result()):
 
+                        for attr, value in step_res["attrs"].items():
+                            setattr(validation, attr, value)
 
-def _get_title_text(title: str | None, tbl_name: str | None, interrogation_performed: bool) -> str:
+                        if step_res["extract_rows"] is not None:
 
-    title = _process_title_text(title=title, tbl_name=tbl_name)
+                            # Rebuild the extract in the same form as the one obtained through
+                            # Narwhals: 1-indexed row numbers as the first column
+                            extract_rows = step_res["extract_rows"]
 
-    if interrogation_performed:
-        return title
+                            extract = data_tbl.iloc[extract_rows][
+                                step_res["extract_columns"]
+                            ].copy()
+                            extract.insert(0, "_row_num_", extract_rows + 1)
 
-    html_str = (
-        "<div>"
-        '<span style="float: left;">'
-        f"{title}"
-        "</span>"
-        '<span style="float: right; text-decoration-line: underline; '
-        "text-underline-position: under;"
-        "font-size: 16px; text-decoration-color: #9C2E83;"
+                            validation.extract = extract
+
+    def _interrogate_in_batches(
+        self,
+        steps: list[_ValidationInfo],
+        data_tbl: FrameT | Any,
+        tbl_type: str,
+        batch_size: int,
+        collect_extracts: bool,
+        get_first_n: int | None,
+        sample_n: int | None,
+        sample_frac: int | float | None,
+        sample_limit: int,
+        extract_columns: list[str] | None = None,
+    ):
+        """
+        Interrogate the validation steps over batches of rows from the target table.
+
+        Only one batch of rows is held in memory at a time (see `_iter_row_batches()`): every step
+        is evaluated on each batch and the counts of test units are merged across batches. The
+        steps must be ones that can be evaluated batch by batch (see `_is_batchable_step()`), so
+        that the merge is exact for the row-based steps and for `col_vals_expr()`. For
+        `rows_distinct()`, the number of occurrences of each distinct row (or portion thereof) is
+        accumulated across batches so that duplicates in different batches are found. For
+        `row_count_match()`, the row counts of the batches are added up. The steps that check the
+        table's structure (`col_exists()`, `col_schema_match()`, and `col_count_match()`) are
+        evaluated on the first batch only. Extracts keep the row numbers of the failing rows in the
+        whole table.
+
+        Parameters
+        ----------
+        steps
+            The validation steps to interrogate.
+        data_tbl
+            The target table.
+        tbl_type
+            The type of the target table.
+        batch_size
+            The number of rows in each batch.
+        collect_extracts, get_first_n, sample_n, sample_frac, sample_limit
+            The options of the same name in `interrogate()`.
+        extract_columns
+            The option of the same name in `interrogate()`, as a list of column names.
+        """
+
+        structural_types = ["col_exists", "col_schema_match", "col_count_match"]
+
+        active_steps = []
+
+        for validation in steps:
+
+            start_time = datetime.datetime.now(datetime.timezone.utc)
+
+            # Skip the validation step if it is not active (or if `eval_error` is `True`) but
+            # still record the time of processing
+            if not validation.active or validation.eval_error:
+                end_time = datetime.datetime.now(datetime.timezone.utc)
+                validation.proc_duration_s = (end_time - start_time).total_seconds()
+                validation.time_processed = end_time.isoformat(timespec="milliseconds")
+                validation.active = False
+                continue
+
+            active_steps.append(validation)
+
+        # For each step: the accumulated counts, processing time, and extract; for
+        # `rows_distinct()` steps, the numbers of occurrences of the distinct rows
+        step_n = {id(validation): 0 for validation in active_steps}
+        step_n_passed = {id(validation): 0 for validation in active_steps}
+        step_n_failed = {id(validation): 0 for validation in active_steps}
+        step_duration_s = {id(validation): 0.0 for validation in active_steps}
+        step_extract = {}
+        step_row_counts = {}
+
+        for row_offset, batch in _iter_row_batches(data_tbl=data_tbl, batch_size=batch_size):
+
+            is_first_batch = row_offset == 0
+
+            # The column types are the same in every batch, so the type checks are only made on the
+            # first batch (this also avoids inferring the type of a Pandas object column from only
+            # a few values)
+            pre_cache = _PreProcessingCache(data_tbl=batch)
+
+            if not is_first_batch:
+                pre_cache.dtype_checks = dtype_checks
+
+            dtype_checks = pre_cache.dtype_checks
+
+            # Evaluate all eligible row-based steps for this batch in a single pass
+            fused_start_time = datetime.datetime.now(datetime.timezone.utc)
+
+            fused_results = self._evaluate_fused_steps(
+                data_tbl=batch,
+                collect_tbl_checked=collect_extracts,
+                collect_extracts=collect_extracts,
+                extract_columns=extract_columns,
+                pre_cache=pre_cache,
+            )
+
+            fused_end_time = datetime.datetime.now(datetime.timezone.utc)
+
+            # The time taken by the fused plans is shared equally by the steps within them
+            if fused_results:
+                fused_duration_s = (fused_end_time - fused_start_time).total_seconds() / len(
+                    fused_results
+                )
+
+            for validation in active_steps:
+
+                key = id(validation)
+                assertion_type = validation.assertion_type
+
+                # Structural checks only need to be made on the first batch
+                if assertion_type in structural_types and not is_first_batch:
+                    continue
+
+                start_time = datetime.datetime.now(datetime.timezone.utc)
+
+                results_tbl = None
+                batch_step = None
+
+                if key in fused_results:
+
+                    fused_res = fused_results[key]
+
+                    n, n_passed, n_failed = (
+                        fused_res["n"],
+                        fused_res["n_passed"],
+                        fused_res["n_failed"],
+                    )
+                    results_tbl = fused_res["tbl_checked"]
+                    batch_step = fused_res["tbl_step"]
+
+                    step_duration_s[key] += fused_duration_s
+
+                elif assertion_type == "rows_distinct":
+
+                    batch_step = nw.from_native(pre_cache.get_tbl(validation.pre))
+
+                    columns_subset = validation.column
+
+                    if columns_subset is None:
+                        columns_subset = batch_step.collect_schema().names()
+
+                    # Count the occurrences of each distinct row in this batch and merge them with
+                    # the counts from the previous batches
+                    row_counts = batch_step.group_by(columns_subset).agg(
+                        nw.len().alias("pb_count_")
+                    )
+
+                    if key in step_row_counts:
+                        row_counts = (
+                            nw.concat([step_row_counts[key], row_counts], how="vertical")
+                            .group_by(columns_subset)
+                            .agg(nw.col("pb_count_").sum())
+                        )
+
+                    step_row_counts[key] = row_counts
+
+                    # The test units are counted once all batches have been processed
+                    n, n_passed, n_failed = 0, 0, 0
+
+                elif assertion_type == "row_count_match":
+
+                    n_rows = get_row_count(pre_cache.get_tbl(validation.pre))
+
+                    step_row_counts[key] = step_row_counts.get(key, 0) + n_rows
+
+                    # The single test unit is evaluated once all batches have been processed
+                    n, n_passed, n_failed = 0, 0, 0
+
+                else:
+
+                    results_tbl, batch_step = self._evaluate_step(
+                        validation=validation,
+                        data_tbl=batch,
+                        tbl_type=tbl_type,
+                        pre_cache=pre_cache,
+                    )
+
+                    n, n_passed, n_failed = validation.n, validation.n_passed, validation.n_failed
+
+                    # Only keep the extracts of row-based steps
+                    if assertion_type not in ROW_BASED_VALIDATION_TYPES:
+                        results_tbl = None
+
+                step_n[key] += n
+                step_n_passed[key] += n_passed
+                step_n_failed[key] += n_failed
+
+                # Once the first `n` failing rows have been collected, there's no need to look at
+                # the failing rows of later batches
+                if (
+                    get_first_n is not None
+                    and key in step_extract
+                    and len(step_extract[key]) >= get_first_n
+                ):
+                    results_tbl = None
+
+                # Add the failing rows of this batch to the step's extract
+                if (
+                    collect_extracts
+                    and results_tbl is not None
+                    and assertion_type in ROW_BASED_VALIDATION_TYPES
+                ):
+
+                    step_extract[key] = _merge_batch_extracts(
+                        extract_nw=step_extract.get(key),
+                        batch_extract_nw=_get_failing_rows(
+                            results_tbl=results_tbl,
+                            row_offset=row_offset,
+                            source_tbl=batch_step,
+                            columns=_get_extract_columns(
+                                validation=validation, extract_columns=extract_columns
+                            ),
+                        ),
+                        get_first_n=get_first_n,
+                        sample_n=sample_n,
+                        sample_frac=sample_frac,
+                        sample_limit=sample_limit,
+                    )
+
+                end_time = datetime.datetime.now(datetime.timezone.utc)
+
+                step_duration_s[key] += (end_time - start_time).total_seconds()
+
+        for validation in active_steps:
+
+            key = id(validation)
+
+            validation.n = step_n[key]
+            validation.n_passed = step_n_passed[key]
+            validation.n_failed = step_n_failed[key]
+            validation.all_passed = validation.n_passed == validation.n
+
+            if validation.assertion_type == "rows_distinct":
+
+                # The rows that occur more than once in the whole table are the failing test units
+                row_counts = step_row_counts[key]
+
+                validation.n = int(row_counts["pb_count_"].sum())
+                validation.n_failed = int(
+                    row_counts.filter(nw.col("pb_count_") > 1)["pb_count_"].sum()
+                )
+                validation.n_passed = validation.n - validation.n_failed
+                validation.all_passed = validation.n_failed == 0
+
+            if validation.assertion_type == "row_count_match":
+
+                count = validation.values["count"]
+                n_rows = step_row_counts[key]
+
+                result_bool = (
+                    n_rows == count if not validation.values["inverse"] else n_rows != count
+                )
+
+                validation.all_passed = result_bool
+                validation.n = 1
+                validation.n_passed = int(result_bool)
+                validation.n_failed = 1 - result_bool
+
+            _set_fractions_and_threshold_levels(validation=validation)
+
+            if key in step_extract:
+
+                extract_nw = step_extract[key]
+
+                # Remove the keys used for sampling rows across batches
+                if "pb_sample_key_" in extract_nw.columns:
+                    extract_nw = extract_nw.drop("pb_sample_key_")
+
+                validation.extract = nw.to_native(extract_nw)
+
+            end_time = datetime.datetime.now(datetime.timezone.utc)
+
+            validation.proc_duration_s = step_duration_s[key]
+            validation.time_processed = end_time.isoformat(timespec="milliseconds")
+
+    def _update_incremental_state(
+        self,
+        full_data_tbl: FrameT | Any,
+        n_new_rows: int,
+        watermark_col: str,
+        incremental_state: dict[str, Any] | None,
+        step_kwargs: dict[str, Any],
+    ):
+        """
+        Merge the results for the new rows with the state of the previous incremental run.
+
+        The results of each step (which were obtained on the rows after the previous watermark)
+        are combined with the step's state from the previous run, and the threshold levels are
+        determined from the cumulative counts. Steps without a matching state from the previous
+        run (i.e., new or changed steps) are evaluated on the whole table. The new state is stored
+        in the `incremental_state` attribute.
+
+        Parameters
+        ----------
+        full_data_tbl
+            The whole target table.
+        n_new_rows
+            The number of rows after the previous watermark.
+        watermark_col
+            The name of the watermark column.
+        incremental_state
+            The state from the previous run (if any).
+        step_kwargs
+            The keyword arguments for `_interrogate_step()` that were used for the new rows.
+        """
+
+        tbl_type = step_kwargs["tbl_type"]
+        new_pre_cache = step_kwargs["pre_cache"]
+
+        if incremental_state is None:
+            full_pre_cache = new_pre_cache
+            prior_steps = {}
+        else:
+            full_pre_cache = _PreProcessingCache(data_tbl=full_data_tbl)
+            prior_steps = incremental_state["steps"]
+
+        steps_state = {}
+
+        # The positions of the new rows in the whole table (found when first needed)
+        new_row_positions = None
+
+        # The row hashes of `rows_distinct()` steps can only be merged with hashes obtained in the
+        # same way
+        row_hash_method = _get_row_hash_method(tbl=full_data_tbl, tbl_type=tbl_type)
+
+        for validation in self.validation_info:
+
+            if not validation.active or validation.eval_error:
+                continue
+
+            key = _get_step_state_key(validation=validation)
+
+            if validation.assertion_type == "rows_distinct":
+                key = f"{key}:{row_hash_method}"
+
+            prior_step = prior_steps.get(validation.i)
+
+            # The results of steps whose handling of missing values depends on the whole table
+            # can't be merged across runs
+            if validation.assertion_type in ROW_BASED_VALIDATION_TYPES and (
+                _has_table_dependent_null_handling(
+                    assertion_method=ASSERTION_TYPE_METHOD_MAP[validation.assertion_type],
+                    values=validation.values,
+                )
+            ):
+                prior_step = None
+
+            if prior_step is not None and prior_step["key"] == key:
+
+                step_state = _merge_step_state(
+                    validation=validation,
+                    prior_step=prior_step,
+                    tbl_step=new_pre_cache.get_tbl(validation.pre) if n_new_rows > 0 else None,
+                    tbl_type=tbl_type,
+                )
+
+                self._incremental_merged_steps.append(validation.i)
+
+                # The step's results for the new rows can't be matched by position to the rows
+                # of the whole table, so the checked table is dropped and the row numbers of the
+                # extract are made to refer to the whole table (an extract of a step with a
+                # `pre=` function, or of a `rows_distinct()` step, can't be fixed in this way)
+                if n_new_rows > 0:
+
+                    validation.tbl_checked = None
+                    validation.checked_rows = None
+
+                    if validation.pre is not None or validation.assertion_type == "rows_distinct":
+                        validation.extract = None
+
+                    elif validation.extract is not None:
+
+                        if new_row_positions is None:
+                            new_row_positions = _get_row_positions_after_watermark(
+                                data_tbl=full_data_tbl,
+                                tbl_type=tbl_type,
+                                column=watermark_col,
+                                watermark=incremental_state["watermark"],
+                            )
+
+                        validation.extract = _offset_extract_row_numbers(
+                            extract=validation.extract, row_positions=new_row_positions
+                        )
+
+            else:
+
+                # A step without any state from the previous run is evaluated on the whole table
+                if incremental_state is not None:
+                    self._interrogate_step(
+                        validation=validation,
+                        **{
+                            **step_kwargs,
+                            "data_tbl": full_data_tbl,
+                            "fused_results": {},
+                            "pre_cache": full_pre_cache,
+                        },
+                    )
+
+                step_state = _get_step_state(
+                    validation=validation,
+                    tbl_step=full_pre_cache.get_tbl(validation.pre),
+                    tbl_type=tbl_type,
+                )
+
+            step_state["key"] = key
+
+            steps_state[validation.i] = step_state
+
+        # The watermark only advances if there are new rows
+        if n_new_rows > 0:
+            watermark = _get_column_max(
+                data_tbl=step_kwargs["data_tbl"], tbl_type=tbl_type, column=watermark_col
+            )
+        else:
+            watermark = None if incremental_state is None else incremental_state["watermark"]
+
+        self.incremental_state = {
+            "watermark_col": watermark_col,
+            "watermark": watermark,
+            "steps": steps_state,
+        }
+
+    def _evaluate_steps_on_statistics(
+        self, pre_cache: _PreProcessingCache
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Find the row-based validation steps that pass for every row from column statistics.
+
+        The minimum and maximum values and the counts of missing values of the columns checked by
+        eligible steps are computed with one aggregation per table (the target table after any
+        `pre=` function is applied; the statistics are cached in the table's context). Each step
+        is then checked against the statistics of its column with `_is_row_check_passed_by_stats()`
+        and the steps that pass for every row get their results here, so that they aren't
+        evaluated row by row. Their checked tables are made to match those of an evaluation: all
+        rows pass and the extracts are empty.
+
+        Parameters
+        ----------
+        pre_cache
+            The cache of pre-processed tables for the interrogation.
+
+        Returns
+        -------
+        dict[int, dict[str, Any]]
+            A dictionary of results for each step that passes for every row, keyed by the `id()`
+            of the step's `_ValidationInfo` object.
+        """
+
+        # Group the eligible steps by their pre-processing function
+        step_groups = {}
+
+        for validation in self.validation_info:
+
+            if not validation.active or validation.eval_error:
+                continue
+
+            if validation.assertion_type not in ROW_BASED_VALIDATION_TYPES:
+                continue
+
+            if not isinstance(validation.column, str):
+                continue
+
+            if ASSERTION_TYPE_METHOD_MAP[validation.assertion_type] not in _STATS_ROW_CHECKS:
+                continue
+
+            step_groups.setdefault(id(validation.pre), (validation.pre, []))[1].append(validation)
+
+        stats_results = {}
+
+        for pre, validations in step_groups.values():
+
+            tbl_context = pre_cache.get_tbl_context(pre)
+
+            column_stats = tbl_context.get_column_stats(
+                columns=[validation.column for validation in validations]
+            )
+
+            n_rows = tbl_context.get_row_count()
+
+            tbl_checked = None
+            checked_rows = None
+
+            for validation in validations:
+
+                # Columns that aren't in the table are left to the row-by-row evaluation (which
+                # reports the error)
+                if validation.column not in column_stats:
+                    continue
+
+                if not _is_row_check_passed_by_stats(
+                    assertion_method=ASSERTION_TYPE_METHOD_MAP[validation.assertion_type],
+                    values=validation.values,
+                    inclusive=validation.inclusive,
+                    na_pass=validation.na_pass,
+                    column_stats=column_stats[validation.column],
+                    n_rows=n_rows,
+                ):
+                    continue
+
+                # The steps of the table share the same checked table, where every row passes;
+                # for tables that hold data, this is kept as packed bitmaps (with a table that has
+                # no rows standing in for the checked table when getting the empty extract)
+                if tbl_checked is None:
+
+                    if tbl_context.tbl_type in IBIS_BACKENDS:
+
+                        import ibis
+
+                        tbl_checked = tbl_context.data_tbl.mutate(pb_is_good_=ibis.literal(True))
+
+                    else:
+
+                        tbl_nw = tbl_context.get_nw_tbl()
+
+                        if isinstance(tbl_nw, nw.DataFrame):
+                            tbl_nw = tbl_nw.head(0)
+                            checked_rows = _CheckedRows.all_passed(n_rows=n_rows)
+
+                        tbl_checked = nw.to_native(tbl_nw.with_columns(pb_is_good_=nw.lit(True)))
+
+                stats_results[id(validation)] = {
+                    "all_passed": True,
+                    "n": n_rows,
+                    "n_passed": n_rows,
+                    "n_failed": 0,
+                    "tbl_checked": tbl_checked,
+                    "tbl_step": tbl_context.data_tbl,
+                    "checked_rows": checked_rows,
+                }
+
+        return stats_results
+
+    def _evaluate_steps_on_row_groups(
+        self,
+        tbl_context: _TableContext,
+        collect_extracts: bool,
+        extract_columns: list[str] | None = None,
+        skip_steps: set[int] | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Evaluate row-based validation steps on the Parquet row groups not decided by statistics.
+
+        The footers of Parquet files have the statistics of each column in each row group, so a
+        step can be found to pass for every row of some row groups but not of others (e.g.,
+        `col_vals_gt(value=0)` on a column whose values are only below zero in the most recent
+        row groups). The steps that are eligible for statistics (see
+        `_is_row_check_passed_by_stats()`) and that have no `pre=` function are checked against
+        the statistics of every row group, and only the remaining row groups are read (with
+        PyArrow, taking only the step's columns) and evaluated. The failing rows of these row
+        groups are collected right away, with their row numbers in the whole table. The checked
+        table of each step is kept as a lazy query over the whole table.
+
+        Parameters
+        ----------
+        tbl_context
+            The context of the target table, which is a Polars LazyFrame that scans Parquet files.
+        collect_extracts
+            Whether to collect the failing rows of the steps.
+        extract_columns
+            The option of the same name in `interrogate()`, as a list of column names.
+        skip_steps
+            The `id()` values of the `_ValidationInfo` objects of any steps that were already
+            evaluated.
+
+        Returns
+        -------
+        dict[int, dict[str, Any]]
+            A dictionary of results for each step that has row groups decided by their statistics,
+            keyed by the `id()` of the step's `_ValidationInfo` object. Along with the counts of
+            test units, each has the step's failing rows (`"failing_rows"`) if they were
+            collected.
+        """
+
+        import polars as pl
+        import pyarrow.parquet as pq
+
+        parquet_metadata = tbl_context.get_parquet_metadata()
+        row_groups = parquet_metadata.get_row_groups()
+        n_rows = parquet_metadata.get_row_count()
+        column_names = tbl_context.get_column_names()
+
+        parquet_files = {}
+
+        def _read_row_group(row_group: dict[str, Any], columns: list[str]) -> pl.DataFrame:
+
+            path = row_group["path"]
+
+            if path not in parquet_files:
+                parquet_files[path] = pq.ParquetFile(path)
+
+            return pl.from_arrow(
+                parquet_files[path].read_row_group(row_group["index"], columns=columns)
+            )
+
+        row_group_results = {}
+
+        for validation in self.validation_info:
+
+            if not validation.active or validation.eval_error:
+                continue
+
+            if skip_steps is not None and id(validation) in skip_steps:
+                continue
+
+            if validation.assertion_type not in ROW_BASED_VALIDATION_TYPES:
+                continue
+
+            if validation.pre is not None or not isinstance(validation.column, str):
+                continue
+
+            assertion_method = ASSERTION_TYPE_METHOD_MAP[validation.assertion_type]
+
+            if assertion_method not in _STATS_ROW_CHECKS:
+                continue
+
+            row_group_stats = parquet_metadata.get_row_group_stats(validation.column)
+
+            if row_group_stats is None:
+                continue
+
+            remaining_row_groups = [
+                row_group
+                for row_group, stats in zip(row_groups, row_group_stats)
+                if row_group["n_rows"] > 0
+                and not _is_row_check_passed_by_stats(
+                    assertion_method=assertion_method,
+                    values=validation.values,
+                    inclusive=validation.inclusive,
+                    na_pass=validation.na_pass,
+                    column_stats=stats,
+                    n_rows=row_group["n_rows"],
+                )
+            ]
+
+            # If no row group can be skipped, the step is evaluated on the whole table as usual
+            if len(remaining_row_groups) == len(
+                [row_group for row_group in row_groups if row_group["n_rows"] > 0]
+            ):
+                continue
+
+            step_columns = _get_step_columns(column=validation.column, values=validation.values)
+            columns = _get_extract_columns(validation=validation, extract_columns=extract_columns)
+
+            if columns is None:
+                columns = column_names
+
+            # Evaluate a copy of the step on each of the remaining row groups
+            validation_row_group = copy.copy(validation)
+
+            n_failed = 0
+            failing_rows_list = []
+
+            for row_group in remaining_row_groups:
+
+                row_group_tbl = _read_row_group(row_group=row_group, columns=step_columns)
+
+                results_tbl, _ = self._evaluate_step(
+                    validation=validation_row_group, data_tbl=row_group_tbl, tbl_type="polars"
+                )
+
+                n_failed += validation_row_group.n_failed
+
+                if collect_extracts and validation_row_group.n_failed > 0:
+                    failing_rows_list.append(
+                        _get_failing_rows(
+                            results_tbl=results_tbl,
+                            row_offset=row_group["row_offset"],
+                            source_tbl=_read_row_group(row_group=row_group, columns=columns),
+                            columns=columns,
+                        )
+                    )
+
+            if not collect_extracts:
+                failing_rows = None
+            elif failing_rows_list:
+                failing_rows = nw.concat(failing_rows_list)
+            else:
+                # An empty extract with the columns of the table
+                failing_rows = _get_failing_rows(
+                    results_tbl=tbl_context.data_tbl.head(0)
+                    .select(columns)
+                    .with_columns(pb_is_good_=pl.lit(True))
+                    .collect(),
+                    columns=columns,
+                )
+
+            row_group_results[id(validation)] = {
+                "all_passed": n_failed == 0,
+                "n": n_rows,
+                "n_passed": n_rows - n_failed,
+                "n_failed": n_failed,
+                "tbl_checked": nw.to_native(
+                    tbl_context.get_nw_tbl().with_columns(
+                        pb_is_good_=_get_row_check_expr_nw(
+                            assertion_method=assertion_method,
+                            column=validation.column,
+                            values=validation.values,
+                            inclusive=validation.inclusive,
+                            na_pass=validation.na_pass,
+                        )
+                    )
+                ),
+                "tbl_step": tbl_context.data_tbl,
+                "failing_rows": failing_rows,
+            }
+
+        return row_group_results
+
+    def _evaluate_steps_on_samples(
+        self,
+        tbl_type: str,
+        test_sample_n: int,
+        conf_level: float,
+        pre_cache: _PreProcessingCache,
+        skip_steps: set[int] | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Estimate the results of the row-based validation steps from random samples of rows.
+
+        Each row-based step is evaluated on a random sample of rows from its table (the target
+        table after any `pre=` function is applied; steps sharing a `pre=` function share the
+        sample, which is taken once, see `_sample_rows()`). A Wilson score interval is computed
+        for the fraction of failing test units and, if the interval falls entirely on one side of
+        each of the step's threshold levels, the estimated results are kept. Otherwise, the step
+        is left out of the returned results so that it is evaluated on the whole table.
+
+        Parameters
+        ----------
+        tbl_type
+            The type of the target table.
+        test_sample_n
+            The number of rows to sample.
+        conf_level
+            The confidence level of the intervals.
+        pre_cache
+            The cache of pre-processed tables for the interrogation.
+        skip_steps
+            The `id()` values of the `_ValidationInfo` objects of any steps that were already
+            evaluated (and that aren't to be sampled).
+
+        Returns
+        -------
+        dict[int, dict[str, Any]]
+            A dictionary of results for each step that could be decided from its sample, keyed by
+            the `id()` of the step's `_ValidationInfo` object.
+        """
+
+        # A single seed is used so that, where possible, every step of a table sees the same sample
+        seed = random.randrange(2**31)
+
+        samples = {}
+        sample_results = {}
+
+        for validation in self.validation_info:
+
+            if not validation.active or validation.eval_error:
+                continue
+
+            if skip_steps is not None and id(validation) in skip_steps:
+                continue
+
+            if validation.assertion_type not in ROW_BASED_VALIDATION_TYPES:
+                continue
+
+            key = id(validation.pre)
+
+            if key not in samples:
+
+                tbl = pre_cache.get_tbl(validation.pre)
+
+                n_rows = get_row_count(tbl)
+
+                # Tables without more rows than the sample size are evaluated in full
+                if n_rows > test_sample_n:
+                    sample_tbl = _sample_rows(
+                        tbl=tbl, tbl_type=tbl_type, n=test_sample_n, n_rows=n_rows, seed=seed
+                    )
+                else:
+                    sample_tbl = None
+
+                samples[key] = (sample_tbl, n_rows)
+
+            sample_tbl, n_rows = samples[key]
+
+            if sample_tbl is None:
+                continue
+
+            # Evaluate a copy of the step on the sample (which is already pre-processed)
+            validation_sample = copy.copy(validation)
+            validation_sample.pre = None
+
+            self._evaluate_step(
+                validation=validation_sample, data_tbl=sample_tbl, tbl_type=tbl_type
+            )
+
+            n_sampled = validation_sample.n
+
+            if n_sampled == 0:
+                continue
+
+            f_failed_ci = _wilson_interval(
+                n_failed=validation_sample.n_failed, n=n_sampled, conf_level=conf_level
+            )
+
+            # The step is evaluated on the whole table if the interval straddles a threshold level
+            if any(
+                validation.thresholds._threshold_result(
+                    fraction_failing=f_failed_ci[0], test_units=n_rows, level=level
+                )
+                != validation.thresholds._threshold_result(
+                    fraction_failing=f_failed_ci[1], test_units=n_rows, level=level
+                )
+                for level in ["warn", "stop", "notify"]
+            ):
+                continue
+
+            # Scale up the number of failing test units in the sample to the number of rows
+            n_failed = round(validation_sample.n_failed / n_sampled * n_rows)
+
+            sample_results[id(validation)] = {
+                "all_passed": n_failed == 0,
+                "n": n_rows,
+                "n_passed": n_rows - n_failed,
+                "n_failed": n_failed,
+                "n_sampled": n_sampled,
+                "f_failed_ci": f_failed_ci,
+                "tbl_checked": None,
+            }
+
+        for sample_tbl, _ in samples.values():
+            _release_sample(sample_tbl=sample_tbl)
+
+        return sample_results
+
+    def _evaluate_fused_steps(
+        self,
+        data_tbl: FrameT | Any,
+        collect_tbl_checked: bool,
+        collect_extracts: bool = False,
+        extract_columns: list[str] | None = None,
+        pre_cache: _PreProcessingCache | None = None,
+        skip_steps: set[int] | None = None,
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Evaluate all eligible row-based validation steps with one pass over the table.
+
+        Steps are grouped by their `pre=` function (the identity of the function object is used
+        so that steps sharing a function share the pre-processed table) and each group is
+        compiled into a single `FusedRowChecks` plan. For a Polars LazyFrame, the queries of all
+        plans are collected together with `pl.collect_all()`.
+
+        Parameters
+        ----------
+        data_tbl
+            The target table.
+        collect_tbl_checked
+            Whether to produce, for each step, a table that has the `pb_is_good_` column.
+        collect_extracts
+            Whether extracts will be collected. For a Polars LazyFrame, the tables with the
+            `pb_is_good_` column are only collected when this is `True` (otherwise they are kept
+            as lazy queries).
+        extract_columns
+            The option of the same name in `interrogate()`, as a list of column names. For a
+            Polars LazyFrame, only these columns (and those used by the steps) are collected.
+        pre_cache
+            The cache of pre-processed tables for the interrogation (if any).
+        skip_steps
+            The `id()` values of the `_ValidationInfo` objects of any steps that were already
+            evaluated (and that are to be left out of the fused plans).
+
+        Returns
+        -------
+        dict[int, dict[str, Any]]
+            A dictionary of results for each fused step, keyed by the `id()` of the step's
+            `_ValidationInfo` object. Along with the results of `FusedRowChecks`, each has the
+            table that the step was evaluated on (`"tbl_step"`).
+        """
+
+        # Group the eligible steps by their pre-processing function
+        step_groups = {}
+
+        for validation in self.validation_info:
+
+            if not validation.active or validation.eval_error:
+                continue
+
+            if skip_steps is not None and id(validation) in skip_steps:
+                continue
+
+            if validation.assertion_type not in ROW_BASED_VALIDATION_TYPES:
+                continue
+
+            assertion_method = ASSERTION_TYPE_METHOD_MAP[validation.assertion_type]
+
+            if not _is_fusable_row_check(
+                assertion_method=assertion_method, values=validation.values
+            ):
+                continue
+
+            step_groups.setdefault(id(validation.pre), (validation.pre, []))[1].append(validation)
+
+        fused_plans = []
+
+        for pre, validations in step_groups.values():
+
+            # Apply the pre-processing function only once for the entire group of steps
+            if pre_cache is not None:
+                tbl_context = pre_cache.get_tbl_context(pre)
+                data_tbl_step = tbl_context.data_tbl
+            else:
+                tbl_context = None
+                data_tbl_step = _apply_pre_processing(data_tbl=data_tbl, pre=pre)
+
+            steps = []
+            dtype_checks = set()
+
+            for validation in validations:
+
+                assertion_method = ASSERTION_TYPE_METHOD_MAP[validation.assertion_type]
+                compatible_dtypes = COMPATIBLE_DTYPES.get(assertion_method, [])
+
+                # The column type only needs to be checked once for the table (a failing check
+                # raises an error, so a repeated check could never fail)
+                dtype_check = (validation.column, tuple(compatible_dtypes))
+
+                if dtype_check in dtype_checks or (
+                    pre_cache is not None
+                    and pre_cache.is_dtype_checked(pre, validation.column, compatible_dtypes)
+                ):
+                    allowed_types = []
+                else:
+                    allowed_types = compatible_dtypes
+
+                dtype_checks.add(dtype_check)
+
+                steps.append(
+                    {
+                        "assertion_method": assertion_method,
+                        "column": validation.column,
+                        "values": validation.values,
+                        "inclusive": validation.inclusive,
+                        "na_pass": validation.na_pass,
+                        "allowed_types": allowed_types,
+                    }
+                )
+
+            fused_plan = FusedRowChecks(
+                data_tbl=data_tbl_step,
+                steps=steps,
+                collect_tbl_checked=collect_tbl_checked,
+                tbl_context=tbl_context,
+                extract_columns=extract_columns,
+            )
+
+            if pre_cache is not None:
+                for column, compatible_dtypes in dtype_checks:
+                    pre_cache.set_dtype_checked(pre, column, list(compatible_dtypes))
+
+            fused_plans.append((fused_plan, validations))
+
+        # Collect the queries of any lazy plans in one go
+        _collect_fused_row_checks(
+            plans=[fused_plan for fused_plan, _ in fused_plans],
+            collect_tbl_checked=collect_extracts,
+        )
+
+        fused_results = {}
+
+        for fused_plan, validations in fused_plans:
+
+            results = fused_plan.get_test_results()
+
+            for validation, result in zip(validations, results):
+                fused_results[id(validation)] = {**result, "tbl_step": fused_plan.data_tbl}
+
+        return fused_results
+
+    def _evaluate_step(
+        self,
+        validation: _ValidationInfo,
+        data_tbl: FrameT | Any,
+        tbl_type: str,
+        pre_cache: _PreProcessingCache | None = None,
+    ):
+        """
+        Evaluate the test units of a single validation step.
+
+        The validation step's `pre=` function (if any) is applied to the table before the step's
+        assertion is checked. The `n`, `n_passed`, `n_failed`, and `all_passed` attributes of the
+        validation step are set in place.
+
+        Parameters
+        ----------
+        validation
+            The validation step to evaluate.
+        data_tbl
+            The target table.
+        tbl_type
+            The type of the target table (as obtained by `_get_tbl_type()`).
+        pre_cache
+            The cache of pre-processed tables for the interrogation (if any). If provided, the
+            pre-processed table and the column type check are shared with other steps that use the
+            same `pre=` function.
+
+        Returns
+        -------
+        tuple[FrameT | Any | None, FrameT | Any]
+            The table with the `pb_is_good_` column for row-based validation steps (`None` for
+            all other types of validation steps) and the table that the step was evaluated on
+            (after any pre-processing), which has all columns of the failing rows.
+        """
+
+        # Apply any pre-processing function to the table for this step; the table's metadata
+        # (e.g., its schema) is shared with the other steps through the table's context
+        if pre_cache is not None:
+            tbl_context = pre_cache.get_tbl_context(validation.pre)
+            data_tbl_step = tbl_context.data_tbl
+        else:
+            tbl_context = None
+            data_tbl_step = _apply_pre_processing(data_tbl=data_tbl, pre=validation.pre)
+
+        assertion_type = validation.assertion_type
+        column = validation.column
+        value = validation.values
+        inclusive = validation.inclusive
+        na_pass = validation.na_pass
+        threshold = validation.thresholds
+
+        assertion_method = ASSERTION_TYPE_METHOD_MAP[assertion_type]
+        assertion_category = METHOD_CATEGORY_MAP[assertion_method]
+        compatible_dtypes = COMPATIBLE_DTYPES.get(assertion_method, [])
+
+        # The categories of steps that check the type of the column
+        dtype_checked_categories = ["COMPARE_ONE", "COMPARE_TWO", "COMPARE_SET", "COMPARE_REGEX"]
+
+        # Skip the column type check if it already passed for the same table in another step
+        if (
+            pre_cache is not None
+            and assertion_category in dtype_checked_categories
+            and pre_cache.is_dtype_checked(validation.pre, column, compatible_dtypes)
+        ):
+            allowed_types = []
+        else:
+            allowed_types = compatible_dtypes
+
+        if tbl_type not in IBIS_BACKENDS:
+            tbl_type = "local"
+
+        if assertion_category == "COMPARE_ONE":
+
+            results_tbl = ColValsCompareOne(
+                data_tbl=data_tbl_step,
+                column=column,
+                value=value,
+                na_pass=na_pass,
+                threshold=threshold,
+                assertion_method=assertion_method,
+                allowed_types=allowed_types,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+        if assertion_category == "COMPARE_TWO":
+
+            results_tbl = ColValsCompareTwo(
+                data_tbl=data_tbl_step,
+                column=column,
+                value1=value[0],
+                value2=value[1],
+                inclusive=inclusive,
+                na_pass=na_pass,
+                threshold=threshold,
+                assertion_method=assertion_method,
+                allowed_types=allowed_types,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+        if assertion_category == "COMPARE_SET":
+
+            inside = True if assertion_method == "in_set" else False
+
+            results_tbl = ColValsCompareSet(
+                data_tbl=data_tbl_step,
+                column=column,
+                values=value,
+                threshold=threshold,
+                inside=inside,
+                allowed_types=allowed_types,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+        if assertion_category == "COMPARE_REGEX":
+
+            results_tbl = ColValsRegex(
+                data_tbl=data_tbl_step,
+                column=column,
+                pattern=value,
+                na_pass=na_pass,
+                threshold=threshold,
+                allowed_types=allowed_types,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+        if assertion_category == "COMPARE_EXPR":
+
+            results_tbl = ColValsExpr(
+                data_tbl=data_tbl_step,
+                expr=value,
+                threshold=threshold,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+        if assertion_category == "ROWS_DISTINCT":
+
+            results_tbl = RowsDistinct(
+                data_tbl=data_tbl_step,
+                columns_subset=column,
+                threshold=threshold,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+        if assertion_category == "COL_EXISTS_HAS_TYPE":
+
+            result_bool = ColExistsHasType(
+                data_tbl=data_tbl_step,
+                column=column,
+                threshold=threshold,
+                assertion_method="exists",
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+            validation.all_passed = result_bool
+            validation.n = 1
+            validation.n_passed = result_bool
+            validation.n_failed = 1 - result_bool
+
+            results_tbl = None
+
+        if assertion_category == "COL_SCHEMA_MATCH":
+
+            result_bool = ColSchemaMatch(
+                data_tbl=data_tbl_step,
+                schema=value["schema"],
+                complete=value["complete"],
+                in_order=value["in_order"],
+                case_sensitive_colnames=value["case_sensitive_colnames"],
+                case_sensitive_dtypes=value["case_sensitive_dtypes"],
+                full_match_dtypes=value["full_match_dtypes"],
+                threshold=threshold,
+            ).get_test_results()
+
+            schema_validation_info = _get_schema_validation_info(
+                data_tbl=data_tbl,
+                schema=value["schema"],
+                passed=result_bool,
+                complete=value["complete"],
+                in_order=value["in_order"],
+                case_sensitive_colnames=value["case_sensitive_colnames"],
+                case_sensitive_dtypes=value["case_sensitive_dtypes"],
+                full_match_dtypes=value["full_match_dtypes"],
+            )
+
+            # Add the schema validation info to the validation object
+            validation.val_info = schema_validation_info
+
+            validation.all_passed = result_bool
+            validation.n = 1
+            validation.n_passed = int(result_bool)
+            validation.n_failed = 1 - result_bool
+
+            results_tbl = None
+
+        if assertion_category == "ROW_COUNT_MATCH":
+
+            result_bool = RowCountMatch(
+                data_tbl=data_tbl_step,
+                count=value["count"],
+                inverse=value["inverse"],
+                threshold=threshold,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+            validation.all_passed = result_bool
+            validation.n = 1
+            validation.n_passed = int(result_bool)
+            validation.n_failed = 1 - result_bool
+
+            results_tbl = None
+
+        if assertion_category == "COL_COUNT_MATCH":
+
+            result_bool = ColCountMatch(
+                data_tbl=data_tbl_step,
+                count=value["count"],
+                inverse=value["inverse"],
+                threshold=threshold,
+                tbl_type=tbl_type,
+                tbl_context=tbl_context,
+            ).get_test_results()
+
+            validation.all_passed = result_bool
+            validation.n = 1
+            validation.n_passed = int(result_bool)
+            validation.n_failed = 1 - result_bool
+
+            results_tbl = None
+
+        # Record that the column type check passed for the table of this step
+        if (
+            pre_cache is not None
+            and allowed_types
+            and assertion_category in dtype_checked_categories
+        ):
+            pre_cache.set_dtype_checked(validation.pre, column, compatible_dtypes)
+
+        if assertion_category not in [
+            "COL_EXISTS_HAS_TYPE",
+            "COL_SCHEMA_MATCH",
+            "ROW_COUNT_MATCH",
+            "COL_COUNT_MATCH",
+        ]:
+
+            # Aggregate the `pb_is_good_` column to get the counts of passing and failing
+            # test units (this is done in the table's backend)
+            test_unit_counts = _get_test_unit_counts(tbl=results_tbl, tbl_type=tbl_type)
+
+            validation.all_passed = test_unit_counts["all_passed"]
+            validation.n = test_unit_counts["n"]
+            validation.n_passed = test_unit_counts["n_passed"]
+            validation.n_failed = test_unit_counts["n_failed"]
+
+        return results_tbl, data_tbl_step
+
+    def _add_validation(self, validation_info):
+        """
+        Add a validation to the list of validations.
+
+        Parameters
+        ----------
+        validation_info
+            Information about the validation to add.
+        """
+
+        # Get the largest value of `i_o` in the `validation_info`; steps are only ever appended
+        # (and expanded in place) so this is the `i_o` value of the last step
+        max_i_o = self.validation_info[-1].i_o if self.validation_info else 0
+
+        # Set the `i_o` attribute to the largest value of `i_o` plus 1
+        validation_info.i_o = max_i_o + 1
+
+        self.validation_info.append(validation_info)
+
+        return self
+
+    def _evaluate_column_exprs(self, validation_info, pre_cache: _PreProcessingCache | None = None):
+        """
+        Evaluate any column expressions stored in the `column` attribute and expand those validation
+        steps into multiple. Errors in evaluation (such as no columns matched) will be caught and
+        recorded in the `eval_error` attribute.
+
+        Parameters
+        ----------
+        validation_info
+            Information about the validation to evaluate and expand.
+        pre_cache
+            The cache of pre-processed tables for the interrogation (if any).
+        """
+
+        # Create a list to store the expanded validation steps
+        expanded_validation_info = []
+
+        # Iterate over the validation steps
+        for i, validation in enumerate(validation_info):
+
+            # Get the column expression
+            column_expr = validation.column
+
+            # If the value is not a Column object, then skip the evaluation and append
+            # the validation step to the list of expanded validation steps
+            if not isinstance(column_expr, Column):
+                expanded_validation_info.append(validation)
+                continue
+
+            # Evaluate the column expression
+            try:
+
+                # Get the table for this step, it can either be:
+                # 1. the target table itself
+                # 2. the target table modified by a `pre` attribute
+
+                if pre_cache is not None:
+                    table = pre_cache.get_tbl(validation.pre)
+                elif validation.pre is None:
+                    table = self.data
+                else:
+                    table = validation.pre(self.data)
+
+                # Get the columns from the table as a list (a Polars LazyFrame only has these
+                # available through its schema)
+                if "LazyFrame" in str(type(table)):
+                    columns = table.collect_schema().names()
+                else:
+                    columns = list(table.columns)
+
+                # Evaluate the column expression
+                if isinstance(column_expr, ColumnSelectorNarwhals):
+                    columns_resolved = ColumnSelectorNarwhals(column_expr).resolve(table=table)
+                else:
+                    columns_resolved = column_expr.resolve(columns=columns, table=table)
+
+            except Exception:  # pragma: no cover
+                validation.eval_error = True
+
+            # If no columns were resolved, then create a patched validation step with the
+            # `eval_error` and `column` attributes set
+            if not columns_resolved:
+                validation.eval_error = True
+                validation.column = str(column_expr)
+
+                expanded_validation_info.append(validation)
+                continue
+
+            # For each column resolved, create a new validation step and add it to the list of
+            # expanded validation steps
+            for column in columns_resolved:
+
+                new_validation = copy.deepcopy(validation)
+
+                new_validation.column = column
+
+                expanded_validation_info.append(new_validation)
+
+        # Replace the `validation_info` attribute with the expanded version
+        self.validation_info = expanded_validation_info
+
+        return self
+
+    def _get_sundering_mask(self, validation_info: list[_ValidationInfo], type: str) -> Any:
+        """
+        Combine the results of row-based validation steps into a single mask of rows.
+
+        The packed `pb_is_good_` bitmaps of the steps are reduced with bitwise operations: for
+        `type="pass"`, a row is kept if it passed every step (AND-reduction) and, for
+        `type="fail"`, a row is kept if it failed at least one step (OR-reduction over the
+        failing rows, so that rows with a missing result are in neither piece).
+
+        Parameters
+        ----------
+        validation_info
+            The row-based validation steps.
+        type
+            Either `"pass"` or `"fail"`.
+
+        Returns
+        -------
+        Any
+            A boolean NumPy array with one value per row of the target table.
+        """
+
+        import numpy as np
+
+        n_rows = self._get_tbl_context().get_row_count()
+
+        checked_rows_list = [validation.checked_rows for validation in validation_info]
+
+        # The results of steps evaluated on a Polars LazyFrame without collecting extracts are
+        # still lazy, so collect their `pb_is_good_` columns together
+        lazy_steps = [k for k, checked_rows in enumerate(checked_rows_list) if checked_rows is None]
+
+        if any(validation_info[k].tbl_checked is None for k in lazy_steps):
+            raise ValueError(
+                "The data can only be sundered if the results of the validation steps were "
+                "collected with `interrogate(collect_tbl_checked=True)`."
+            )
+
+        if lazy_steps:
+
+            import polars as pl
+
+            collected = pl.collect_all(
+                [validation_info[k].tbl_checked.select("pb_is_good_") for k in lazy_steps]
+            )
+
+            for k, results_tbl in zip(lazy_steps, collected):
+                checked_rows_list[k] = _CheckedRows.from_results_tbl(results_tbl=results_tbl)
+
+        # The rows of each step are matched to the rows of the target table by position; a step
+        # evaluated on fewer rows (e.g., after a `pre=` function took the head of the table) has
+        # missing results for the remaining rows
+        for k, (validation, checked_rows) in enumerate(zip(validation_info, checked_rows_list)):
+            if checked_rows.n_rows > n_rows:
+                raise ValueError(
+                    f"The data can't be sundered since step {validation.i} was evaluated on a "
+                    "table (modified by its `pre=` function) with more rows than the data."
+                )
+            checked_rows_list[k] = checked_rows.pad_rows(n_rows=n_rows)
+
+        if type == "pass":
+            mask_bits = np.bitwise_and.reduce(
+                [checked_rows.bits for checked_rows in checked_rows_list]
+            )
+        else:
+            mask_bits = np.bitwise_or.reduce(
+                [
+                    (
+                        ~checked_rows.bits
+                        if checked_rows.validity is None
+                        else checked_rows.validity & ~checked_rows.bits
+                    )
+                    for checked_rows in checked_rows_list
+                ]
+            )
+
+        return np.unpackbits(mask_bits, count=n_rows).astype(bool)
+
+    def _get_tbl_context(self) -> _TableContext:
+        """
+        Get the context of the target table, with its metadata (e.g., its type and schema).
+
+        The context created by the last interrogation is reused for as long as the `data`
+        attribute refers to the same table, so that the reporting methods share its metadata.
+        """
+
+        if self._tbl_context is None or self._tbl_context.data_tbl is not self.data:
+            self._tbl_context = _TableContext(data_tbl=self.data)
+
+        return self._tbl_context
+
+    def _get_tbl_checked(self, validation: _ValidationInfo) -> FrameT | Any | None:
+        """
+        Get the checked table of a validation step (the table with the `pb_is_good_` column).
+
+        For tables that hold data, the checked table is rebuilt from the target table (after
+        applying any `pre=` function) and the step's packed `pb_is_good_` values.
+
+        Parameters
+        ----------
+        validation
+            The validation step.
+
+        Returns
+        -------
+        FrameT | Any | None
+            The checked table, or `None` if the step's results weren't collected.
+        """
+
+        if validation.tbl_checked is not None:
+            return validation.tbl_checked
+
+        checked_rows = validation.checked_rows
+
+        if checked_rows is None:
+            return None
+
+        data_nw = nw.from_native(_apply_pre_processing(data_tbl=self.data, pre=validation.pre))
+
+        if isinstance(data_nw, nw.LazyFrame):
+            data_nw = data_nw.collect()
+
+        # A `pre=` function that doesn't give the same table each time can't be used to rebuild
+        # the checked table
+        if len(data_nw) != checked_rows.n_rows:
+            raise ValueError(
+                f"The checked table for step {validation.i} can't be rebuilt since its `pre=` "
+                "function gave a table with a different number of rows."
+            )
+
+        pb_is_good_ = checked_rows.get_is_good()
+        validity = checked_rows.get_validity()
+
+        if validity is not None:
+            pb_is_good_ = [
+                value if valid else None
+                for value, valid in zip(pb_is_good_.tolist(), validity.tolist())
+            ]
+
+        return nw.to_native(
+            data_nw.with_columns(
+                nw.new_series(
+                    "pb_is_good_",
+                    pb_is_good_,
+                    nw.Boolean,
+                    backend=nw.get_native_namespace(data_nw),
+                )
+            )
+        )
+
+    def _get_validation_dict(self, i: int | list[int] | None, attr: str) -> dict[int, int]:
+        """
+        Utility function to get a dictionary of validation attributes for each validation step.
+
+        Parameters
+        ----------
+        i
+            The validation step number(s) from which the attribute values are obtained.
+            If `None`, all steps are included.
+        attr
+            The attribute name to retrieve from each validation step.
+
+        Returns
+        -------
+        dict[int, int]
+            A dictionary of the attribute values for each validation step.
+        """
+        if i is None:
+            return {validation.i: getattr(validation, attr) for validation in self.validation_info}
+
+        if isinstance(i, int):
+
+            # After interrogation, step `i` is at position `i - 1` so it can be looked up directly
+            if 0 < i <= len(self.validation_info) and self.validation_info[i - 1].i == i:
+                return {i: getattr(self.validation_info[i - 1], attr)}
+
+            i = [i]
+
+        i = set(i)
+
+        return {
+            validation.i: getattr(validation, attr)
+            for validation in self.validation_info
+            if validation.i in i
+        }
+
+
+def _validation_info_as_dict(validation_info: _ValidationInfo) -> dict:
+    """
+    Convert a `_ValidationInfo` object to a dictionary.
+
+    Parameters
+    ----------
+    validation_info
+        The `_ValidationInfo` object to convert to a dictionary.
+
+    Returns
+    -------
+    dict
+        A dictionary representing the `_ValidationInfo` object.
+    """
+
+    # Define the fields to include in the validation information
+    validation_info_fields = [
+        "i",
+        "assertion_type",
+        "column",
+        "values",
+        "inclusive",
+        "na_pass",
+        "pre",
+        "label",
+        "brief",
+        "active",
+        "eval_error",
+        "all_passed",
+        "n",
+        "n_passed",
+        "n_failed",
+        "f_passed",
+        "f_failed",
+        "warn",
+        "stop",
+        "notify",
+        "extract",
+        "proc_duration_s",
+    ]
+
+    # Get the validation information as a dictionary of lists (one per field) so that it can be
+    # used to create a DataFrame
+    validation_info_dict = {
+        field: [getattr(validation, field) for validation in validation_info]
+        for field in validation_info_fields
+    }
+
+    return validation_info_dict
+
+
+def _get_assertion_icon(icon: list[str], length_val: int = 30) -> list[str]:
+
+    # For each icon, get the assertion icon SVG test from SVG_ICONS_FOR_ASSERTION_TYPES dictionary
+    icon_svg = [SVG_ICONS_FOR_ASSERTION_TYPES.get(icon) for icon in icon]
+
+    # Replace the width and height in the SVG string
+    for i in range(len(icon_svg)):
+        icon_svg[i] = _replace_svg_dimensions(icon_svg[i], height_width=length_val)
+
+    return icon_svg
+
+
+def _replace_svg_dimensions(svg: list[str], height_width: int | float) -> list[str]:
+
+    svg = re.sub(r'width="[0-9]*?px', f'width="{height_width}px', svg)
+    svg = re.sub(r'height="[0-9]*?px', f'height="{height_width}px', svg)
+
+    return svg
+
+
+def _get_title_text(title: str | None, tbl_name: str | None, interrogation_performed: bool) -> str:
+
+    title = _process_title_text(title=title, tbl_name=tbl_name)
+
+    if interrogation_performed:
+        return title
+
+    html_str = (
+        "<div>"
+        '<span style="float: left;">'
+        f"{title}"
+        "</span>"
+        '<span style="float: right; text-decoration-line: underline; '
+        "text-underline-position: under;"
+        "font-size: 16px; text-decoration-color: #9C2E83;"
         'padding-top: 0.1em; padding-right: 0.4em;">'
         "No Interrogation Peformed"
         "</span>"
         "</div>"
     )
 
-    return html_str
+    return html_str
+
+
+def _process_title_text(title: str | None, tbl_name: str | None) -> str:
+
+    if title is None:
+        title_text = ""
+    elif title == ":default:":
+        title_text = _get_default_title_text()
+    elif title == ":none:":
+        title_text = ""
+    elif title == ":tbl_name:":
+        if tbl_name is not None:
+            title_text = f"<code>{tbl_name}</code>"
+        else:
+            title_text = ""
+    else:
+        title_text = commonmark.commonmark(title)
+
+    return title_text
+
+
+def _get_default_title_text() -> str:
+    return "Pointblank Validation"
+
+
+def _transform_tbl_preprocessed(pre: str, interrogation_performed: bool) -> list[str]:
+
+    # If no interrogation was performed, return a list of empty strings
+    if not interrogation_performed:
+        return ["" for _ in range(len(pre))]
+
+    # Iterate over the pre-processed table status and return the appropriate SVG icon name
+    # (either 'unchanged' (None) or 'modified' (not None))
+    status_list = []
+
+    for status in pre:
+        if status is None:
+            status_list.append("unchanged")
+        else:
+            status_list.append("modified")
+
+    return _get_preprocessed_table_icon(icon=status_list)
+
+
+def _get_preprocessed_table_icon(icon: list[str]) -> list[str]:
+
+    # For each icon, get the SVG icon from the SVG_ICONS_FOR_TBL_STATUS dictionary
+    icon_svg = [SVG_ICONS_FOR_TBL_STATUS.get(icon) for icon in icon]
+
+    return icon_svg
+
+
+def _transform_eval(
+    n: list[int], interrogation_performed: bool, eval_error: list[bool], active: list[bool]
+) -> list[str]:
+
+    # If no interrogation was performed, return a list of empty strings
+    if not interrogation_performed:
+        return ["" for _ in range(len(n))]
+
+    symbol_list = []
+
+    for i in range(len(n)):
+
+        # If there was an evaluation error, then add a collision mark
+        if eval_error[i]:
+            symbol_list.append('<span style="color:#CF142B;">&#128165;</span>')
+            continue
+
+        # If the validation step is inactive, then add an em dash
+        if not active[i]:
+            symbol_list.append("&mdash;")
+            continue
+
+        # Otherwise, add a green check mark
+        symbol_list.append('<span style="color:#4CA64C;">&check;</span>')
+
+    return symbol_list
+
+
+def _transform_test_units(
+    test_units: list[int], interrogation_performed: bool, active: list[bool]
+) -> list[str]:
+
+    # If no interrogation was performed, return a list of empty strings
+    if not interrogation_performed:
+        return ["" for _ in range(len(test_units))]
+
+    return [
+        (
+            (
+                str(test_units[i])
+                if test_units[i] < 10000
+                else str(vals.fmt_number(test_units[i], n_sigfig=3, compact=True)[0])
+            )
+            if active[i]
+            else "&mdash;"
+        )
+        for i in range(len(test_units))
+    ]
+
+
+def _fmt_lg(value: int) -> str:
+    return vals.fmt_number(value, n_sigfig=3, compact=True)[0]
+
+
+def _transform_passed_failed(
+    n_passed_failed: list[int],
+    f_passed_failed: list[float],
+    interrogation_performed: bool,
+    active: list[bool],
+) -> list[str]:
+
+    if not interrogation_performed:
+        return ["" for _ in range(len(n_passed_failed))]
+
+    passed_failed = [
+        (
+            f"{n_passed_failed[i] if n_passed_failed[i] < 10000 else _fmt_lg(n_passed_failed[i])}"
+            f"<br />{vals.fmt_number(f_passed_failed[i], decimals=2)[0]}"
+            if active[i]
+            else "&mdash;"
+        )
+        for i in range(len(n_passed_failed))
+    ]
+
+    return passed_failed
+
+
+def _transform_w_s_n(values, color, interrogation_performed):
+
+    # If no interrogation was performed, return a list of empty strings
+    if not interrogation_performed:
+        return ["" for _ in range(len(values))]
+
+    return [
+        (
+            "&mdash;"
+            if value is None
+            else (
+                f'<span style="color: {color};">&#9679;</span>'
+                if value is True
+                else f'<span style="color: {color};">&cir;</span>' if value is False else value
+            )
+        )
+        for value in values
+    ]
+
+
+def _transform_assertion_str(assertion_str: list[str]) -> list[str]:
+
+    # Get the SVG icons for the assertion types
+    svg_icon = _get_assertion_icon(icon=assertion_str)
+
+    # Append `()` to the `assertion_str`
+    assertion_str = [x + "()" for x in assertion_str]
+
+    # Obtain the number of characters contained in the assertion
+    # string; this is important for sizing components appropriately
+    assertion_type_nchar = [len(x) for x in assertion_str]
+
+    # Declare the text size based on the length of `assertion_str`
+    text_size = [10 if nchar + 2 >= 20 else 11 for nchar in assertion_type_nchar]
+
+    # Create the assertion type update using a list comprehension
+    type_upd = [
+        f"""
+        <div style="margin:0;padding:0;display:inline-block;height:30px;vertical-align:middle;">
+        <!--?xml version="1.0" encoding="UTF-8"?-->{svg}
+        </div>
+        <span style="font-family: 'IBM Plex Mono', monospace, courier; color: black; font-size:{size}px;"> {assertion}</span>
+        """
+        for assertion, svg, size in zip(assertion_str, svg_icon, text_size)
+    ]
+
+    return type_upd
+
+
+def _is_batchable_step(validation: _ValidationInfo) -> bool:
+    """
+    Determine whether a validation step can be evaluated batch by batch.
+
+    A step's results over the batches of a table are merged exactly unless the step has a `pre=`
+    function (which may depend on all rows of the table, e.g., by aggregating or by taking the
+    first rows) or its handling of missing values depends on the whole table (see
+    `_has_table_dependent_null_handling()`). Such steps are to be evaluated on the whole table.
+    """
+
+    if validation.pre is not None:
+        return False
+
+    if validation.assertion_type in ROW_BASED_VALIDATION_TYPES:
+        return not _has_table_dependent_null_handling(
+            assertion_method=ASSERTION_TYPE_METHOD_MAP[validation.assertion_type],
+            values=validation.values,
+        )
+
+    return True
+
+
+def _iter_row_batches(data_tbl: FrameT | Any, batch_size: int):
+    """
+    Iterate over batches of rows from a table.
+
+    A Polars LazyFrame is read once, as a stream, with `_iter_lazy_row_batches()`. The batches of
+    a Polars or Pandas DataFrame are slices of the DataFrame.
+
+    Parameters
+    ----------
+    data_tbl
+        A Polars LazyFrame, or a Polars or Pandas DataFrame.
+    batch_size
+        The number of rows in each batch.
+
+    Yields
+    ------
+    tuple[int, FrameT]
+        The number of rows preceding the batch (the row offset) and the batch itself. A table
+        without any rows yields a single empty batch.
+    """
+
+    if is_polars_lazyframe(data_tbl):
+        yield from _iter_lazy_row_batches(data_tbl=data_tbl, batch_size=batch_size)
+        return
+
+    data_nw = nw.from_native(data_tbl)
+
+    n_rows = len(data_nw)
+
+    for row_offset in range(0, max(n_rows, 1), batch_size):
+        yield row_offset, nw.to_native(data_nw[row_offset : row_offset + batch_size])
+
+
+def _iter_lazy_row_batches(data_tbl: Any, batch_size: int):
+    """
+    Iterate over batches of rows from a Polars LazyFrame, reading the LazyFrame only once.
+
+    The query is run once by the streaming engine of Polars, which writes its rows to a temporary
+    (uncompressed) Arrow IPC file as they are produced (e.g., as the row groups of a Parquet file
+    or the chunks of a CSV file are read). The file is then memory-mapped and each batch is taken
+    from it without reading the rest of the file, so only one batch is held in memory at a time.
+    Slicing the LazyFrame for each batch instead would scan the source again for every batch (and
+    files like CSV files can only be scanned from the start). If the query can't be run by the
+    streaming engine, or if PyArrow isn't available, the LazyFrame is collected in full.
+
+    Parameters
+    ----------
+    data_tbl
+        A Polars LazyFrame.
+    batch_size
+        The number of rows in each batch.
+
+    Yields
+    ------
+    tuple[int, pl.DataFrame]
+        The number of rows preceding the batch (the row offset) and the batch itself. A table
+        without any rows yields a single empty batch.
+    """
+
+    import polars as pl
+
+    if not _is_lib_present(lib_name="pyarrow"):
+        yield from _iter_row_batches(data_tbl=data_tbl.collect(), batch_size=batch_size)
+        return
+
+    import pyarrow as pa
+
+    schema = data_tbl.collect_schema()
+
+    with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as tmp_dir:
+
+        ipc_path = os.path.join(tmp_dir, "data.arrow")
+
+        try:
+            data_tbl.sink_ipc(ipc_path, compression=None)
+        except pl.exceptions.InvalidOperationError:
+            yield from _iter_row_batches(data_tbl=data_tbl.collect(), batch_size=batch_size)
+            return
+
+        # The Arrow buffers of the table point into the mapped file, so the rows are only read
+        # when a batch is converted to a Polars DataFrame
+        arrow_tbl = pa.ipc.open_file(pa.memory_map(ipc_path, "r")).read_all()
+
+        for row_offset in range(0, max(arrow_tbl.num_rows, 1), batch_size):
+
+            batch = pl.from_arrow(arrow_tbl.slice(row_offset, batch_size))
+
+            # Keep the data types of the LazyFrame where Arrow has no exact counterpart
+            if batch.schema != schema:
+                batch = batch.cast(dict(schema))
+
+            yield row_offset, batch
+
+        del arrow_tbl
+
+
+def _merge_batch_extracts(
+    extract_nw: nw.DataFrame | None,
+    batch_extract_nw: nw.DataFrame,
+    get_first_n: int | None,
+    sample_n: int | None,
+    sample_frac: int | float | None,
+    sample_limit: int,
+) -> nw.DataFrame:
+    """
+    Merge the failing rows of a batch into the extract collected over the previous batches.
+
+    The limiting and sampling options are applied as the batches are merged so that the extract
+    never grows beyond its final size (except when all failing rows are collected). To sample
+    `sample_n` rows uniformly across all batches, each failing row is given a random key and the
+    rows with the `sample_n` smallest keys are kept (the keys are stored in the `pb_sample_key_`
+    column, which needs to be dropped at the end).
+
+    Parameters
+    ----------
+    extract_nw
+        The extract collected over the previous batches (if any).
+    batch_extract_nw
+        The failing rows of the current batch.
+    get_first_n, sample_n, sample_frac, sample_limit
+        The options of the same name in `interrogate()`.
+
+    Returns
+    -------
+    nw.DataFrame
+        The merged extract.
+    """
+
+    if sample_n is not None:
+
+        import numpy as np
+
+        batch_extract_nw = batch_extract_nw.with_columns(
+            nw.new_series(
+                name="pb_sample_key_",
+                values=np.random.random(len(batch_extract_nw)),
+                dtype=nw.Float64(),
+                backend=nw.get_native_namespace(batch_extract_nw),
+            )
+        )
+
+    elif sample_frac is not None:
+
+        batch_extract_nw = batch_extract_nw.sample(fraction=sample_frac)
+
+    if extract_nw is not None:
+        extract_nw = nw.concat([extract_nw, batch_extract_nw], how="vertical")
+    else:
+        extract_nw = batch_extract_nw
+
+    if get_first_n is not None:
+        extract_nw = extract_nw.head(get_first_n)
+    elif sample_n is not None:
+        extract_nw = extract_nw.sort("pb_sample_key_").head(sample_n)
+    elif sample_frac is not None:
+        extract_nw = extract_nw.head(sample_limit)
+
+    return extract_nw
+
+
+def _get_ibis_base_predicate(tbl_checked: Any, base_tbl: Any, i: int) -> Any:
+    """
+    Get the `pb_is_good_` column of an Ibis checked table as an expression on the target table.
+
+    The checked tables of Ibis tables are built with a chain of projections (i.e., `mutate()`
+    calls) on the target table. The value of `pb_is_good_` is obtained by inlining the values of
+    the projected columns until the expression only refers to the columns of the target table,
+    so that it can be used directly in a `filter()` of that table. If the expression has a
+    structure that isn't supported (which can happen with other versions of Ibis, since this
+    relies on its expression nodes), `None` is returned.
+    """
+
+    import ibis.expr.operations as ops
+    from ibis.common.annotations import ValidationError
+    from ibis.common.exceptions import IbisError
+    from ibis.common.graph import Node
+
+    def inline_arg(arg):
+
+        if isinstance(arg, ops.Relation):
+            return arg
+
+        if isinstance(arg, Node):
+            return inline_value(arg)
+
+        if isinstance(arg, tuple):
+            return tuple(inline_arg(value) for value in arg)
+
+        return arg
+
+    def inline_value(node):
+
+        if isinstance(node, ops.Field):
+
+            if isinstance(node.rel, ops.Project):
+                return inline_value(node.rel.values[node.name])
+
+            if isinstance(node.rel, ops.DropColumns):
+                return inline_value(ops.Field(node.rel.parent, node.name))
+
+            return node
+
+        return node.copy(
+            **{name: inline_arg(arg) for name, arg in zip(node.__argnames__, node.__args__)}
+        )
+
+    if tbl_checked is None:
+        raise ValueError(
+            "The data can only be sundered if the results of the validation steps were "
+            "collected with `interrogate(collect_tbl_checked=True)`."
+        )
+
+    try:
+        predicate = inline_value(tbl_checked.pb_is_good_.op())
+        fields = predicate.find(ops.Field, filter=ops.Value)
+    except (AttributeError, TypeError, IbisError, ValidationError):
+        return None
+
+    # Any columns of relations other than the target table mean that a `pre=` function has
+    # changed the rows (relations in subqueries, e.g., those of reference sets in set membership
+    # checks, aren't traversed since they don't refer to the target table's rows)
+    if any(field.rel != base_tbl.op() for field in fields):
+        raise ValueError(
+            f"The data can't be sundered since step {i} was evaluated on a table that was "
+            "modified (by its `pre=` function) in a way that changes its rows."
+        )
+
+    return predicate.to_expr()
+
+
+def _get_ibis_sundered_data_by_join(
+    base_tbl: Any, validation_info: list[_ValidationInfo], type: str
+) -> Any:
+    """
+    Sunder an Ibis target table by joining the `pb_is_good_` columns of the checked tables.
+
+    The rows of the checked tables are matched to the rows of the target table by their row
+    numbers, with the rows ordered by all of the target table's columns so that the numbering is
+    the same in every relation (rows that are the same in every column have the same results in
+    row-based checks, so the order among them doesn't matter). This needs every checked table to
+    have been obtained from the target table itself (without a `pre=` function) and the columns
+    to be orderable; otherwise, an error is raised.
+    """
+
+    import ibis
+
+    columns = list(base_tbl.columns)
+
+    for validation in validation_info:
+
+        if validation.tbl_checked is None:
+            raise ValueError(
+                "The data can only be sundered if the results of the validation steps were "
+                "collected with `interrogate(collect_tbl_checked=True)`."
+            )
+
+        if validation.pre is not None or not set(columns) <= set(validation.tbl_checked.columns):
+            raise ValueError(
+                f"The data can't be sundered since the results of step {validation.i} can't be "
+                "matched to the rows of the target table with this version of Ibis."
+            )
+
+    if any(dtype.is_nested() or dtype.is_json() for dtype in base_tbl.schema().types):
+        raise ValueError(
+            "The data can't be sundered since the target table has columns that can't be ordered "
+            "to match the results of the validation steps to its rows."
+        )
+
+    index_name = "pb_index_"
+
+    labeled_tbl = base_tbl.mutate(**{index_name: ibis.row_number().over(order_by=columns)})
+
+    for k, validation in enumerate(validation_info):
+
+        results_tbl = validation.tbl_checked.mutate(
+            **{index_name: ibis.row_number().over(order_by=columns)}
+        ).select(index_name, **{f"pb_is_good_{k}": "pb_is_good_"})
+
+        labeled_tbl = labeled_tbl.left_join(results_tbl, index_name).select(
+            *labeled_tbl.columns, f"pb_is_good_{k}"
+        )
+
+    predicate = ibis.and_(*[labeled_tbl[f"pb_is_good_{k}"] for k in range(len(validation_info))])
+
+    return labeled_tbl.filter(predicate if type == "pass" else ~predicate).select(*columns)
+
+
+def _check_watermark_column(data_tbl: FrameT | Any, tbl_type: str, column: str):
+    """
+    Check that the watermark column for incremental interrogation is present in the table.
+    """
+
+    if tbl_type in IBIS_BACKENDS:
+        column_names = data_tbl.columns
+    else:
+        column_names = nw.from_native(data_tbl).collect_schema().names()
+
+    if column not in column_names:
+        raise ValueError(f"The watermark column `{column}` is not present in the table.")
+
+
+def _filter_rows_after_watermark(
+    data_tbl: FrameT | Any, tbl_type: str, column: str, watermark: Any
+) -> FrameT | Any:
+    """
+    Get the rows of a table where the watermark column is greater than the watermark.
+    """
+
+    if watermark is None:
+        return data_tbl
+
+    if tbl_type in IBIS_BACKENDS:
+        return data_tbl.filter(data_tbl[column] > watermark)
+
+    return nw.to_native(nw.from_native(data_tbl).filter(nw.col(column) > watermark))
+
+
+def _get_row_positions_after_watermark(
+    data_tbl: FrameT | Any, tbl_type: str, column: str, watermark: Any
+) -> Any:
+    """
+    Get the 0-indexed positions in a table of the rows where the watermark column is greater
+    than the watermark, as a NumPy array in the order of the rows.
+    """
+
+    import numpy as np
+
+    if tbl_type in IBIS_BACKENDS:
+
+        import ibis
+
+        tbl_indexed = data_tbl.mutate(_pb_row_=ibis.row_number())
+        positions = (
+            tbl_indexed.filter(tbl_indexed[column] > watermark)
+            .select("_pb_row_")
+            .to_pyarrow()["_pb_row_"]
+            .to_numpy()
+        )
+
+    else:
+
+        positions = (
+            nw.from_native(data_tbl)
+            .lazy()
+            .with_row_index(name="_pb_row_")
+            .filter(nw.col(column) > watermark)
+            .select("_pb_row_")
+            .collect()["_pb_row_"]
+            .to_numpy()
+        )
+
+    return np.sort(positions.astype(np.int64))
+
+
+def _offset_extract_row_numbers(extract: FrameT, row_positions: Any) -> FrameT:
+    """
+    Make the row numbers of an extract of the rows after the watermark refer to the whole table.
+    """
+
+    extract_nw = nw.from_native(extract, eager_only=True)
+
+    row_nums = row_positions[extract_nw["_row_num_"].to_numpy().astype("int64") - 1] + 1
+
+    return extract_nw.with_columns(
+        nw.new_series(
+            "_row_num_",
+            row_nums,
+            extract_nw.schema["_row_num_"],
+            backend=nw.get_native_namespace(extract_nw),
+        )
+    ).to_native()
+
+
+def _get_column_max(data_tbl: FrameT | Any, tbl_type: str, column: str) -> Any:
+    """
+    Get the largest value of a column as a Python value.
+    """
+
+    if tbl_type in IBIS_BACKENDS:
+        return data_tbl[column].max().to_pyarrow().as_py()
+
+    value = nw.from_native(data_tbl).lazy().select(nw.col(column).max()).collect().item()
+
+    # Convert NumPy scalars (from Pandas tables) to Python values
+    if hasattr(value, "item") and not hasattr(value, "to_pydatetime"):
+        value = value.item()
+
+    return value
+
+
+def _get_step_state_key(validation: _ValidationInfo) -> str:
+    """
+    Get a key that identifies a validation step across incremental interrogations.
+
+    Thresholds are left out since the counts of test units don't depend on them.
+    """
+
+    pre_text = _pre_processing_funcs_to_str(validation.pre) if validation.pre is not None else None
+
+    return repr(
+        (
+            validation.assertion_type,
+            validation.column,
+            validation.values,
+            validation.inclusive,
+            validation.na_pass,
+            pre_text,
+        )
+    )
+
+
+def _get_value_fingerprint(value: Any) -> Any:
+    """
+    Get a representation of a value of a validation step that can be used in its fingerprint.
+
+    Only values that are fully described by their contents are represented by them: scalars
+    (numbers, strings, dates, etc.), containers of such values, column references, and Polars
+    expressions (by their serialization). Functions and reference sets are represented by their
+    identity, so they only match themselves. Any other value (e.g., a DataFrame captured in a
+    `pre=` function, which could have the same truncated `repr()` as a different DataFrame) can't
+    be fingerprinted and a `TypeError` is raised.
+    """
+
+    import dataclasses
+    import decimal
+    import types
+
+    if value is None or isinstance(
+        value,
+        (
+            bool,
+            int,
+            float,
+            str,
+            bytes,
+            decimal.Decimal,
+            datetime.date,
+            datetime.time,
+            datetime.timedelta,
+        ),
+    ):
+        return (type(value).__name__, repr(value))
+
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_get_value_fingerprint(x) for x in value))
+
+    if isinstance(value, dict):
+        return (
+            "dict",
+            tuple((_get_value_fingerprint(k), _get_value_fingerprint(v)) for k, v in value.items()),
+        )
+
+    if isinstance(value, (set, frozenset)):
+        return (type(value).__name__, tuple(sorted(repr(_get_value_fingerprint(x)) for x in value)))
+
+    # Functions (including lambdas and closures) are only the same as themselves since the
+    # values they use can't all be inspected
+    if isinstance(value, (types.FunctionType, types.BuiltinFunctionType, types.MethodType)):
+        return ("function", id(value))
+
+    value_type = type(value)
+    type_name = f"{value_type.__module__}.{value_type.__qualname__}"
+
+    # Column references and selectors are described by their fields
+    if isinstance(value, (Column, ColumnSelector)) and not isinstance(
+        value, ColumnSelectorNarwhals
+    ):
+        return (
+            type_name,
+            tuple(
+                (field.name, _get_value_fingerprint(getattr(value, field.name)))
+                for field in dataclasses.fields(value)
+            ),
+        )
+
+    # Polars expressions are compared by their serialization (their `repr()` is truncated)
+    if type_name.startswith("polars.") and value_type.__name__ == "Expr":
+        try:
+            return (type_name, value.meta.serialize(format="json"))
+        except Exception as e:
+            raise TypeError(f"The Polars expression {value} can't be fingerprinted.") from e
+
+    # Reference sets are the same when they are for the same object
+    if isinstance(value, _ReferenceSet):
+        return (type_name, id(value.data))
+
+    raise TypeError(f"A value of type `{type_name}` can't be fingerprinted.")
+
+
+def _get_step_fingerprint(validation: _ValidationInfo) -> str | None:
+    """
+    Get the SHA-1 fingerprint of the parts of a validation step that determine its results.
+
+    Thresholds, labels, and other reporting options are left out so that steps that differ only
+    in those share a fingerprint (their test units are the same). If any part of the step can't
+    be fingerprinted (see `_get_value_fingerprint()`), `None` is returned.
+    """
+
+    try:
+        key = (
+            validation.assertion_type,
+            _get_value_fingerprint(validation.column),
+            _get_value_fingerprint(validation.values),
+            _get_value_fingerprint(validation.inclusive),
+            validation.na_pass,
+            _get_value_fingerprint(validation.pre),
+        )
+    except TypeError:
+        return None
+
+    return hashlib.sha1(repr(key).encode("utf-8")).hexdigest()
+
+
+def _get_duplicate_steps(
+    validation_info: list[_ValidationInfo], skip_steps: set[int]
+) -> dict[int, _ValidationInfo]:
+    """
+    Set the fingerprints of validation steps and find the steps that duplicate an earlier step.
+
+    Parameters
+    ----------
+    validation_info
+        The validation steps.
+    skip_steps
+        The `id()` values of steps that already have results (e.g., from their samples, which
+        are only decisive for some thresholds); these aren't matched with other steps.
+
+    Returns
+    -------
+    dict[int, _ValidationInfo]
+        The first step with the same fingerprint, keyed by the `id()` of each duplicate step.
+        Only active steps are considered.
+    """
+
+    first_steps = {}
+    duplicate_steps = {}
+
+    for validation in validation_info:
+
+        validation.sha1 = _get_step_fingerprint(validation=validation)
+
+        # A step that can't be fingerprinted is never matched with other steps
+        if (
+            validation.sha1 is None
+            or not validation.active
+            or validation.eval_error
+            or id(validation) in skip_steps
+        ):
+            continue
+
+        if validation.sha1 in first_steps:
+            duplicate_steps[id(validation)] = first_steps[validation.sha1]
+        else:
+            first_steps[validation.sha1] = validation
+
+    return duplicate_steps
+
+
+def _copy_step_results(source: _ValidationInfo, target: _ValidationInfo):
+    """
+    Give a duplicate validation step the results of the step it duplicates.
+
+    The threshold levels are determined with the duplicate step's own thresholds.
+    """
+
+    start_time = datetime.datetime.now(datetime.timezone.utc)
+
+    if not source.active:
+
+        # The source step wasn't evaluated (e.g., it was skipped after a stopping step)
+        _set_step_not_evaluated(validation=target)
+
+    else:
+
+        for attr in [
+            "all_passed",
+            "n",
+            "n_passed",
+            "n_failed",
+            "n_sampled",
+            "f_failed_ci",
+            "tbl_checked",
+            "checked_rows",
+            "extract",
+            "val_info",
+        ]:
+            setattr(target, attr, getattr(source, attr))
+
+        _set_fractions_and_threshold_levels(validation=target)
+
+    end_time = datetime.datetime.now(datetime.timezone.utc)
+    target.proc_duration_s = (end_time - start_time).total_seconds()
+    target.time_processed = end_time.isoformat(timespec="milliseconds")
+
+
+def _get_row_hash_method(tbl: FrameT | Any, tbl_type: str) -> str:
+    """
+    Get a description of how `_hash_rows()` hashes the rows of a table.
+
+    Row hashes are only stable for the same hashing engine and library version, so hashes kept
+    between incremental interrogations can only be compared if this description is unchanged.
+    """
+
+    if tbl_type in IBIS_BACKENDS:
+
+        import ibis
+        import ibis.expr.operations as ops
+
+        backend = ibis.get_backend(tbl)
+
+        if backend.has_operation(ops.Hash):
+            return f"ibis-{backend.name}-{backend.version}"
+
+    if tbl_type == "pandas":
+
+        import pandas as pd
+
+        return f"pandas-{pd.__version__}"
+
+    import polars as pl
+
+    return f"polars-{pl.__version__}"
+
+
+def _hash_rows(tbl: FrameT | Any, tbl_type: str, columns: list[str] | None):
+    """
+    Get the 64-bit hashes of the distinct rows of a table and their numbers of occurrences.
+
+    The rows are hashed by the table's engine: Ibis tables are hashed and counted by their
+    backends (over the concatenated text of the columns), so that only the distinct hashes and
+    their counts are fetched; Pandas tables are hashed with `pd.util.hash_pandas_object()` and
+    Polars tables with `Expr.hash()`. For Ibis backends without a hash function, the distinct rows
+    are counted by the backend and hashed with Polars.
+    """
+
+    import numpy as np
+
+    method = _get_row_hash_method(tbl=tbl, tbl_type=tbl_type)
+
+    if tbl_type in IBIS_BACKENDS:
+
+        import ibis
+
+        if columns is None:
+            columns = tbl.columns
+
+        if method.startswith("ibis-"):
+
+            # Missing values are told apart from any text (non-missing values are prefixed)
+            row_text = ibis.literal("\x1f").join(
+                [
+                    ibis.coalesce(ibis.literal("v").concat(tbl[col].cast("string")), "n")
+                    for col in columns
+                ]
+            )
+
+            counts = (
+                tbl.select(_pb_hash_=row_text.hash())
+                .group_by("_pb_hash_")
+                .aggregate(_pb_count_=ibis._.count())
+                .to_pyarrow()
+            )
+
+            row_hashes = counts["_pb_hash_"].to_numpy().astype(np.int64).view(np.uint64)
+            row_counts = counts["_pb_count_"].to_numpy().astype(np.int64)
+
+            order = np.argsort(row_hashes)
+
+            return row_hashes[order], row_counts[order]
+
+        # Only the distinct rows (with their counts) are fetched from the backend
+        tbl = tbl.group_by(columns).aggregate(_pb_count_=ibis._.count()).to_polars()
+
+    elif tbl_type == "pandas":
+
+        import pandas as pd
+
+        if columns is not None:
+            tbl = tbl[columns]
+
+        row_hashes = pd.util.hash_pandas_object(tbl, index=False).to_numpy()
+
+        return np.unique(row_hashes, return_counts=True)
+
+    import polars as pl
+
+    tbl_pl = nw.from_native(tbl).lazy().to_native().lazy()
+
+    if columns is None:
+        columns = tbl_pl.collect_schema().names()
+
+    row_count = pl.col("_pb_count_") if tbl_type in IBIS_BACKENDS else pl.lit(1)
+
+    counts = (
+        tbl_pl.select(
+            pl.struct(columns).hash(seed=0).alias("_pb_hash_"),
+            row_count.cast(pl.Int64).alias("_pb_count_"),
+        )
+        .group_by("_pb_hash_")
+        .agg(pl.col("_pb_count_").sum())
+        .sort("_pb_hash_")
+        .collect()
+    )
+
+    return counts["_pb_hash_"].to_numpy(), counts["_pb_count_"].to_numpy()
+
+
+def _get_step_state(
+    validation: _ValidationInfo, tbl_step: FrameT | Any, tbl_type: str
+) -> dict[str, Any]:
+    """
+    Get the incremental state of a step that was evaluated on the whole table.
+    """
+
+    step_state = {
+        "n": validation.n,
+        "n_passed": validation.n_passed,
+        "n_failed": validation.n_failed,
+    }
+
+    if validation.assertion_type == "row_count_match":
+        step_state["n_rows"] = get_row_count(tbl_step)
+
+    if validation.assertion_type == "rows_distinct":
+        step_state["row_hashes"], step_state["row_counts"] = _hash_rows(
+            tbl=tbl_step, tbl_type=tbl_type, columns=validation.column
+        )
+
+    return step_state
+
+
+def _merge_step_state(
+    validation: _ValidationInfo,
+    prior_step: dict[str, Any],
+    tbl_step: FrameT | Any | None,
+    tbl_type: str,
+) -> dict[str, Any]:
+    """
+    Merge the results of a step for the new rows with its state from the previous run.
+
+    The step's results are replaced by the cumulative results and its new state is returned. If
+    there are no new rows (`tbl_step=None`), the step gets the results of the previous run.
+    """
+
+    import numpy as np
+
+    assertion_type = validation.assertion_type
+
+    step_state = dict(prior_step)
+
+    if tbl_step is None:
+
+        # The step wasn't evaluated so any checked table or extract is from an earlier run
+        validation.tbl_checked = None
+        validation.checked_rows = None
+        validation.extract = None
+
+        validation.time_processed = datetime.datetime.now(datetime.timezone.utc).isoformat(
+            timespec="milliseconds"
+        )
+        validation.proc_duration_s = 0.0
+
+    elif assertion_type in ["col_exists", "col_schema_match", "col_count_match"]:
+
+        # The table's structure is checked on the new rows
+        step_state["n"] = validation.n
+        step_state["n_passed"] = validation.n_passed
+        step_state["n_failed"] = validation.n_failed
+
+    elif assertion_type == "row_count_match":
 
+        step_state["n_rows"] = prior_step["n_rows"] + get_row_count(tbl_step)
 
-def _process_title_text(title: str | None, tbl_name: str | None) -> str:
+        result_bool = (step_state["n_rows"] == validation.values["count"]) != validation.values[
+            "inverse"
+        ]
+
+        step_state["n"] = 1
+        step_state["n_passed"] = int(result_bool)
+        step_state["n_failed"] = 1 - int(result_bool)
+
+    elif assertion_type == "rows_distinct":
+
+        # Add the occurrences of the new rows to those of the rows seen before; every row that
+        # occurs more than once is a failing test unit
+        new_hashes, new_counts = _hash_rows(
+            tbl=tbl_step, tbl_type=tbl_type, columns=validation.column
+        )
+
+        row_hashes, inverse = np.unique(
+            np.concatenate([prior_step["row_hashes"], new_hashes]), return_inverse=True
+        )
+        row_counts = np.bincount(
+            inverse, weights=np.concatenate([prior_step["row_counts"], new_counts])
+        ).astype(np.int64)
+
+        step_state["row_hashes"] = row_hashes
+        step_state["row_counts"] = row_counts
+
+        step_state["n"] = prior_step["n"] + validation.n
+        step_state["n_failed"] = int(row_counts[row_counts > 1].sum())
+        step_state["n_passed"] = step_state["n"] - step_state["n_failed"]
 
-    if title is None:
-        title_text = ""
-    elif title == ":default:":
-        title_text = _get_default_title_text()
-    elif title == ":none:":
-        title_text = ""
-    elif title == ":tbl_name:":
-        if tbl_name is not None:
-            title_text = f"<code>{tbl_name}</code>"
-        else:
-            title_text = ""
     else:
-        title_text = commonmark.commonmark(title)
 
-    return title_text
+        for attr in ["n", "n_passed", "n_failed"]:
+            step_state[attr] = prior_step[attr] + getattr(validation, attr)
 
+    validation.n = step_state["n"]
+    validation.n_passed = step_state["n_passed"]
+    validation.n_failed = step_state["n_failed"]
+    validation.all_passed = step_state["n_failed"] == 0
 
-def _get_default_title_text() -> str:
-    return "Pointblank Validation"
+    _set_fractions_and_threshold_levels(validation=validation)
 
+    return step_state
 
-def _transform_tbl_preprocessed(pre: str, interrogation_performed: bool) -> list[str]:
 
-    # If no interrogation was performed, return a list of empty strings
-    if not interrogation_performed:
-        return ["" for _ in range(len(pre))]
+def _sample_rows(tbl: FrameT | Any, tbl_type: str, n: int, n_rows: int, seed: int) -> FrameT | Any:
+    """
+    Take a random sample of about `n` rows from a table.
+
+    Polars and Pandas tables are sampled exactly (a Polars LazyFrame sample is collected). Ibis
+    tables are sampled by their backends with row-level Bernoulli sampling, so the number of rows
+    in the sample varies around `n`. The sample of an Ibis table is materialized once, as a
+    temporary table in the backend (or as an in-memory table, if the backend can't cache it), so
+    that the table is only scanned once and every step evaluated on the sample sees the same rows
+    (not all backends support a seed for sampling, e.g., SQLite, so a sampling query that's run
+    again gives other rows). The temporary table is to be released with `_release_sample()`.
+    """
 
-    # Iterate over the pre-processed table status and return the appropriate SVG icon name
-    # (either 'unchanged' (None) or 'modified' (not None))
-    status_list = []
+    if tbl_type in IBIS_BACKENDS:
 
-    for status in pre:
-        if status is None:
-            status_list.append("unchanged")
+        fraction = n / n_rows
+
+        # Not all backends support a seed for sampling (e.g., SQLite)
+        if tbl_type in ["duckdb", "parquet", "memtable"]:
+            sample_tbl = tbl.sample(fraction, method="row", seed=seed)
         else:
-            status_list.append("modified")
+            sample_tbl = tbl.sample(fraction, method="row")
 
-    return _get_preprocessed_table_icon(icon=status_list)
+        # Not every backend can create temporary tables (the errors raised vary by backend)
+        try:
+            return sample_tbl.cache()
+        except Exception:
 
+            import ibis
 
-def _get_preprocessed_table_icon(icon: list[str]) -> list[str]:
+            return ibis.memtable(sample_tbl.to_pyarrow())
 
-    # For each icon, get the SVG icon from the SVG_ICONS_FOR_TBL_STATUS dictionary
-    icon_svg = [SVG_ICONS_FOR_TBL_STATUS.get(icon) for icon in icon]
+    if is_polars_lazyframe(tbl):
 
-    return icon_svg
+        import polars as pl
 
+        return tbl.filter(pl.int_range(pl.len()).shuffle(seed=seed) < n).collect()
 
-def _transform_eval(
-    n: list[int], interrogation_performed: bool, eval_error: list[bool], active: list[bool]
-) -> list[str]:
+    if is_polars_dataframe(tbl):
+        return tbl.sample(n=n, seed=seed)
 
-    # If no interrogation was performed, return a list of empty strings
-    if not interrogation_performed:
-        return ["" for _ in range(len(n))]
+    return tbl.sample(n=n, random_state=seed).reset_index(drop=True)
 
-    symbol_list = []
 
-    for i in range(len(n)):
+def _release_sample(sample_tbl: FrameT | Any):
+    """
+    Release the temporary table of a materialized sample of an Ibis table (see `_sample_rows()`).
+    """
 
-        # If there was an evaluation error, then add a collision mark
-        if eval_error[i]:
-            symbol_list.append('<span style="color:#CF142B;">&#128165;</span>')
-            continue
+    if "CachedTable" in str(type(sample_tbl)):
+        sample_tbl.release()
 
-        # If the validation step is inactive, then add an em dash
-        if not active[i]:
-            symbol_list.append("&mdash;")
-            continue
 
-        # Otherwise, add a green check mark
-        symbol_list.append('<span style="color:#4CA64C;">&check;</span>')
+def _wilson_interval(n_failed: int, n: int, conf_level: float) -> tuple[float, float]:
+    """
+    Get the Wilson score interval for a fraction of failing test units in a sample.
+    """
 
-    return symbol_list
+    z = NormalDist().inv_cdf(1 - (1 - conf_level) / 2)
 
+    p = n_failed / n
+    denominator = 1 + z**2 / n
+    center = (p + z**2 / (2 * n)) / denominator
+    half_width = z * (p * (1 - p) / n + z**2 / (4 * n**2)) ** 0.5 / denominator
 
-def _transform_test_units(
-    test_units: list[int], interrogation_performed: bool, active: list[bool]
-) -> list[str]:
+    # The bounds are exact when no test units (or all of them) failed in the sample
+    lower = 0.0 if n_failed == 0 else max(0.0, center - half_width)
+    upper = 1.0 if n_failed == n else min(1.0, center + half_width)
 
-    # If no interrogation was performed, return a list of empty strings
-    if not interrogation_performed:
-        return ["" for _ in range(len(test_units))]
+    return (lower, upper)
 
-    return [
-        (
-            (
-                str(test_units[i])
-                if test_units[i] < 10000
-                else str(vals.fmt_number(test_units[i], n_sigfig=3, compact=True)[0])
-            )
-            if active[i]
-            else "&mdash;"
+
+def _get_failing_rows(
+    results_tbl: FrameT | Any,
+    row_offset: int = 0,
+    source_tbl: FrameT | Any | None = None,
+    columns: list[str] | None = None,
+) -> nw.DataFrame:
+    """
+    Get the rows of a results table that failed a validation step.
+
+    Parameters
+    ----------
+    results_tbl
+        A table with a `pb_is_good_` column.
+    row_offset
+        The number of rows that precede the results table in the target table (this is nonzero
+        when the target table is interrogated in batches of rows).
+    source_tbl
+        The table that the step was evaluated on. The results tables of eager tables only have
+        the columns used by the step (see `_select_step_columns()`), so any other columns of the
+        failing rows are taken from this table (the rows of both tables match by position).
+    columns
+        The columns to keep in the failing rows (see `_get_extract_columns()`). If `None`, all
+        columns are kept.
+
+    Returns
+    -------
+    nw.DataFrame
+        The failing rows (without the `pb_is_good_` column) with their 1-indexed row numbers in
+        the target table as the first column (`_row_num_`).
+    """
+
+    results_nw = nw.from_native(results_tbl)
+
+    results_columns = [col for col in results_nw.collect_schema().names() if col != "pb_is_good_"]
+
+    source_nw = nw.from_native(source_tbl) if source_tbl is not None else None
+
+    # Take the failing rows from the table the step was evaluated on if the results table is
+    # missing some of the columns to extract
+    if (
+        isinstance(results_nw, nw.DataFrame)
+        and isinstance(source_nw, nw.DataFrame)
+        and any(
+            col not in results_columns
+            for col in (columns if columns is not None else source_nw.columns)
         )
-        for i in range(len(test_units))
-    ]
+    ):
+        failing_mask = (results_nw["pb_is_good_"] == False).fill_null(False)  # noqa
+        failing_rows_nw = source_nw.with_row_index(name="_row_num_").filter(failing_mask)
 
+    else:
 
-def _fmt_lg(value: int) -> str:
-    return vals.fmt_number(value, n_sigfig=3, compact=True)[0]
+        # Add row numbers to the results table
+        failing_rows_nw = (
+            results_nw.with_row_index(name="_row_num_")
+            .filter(nw.col("pb_is_good_") == False)  # noqa
+            .drop("pb_is_good_")
+        )
 
+    # Only keep the requested columns (for a lazy results table, this means that only these
+    # columns are read when it's collected)
+    if columns is not None:
+        failing_rows_nw = failing_rows_nw.select(
+            "_row_num_",
+            *[col for col in failing_rows_nw.collect_schema().names() if col in columns],
+        )
 
-def _transform_passed_failed(
-    n_passed_failed: list[int],
-    f_passed_failed: list[float],
-    interrogation_performed: bool,
-    active: list[bool],
-) -> list[str]:
+    # Add 1 to the row numbers to make them 1-indexed
+    failing_rows_nw = failing_rows_nw.with_columns(nw.col("_row_num_") + (row_offset + 1))
 
-    if not interrogation_performed:
-        return ["" for _ in range(len(n_passed_failed))]
+    # A lazy results table is only collected now that it's been reduced to the failing rows
+    if isinstance(failing_rows_nw, nw.LazyFrame):
+        failing_rows_nw = failing_rows_nw.collect()
 
-    passed_failed = [
-        (
-            f"{n_passed_failed[i] if n_passed_failed[i] < 10000 else _fmt_lg(n_passed_failed[i])}"
-            f"<br />{vals.fmt_number(f_passed_failed[i], decimals=2)[0]}"
-            if active[i]
-            else "&mdash;"
+    # The columns of rows collected from a table that's read in parts (e.g., the row groups of a
+    # Parquet file) can be split into different numbers of chunks, which Polars doesn't always
+    # handle (e.g., it panics when writing the extract as CSV for the tabular report), so the
+    # extract is put in contiguous memory
+    if is_polars_dataframe(failing_rows_nw.to_native()):
+        failing_rows_nw = nw.from_native(failing_rows_nw.to_native().rechunk())
+
+    return failing_rows_nw
+
+
+def _get_extract_columns(
+    validation: _ValidationInfo, extract_columns: list[str] | None
+) -> list[str] | None:
+    """
+    Get the columns to keep in the extract of a row-based validation step.
+
+    These are the columns used by the step (see `_get_step_columns()`) along with the columns
+    given in `interrogate(extract_columns=)`. If that option is `None`, all columns are kept (and
+    `None` is returned).
+    """
+
+    if extract_columns is None:
+        return None
+
+    step_columns = _get_step_columns(column=validation.column, values=validation.values)
+
+    return step_columns + [col for col in extract_columns if col not in step_columns]
+
+
+def _get_ibis_failing_rows(
+    results_tbl: Any,
+    get_first_n: int | None,
+    sample_n: int | None,
+    sample_frac: int | float | None,
+    sample_limit: int,
+    columns: list[str] | None = None,
+) -> FrameT:
+    """
+    Get the rows of an Ibis results table that failed a validation step.
+
+    The failing rows are selected by a query that is executed in the backend: row numbers are
+    added with a window function, the rows are filtered on the `pb_is_good_` column, and the
+    extract is limited to the first `get_first_n=` rows (with `LIMIT`) or to a random sample of
+    the rows (ordering by a random value for `sample_n=` or filtering on a random value for
+    `sample_frac=`, with the `sample_limit=` as the limit). Only the extracted rows are fetched.
+
+    Parameters
+    ----------
+    results_tbl
+        An Ibis table with a `pb_is_good_` column.
+    get_first_n, sample_n, sample_frac, sample_limit
+        The options of the same name in `interrogate()`.
+    columns
+        The columns to keep in the extract (see `_get_extract_columns()`). If `None`, all columns
+        are kept.
+
+    Returns
+    -------
+    FrameT
+        The failing rows (without the `pb_is_good_` column) with their 1-indexed row numbers as
+        the first column (`_row_num_`), as a Polars DataFrame (or as a Pandas DataFrame if
+        Polars isn't available).
+    """
+
+    import ibis
+
+    # Add row numbers to the results table before filtering so that they refer to all rows
+    results_tbl = results_tbl.mutate(_row_num_=ibis.row_number() + 1)
+
+    failing_rows = results_tbl.filter(results_tbl.pb_is_good_ == False)  # noqa
+    failing_rows = failing_rows.select(
+        "_row_num_",
+        *[
+            col
+            for col in results_tbl.columns
+            if col not in ["_row_num_", "pb_is_good_"] and (columns is None or col in columns)
+        ],
+    )
+
+    # Apply any sampling or limiting to the number of rows to extract
+    if get_first_n is not None:
+        failing_rows = failing_rows.order_by("_row_num_").limit(get_first_n)
+    elif sample_n is not None:
+        failing_rows = failing_rows.order_by(ibis.random()).limit(sample_n)
+    elif sample_frac is not None:
+        failing_rows = failing_rows.filter(ibis.random() < sample_frac).limit(sample_limit)
+    else:
+        failing_rows = failing_rows.order_by("_row_num_")
+
+    if _is_lib_present(lib_name="polars"):
+        return failing_rows.to_polars()
+
+    return failing_rows.to_pandas()
+
+
+def _set_fractions_and_threshold_levels(validation: _ValidationInfo):
+    """
+    Set the fractions of passing/failing test units and the threshold levels for a step.
+
+    Parameters
+    ----------
+    validation
+        An interrogated validation step (its `n`, `n_passed`, and `n_failed` attributes must be
+        set already).
+    """
+
+    # Calculate fractions of passing and failing test units
+    # - `f_passed` is the fraction of test units that passed
+    # - `f_failed` is the fraction of test units that failed
+    for attr in ["passed", "failed"]:
+        setattr(
+            validation,
+            f"f_{attr}",
+            _convert_abs_count_to_fraction(
+                value=getattr(validation, f"n_{attr}"), test_units=validation.n
+            ),
         )
-        for i in range(len(n_passed_failed))
-    ]
 
-    return passed_failed
+    # Determine if the number of failing test units is beyond the threshold value
+    # for each of the severity levels
+    # - `warn` is the threshold for a warning
+    # - `stop` is the threshold for stopping
+    # - `notify` is the threshold for notifying
+    for level in ["warn", "stop", "notify"]:
+        setattr(
+            validation,
+            level,
+            validation.thresholds._threshold_result(
+                fraction_failing=validation.f_failed, test_units=validation.n, level=level
+            ),
+        )
 
 
-def _transform_w_s_n(values, color, interrogation_performed):
+def _set_step_not_evaluated(validation: _ValidationInfo):
+    """
+    Clear the results of a validation step and mark the step as not evaluated.
 
-    # If no interrogation was performed, return a list of empty strings
-    if not interrogation_performed:
-        return ["" for _ in range(len(values))]
+    The step is made inactive (as is done for steps with an evaluation error) so that it appears
+    in the validation report without any results.
+    """
 
-    return [
-        (
-            "&mdash;"
-            if value is None
-            else (
-                f'<span style="color: {color};">&#9679;</span>'
-                if value is True
-                else f'<span style="color: {color};">&cir;</span>' if value is False else value
-            )
+    for attr in [
+        "all_passed",
+        "n",
+        "n_passed",
+        "n_failed",
+        "f_passed",
+        "f_failed",
+        "n_sampled",
+        "f_failed_ci",
+        "warn",
+        "stop",
+        "notify",
+        "tbl_checked",
+        "checked_rows",
+        "extract",
+        "val_info",
+    ]:
+        setattr(validation, attr, None)
+
+    validation.active = False
+
+
+def _interrogate_steps_in_process(
+    ipc_path: str, validation_info: list[_ValidationInfo], step_kwargs: dict[str, Any]
+) -> list[dict[str, Any]]:
+    """
+    Interrogate a share of the validation steps of a Pandas table in a worker process.
+
+    Parameters
+    ----------
+    ipc_path
+        The path to the Arrow IPC file that holds the target table.
+    validation_info
+        The validation steps to interrogate.
+    step_kwargs
+        The keyword arguments for `_interrogate_step()` (other than the table, its type, the
+        results of fused plans, and the cache of pre-processed tables).
+
+    Returns
+    -------
+    list[dict[str, Any]]
+        For each step, the step's result attributes (`"attrs"`, including the packed results in
+        `checked_rows`), the 0-indexed row numbers of the extracted rows (`"extract_rows"`), and
+        the columns of the extract (`"extract_columns"`).
+    """
+
+    import pandas as pd
+    import pyarrow as pa
+
+    # Read the table from the memory-mapped file as a Pandas DataFrame with Arrow-backed columns:
+    # these wrap the Arrow arrays, whose buffers point into the mapped file, so the table isn't
+    # copied into the worker process (as it would be with NumPy-backed columns)
+    source = pa.memory_map(ipc_path, "r")
+    data_tbl = pa.ipc.open_file(source).read_all().to_pandas(types_mapper=pd.ArrowDtype)
+
+    validation = Validate(data=data_tbl)
+
+    results = []
+
+    for step in validation_info:
+
+        validation._interrogate_step(
+            validation=step, data_tbl=data_tbl, tbl_type="pandas", fused_results={}, **step_kwargs
         )
-        for value in values
-    ]
 
+        if step.extract is not None:
+            extract_rows = step.extract["_row_num_"].to_numpy().astype("int64") - 1
+            extract_columns = [col for col in step.extract.columns if col != "_row_num_"]
+        else:
+            extract_rows = None
+            extract_columns = None
 
-def _transform_assertion_str(assertion_str: list[str]) -> list[str]:
+        results.append(
+            {
+                "attrs": {
+                    attr: getattr(step, attr)
+                    for attr in [
+                        "all_passed",
+                        "n",
+                        "n_passed",
+                        "n_failed",
+                        "f_passed",
+                        "f_failed",
+                        "warn",
+                        "stop",
+                        "notify",
+                        "val_info",
+                        "active",
+                        "checked_rows",
+                        "proc_duration_s",
+                        "time_processed",
+                    ]
+                },
+                "extract_rows": extract_rows,
+                "extract_columns": extract_columns,
+            }
+        )
 
-    # Get the SVG icons for the assertion types
-    svg_icon = _get_assertion_icon(icon=assertion_str)
+    return results
 
-    # Append `()` to the `assertion_str`
-    assertion_str = [x + "()" for x in assertion_str]
 
-    # Obtain the number of characters contained in the assertion
-    # string; this is important for sizing components appropriately
-    assertion_type_nchar = [len(x) for x in assertion_str]
+def _apply_pre_processing(data_tbl: FrameT | Any, pre: Callable | None) -> FrameT | Any:
+    """
+    Apply a validation step's pre-processing function to the target table.
 
-    # Declare the text size based on the length of `assertion_str`
-    text_size = [10 if nchar + 2 >= 20 else 11 for nchar in assertion_type_nchar]
+    Parameters
+    ----------
+    data_tbl
+        The target table.
+    pre
+        The pre-processing function or lambda (or `None` if there isn't one).
 
-    # Create the assertion type update using a list comprehension
-    type_upd = [
-        f"""
-        <div style="margin:0;padding:0;display:inline-block;height:30px;vertical-align:middle;">
-        <!--?xml version="1.0" encoding="UTF-8"?-->{svg}
-        </div>
-        <span style="font-family: 'IBM Plex Mono', monospace, courier; color: black; font-size:{size}px;"> {assertion}</span>
-        """
-        for assertion, svg, size in zip(assertion_str, svg_icon, text_size)
-    ]
+    Returns
+    -------
+    FrameT | Any
+        The pre-processed table (or the target table itself if there is no pre-processing).
+    """
 
-    return type_upd
+    data_tbl_step = data_tbl
+
+    # Determine whether any pre-processing functions are to be applied to the table
+    if pre is not None:
+
+        # Read the text of the pre-processing function
+        pre_text = _pre_processing_funcs_to_str(pre)
+
+        # Determine if the pre-processing function is a lambda function; return a boolean
+        is_lambda = re.match(r"^lambda", pre_text) is not None
+
+        # If the pre-processing function is a lambda function, then check if there is
+        # a keyword argument called `dfn` in the lamda signature; if so, that's a cue
+        # to use a Narwhalified version of the table
+        if is_lambda:
+
+            # Get the signature of the lambda function
+            sig = inspect.signature(pre)
+
+            # Check if the lambda function has a keyword argument called `dfn`
+            if "dfn" in sig.parameters:
+
+                # Convert the table to a Narwhals DataFrame
+                data_tbl_step = nw.from_native(data_tbl_step)
+
+                # Apply the pre-processing function to the table
+                data_tbl_step = pre(dfn=data_tbl_step)
+
+                # Convert the table back to its original format
+                data_tbl_step = nw.to_native(data_tbl_step)
+
+            else:
+                # Apply the pre-processing function to the table
+                data_tbl_step = pre(data_tbl_step)
+
+        # If the pre-processing function is a function, apply it to the table
+        elif isinstance(pre, Callable):
+
+            data_tbl_step = pre(data_tbl_step)
+
+    return data_tbl_step
 
 
 def _pre_processing_funcs_to_str(pre: Callable) -> str | list[str]:
@@ -7687,10 +11378,10 @@ def _step_report_row_based(
         symbol_right = "&gt;" if inclusive[1] else "&ge;"
         text = f"<code style='color: #303030; font-family: monospace; font-size: smaller;'>{column} {symbol_left} {values[0]}, {column} {symbol_right} {values[1]}</code>"
     elif assertion_type == "col_vals_in_set":
-        elements = ", ".join(values)
+        elements = str(values) if isinstance(values, _ReferenceSet) else ", ".join(values)
         text = f"<code style='color: #303030; font-family: monospace; font-size: smaller;'>{column} &isinv; {{{elements}}}</code>"
     elif assertion_type == "col_vals_not_in_set":
-        elements = ", ".join(values)
+        elements = str(values) if isinstance(values, _ReferenceSet) else ", ".join(values)
         text = f"<code style='color: #303030; font-family: monospace; font-size: smaller;'>{column} &NotElement; {{{elements}}}</code>"
     elif assertion_type == "col_vals_regex":
         text = f"<code style='color: #303030; font-family: monospace; font-size: smaller;'>{column}</code> matches regex <code style='color: #303030; font-family: monospace; font-size: smaller;'>{values}</code>"
@@ -1,6 +1,10 @@
+import pathlib
+
 import pytest
 import pandas as pd
 import polars as pl
+import ibis
+import narwhals as nw
 
 from pointblank._interrogation import (
     ColValsCompareOne,
@@ -9,7 +13,14 @@ from pointblank._interrogation import (
     ColValsRegex,
     ColExistsHasType,
     RowsDistinct,
+    FusedRowChecks,
+    _collect_fused_row_checks,
+    _get_duplicated_rows,
+    _get_test_unit_counts,
+    _is_row_check_passed_by_stats,
 )
+from pointblank._utils import _TableContext
+from pointblank.column import col
 
 
 @pytest.fixture
@@ -46,6 +57,10 @@ def tbl_pl_distinct():
 
 COLUMN_LIST = ["x", "y", "z", "pb_is_good_"]
 
+# The results of the column value checks only have the columns used by the check
+COLUMN_LIST_X = ["x", "pb_is_good_"]
+COLUMN_LIST_Y = ["y", "pb_is_good_"]
+
 COLUMN_LIST_DISTINCT = ["col_1", "col_2", "col_3", "pb_is_good_"]
 
 
@@ -86,11 +101,11 @@ def test_col_vals_compare_one(request, tbl_fixture, assertion_method):
     )
 
     if tbl_fixture == "tbl_pd":
-        assert col_vals_compare_one.test_unit_res.columns.tolist() == COLUMN_LIST
-        assert col_vals_compare_one.get_test_results().columns.tolist() == COLUMN_LIST
+        assert col_vals_compare_one.test_unit_res.columns.tolist() == COLUMN_LIST_X
+        assert col_vals_compare_one.get_test_results().columns.tolist() == COLUMN_LIST_X
     else:
-        assert col_vals_compare_one.test_unit_res.columns == COLUMN_LIST
-        assert col_vals_compare_one.get_test_results().columns == COLUMN_LIST
+        assert col_vals_compare_one.test_unit_res.columns == COLUMN_LIST_X
+        assert col_vals_compare_one.get_test_results().columns == COLUMN_LIST_X
 
     assert col_vals_compare_one.test() is True
 
@@ -140,11 +155,11 @@ def test_col_vals_compare_two(request, tbl_fixture, assertion_method):
     )
 
     if tbl_fixture == "tbl_pd":
-        assert col_vals_compare_two.test_unit_res.columns.tolist() == COLUMN_LIST
-        assert col_vals_compare_two.get_test_results().columns.tolist() == COLUMN_LIST
+        assert col_vals_compare_two.test_unit_res.columns.tolist() == COLUMN_LIST_X
+        assert col_vals_compare_two.get_test_results().columns.tolist() == COLUMN_LIST_X
     else:
-        assert col_vals_compare_two.test_unit_res.columns == COLUMN_LIST
-        assert col_vals_compare_two.get_test_results().columns == COLUMN_LIST
+        assert col_vals_compare_two.test_unit_res.columns == COLUMN_LIST_X
+        assert col_vals_compare_two.get_test_results().columns == COLUMN_LIST_X
 
     assert col_vals_compare_two.test() is True
 
@@ -193,11 +208,11 @@ def test_col_vals_compare_set(request, tbl_fixture, inside):
     )
 
     if tbl_fixture == "tbl_pd":
-        assert col_vals_compare_set.test_unit_res.columns.tolist() == COLUMN_LIST
-        assert col_vals_compare_set.get_test_results().columns.tolist() == COLUMN_LIST
+        assert col_vals_compare_set.test_unit_res.columns.tolist() == COLUMN_LIST_X
+        assert col_vals_compare_set.get_test_results().columns.tolist() == COLUMN_LIST_X
     else:
-        assert col_vals_compare_set.test_unit_res.columns == COLUMN_LIST
-        assert col_vals_compare_set.get_test_results().columns == COLUMN_LIST
+        assert col_vals_compare_set.test_unit_res.columns == COLUMN_LIST_X
+        assert col_vals_compare_set.get_test_results().columns == COLUMN_LIST_X
 
     assert col_vals_compare_set.test() is True
 
@@ -225,11 +240,11 @@ def test_col_vals_regex(request, tbl_fixture):
     )
 
     if tbl_fixture == "tbl_pd":
-        assert col_vals_regex.test_unit_res.columns.tolist() == COLUMN_LIST
-        assert col_vals_regex.get_test_results().columns.tolist() == COLUMN_LIST
+        assert col_vals_regex.test_unit_res.columns.tolist() == COLUMN_LIST_Y
+        assert col_vals_regex.get_test_results().columns.tolist() == COLUMN_LIST_Y
     else:
-        assert col_vals_regex.test_unit_res.columns == COLUMN_LIST
-        assert col_vals_regex.get_test_results().columns == COLUMN_LIST
+        assert col_vals_regex.test_unit_res.columns == COLUMN_LIST_Y
+        assert col_vals_regex.get_test_results().columns == COLUMN_LIST_Y
 
     assert col_vals_regex.test() is True
 
@@ -278,3 +293,430 @@ def test_rows_distinct(request, tbl_fixture):
     else:
         assert rows_distinct.test_unit_res.columns == COLUMN_LIST_DISTINCT
         assert rows_distinct.get_test_results().columns == COLUMN_LIST_DISTINCT
+
+
+@pytest.fixture
+def tbl_pl_duplicates():
+    return pl.DataFrame(
+        {
+            "x": [1, 1, 2, 2, None, None, 3, 3],
+            "y": [0.0, -0.0, 1.5, 2.5, float("nan"), float("nan"), None, None],
+            "z": ["a", "a", "b", "b", None, None, "c", "d"],
+        }
+    )
+
+
+DUPLICATED_ROWS = [True, True, False, False, True, True, False, False]
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars"])
+def test_get_duplicated_rows(monkeypatch, tbl_pl_duplicates, tbl_type):
+
+    tbl = tbl_pl_duplicates if tbl_type == "polars" else tbl_pl_duplicates.to_pandas()
+    tbl = nw.from_native(tbl)
+
+    assert _get_duplicated_rows(tbl=tbl, columns=["x", "y", "z"]).to_list() == DUPLICATED_ROWS
+    assert _get_duplicated_rows(tbl=tbl, columns=["x"]).to_list() == [True] * 8
+    assert _get_duplicated_rows(tbl=tbl, columns=["x", "z"]).to_list() == [True] * 6 + [False] * 2
+
+    # Hash collisions are resolved by comparing the candidate rows in full
+    monkeypatch.setattr(
+        "pointblank._interrogation._get_row_hashes",
+        lambda tbl: tbl.with_columns(hash=nw.lit(0))["hash"],
+    )
+
+    assert _get_duplicated_rows(tbl=tbl, columns=["x", "y", "z"]).to_list() == DUPLICATED_ROWS
+
+
+@pytest.mark.parametrize("max_candidate_rows", [10_000_000, 2])
+def test_rows_distinct_lazyframe(monkeypatch, tbl_pl_duplicates, max_candidate_rows):
+
+    # With a low maximum number of candidate rows, these are checked in partitions
+    monkeypatch.setattr(
+        "pointblank._interrogation._ROWS_DISTINCT_MAX_CANDIDATE_ROWS", max_candidate_rows
+    )
+
+    rows_distinct = RowsDistinct(
+        data_tbl=tbl_pl_duplicates.lazy(), columns_subset=["x", "y", "z"], threshold=1
+    )
+
+    assert isinstance(rows_distinct.test_unit_res, pl.LazyFrame)
+
+    tbl_checked = rows_distinct.get_test_results().collect()
+
+    assert tbl_checked.columns == ["x", "y", "z", "pb_is_good_"]
+    assert tbl_checked["pb_is_good_"].to_list() == [not dup for dup in DUPLICATED_ROWS]
+
+
+def test_rows_distinct_ibis(tbl_pl_duplicates):
+
+    # Missing values are equal to each other (as in the local backends)
+    tbl = ibis.memtable(tbl_pl_duplicates.with_row_index("i").drop("y"))
+
+    tbl_checked = (
+        RowsDistinct(data_tbl=tbl, columns_subset=["x", "z"], threshold=1, tbl_type="memtable")
+        .get_test_results()
+        .to_polars()
+        .sort("i")
+    )
+
+    assert tbl_checked.columns == ["i", "x", "z", "pb_is_good_"]
+    assert tbl_checked["pb_is_good_"].to_list() == [False] * 6 + [True, True]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_fused_row_checks(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    steps = [
+        {
+            "assertion_method": "gt",
+            "column": "x",
+            "values": 1,
+            "inclusive": None,
+            "na_pass": False,
+            "allowed_types": ["numeric"],
+        },
+        {
+            "assertion_method": "between",
+            "column": "z",
+            "values": [0, 10],
+            "inclusive": (True, True),
+            "na_pass": False,
+            "allowed_types": ["numeric"],
+        },
+        {
+            "assertion_method": "regex",
+            "column": "y",
+            "values": r"^[4-5]$",
+            "inclusive": None,
+            "na_pass": False,
+            "allowed_types": ["str"],
+        },
+    ]
+
+    results = FusedRowChecks(data_tbl=tbl, steps=steps).get_test_results()
+
+    assert [(res["n"], res["n_passed"], res["n_failed"]) for res in results] == [
+        (4, 3, 1),
+        (4, 4, 0),
+        (4, 2, 2),
+    ]
+    assert [res["all_passed"] for res in results] == [False, True, False]
+    assert all(res["tbl_checked"] is None for res in results)
+
+    results = FusedRowChecks(data_tbl=tbl, steps=steps, collect_tbl_checked=True).get_test_results()
+
+    # Each checked table only has the columns used by its step
+    for res, column in zip(results, ["x", "z", "y"]):
+        assert list(res["tbl_checked"].columns) == [column, "pb_is_good_"]
+
+
+@pytest.mark.parametrize(
+    "tbl_fixture, dtype",
+    [
+        ("tbl_pd", "str"),
+        ("tbl_pd", "category"),
+        ("tbl_pl", "str"),
+        ("tbl_pl", "categorical"),
+        ("tbl_pl", "enum"),
+    ],
+)
+def test_checks_on_distinct_values(request, monkeypatch, tbl_fixture, dtype):
+
+    # Make the string columns of the small test table eligible for the evaluation of checks on
+    # their distinct values
+    monkeypatch.setattr("pointblank._utils._DISTINCT_VALUES_MIN_ROWS", 0)
+    monkeypatch.setattr("pointblank._utils._DISTINCT_VALUES_MAX_FRACTION", 1)
+
+    tbl = request.getfixturevalue(tbl_fixture)
+    values = ["a", "b", None, "a", "c", "b", None, "d"]
+
+    if tbl_fixture == "tbl_pd":
+        tbl = pd.DataFrame({"y": values})
+        if dtype == "category":
+            tbl = tbl.astype({"y": "category"})
+    else:
+        tbl = pl.DataFrame({"y": values})
+        if dtype == "categorical":
+            tbl = tbl.with_columns(pl.col("y").cast(pl.Categorical))
+        elif dtype == "enum":
+            tbl = tbl.with_columns(pl.col("y").cast(pl.Enum(["a", "b", "c", "d"])))
+
+    def get_results(tbl_checked):
+        return tbl_checked["pb_is_good_"].to_list()
+
+    tbl_str = tbl.astype({"y": "object"}) if tbl_fixture == "tbl_pd" else tbl.cast({"y": pl.String})
+
+    # The results with the table's context are the same as those on the values as strings
+    for na_pass in [True, False]:
+
+        regex_args = dict(column="y", pattern=r"^[ab]$", na_pass=na_pass, threshold=10)
+        regex_args["allowed_types"] = ["str"]
+
+        assert get_results(
+            ColValsRegex(data_tbl=tbl, tbl_context=_TableContext(tbl), **regex_args).test_unit_res
+        ) == get_results(ColValsRegex(data_tbl=tbl_str, **regex_args).test_unit_res)
+
+    for inside in [True, False]:
+
+        set_args = dict(column="y", values=["b", "d"], threshold=10, inside=inside)
+        set_args["allowed_types"] = ["str"]
+
+        assert get_results(
+            ColValsCompareSet(
+                data_tbl=tbl, tbl_context=_TableContext(tbl), **set_args
+            ).test_unit_res
+        ) == get_results(ColValsCompareSet(data_tbl=tbl_str, **set_args).test_unit_res)
+
+    steps = [
+        {
+            "assertion_method": assertion_method,
+            "column": "y",
+            "values": values,
+            "inclusive": None,
+            "na_pass": na_pass,
+            "allowed_types": ["str"],
+        }
+        for assertion_method, values in [
+            ("regex", r"^[bc]$"),
+            ("in_set", ["a", "c"]),
+            ("not_in_set", ["a", "c"]),
+        ]
+        for na_pass in [True, False]
+    ]
+
+    def get_counts(tbl):
+        return [
+            (res["n"], res["n_passed"], res["n_failed"])
+            for res in FusedRowChecks(data_tbl=tbl, steps=steps).get_test_results()
+        ]
+
+    assert get_counts(tbl) == get_counts(tbl_str)
+
+    # The distinct values are obtained once for all steps on the column
+    tbl_context = _TableContext(tbl)
+
+    FusedRowChecks(data_tbl=tbl, steps=steps, tbl_context=tbl_context)
+
+    assert list(tbl_context.distinct_values) == ["y"]
+    assert tbl_context.distinct_values["y"] is not None
+
+
+def test_fused_row_checks_lazyframe(tbl_pl):
+
+    steps = [
+        {
+            "assertion_method": "gt",
+            "column": "x",
+            "values": 1,
+            "inclusive": None,
+            "na_pass": False,
+            "allowed_types": ["numeric"],
+        },
+    ]
+
+    # Nothing is collected when the plans are created
+    plans = [
+        FusedRowChecks(data_tbl=tbl_pl.lazy(), steps=steps, collect_tbl_checked=True),
+        FusedRowChecks(data_tbl=tbl_pl.lazy().head(2), steps=steps, collect_tbl_checked=True),
+    ]
+
+    assert all(plan.test_unit_res is None for plan in plans)
+
+    _collect_fused_row_checks(plans=plans, collect_tbl_checked=True)
+
+    results = [plan.get_test_results()[0] for plan in plans]
+
+    assert [(res["n"], res["n_passed"], res["n_failed"]) for res in results] == [
+        (4, 3, 1),
+        (2, 1, 1),
+    ]
+    assert all(isinstance(res["tbl_checked"], pl.DataFrame) for res in results)
+
+    # Without collecting the checked tables, these remain as lazy queries
+    results = FusedRowChecks(
+        data_tbl=tbl_pl.lazy(), steps=steps, collect_tbl_checked=True
+    ).get_test_results()
+
+    assert (results[0]["n"], results[0]["n_passed"]) == (4, 3)
+    assert isinstance(results[0]["tbl_checked"], pl.LazyFrame)
+    assert results[0]["tbl_checked"].collect()["pb_is_good_"].to_list() == [
+        False,
+        True,
+        True,
+        True,
+    ]
+
+    # The checked tables of a lazy table keep all columns unless the columns for the extracts
+    # are given (then only these and the step's columns are collected)
+    assert results[0]["tbl_checked"].collect_schema().names() == COLUMN_LIST
+
+    results = FusedRowChecks(
+        data_tbl=tbl_pl.lazy(), steps=steps, collect_tbl_checked=True, extract_columns=["z"]
+    ).get_test_results()
+
+    assert results[0]["tbl_checked"].collect_schema().names() == ["x", "z", "pb_is_good_"]
+
+
+@pytest.mark.parametrize(
+    "assertion_method, values, inclusive, na_pass, passed",
+    [
+        ("gt", 0, None, False, True),
+        ("gt", 1, None, False, False),
+        ("ge", 1, None, False, True),
+        ("lt", 10, None, False, True),
+        ("lt", 9, None, False, False),
+        ("le", 9, None, False, True),
+        ("eq", 1, None, False, False),
+        ("between", [1, 9], (True, True), False, True),
+        ("between", [1, 9], (False, True), False, False),
+        ("between", [0, 9], (False, False), False, False),
+        ("outside", [10, 20], (True, True), False, True),
+        ("outside", [9, 20], (True, True), False, False),
+        ("outside", [9, 20], (False, True), False, True),
+        ("outside", [-5, 0], (True, True), False, True),
+        ("outside", [-5, 1], (True, False), False, True),
+        ("outside", [-5, 1], (True, True), False, False),
+        ("not_null", None, None, False, True),
+        ("null", None, None, False, False),
+        # Comparisons against other columns, non-numeric values, and `NaN` can't be decided
+        ("gt", col("x"), None, False, False),
+        ("gt", "0", None, False, False),
+        ("gt", True, None, False, False),
+        ("gt", float("nan"), None, False, False),
+        ("in_set", [1, 9], None, False, False),
+    ],
+)
+def test_is_row_check_passed_by_stats(assertion_method, values, inclusive, na_pass, passed):
+
+    column_stats = {"min": 1, "max": 9, "null_count": 0, "nan_count": 0}
+
+    assert (
+        _is_row_check_passed_by_stats(
+            assertion_method=assertion_method,
+            values=values,
+            inclusive=inclusive,
+            na_pass=na_pass,
+            column_stats=column_stats,
+            n_rows=10,
+        )
+        is passed
+    )
+
+
+def test_is_row_check_passed_by_stats_missing_values():
+
+    def is_passed(assertion_method, column_stats, values=0, na_pass=False, n_rows=10):
+        return _is_row_check_passed_by_stats(
+            assertion_method=assertion_method,
+            values=values,
+            inclusive=None,
+            na_pass=na_pass,
+            column_stats=column_stats,
+            n_rows=n_rows,
+        )
+
+    with_nulls = {"min": 1, "max": 9, "null_count": 2, "nan_count": 0}
+    with_nans = {"min": 1, "max": 9, "null_count": 0, "nan_count": 2}
+    all_nulls = {"min": None, "max": None, "null_count": 10, "nan_count": 0}
+
+    # Missing values only pass with `na_pass=True`
+    assert not is_passed("gt", with_nulls)
+    assert is_passed("gt", with_nulls, na_pass=True)
+    assert not is_passed("not_null", with_nulls)
+
+    # Columns with `NaN` values (or without a minimum value) are evaluated row by row
+    assert not is_passed("gt", with_nans)
+    assert not is_passed("gt", all_nulls, na_pass=True)
+
+    assert is_passed("null", all_nulls)
+    assert not is_passed("not_null", all_nulls)
+
+    # Steps on empty tables are evaluated as usual
+    assert not is_passed("not_null", {**all_nulls, "null_count": 0}, n_rows=0)
+
+
+def test_fused_row_checks_invalid_column(tbl_pl):
+
+    steps = [
+        {
+            "assertion_method": "gt",
+            "column": "invalid",
+            "values": 1,
+            "inclusive": None,
+            "na_pass": False,
+            "allowed_types": ["numeric"],
+        },
+    ]
+
+    with pytest.raises(ValueError):
+        FusedRowChecks(data_tbl=tbl_pl, steps=steps)
+
+
+@pytest.mark.parametrize(
+    "tbl",
+    [
+        pl.DataFrame({"pb_is_good_": [True, None, False, True]}),
+        pd.DataFrame({"pb_is_good_": pd.Series([True, None, False, True], dtype="boolean")}),
+        pd.DataFrame({"pb_is_good_": [True, None, False, True]}),
+    ],
+)
+def test_get_test_unit_counts_with_missing(tbl):
+
+    # Missing values are test units that neither pass nor fail
+    assert _get_test_unit_counts(tbl=tbl) == {
+        "n": 4,
+        "n_passed": 2,
+        "n_failed": 1,
+        "all_passed": False,
+    }
+
+
+@pytest.mark.parametrize(
+    "tbl",
+    [
+        pl.DataFrame({"pb_is_good_": []}, schema={"pb_is_good_": pl.Boolean}),
+        pd.DataFrame({"pb_is_good_": pd.Series([], dtype=bool)}),
+    ],
+)
+def test_get_test_unit_counts_empty_table(tbl):
+
+    assert _get_test_unit_counts(tbl=tbl) == {
+        "n": 0,
+        "n_passed": 0,
+        "n_failed": 0,
+        "all_passed": True,
+    }
+
+
+@pytest.mark.parametrize("tbl_ext", ["parquet", "ddb", "sqlite"])
+def test_get_test_unit_counts_ibis(tbl_ext):
+
+    file_path = pathlib.Path.cwd() / "tests" / "tbl_files" / f"tbl_xyz_missing.{tbl_ext}"
+
+    if tbl_ext == "parquet":
+        tbl = ibis.read_parquet(file_path)
+    elif tbl_ext == "ddb":
+        tbl = ibis.connect(f"duckdb://{file_path}").table("tbl_xyz_missing")
+    else:
+        tbl = ibis.sqlite.connect(file_path).table("tbl_xyz_missing")
+
+    # The missing value in `x` produces a missing `pb_is_good_` value
+    results_tbl = tbl.mutate(pb_is_good_=tbl.x > 1)
+
+    assert _get_test_unit_counts(tbl=results_tbl, tbl_type="duckdb") == {
+        "n": 4,
+        "n_passed": 2,
+        "n_failed": 1,
+        "all_passed": False,
+    }
+
+    # An empty table has no test units at all
+    assert _get_test_unit_counts(tbl=results_tbl.filter(tbl.x > 100), tbl_type="duckdb") == {
+        "n": 0,
+        "n_passed": 0,
+        "n_failed": 0,
+        "all_passed": True,
+    }
@@ -8,11 +8,14 @@ from unittest.mock import patch
 import narwhals as nw
 
 from pointblank._utils import (
+    _ParquetMetadata,
+    _TableContext,
     _convert_to_narwhals,
     _check_column_exists,
     _check_column_type,
     _check_invalid_fields,
     _column_test_prep,
+    _convert_arrow_data,
     _format_to_float_value,
     _format_to_integer_value,
     _get_assertion_from_fname,
@@ -21,10 +24,12 @@ from pointblank._utils import (
     _get_api_text,
     _get_examples_text,
     _get_fn_name,
+    _get_parquet_file_paths,
     _get_tbl_type,
     _is_numeric_dtype,
     _is_date_or_datetime_dtype,
     _is_duration_dtype,
+    _scan_file_data,
     _select_df_lib,
 )
 
@@ -336,6 +341,315 @@ def test_check_column_test_prep_raises(request, tbl_fixture):
         _column_test_prep(df=tbl, column="invalid", allowed_types=["numeric"])
 
 
+@pytest.mark.parametrize(
+    "tbl_fixture",
+    ["tbl_multiple_types_pd", "tbl_multiple_types_pl"],
+)
+def test_check_column_test_prep_with_context(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    tbl_context = _TableContext(data_tbl=tbl)
+
+    dfn = _column_test_prep(
+        df=tbl, column="int", allowed_types=["numeric"], tbl_context=tbl_context
+    )
+
+    # The Narwhals-wrapped table is reused by every step that uses the context
+    assert dfn is tbl_context.get_nw_tbl()
+    assert (
+        _column_test_prep(df=tbl, column="str", allowed_types=["str"], tbl_context=tbl_context)
+        is dfn
+    )
+
+    with pytest.raises(TypeError):
+        _column_test_prep(df=tbl, column="int", allowed_types=["str"], tbl_context=tbl_context)
+
+    with pytest.raises(ValueError):
+        _column_test_prep(
+            df=tbl, column="invalid", allowed_types=["numeric"], tbl_context=tbl_context
+        )
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_table_context(request, tbl_fixture):
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    tbl_context = _TableContext(data_tbl=tbl)
+
+    assert tbl_context.tbl_type == _get_tbl_type(tbl)
+    assert tbl_context.get_column_names() == ["x", "y", "z"]
+    assert tbl_context.get_row_count() == 4
+
+    # The metadata is only computed once
+    assert tbl_context.get_schema() is tbl_context.get_schema()
+
+    # The table type can be provided so that it isn't determined again
+    assert _TableContext(data_tbl=tbl, tbl_type="local").tbl_type == "local"
+
+
+def test_table_context_distinct_values(monkeypatch):
+
+    monkeypatch.setattr("pointblank._utils._DISTINCT_VALUES_MIN_ROWS", 100)
+
+    tbl = pl.DataFrame(
+        {
+            "low": ["a", "b", None, "c"] * 100,
+            "high": [str(i) for i in range(400)],
+            "num": [1, 2, 3, 4] * 100,
+        }
+    ).with_columns(cat=pl.col("low").cast(pl.Categorical))
+
+    tbl_context = _TableContext(data_tbl=tbl)
+
+    # Dictionary-encoded columns and low-cardinality string columns are eligible
+    assert sorted(tbl_context.get_distinct_values("low")["low"].to_list(), key=str) == [
+        None,
+        "a",
+        "b",
+        "c",
+    ]
+    assert len(tbl_context.get_distinct_values("cat")) == 4
+    assert tbl_context.get_distinct_values("high") is None
+    assert tbl_context.get_distinct_values("num") is None
+
+    # The distinct values are only obtained once
+    assert tbl_context.get_distinct_values("low") is tbl_context.get_distinct_values("low")
+
+    # String columns in small tables and columns in lazy tables aren't eligible
+    assert _TableContext(data_tbl=tbl.head(10)).get_distinct_values("low") is None
+    assert _TableContext(data_tbl=tbl.head(10)).get_distinct_values("cat") is not None
+    assert _TableContext(data_tbl=tbl.lazy()).get_distinct_values("cat") is None
+    assert _TableContext(data_tbl=tbl.to_pandas()).get_distinct_values("low") is not None
+
+
+def test_table_context_ibis():
+    ibis = pytest.importorskip("ibis")
+
+    tbl = ibis.memtable({"x": [1, 2, 3], "y": ["a", "b", "c"]})
+
+    tbl_context = _TableContext(data_tbl=tbl)
+
+    assert tbl_context.tbl_type == "memtable"
+    assert tbl_context.get_column_names() == ["x", "y"]
+    assert tbl_context.get_row_count() == 3
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "lazy", "pandas", "duckdb"])
+def test_table_context_column_stats(tbl_type):
+
+    tbl = pl.DataFrame(
+        {
+            "x": [3, 1, None, 4],
+            "y": [1.5, float("nan"), 2.5, 0.5],
+            "z": ["a", "b", None, None],
+        }
+    )
+
+    if tbl_type == "lazy":
+        tbl = tbl.lazy()
+    elif tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+    elif tbl_type == "duckdb":
+        ibis = pytest.importorskip("ibis")
+        tbl = ibis.memtable(tbl.to_arrow())
+
+    tbl_context = _TableContext(data_tbl=tbl)
+
+    column_stats = tbl_context.get_column_stats(["x", "y", "z", "w"])
+
+    # Columns that aren't in the table are left out; the row count is obtained along the way
+    assert list(column_stats) == ["x", "y", "z"]
+    assert tbl_context.row_count == 4
+
+    assert column_stats["x"] == {"min": 1, "max": 4, "null_count": 1, "nan_count": 0}
+    assert column_stats["z"] == {"min": None, "max": None, "null_count": 2, "nan_count": 0}
+
+    # `NaN` values are counted separately from missing values, except for pandas columns (where
+    # they are the missing values)
+    if tbl_type == "pandas":
+        assert column_stats["y"]["null_count"] == 1
+        assert column_stats["y"]["nan_count"] == 0
+    else:
+        assert column_stats["y"]["null_count"] == 0
+        assert column_stats["y"]["nan_count"] == 1
+
+    # The statistics are cached for each column
+    assert tbl_context.get_column_stats(["z"])["z"] is column_stats["z"]
+
+
+def test_convert_arrow_data(monkeypatch, tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    tbl = pa.table({"x": [1, 2, None], "y": pa.array(["a", "b", "a"]).dictionary_encode()})
+    pq.write_table(tbl, tmp_path / "tbl.parquet")
+
+    # Other data is returned as is
+    tbl_pl = pl.DataFrame({"x": [1, 2, 3]})
+
+    assert _convert_arrow_data(tbl_pl) is tbl_pl
+    assert _convert_arrow_data([1, 2, 3]) == [1, 2, 3]
+
+    # Tables, record batches, and record batch readers become Polars DataFrames
+    for data in [
+        tbl,
+        tbl.to_batches()[0],
+        pa.RecordBatchReader.from_batches(tbl.schema, tbl.to_batches()),
+    ]:
+        converted = _convert_arrow_data(data)
+
+        assert isinstance(converted, pl.DataFrame)
+        assert converted.schema == {"x": pl.Int64, "y": pl.Categorical(ordering="physical")}
+        assert converted["x"].to_list() == [1, 2, None]
+
+    # A dataset is scanned lazily
+    converted = _convert_arrow_data(ds.dataset(tmp_path / "tbl.parquet"))
+
+    assert isinstance(converted, pl.LazyFrame)
+    assert converted.collect()["x"].to_list() == [1, 2, None]
+
+    # Without Polars, the data becomes a pandas DataFrame with Arrow-backed columns
+    monkeypatch.setattr("pointblank._utils._is_lib_present", lambda lib_name: lib_name != "polars")
+
+    for data in [tbl, ds.dataset(tmp_path / "tbl.parquet")]:
+        converted = _convert_arrow_data(data)
+
+        assert isinstance(converted, pd.DataFrame)
+        assert isinstance(converted["x"].dtype, pd.ArrowDtype)
+        assert converted["x"].isna().tolist() == [False, False, True]
+
+
+def test_scan_file_data(monkeypatch, tmp_path):
+
+    tbl = pl.DataFrame({"x": [1, 2, None], "y": ["a", "b", "c"]})
+
+    tbl.write_parquet(tmp_path / "tbl_1.parquet")
+    tbl.write_parquet(tmp_path / "tbl_2.parquet")
+    tbl.write_ipc(tmp_path / "tbl.feather")
+    tbl.write_csv(tmp_path / "tbl.CSV")
+
+    # Other data (including strings that aren't paths to data files) is returned as is
+    assert _scan_file_data(tbl) is tbl
+    assert _scan_file_data("tbl") == "tbl"
+    assert _scan_file_data("tbl.txt") == "tbl.txt"
+
+    for path in [
+        tmp_path / "tbl_1.parquet",
+        str(tmp_path / "tbl.feather"),
+        str(tmp_path / "tbl.CSV"),
+    ]:
+        scanned = _scan_file_data(path)
+
+        assert isinstance(scanned, pl.LazyFrame)
+        assert scanned.collect().equals(tbl)
+
+    assert _scan_file_data(str(tmp_path / "tbl_?.parquet")).collect().height == 6
+
+    with pytest.raises(FileNotFoundError):
+        _scan_file_data(tmp_path / "missing.parquet")
+
+    with pytest.raises(FileNotFoundError):
+        _scan_file_data(str(tmp_path / "missing_*.csv"))
+
+    # Without Polars, the files are opened as a PyArrow dataset
+    ds = pytest.importorskip("pyarrow.dataset")
+
+    monkeypatch.setattr("pointblank._utils._is_lib_present", lambda lib_name: lib_name != "polars")
+
+    scanned = _scan_file_data(str(tmp_path / "tbl_*.parquet"))
+
+    assert isinstance(scanned, ds.Dataset)
+    assert scanned.count_rows() == 6
+
+
+def test_get_parquet_file_paths(tmp_path):
+    ibis = pytest.importorskip("ibis")
+
+    tbl = pl.DataFrame({"x": [1, 2, 3]})
+
+    tbl.write_parquet(tmp_path / "tbl_1.parquet")
+    tbl.write_parquet(tmp_path / "tbl_2.parquet")
+    tbl.write_csv(tmp_path / "tbl.csv")
+
+    paths = [str(tmp_path / "tbl_1.parquet"), str(tmp_path / "tbl_2.parquet")]
+
+    assert _get_parquet_file_paths(tmp_path / "tbl_1.parquet") == paths[:1]
+    assert _get_parquet_file_paths(str(tmp_path / "tbl_*.parquet")) == paths
+    assert _get_parquet_file_paths(str(tmp_path / "missing_*.parquet")) is None
+    assert _get_parquet_file_paths(str(tmp_path / "tbl.csv")) is None
+    assert _get_parquet_file_paths(tbl) is None
+
+    # Ibis doesn't expose the files that its tables are read from
+    assert _get_parquet_file_paths(ibis.read_parquet(str(tmp_path / "tbl_*.parquet"))) is None
+    assert _get_parquet_file_paths(ibis.memtable(tbl.to_arrow())) is None
+
+
+def test_parquet_metadata(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    tbl = pl.DataFrame(
+        {
+            "x": [1, 2, 3, 4, None, 6],
+            "y": [0.5, 1.5, 2.5, 3.5, 4.5, 5.5],
+            "z": [None, None, "a", "b", "c", "d"],
+        }
+    )
+
+    pq.write_table(tbl.to_arrow(), tmp_path / "tbl_1.parquet", row_group_size=2)
+    pq.write_table(tbl.head(3).to_arrow(), tmp_path / "tbl_2.parquet")
+
+    parquet_metadata = _ParquetMetadata(
+        file_paths=[str(tmp_path / "tbl_1.parquet"), str(tmp_path / "tbl_2.parquet")]
+    )
+
+    assert parquet_metadata.get_row_count() == 9
+    assert [row_group["row_offset"] for row_group in parquet_metadata.get_row_groups()] == [
+        0,
+        2,
+        4,
+        6,
+    ]
+    assert [row_group["n_rows"] for row_group in parquet_metadata.get_row_groups()] == [
+        2,
+        2,
+        2,
+        3,
+    ]
+
+    assert [stats["max"] for stats in parquet_metadata.get_row_group_stats("x")] == [2, 4, 6, 3]
+    assert parquet_metadata.get_column_stats("x") == {
+        "min": 1,
+        "max": 6,
+        "null_count": 1,
+        "nan_count": 0,
+    }
+
+    # Only the counts of missing values are kept for columns that aren't integer or decimal
+    # columns (and row groups without any non-missing values have no minimum or maximum values)
+    assert parquet_metadata.get_column_stats("y")["min"] is None
+    assert parquet_metadata.get_column_stats("z") == {
+        "min": None,
+        "max": None,
+        "null_count": 4,
+        "nan_count": 0,
+    }
+
+    assert parquet_metadata.get_column_stats("w") is None
+
+    # The row count and column statistics of a table read from the files come from the footers
+    tbl_context = _TableContext(
+        data_tbl=pl.scan_parquet(tmp_path / "tbl_*.parquet"),
+        parquet_paths=parquet_metadata.file_paths,
+    )
+
+    assert tbl_context.get_row_count() == 9
+    assert tbl_context.get_column_stats(["x"])["x"]["max"] == 6
+
+    # Floating-point columns are aggregated to count any `NaN` values
+    assert tbl_context.get_column_stats(["y"])["y"]["max"] == 5.5
+
+
 def test_format_to_integer_value():
 
     assert _format_to_integer_value(0) == "0"
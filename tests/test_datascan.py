@@ -100,6 +100,19 @@ def test_datascan_json_file_output(tmp_path):
     assert profile_json == file_content
 
 
+def test_datascan_file_path(tmp_path):
+
+    dataset = load_dataset(dataset="small_table")
+    dataset.write_parquet(tmp_path / "small_table.parquet")
+
+    scanner = DataScan(data=str(tmp_path / "small_table.parquet"))
+
+    # The scanned file is read in full for the profile
+    assert scanner.data.equals(dataset)
+    assert scanner.tbl_type == "polars"
+    assert scanner.profile == DataScan(data=dataset).profile
+
+
 def test_datascan_class_raises():
     with pytest.raises(TypeError):
         DataScan(data="not a DataFrame or Ibis Table")
@@ -1,4 +1,7 @@
 import pathlib
+import copy
+import pickle
+import warnings
 
 import pprint
 import sys
@@ -8,6 +11,7 @@ import pytest
 
 import pandas as pd
 import polars as pl
+from polars.testing import assert_frame_equal
 import ibis
 from datetime import datetime
 
@@ -23,6 +27,9 @@ from pointblank.validate import (
     get_row_count,
     PointblankConfig,
     _ValidationInfo,
+    _PreProcessingCache,
+    _CheckedRows,
+    _get_step_fingerprint,
     _process_title_text,
     _get_default_title_text,
     _fmt_lg,
@@ -360,10 +367,13 @@ def test_validation_plan_and_interrogation(request, tbl_fixture):
         "n_failed",
         "f_passed",
         "f_failed",
+        "n_sampled",
+        "f_failed_ci",
         "warn",
         "stop",
         "notify",
         "tbl_checked",
+        "checked_rows",
         "extract",
         "val_info",
         "time_processed",
@@ -392,6 +402,7 @@ def test_validation_plan_and_interrogation(request, tbl_fixture):
     assert val_info.stop is None
     assert val_info.notify is None
     assert val_info.tbl_checked is None
+    assert val_info.checked_rows is None
     assert val_info.extract is None
     assert val_info.val_info is None
     assert val_info.time_processed is None
@@ -433,10 +444,13 @@ def test_validation_plan_and_interrogation(request, tbl_fixture):
         "n_failed",
         "f_passed",
         "f_failed",
+        "n_sampled",
+        "f_failed_ci",
         "warn",
         "stop",
         "notify",
         "tbl_checked",
+        "checked_rows",
         "extract",
         "val_info",
         "time_processed",
@@ -463,7 +477,7 @@ def test_validation_plan_and_interrogation(request, tbl_fixture):
     assert val_info.warn is None
     assert val_info.stop is None
     assert val_info.notify is None
-    assert val_info.tbl_checked is not None
+    assert val_info.tbl_checked is not None or val_info.checked_rows is not None
     assert val_info.val_info is None
     assert isinstance(val_info.time_processed, str)
     assert val_info.proc_duration_s > 0.0
@@ -565,6 +579,29 @@ def test_validation_attr_getters_no_dict(request, tbl_fixture):
     assert notify_val is None
 
 
+def test_validation_step_numbering(tbl_pl):
+
+    v = (
+        Validate(tbl_pl)
+        .col_vals_gt(columns=["x", "y"], value=0)
+        .col_vals_gt(columns=col(starts_with("z")), value=0)
+        .col_vals_lt(columns="x", value=3)
+    )
+
+    assert [validation.i_o for validation in v.validation_info] == [1, 2, 3, 4]
+
+    # Identical steps are numbered by their position in the plan
+    v = v.col_vals_lt(columns="x", value=3).interrogate()
+
+    assert [validation.i for validation in v.validation_info] == [1, 2, 3, 4, 5]
+    assert v.n_passed() == {1: 4, 2: 4, 3: 4, 4: 2, 5: 2}
+
+    # Steps can be accessed individually or by a list of steps (in any order)
+    assert [v.n_passed(i=i, scalar=True) for i in range(1, 6)] == [4, 4, 4, 2, 2]
+    assert v.n_passed(i=[5, 1]) == {1: 4, 5: 2}
+    assert v.n_passed(i=6) == {}
+
+
 @pytest.mark.parametrize("tbl_fixture", TBL_LIST)
 def test_get_json_report(request, tbl_fixture):
 
@@ -1412,6 +1449,91 @@ def test_col_vals_not_in_set(request, tbl_fixture):
     )
 
 
+@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
+@pytest.mark.parametrize(
+    "reference_set",
+    [
+        pl.Series("ref", [1, 2, 3, None, 3]),
+        pd.Series([1, 2, 3, None, 3], name="ref"),
+        pl.DataFrame({"ref": [1, 2, 3, None, 3]}),
+        pd.DataFrame({"ref": [1, 2, 3, None, 3]}),
+        ibis.memtable({"ref": [1, 2, 3, None, 3]}),
+    ],
+)
+def test_col_vals_in_set_reference_set(request, tbl_fixture, reference_set):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    # A table or Series used as the set gives the same results as a list of its values
+    validation = (
+        Validate(tbl)
+        .col_vals_in_set(columns="x", set=reference_set)
+        .col_vals_not_in_set(columns="x", set=reference_set)
+        .interrogate()
+    )
+
+    validation_list = (
+        Validate(tbl)
+        .col_vals_in_set(columns="x", set=[1, 2, 3])
+        .col_vals_not_in_set(columns="x", set=[1, 2, 3])
+        .interrogate()
+    )
+
+    assert validation.n_passed() == validation_list.n_passed() == {1: 3, 2: 1}
+    assert validation.n_failed() == validation_list.n_failed() == {1: 1, 2: 3}
+
+    # The failing rows are collected and the data can be sundered
+    assert len(validation.get_data_extracts(i=1, frame=True)) == 1
+    assert get_row_count(validation.get_sundered_data(type="pass")) == 0
+
+    # The reporting methods show the name of the reference set's column
+    validation.get_tabular_report()
+    validation.get_step_report(i=1)
+
+    assert "reference set 'ref'" in validation.get_json_report()
+
+
+def test_col_vals_in_set_reference_set_cache(tbl_pl):
+
+    from pointblank._interrogation import _REFERENCE_SET_CACHE
+
+    reference_set = pl.DataFrame({"ref": [1, 2, 3]})
+
+    validation = (
+        Validate(tbl_pl)
+        .col_vals_in_set(columns="x", set=reference_set)
+        .col_vals_in_set(columns="x", set=reference_set)
+        .interrogate()
+    )
+
+    # The two steps use the same reference set, so they share a fingerprint
+    assert validation.validation_info[0].sha1 == validation.validation_info[1].sha1
+
+    # The distinct values of the set are cached for the object, and reused across validations
+    cache = _REFERENCE_SET_CACHE[id(reference_set)]
+    cached_series = cache["polars"]
+
+    Validate(tbl_pl).col_vals_not_in_set(columns="x", set=reference_set).interrogate()
+
+    assert _REFERENCE_SET_CACHE[id(reference_set)]["polars"] is cached_series
+
+    # The cache entry is removed when the reference set is garbage collected
+    key = id(reference_set)
+    del reference_set, validation, cache
+
+    import gc
+
+    gc.collect()
+
+    assert key not in _REFERENCE_SET_CACHE
+
+
+def test_col_vals_in_set_reference_set_invalid(tbl_pl):
+
+    with pytest.raises(ValueError, match="exactly one column"):
+        Validate(tbl_pl).col_vals_in_set(columns="x", set=pl.DataFrame({"a": [1], "b": [2]}))
+
+
 @pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
 def test_col_vals_regex(request, tbl_fixture):
 
@@ -4097,253 +4219,1840 @@ def test_interrogate_sample_frac_with_sample_limit(request, tbl_fixture):
     assert len(nw.from_native(validation.get_data_extracts(i=1, frame=True)).columns) == 4
 
 
-@pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
-def test_col_vals_null(request, tbl_fixture):
+@pytest.mark.parametrize("tbl_fixture", ["tbl_missing_pd", "tbl_missing_pl"])
+def test_interrogate_fuse_steps(request, tbl_fixture):
 
     tbl = request.getfixturevalue(tbl_fixture)
 
-    assert Validate(tbl).col_vals_null(columns="text").interrogate().n_passed(i=1, scalar=True) == 1
+    def validation_plan():
+        return (
+            Validate(tbl, thresholds=(1, 2, 3))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_eq(columns="z", value=8)
+            .col_vals_ne(columns="z", value=8)
+            .col_vals_between(columns="y", left=4, right=col("z"), na_pass=True)
+            .col_vals_outside(columns="x", left=2, right=3, inclusive=(False, True))
+            .col_vals_in_set(columns="z", set=[8])
+            .col_vals_not_null(columns="y")
+            .col_vals_gt(columns="x", value=1, pre=lambda df: df.head(2))
+            .col_vals_lt(columns="y", value=7, pre=lambda df: df.head(2))
+            .rows_distinct()
+            .col_exists(columns="x")
+        )
 
+    validation_stepwise = validation_plan().interrogate()
+    validation_fused = validation_plan().interrogate(fuse_steps=True)
 
-@pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
-def test_col_vals_not_null(request, tbl_fixture):
+    for step_stepwise, step_fused in zip(
+        validation_stepwise.validation_info, validation_fused.validation_info
+    ):
+        for attr in ["n", "n_passed", "n_failed", "all_passed", "warn", "stop", "notify"]:
+            assert getattr(step_stepwise, attr) == getattr(step_fused, attr)
 
-    tbl = request.getfixturevalue(tbl_fixture)
+    extracts_stepwise = validation_stepwise.get_data_extracts()
+    extracts_fused = validation_fused.get_data_extracts()
 
-    assert (
-        Validate(tbl).col_vals_not_null(columns="text").interrogate().n_passed(i=1, scalar=True)
-        == 2
+    for i in extracts_stepwise:
+        if extracts_stepwise[i] is None:
+            assert extracts_fused[i] is None
+        else:
+            assert (
+                nw.from_native(extracts_stepwise[i]).rows()
+                == nw.from_native(extracts_fused[i]).rows()
+            )
+
+    assert nw.from_native(validation_stepwise.get_sundered_data()).rows() == (
+        nw.from_native(validation_fused.get_sundered_data()).rows()
     )
 
 
-@pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
-def test_col_exists(request, tbl_fixture):
+def test_interrogate_fuse_steps_ibis_table(tbl_duckdb):
 
-    tbl = request.getfixturevalue(tbl_fixture)
+    # Fusing isn't done for Ibis tables but the option shouldn't change the results
+    validation = (
+        Validate(tbl_duckdb)
+        .col_vals_gt(columns="x", value=1)
+        .col_vals_lt(columns="y", value=7)
+        .interrogate(fuse_steps=True)
+    )
 
-    assert Validate(tbl).col_exists(columns="text").interrogate().n_passed(i=1, scalar=True) == 1
-    assert Validate(tbl).col_exists(columns="invalid").interrogate().n_passed(i=1, scalar=True) == 0
+    assert validation.n_passed() == {1: 3, 2: 3}
 
 
-@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
-def test_validation_types(request, tbl_fixture):
+@pytest.mark.parametrize(
+    "tbl_fixture", ["tbl_missing_parquet", "tbl_missing_duckdb", "tbl_missing_sqlite"]
+)
+def test_interrogate_ibis_extracts(request, tbl_missing_pl, tbl_fixture):
 
     tbl = request.getfixturevalue(tbl_fixture)
 
-    validation = Validate(tbl).col_vals_gt(columns="x", value=0).interrogate()
+    def validation_plan(tbl):
+        return (
+            Validate(tbl)
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_in_set(columns="z", set=[8])
+            .col_exists(columns="x")
+        )
 
-    # Check that the `validation` object is a Validate object
-    assert isinstance(validation, Validate)
+    validation_ibis = validation_plan(tbl).interrogate()
+    validation_pl = validation_plan(tbl_missing_pl).interrogate()
 
-    # Check that using the `get_tabular_report()` returns a GT object
-    assert isinstance(validation.get_tabular_report(), GT.GT)
+    # The extracts of Ibis tables are the same as those of the equivalent Polars table
+    extracts_ibis = validation_ibis.get_data_extracts()
+    extracts_pl = validation_pl.get_data_extracts()
 
+    assert list(extracts_ibis) == list(extracts_pl)
 
-@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
-def test_interrogate_raise_on_get_first_and_sample(request, tbl_fixture):
+    for i in extracts_pl:
+        if extracts_pl[i] is None:
+            assert extracts_ibis[i] is None
+        else:
+            assert isinstance(extracts_ibis[i], pl.DataFrame)
+            assert extracts_ibis[i].columns == ["_row_num_", "x", "y", "z"]
+            assert extracts_ibis[i]["_row_num_"].to_list() == extracts_pl[i]["_row_num_"].to_list()
+            assert extracts_ibis[i].drop("_row_num_").rows() == (
+                extracts_pl[i].drop("_row_num_").rows()
+            )
 
-    tbl = request.getfixturevalue(tbl_fixture)
+    assert isinstance(validation_ibis.get_step_report(i=1), GT.GT)
 
-    with pytest.raises(ValueError):
-        Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(get_first_n=2, sample_n=4)
-    with pytest.raises(ValueError):
-        Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(get_first_n=2, sample_frac=0.5)
-    with pytest.raises(ValueError):
-        Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(sample_n=2, sample_frac=0.5)
+    # The number of extracted rows can be limited in the query
+    validation = validation_plan(tbl).interrogate(get_first_n=1)
 
+    assert validation.get_data_extracts(i=1, frame=True)["_row_num_"].to_list() == [1]
 
-def test_get_data_extracts(tbl_missing_pd):
+    validation = validation_plan(tbl).interrogate(sample_n=1)
 
-    validation = (
-        Validate(tbl_missing_pd)
-        .col_vals_gt(columns="x", value=1)
-        .col_vals_lt(columns="y", value=10)
-        .interrogate()
-    )
+    assert len(validation.get_data_extracts(i=1, frame=True)) == 1
 
-    extracts_all = validation.get_data_extracts()
-    extracts_1 = validation.get_data_extracts(i=1)
-    extracts_2 = validation.get_data_extracts(i=2)
+    validation = validation_plan(tbl).interrogate(sample_frac=1, sample_limit=1)
 
-    assert isinstance(extracts_all, dict)
-    assert isinstance(extracts_1, dict)
-    assert isinstance(extracts_2, dict)
-    assert len(extracts_all) == 2
-    assert len(extracts_1) == 1
-    assert len(extracts_2) == 1
+    assert len(validation.get_data_extracts(i=1, frame=True)) == 1
 
-    extracts_1_df = validation.get_data_extracts(i=1, frame=True)
-    extracts_2_df = validation.get_data_extracts(i=2, frame=True)
+    # No extracts are collected if `collect_extracts=False`
+    validation = validation_plan(tbl).interrogate(collect_extracts=False)
 
-    assert isinstance(extracts_1_df, pd.DataFrame)
-    assert isinstance(extracts_2_df, pd.DataFrame)
+    assert all(extract is None for extract in validation.get_data_extracts().values())
 
 
-@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
-def test_interrogate_with_active_inactive(request, tbl_fixture):
+@pytest.mark.parametrize("tbl_fixture", TBL_MISSING_LIST)
+def test_interrogate_workers(request, tbl_fixture):
 
     tbl = request.getfixturevalue(tbl_fixture)
 
-    validation = (
-        Validate(tbl)
-        .col_vals_eq(columns="z", value=8)
-        .col_vals_lt(columns="y", value=10, active=False)
-        .interrogate()
+    def validation_plan():
+        return (
+            Validate(tbl, thresholds=(1, 2, 3))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_ne(columns="z", value=8)
+            .col_vals_in_set(columns="z", set=[8])
+            .col_vals_not_null(columns="y", active=False)
+            .col_vals_gt(columns="x", value=1, pre=lambda df: df.head(2))
+            .rows_distinct()
+            .col_exists(columns="x")
+            .row_count_match(count=4)
+        )
+
+    validation_serial = validation_plan().interrogate()
+    validation_threaded = validation_plan().interrogate(workers=4)
+
+    for step_serial, step_threaded in zip(
+        validation_serial.validation_info, validation_threaded.validation_info
+    ):
+        for attr in ["i", "n", "n_passed", "n_failed", "all_passed", "warn", "stop", "notify"]:
+            assert getattr(step_serial, attr) == getattr(step_threaded, attr)
+
+        # The processing time is recorded for each step
+        assert step_threaded.time_processed is not None
+        assert step_threaded.proc_duration_s is not None
+
+    extracts_serial = validation_serial.get_data_extracts()
+    extracts_threaded = validation_threaded.get_data_extracts()
+
+    for i in extracts_serial:
+        if extracts_serial[i] is None:
+            assert extracts_threaded[i] is None
+        else:
+            assert (
+                nw.from_native(extracts_serial[i]).rows()
+                == nw.from_native(extracts_threaded[i]).rows()
+            )
+
+
+def test_interrogate_workers_processes(tbl_missing_pd):
+
+    def validation_plan():
+        return (
+            Validate(tbl_missing_pd, thresholds=(1, 2, 3))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_ne(columns="z", value=8)
+            .col_vals_in_set(columns="z", set=[8])
+            .col_vals_not_null(columns="y", active=False)
+            .col_vals_gt(columns="x", value=1, pre=lambda df: df.head(2))
+            .col_vals_expr(expr=lambda df: df["y"] > 5)
+            .col_vals_ne(columns="x", value=col("y"), na_pass=True)
+            .col_schema_match(schema=Schema(columns=[("x", "object")]), complete=False)
+            .rows_distinct()
+            .col_exists(columns="x")
+            .row_count_match(count=4)
+        )
+
+    validation_serial = validation_plan().interrogate()
+    validation_processes = validation_plan().interrogate(
+        workers=2, worker_type="process", fuse_steps=False
     )
 
-    assert validation.validation_info[0].active is True
-    assert validation.validation_info[1].active is False
-    assert validation.validation_info[0].proc_duration_s is not None
-    assert validation.validation_info[1].proc_duration_s is not None
-    assert validation.validation_info[0].time_processed is not None
-    assert validation.validation_info[1].time_processed is not None
-    assert validation.validation_info[0].all_passed is True
-    assert validation.validation_info[1].all_passed is None
-    assert validation.validation_info[0].n == 4
-    assert validation.validation_info[1].n is None
-    assert validation.validation_info[0].n_passed == 4
-    assert validation.validation_info[1].n_passed is None
-    assert validation.validation_info[0].n_failed == 0
-    assert validation.validation_info[1].n_failed is None
-    assert validation.validation_info[0].warn is None
-    assert validation.validation_info[1].warn is None
-    assert validation.validation_info[0].stop is None
-    assert validation.validation_info[1].stop is None
-    assert validation.validation_info[0].notify is None
-    assert validation.validation_info[1].notify is None
-    assert validation.validation_info[1].extract is None
-    assert validation.validation_info[1].extract is None
+    for step_serial, step_processes in zip(
+        validation_serial.validation_info, validation_processes.validation_info
+    ):
+        for attr in ["i", "n", "n_passed", "n_failed", "all_passed", "warn", "stop", "notify"]:
+            assert getattr(step_serial, attr) == getattr(step_processes, attr)
 
+        assert step_processes.time_processed is not None
 
-@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
-def test_get_sundered_data(request, tbl_fixture):
+        # The checked tables and extracts are rebuilt from the target table
+        tbl_checked_serial = validation_serial._get_tbl_checked(validation=step_serial)
+        tbl_checked_processes = validation_processes._get_tbl_checked(validation=step_processes)
 
-    tbl = request.getfixturevalue(tbl_fixture)
+        for obj_serial, obj_processes in [
+            (tbl_checked_serial, tbl_checked_processes),
+            (step_serial.extract, step_processes.extract),
+        ]:
+            if obj_serial is None:
+                assert obj_processes is None
+            else:
+                pd.testing.assert_frame_equal(obj_serial, obj_processes)
 
-    # This validation will:
-    # - pass completely for all rows in the `col_vals_eq()` step
-    # - fail for row 0 in `col_vals_gt()` step
-    # - fail for row 3 in `col_vals_lt()` step
-    # when error rows are considered across all steps, only rows 1 and 2 free of errors;
-    # an 'error row' is a row with a test unit that has failed in any of the row-based steps
-    # and all of the validation steps here are row-based
-    validation = (
-        Validate(tbl)
-        .col_vals_eq(columns="z", value=8)
-        .col_vals_gt(columns="y", value=4)
-        .col_vals_lt(columns="x", value=4)
-        .interrogate()
+
+@pytest.mark.parametrize(
+    "values_a, values_d",
+    [([1, 2, 3, 4], [3, 2, 1, 4]), ([1, None, 3, None, 2], [3, 2, None, None, 2])],
+)
+def test_interrogate_workers_processes_column_comparison(values_a, values_d):
+
+    tbl = pd.DataFrame(
+        {"a": pd.array(values_a, dtype="Int64"), "d": pd.array(values_d, dtype="Int64")}
     )
 
-    sundered_data_pass = validation.get_sundered_data(type="pass")  # this is the default
-    sundered_data_fail = validation.get_sundered_data(type="fail")
+    def validation_plan():
+        validation = Validate(tbl)
+        for na_pass in [False, True]:
+            validation = validation.col_vals_eq(
+                columns="a", value=col("d"), na_pass=na_pass
+            ).col_vals_ne(columns="a", value=col("d"), na_pass=na_pass)
+        return validation
 
-    assert isinstance(sundered_data_pass, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
-    assert isinstance(sundered_data_fail, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
+    validation_serial = validation_plan().interrogate()
+    validation_processes = validation_plan().interrogate(
+        workers=2, worker_type="process", fuse_steps=False
+    )
 
-    # Check properties of the passed data piece
-    assert len(nw.from_native(sundered_data_pass).rows()) == 2
-    assert len(nw.from_native(sundered_data_pass).columns) == 3
-    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+    assert validation_processes.n_passed() == validation_serial.n_passed()
+    assert validation_processes.n_failed() == validation_serial.n_failed()
 
-    # Check the rows of the passed data piece
-    passed_data_rows = nw.from_native(sundered_data_pass).rows()
-    assert passed_data_rows[0] == (2, 5, 8)
-    assert passed_data_rows[1] == (3, 6, 8)
 
-    # Check properties of the failed data piece
-    assert len(nw.from_native(sundered_data_fail).rows()) == 2
-    assert len(nw.from_native(sundered_data_fail).columns) == 3
-    assert nw.from_native(sundered_data_fail).columns == ["x", "y", "z"]
+def test_interrogate_arrow_backed_pandas(tbl_missing_pd):
 
-    # Check the rows of the failed data piece
-    failed_data_rows = nw.from_native(sundered_data_fail).rows()
-    assert failed_data_rows[0] == (1, 4, 8)
-    assert failed_data_rows[1] == (4, 7, 8)
+    pa = pytest.importorskip("pyarrow")
 
+    # The worker processes interrogate the table with Arrow-backed columns, which must give the
+    # same results as NumPy-backed columns
+    tbl_arrow_pd = pa.Table.from_pandas(tbl_missing_pd, preserve_index=False).to_pandas(
+        types_mapper=pd.ArrowDtype
+    )
 
-@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
-def test_get_sundered_data_empty_frame(request, tbl_fixture):
+    def validation_plan(tbl):
+        validation = Validate(tbl)
+        for na_pass in [False, True]:
+            validation = (
+                validation.col_vals_gt(columns="x", value=1, na_pass=na_pass)
+                .col_vals_ne(columns="z", value=8, na_pass=na_pass)
+                .col_vals_le(columns="x", value=col("y"), na_pass=na_pass)
+                .col_vals_eq(columns="x", value=col("y"), na_pass=na_pass)
+                .col_vals_ne(columns="x", value=col("y"), na_pass=na_pass)
+                .col_vals_between(columns="x", left=1, right=col("y"), na_pass=na_pass)
+            )
+        return validation.col_vals_not_in_set(columns="z", set=[8]).interrogate(fuse_steps=False)
 
-    tbl = request.getfixturevalue(tbl_fixture)
+    assert validation_plan(tbl_missing_pd).n_passed() == validation_plan(tbl_arrow_pd).n_passed()
 
-    # Remove all rows from the table
-    tbl = tbl.head(0)
 
-    validation = Validate(tbl).col_exists(columns="z").interrogate()
+def test_interrogate_workers_raises(tbl_pl):
 
-    sundered_data_pass = validation.get_sundered_data(type="pass")
-    sundered_data_fail = validation.get_sundered_data(type="fail")
+    for workers in [0, -1, 2.5, True, "2"]:
+        with pytest.raises(ValueError):
+            Validate(tbl_pl).col_vals_gt(columns="x", value=1).interrogate(workers=workers)
 
-    # Check properties of the passed data piece
-    assert len(nw.from_native(sundered_data_pass).rows()) == 0
-    assert len(nw.from_native(sundered_data_pass).columns) == 3
-    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+    with pytest.raises(ValueError):
+        Validate(tbl_pl).col_vals_gt(columns="x", value=1).interrogate(
+            workers=2, worker_type="fork"
+        )
 
-    # Check properties of the failed data piece
-    assert len(nw.from_native(sundered_data_fail).rows()) == 0
-    assert len(nw.from_native(sundered_data_fail).columns) == 3
-    assert nw.from_native(sundered_data_fail).columns == ["x", "y", "z"]
 
+@pytest.mark.parametrize("fuse_steps", [False, True])
+def test_interrogate_pre_cache(tbl_pl, fuse_steps):
 
-@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
-def test_get_sundered_data_no_validation_steps(request, tbl_fixture):
+    n_calls = []
 
-    tbl = request.getfixturevalue(tbl_fixture)
+    def pre_fn(df):
+        n_calls.append(1)
+        return df.with_columns(w=pl.col("x") * 2)
 
-    validation = Validate(tbl).interrogate()
+    validation = (
+        Validate(tbl_pl)
+        .col_vals_gt(columns="w", value=2, pre=pre_fn)
+        .col_vals_lt(columns="w", value=10, pre=pre_fn)
+        .col_vals_ne(columns="w", value=4, pre=pre_fn)
+        .col_vals_not_null(columns=starts_with("w"), pre=pre_fn)
+        .rows_distinct(pre=pre_fn)
+        .col_vals_gt(columns="x", value=2)
+        .interrogate(fuse_steps=fuse_steps)
+    )
 
-    sundered_data_pass = validation.get_sundered_data(type="pass")
-    sundered_data_fail = validation.get_sundered_data(type="fail")
+    # The pre-processed table is only computed once for all steps sharing `pre_fn()`
+    assert len(n_calls) == 1
+    assert validation.n_passed() == {1: 3, 2: 4, 3: 3, 4: 4, 5: 4, 6: 2}
 
-    # Check properties of the passed data piece
-    assert len(nw.from_native(sundered_data_pass).rows()) == 4
-    assert len(nw.from_native(sundered_data_pass).columns) == 3
-    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+    # The caching can be disabled with a cap of `0` bytes
+    n_calls.clear()
 
-    # Check properties of the failed data piece
-    assert len(nw.from_native(sundered_data_fail).rows()) == 0
-    assert len(nw.from_native(sundered_data_fail).columns) == 3
-    assert nw.from_native(sundered_data_fail).columns == ["x", "y", "z"]
+    validation_no_cache = (
+        Validate(tbl_pl)
+        .col_vals_gt(columns="w", value=2, pre=pre_fn)
+        .col_vals_lt(columns="w", value=10, pre=pre_fn)
+        .interrogate(pre_cache_max_bytes=0)
+    )
 
+    assert len(n_calls) == 2
+    assert validation_no_cache.n_passed() == {1: 3, 2: 4}
 
-@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
-def test_get_sundered_data_mix_of_step_types(request, tbl_fixture):
 
-    tbl = request.getfixturevalue(tbl_fixture)
+def test_interrogate_pre_cache_shares_dtype_checks(tbl_pl):
 
-    # This sundering from this validation will effectively be the same as in the
-    # `test_get_sundered_data()` test; steps 3 and 4 are not included in the sundering process:
-    # - step 3 is not included because it is not row-based (it checks for a column's existence)
-    # - step 4 is not included because it is inactive (if active, it would have failed all rows)
-    # - the remaining steps are row-based the parameters of the steps are the same as in the
-    #   `test_get_sundered_data()` test
-    validation = (
-        Validate(tbl)
-        .col_vals_eq(columns="z", value=8)
-        .col_vals_gt(columns="y", value=4)
-        .col_exists(columns="z")  # <- this step is not row-based so not included when sundering
-        .col_vals_eq(columns="z", value=7, active=False)  # <- this step is inactive so not included
-        .col_vals_lt(columns="x", value=4)
-        .interrogate()
-    )
+    from pointblank import _utils
 
-    sundered_data_pass = validation.get_sundered_data(type="pass")
-    sundered_data_fail = validation.get_sundered_data(type="fail")
+    with patch.object(
+        _utils, "_check_column_type", wraps=_utils._check_column_type
+    ) as check_column_type:
 
-    # Check properties of the passed data piece
-    assert isinstance(sundered_data_pass, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
-    assert isinstance(sundered_data_fail, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
+        (
+            Validate(tbl_pl)
+            .col_vals_gt(columns="x", value=0)
+            .col_vals_lt(columns="x", value=10)
+            .col_vals_between(columns="x", left=0, right=10)
+            .col_vals_gt(columns="x", value=0, pre=lambda df: df.head(2))
+            .interrogate(use_column_stats=False)
+        )
 
-    # Check properties of the passed data piece
-    assert len(nw.from_native(sundered_data_pass).rows()) == 2
-    assert len(nw.from_native(sundered_data_pass).columns) == 3
-    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+    # The type of `x` is checked once for the target table and once for the pre-processed table
+    # (the steps are evaluated row by row since they could otherwise be decided from statistics)
+    assert check_column_type.call_count == 2
 
-    # Check the rows of the passed data piece
-    passed_data_rows = nw.from_native(sundered_data_pass).rows()
-    assert passed_data_rows[0] == (2, 5, 8)
-    assert passed_data_rows[1] == (3, 6, 8)
+
+def test_pre_processing_cache_eviction(tbl_pl):
+
+    def pre_1(df):
+        return df.head(1)
+
+    def pre_2(df):
+        return df.head(2)
+
+    tbl_size = tbl_pl.head(2).estimated_size()
+
+    pre_cache = _PreProcessingCache(data_tbl=tbl_pl, max_bytes=tbl_size)
+
+    assert pre_cache.get_tbl(None) is tbl_pl
+
+    tbl_1 = pre_cache.get_tbl(pre_1)
+    assert pre_cache.get_tbl(pre_1) is tbl_1
+
+    # Adding the second table goes over the cap, so the least recently used table is evicted
+    tbl_2 = pre_cache.get_tbl(pre_2)
+
+    assert list(pre_cache.tbls.values()) == [tbl_2]
+    assert pre_cache.get_tbl(pre_1) is not tbl_1
+    assert pre_cache.get_tbl(pre_1).equals(tbl_1)
+
+
+def test_pre_processing_cache_tbl_context(tbl_pl):
+
+    def pre(df):
+        return df.head(2)
+
+    pre_cache = _PreProcessingCache(data_tbl=tbl_pl)
+
+    # The target table and each pre-processed table have their own context, which is shared
+    # by all the steps using the same table
+    tbl_context = pre_cache.get_tbl_context(None)
+    tbl_context_pre = pre_cache.get_tbl_context(pre)
+
+    assert tbl_context.data_tbl is tbl_pl
+    assert tbl_context_pre.data_tbl is pre_cache.get_tbl(pre)
+    assert pre_cache.get_tbl_context(None) is tbl_context
+    assert pre_cache.get_tbl_context(pre) is tbl_context_pre
+    assert tbl_context.get_row_count() == 4
+    assert tbl_context_pre.get_row_count() == 2
+
+    # Without any room in the cache, the pre-processed tables (and their contexts) aren't kept
+    pre_cache = _PreProcessingCache(data_tbl=tbl_pl, max_bytes=0)
+
+    assert pre_cache.get_tbl_context(pre) is not pre_cache.get_tbl_context(pre)
+    assert pre_cache.tbl_contexts == {}
+
+
+def test_interrogate_tbl_context(tbl_pl):
+
+    # The table's schema is collected once for all steps on the same table
+    with patch(
+        "narwhals.DataFrame.collect_schema", side_effect=nw.DataFrame.collect_schema, autospec=True
+    ) as collect_schema:
+        validation = (
+            Validate(tbl_pl)
+            .col_vals_gt(columns="x", value=0)
+            .col_vals_lt(columns="y", value=10)
+            .col_vals_in_set(columns="z", set=[8])
+            .col_exists(columns=["x", "y"])
+            .interrogate(collect_extracts=False)
+        )
+
+    assert validation.all_passed()
+    assert collect_schema.call_count == 1
+
+
+@pytest.mark.parametrize("tbl_type", ["pandas", "polars", "lazy"])
+@pytest.mark.parametrize("batch_size", [1, 3, 10])
+def test_interrogate_batch_size(tbl_missing_pl, tbl_type, batch_size):
+
+    if tbl_type == "pandas":
+        tbl = tbl_missing_pl.to_pandas()
+    elif tbl_type == "lazy":
+        tbl = tbl_missing_pl.lazy()
+    else:
+        tbl = tbl_missing_pl
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl, thresholds=(1, 2, 3))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_eq(columns="z", value=8)
+            .col_vals_ne(columns="z", value=8)
+            .col_vals_ne(columns="x", value=col("y"), na_pass=True)
+            .col_vals_in_set(columns="z", set=[8])
+            .col_vals_gt(columns="x", value=1, pre=lambda df: df.head(3))
+            .row_count_match(count=3, pre=lambda df: df.head(3))
+            .rows_distinct(columns_subset=["z"])
+            .rows_distinct()
+            .col_exists(columns="x")
+            .row_count_match(count=4)
+            .col_count_match(count=3)
+        )
+
+    validation_full = validation_plan(tbl).interrogate()
+    validation_batches = validation_plan(tbl).interrogate(batch_size=batch_size)
+
+    # Steps with a `pre=` function are evaluated on the whole table, not on each batch
+    assert validation_batches.n(i=7, scalar=True) == 3
+    assert validation_batches.validation_info[7].all_passed
+
+    for step_full, step_batches in zip(
+        validation_full.validation_info, validation_batches.validation_info
+    ):
+        for attr in ["n", "n_passed", "n_failed", "all_passed", "warn", "stop", "notify"]:
+            assert getattr(step_full, attr) == getattr(step_batches, attr)
+
+    extracts_full = validation_full.get_data_extracts()
+    extracts_batches = validation_batches.get_data_extracts()
+
+    # The row numbers in the extracts are those of the whole table
+    for i in extracts_full:
+        if extracts_full[i] is None:
+            assert extracts_batches[i] is None
+        else:
+            assert_frame_equal(
+                nw.from_native(extracts_full[i]).to_polars(),
+                nw.from_native(extracts_batches[i]).to_polars(),
+            )
+
+
+def test_interrogate_batch_size_extract_options(tbl_missing_pl):
+
+    tbl = pl.concat([tbl_missing_pl] * 5)
+
+    validation = (
+        Validate(tbl.lazy()).col_vals_not_null(columns="y").interrogate(batch_size=3, get_first_n=3)
+    )
+
+    assert validation.n_failed(i=1, scalar=True) == 5
+    assert validation.get_data_extracts(i=1, frame=True)["_row_num_"].to_list() == [2, 6, 10]
+
+    validation = (
+        Validate(tbl.lazy()).col_vals_not_null(columns="y").interrogate(batch_size=3, sample_n=2)
+    )
+
+    extract = validation.get_data_extracts(i=1, frame=True)
+
+    assert extract.columns == ["_row_num_", "x", "y", "z"]
+    assert len(extract) == 2
+    assert set(extract["_row_num_"].to_list()) <= {2, 6, 10, 14, 18}
+
+
+def test_interrogate_batch_size_scan_parquet():
+
+    file_path = pathlib.Path.cwd() / "tests" / "tbl_files" / "tbl_xyz_missing.parquet"
+
+    validation = (
+        Validate(pl.scan_parquet(file_path))
+        .col_vals_gt(columns="x", value=1)
+        .rows_distinct(columns_subset=["z"])
+        .interrogate(batch_size=2)
+    )
+
+    assert validation.n() == {1: 4, 2: 4}
+    assert validation.n_passed() == {1: 2, 2: 1}
+    assert validation.get_data_extracts(i=1, frame=True)["_row_num_"].to_list() == [1, 3]
+
+    with pytest.raises(ValueError):
+        Validate(pl.scan_parquet(file_path)).col_vals_gt(columns="x", value=1).interrogate(
+            batch_size=0
+        )
+
+
+def test_interrogate_batch_size_scan_csv(tbl_missing_pl, tmp_path):
+
+    file_path = tmp_path / "tbl.csv"
+    pl.concat([tbl_missing_pl] * 25).write_csv(file_path)
+
+    def validation_plan():
+        return (
+            Validate(pl.scan_csv(file_path))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_ne(columns="z", value=8)
+            .rows_distinct()
+        )
+
+    validation_full = validation_plan().interrogate()
+
+    # The file is scanned once (rather than once per batch, from the start of the file)
+    with patch("polars.LazyFrame.slice", side_effect=AssertionError):
+        validation_batches = validation_plan().interrogate(batch_size=7)
+
+    assert validation_batches.n() == validation_full.n() == {1: 100, 2: 100, 3: 100}
+    assert validation_batches.n_passed() == validation_full.n_passed()
+    assert_frame_equal(
+        validation_batches.get_data_extracts(i=1, frame=True),
+        validation_full.get_data_extracts(i=1, frame=True),
+    )
+
+
+@pytest.mark.parametrize(
+    "interrogate_kwargs",
+    [{}, {"fuse_steps": True}, {"workers": 3}, {"batch_size": 2}],
+)
+def test_interrogate_stop_on_first_stop(interrogate_kwargs):
+
+    tbl = pl.DataFrame({"a": [1, 2, 3, 4], "b": [5, 6, 7, 8]})
+
+    validation = (
+        Validate(tbl, thresholds=Thresholds(warn_at=1, stop_at=2))
+        .col_vals_gt(columns="a", value=0)
+        .col_vals_gt(columns="a", value=1)
+        .col_vals_gt(columns="a", value=10)
+        .col_vals_lt(columns="b", value=0)
+        .col_exists(columns="b")
+        .interrogate(stop_on_first_stop=True, **interrogate_kwargs)
+    )
+
+    # The third step is the first to exceed the `stop` threshold, so the steps after it are not
+    # evaluated and are made inactive
+    assert [validation.active for validation in validation.validation_info] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+    ]
+    assert validation.n() == {1: 4, 2: 4, 3: 4, 4: None, 5: None}
+    assert validation.warn() == {1: False, 2: True, 3: True, 4: None, 5: None}
+    assert validation.stop() == {1: False, 2: False, 3: True, 4: None, 5: None}
+    assert validation.get_data_extracts(i=4) == {4: None}
+    assert all(validation.time_processed is not None for validation in validation.validation_info)
+
+    # The skipped steps are reported as not evaluated
+    validation.get_tabular_report()
+
+
+def test_interrogate_stop_on_first_stop_no_stop():
+
+    tbl = pl.DataFrame({"a": [1, 2, 3, 4]})
+
+    validation = (
+        Validate(tbl, thresholds=Thresholds(warn_at=1, stop_at=3))
+        .col_vals_gt(columns="a", value=2)
+        .col_vals_lt(columns="a", value=4)
+        .interrogate(stop_on_first_stop=True)
+    )
+
+    assert validation.n() == {1: 4, 2: 4}
+    assert validation.stop() == {1: False, 2: False}
+
+    with pytest.raises(ValueError):
+        Validate(tbl).col_vals_gt(columns="a", value=2).interrogate(stop_on_first_stop="yes")
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "lazy", "pandas", "duckdb"])
+@pytest.mark.parametrize(
+    "interrogate_kwargs",
+    [{}, {"fuse_steps": True}, {"workers": 2}, {"batch_size": 2}],
+)
+def test_interrogate_extract_columns(tbl_type, interrogate_kwargs):
+
+    tbl = pl.DataFrame(
+        {"a": [1, 5, 2, 6], "b": [3, 3, 9, 9], "c": ["p", "q", "r", "s"], "d": [0, 0, 0, 0]}
+    )
+
+    if tbl_type == "lazy":
+        tbl = tbl.lazy()
+    elif tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+    elif tbl_type == "duckdb":
+        tbl = ibis.memtable(tbl.to_pandas())
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl)
+            .col_vals_gt(columns="a", value=3)
+            .col_vals_lt(columns="b", value=col("a"))
+            .col_vals_in_set(columns="c", set=["p", "q"])
+        )
+
+    def get_extract(validation, i):
+        return nw.from_native(validation.get_data_extracts(i=i, frame=True))
+
+    # By default, the extracts have all of the table's columns
+    validation = validation_plan(tbl).interrogate(**interrogate_kwargs)
+
+    assert get_extract(validation, i=1).columns == ["_row_num_", "a", "b", "c", "d"]
+
+    # With `extract_columns=`, the extracts have the step's columns and the given columns
+    validation = validation_plan(tbl).interrogate(extract_columns="c", **interrogate_kwargs)
+
+    assert validation.n_failed() == {1: 2, 2: 3, 3: 2}
+
+    expected = {
+        1: (["_row_num_", "a", "c"], [1, 3]),
+        2: (["_row_num_", "a", "b", "c"], [1, 3, 4]),
+        3: (["_row_num_", "c"], [3, 4]),
+    }
+
+    for i, (columns, row_nums) in expected.items():
+        extract = get_extract(validation, i=i)
+        assert extract.columns == columns
+        assert sorted(extract["_row_num_"].to_list()) == row_nums
+
+    # The extract for the `c` column has the values of the failing rows
+    assert sorted(get_extract(validation, i=3)["c"].to_list()) == ["r", "s"]
+
+    # The step report can be generated from the narrower extracts
+    validation.get_step_report(i=2)
+
+
+def test_interrogate_extract_columns_invalid(tbl_missing_pl):
+
+    validation = Validate(tbl_missing_pl).col_vals_gt(columns="x", value=1)
+
+    with pytest.raises(ValueError):
+        validation.interrogate(extract_columns=1)
+
+    with pytest.raises(ValueError):
+        validation.interrogate(extract_columns=["y", 2])
+
+    # Columns that are not in the table are not allowed
+    with pytest.raises(ValueError):
+        validation.interrogate(extract_columns=["y", "w"])
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "lazy", "pandas", "duckdb"])
+@pytest.mark.parametrize(
+    "interrogate_kwargs",
+    [{}, {"fuse_steps": True}, {"workers": 2}, {"batch_size": 2}],
+)
+def test_interrogate_use_column_stats(tbl_type, interrogate_kwargs):
+
+    tbl = pl.DataFrame(
+        {
+            "a": [1, 2, 3, 4],
+            "b": [1.5, None, 3.5, 4.5],
+            "c": [0.5, float("nan"), 1.5, 2.5],
+            "d": ["x", None, "y", "z"],
+        }
+    )
+
+    if tbl_type == "lazy":
+        tbl = tbl.lazy()
+    elif tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+    elif tbl_type == "duckdb":
+        tbl = ibis.memtable(tbl.to_arrow())
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl)
+            .col_vals_gt(columns="a", value=0)
+            .col_vals_gt(columns="a", value=2)
+            .col_vals_between(columns="b", left=1, right=5, na_pass=True)
+            .col_vals_between(columns="b", left=1, right=5)
+            .col_vals_outside(columns="a", left=5, right=10)
+            .col_vals_lt(columns="c", value=3)
+            .col_vals_not_null(columns="a")
+            .col_vals_not_null(columns="d")
+            .col_vals_gt(columns="a", value=0, pre=lambda df: df.head(2))
+        )
+
+    validation_rows = validation_plan(tbl).interrogate(use_column_stats=False, **interrogate_kwargs)
+    validation_stats = validation_plan(tbl).interrogate(**interrogate_kwargs)
+
+    # The results are the same as with the row-by-row evaluation
+    for method in ["n", "n_passed", "n_failed", "all_passed", "warn"]:
+        assert getattr(validation_stats, method)() == getattr(validation_rows, method)()
+
+    for i in range(1, 10):
+
+        extract_stats = validation_stats.get_data_extracts(i=i, frame=True)
+        extract_rows = validation_rows.get_data_extracts(i=i, frame=True)
+
+        assert nw.from_native(extract_stats).columns == nw.from_native(extract_rows).columns
+        assert len(extract_stats) == len(extract_rows)
+
+    validation_stats.get_tabular_report()
+    validation_stats.get_step_report(i=1)
+
+    if tbl_type in ["polars", "pandas"] and "batch_size" not in interrogate_kwargs:
+        assert_frame_equal(
+            pl.DataFrame(validation_stats.get_sundered_data(type="fail")),
+            pl.DataFrame(validation_rows.get_sundered_data(type="fail")),
+        )
+
+
+def test_interrogate_use_column_stats_skips_steps():
+
+    tbl = pl.DataFrame({"a": [1, 2, 3, 4], "b": [None, 2, 3, 4]})
+
+    with patch.object(
+        Validate, "_evaluate_step", autospec=True, side_effect=Validate._evaluate_step
+    ) as evaluate_step:
+
+        validation = (
+            Validate(tbl)
+            .col_vals_ge(columns="a", value=1)
+            .col_vals_gt(columns="a", value=1)
+            .col_vals_not_null(columns="a")
+            .col_vals_not_null(columns="b")
+            .col_vals_le(columns="b", value=4, na_pass=True)
+            .interrogate()
+        )
+
+    # Only the steps that can't be decided from the column statistics are evaluated row by row
+    assert [call.kwargs["validation"].i for call in evaluate_step.call_args_list] == [2, 4]
+    assert validation.all_passed() is False
+    assert validation.n_failed() == {1: 0, 2: 1, 3: 0, 4: 1, 5: 0}
+
+    # Steps decided from statistics have exact results, so they aren't estimated from samples
+    validation = (
+        Validate(pl.DataFrame({"a": range(10000)}), thresholds=Thresholds(warn_at=0.1))
+        .col_vals_gt(columns="a", value=-1)
+        .col_vals_lt(columns="a", value=0)
+        .interrogate(test_sample_n=1000)
+    )
+
+    assert validation.f_failed_ci(i=1, scalar=True) is None
+    assert validation.validation_info[0].n_sampled is None
+    assert validation.validation_info[1].n_sampled == 1000
+
+    with pytest.raises(ValueError):
+        Validate(tbl).col_vals_gt(columns="a", value=0).interrogate(use_column_stats="yes")
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "lazy", "pandas", "duckdb"])
+def test_interrogate_test_sample_n(tbl_type):
+
+    tbl = pl.DataFrame({"a": range(10000)})
+
+    if tbl_type == "lazy":
+        tbl = tbl.lazy()
+    elif tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+    elif tbl_type == "duckdb":
+        con = ibis.duckdb.connect()
+        con.create_table("tbl", tbl.to_arrow())
+        tbl = con.table("tbl")
+
+    validation = (
+        Validate(tbl, thresholds=Thresholds(warn_at=0.1))
+        .col_vals_gt(columns="a", value=-1)
+        .col_vals_lt(columns="a", value=0)
+        .col_vals_gt(columns="a", value=-1, thresholds=1)
+        .rows_distinct()
+        .interrogate(test_sample_n=1000, use_column_stats=False)
+    )
+
+    # The first two steps are far from their `warn` thresholds, so they are estimated from their
+    # samples; the third step's interval straddles its threshold so it is evaluated in full
+    # (statistics aren't used here since they would decide the first and third steps)
+    assert validation.n() == {1: 10000, 2: 10000, 3: 10000, 4: 10000}
+    assert validation.n_failed() == {1: 0, 2: 10000, 3: 0, 4: 0}
+    assert validation.warn() == {1: False, 2: True, 3: False, 4: False}
+
+    f_failed_ci = validation.f_failed_ci()
+
+    assert f_failed_ci[1][0] == 0 and 0 < f_failed_ci[1][1] < 0.1
+    assert 0.1 < f_failed_ci[2][0] < 1 and f_failed_ci[2][1] == 1
+    assert f_failed_ci[3] is None
+    assert f_failed_ci[4] is None
+    assert validation.f_failed_ci(i=3, scalar=True) is None
+
+    if tbl_type != "duckdb":
+        assert validation.validation_info[0].n_sampled == 1000
+
+    # No extracts are collected for the sampled steps
+    assert validation.get_data_extracts(i=1) == {1: None}
+
+    validation.get_tabular_report()
+
+
+@pytest.mark.parametrize("backend", ["duckdb", "sqlite"])
+def test_interrogate_test_sample_n_ibis_same_sample(backend):
+
+    con = ibis.duckdb.connect() if backend == "duckdb" else ibis.sqlite.connect()
+    tbl = con.create_table("tbl", pl.DataFrame({"a": range(10000)}).to_pandas())
+
+    # The sample of each table is taken once and materialized (SQLite doesn't support a seed, so
+    # each query of a sample would otherwise give other rows) and every step is evaluated on the
+    # same rows
+    Table = ibis.expr.types.relations.Table
+
+    with (
+        patch.object(Table, "sample", side_effect=Table.sample, autospec=True) as sample,
+        patch.object(Table, "cache", side_effect=Table.cache, autospec=True) as cache,
+    ):
+        validation = (
+            Validate(tbl)
+            .col_vals_lt(columns="a", value=5000)
+            .col_vals_ge(columns="a", value=5000)
+            .col_vals_lt(columns="a", value=5000, pre=lambda t: t.filter(t.a > 0))
+            .interrogate(test_sample_n=1000, use_column_stats=False)
+        )
+
+    assert sample.call_count == 2
+    assert cache.call_count == 2
+
+    n_sampled = [step.n_sampled for step in validation.validation_info]
+
+    assert n_sampled[0] == n_sampled[1] > 0
+    assert validation.n_failed(i=1, scalar=True) + validation.n_failed(i=2, scalar=True) == 10000
+
+
+def test_interrogate_test_sample_n_small_table(tbl_missing_pl):
+
+    validation = (
+        Validate(tbl_missing_pl, thresholds=Thresholds(warn_at=0.1))
+        .col_vals_gt(columns="x", value=0, na_pass=True)
+        .interrogate(test_sample_n=1000)
+    )
+
+    assert validation.f_failed_ci() == {1: None}
+    assert validation.validation_info[0].n_sampled is None
+
+
+def test_interrogate_test_sample_n_raises(tbl_missing_pl):
+
+    validation = Validate(tbl_missing_pl).col_vals_gt(columns="x", value=0)
+
+    with pytest.raises(ValueError):
+        validation.interrogate(test_sample_n=0)
+    with pytest.raises(ValueError):
+        validation.interrogate(test_sample_n=1.5)
+    with pytest.raises(ValueError):
+        validation.interrogate(test_sample_n=10, test_sample_conf_level=1)
+    with pytest.raises(ValueError):
+        validation.interrogate(test_sample_n=10, batch_size=10)
+
+
+def _incremental_plan(tbl):
+
+    return (
+        Validate(tbl, thresholds=(2, 3))
+        .col_vals_gt(columns="x", value=0)
+        .rows_distinct(columns_subset="y")
+        .row_count_match(count=10)
+        .col_exists(columns="x")
+        .col_vals_lt(columns="x", value=100, pre=lambda df: df)
+    )
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "pandas", "lazy", "duckdb", "sqlite"])
+def test_interrogate_incremental(tbl_type):
+
+    tbl = pl.DataFrame(
+        {
+            "id": range(1, 11),
+            "x": [1, 2, 3, -1, 5, 6, 7, 1, 9, -2],
+            "y": ["a", "b", "c", "d", "e", "a", "g", "h", "i", "j"],
+        }
+    )
+
+    def convert(tbl):
+        if tbl_type == "pandas":
+            return tbl.to_pandas()
+        if tbl_type == "lazy":
+            return tbl.lazy()
+        if tbl_type in ["duckdb", "sqlite"]:
+            con = getattr(ibis, tbl_type).connect()
+            con.create_table("tbl", tbl.to_arrow())
+            return con.table("tbl")
+        return tbl
+
+    validation_full = _incremental_plan(convert(tbl)).interrogate()
+
+    # Interrogate the table as it grows; the state survives a round trip through pickle
+    validation = _incremental_plan(convert(tbl[:5])).interrogate(watermark_col="id")
+
+    incremental_state = pickle.loads(pickle.dumps(validation.incremental_state))
+
+    assert incremental_state["watermark"] == 5
+    assert validation.n() == {1: 5, 2: 5, 3: 1, 4: 1, 5: 5}
+
+    for n_rows in [8, 10, 10]:
+
+        validation = _incremental_plan(convert(tbl[:n_rows])).interrogate(
+            watermark_col="id", incremental_state=incremental_state
+        )
+
+        incremental_state = validation.incremental_state
+
+        assert incremental_state["watermark"] == n_rows
+
+    # The cumulative results are those of interrogating the whole table (the duplicate in `y`
+    # spans two runs)
+    assert validation.n() == validation_full.n()
+    assert validation.n_failed() == validation_full.n_failed()
+    assert validation.n_failed() == {1: 2, 2: 2, 3: 0, 4: 0, 5: 0}
+    assert validation.warn() == validation_full.warn()
+    assert validation.stop() == validation_full.stop()
+
+
+def test_interrogate_incremental_changed_plan():
+
+    tbl = pl.DataFrame({"id": range(1, 11), "x": [1, 2, 3, -1, 5, 6, 7, 1, 9, -2]})
+
+    validation = Validate(tbl[:5]).col_vals_gt(columns="x", value=0).interrogate(watermark_col="id")
+
+    # The second step is new, so it's evaluated on the whole table (the first step is evaluated
+    # on the new rows only, so its extract only covers those rows)
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="x", value=0)
+        .col_vals_gt(columns="x", value=1)
+        .interrogate(watermark_col="id", incremental_state=validation.incremental_state)
+    )
+
+    assert validation.n() == {1: 10, 2: 10}
+    assert validation.n_failed() == {1: 2, 2: 4}
+    assert validation.get_data_extracts(i=1, frame=True)["_row_num_"].to_list() == [10]
+    assert len(validation.get_data_extracts(i=2, frame=True)) == 4
+
+    # The first step only has results for the new rows, so the data can't be sundered
+    with pytest.raises(ValueError):
+        validation.get_sundered_data(type="pass")
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "pandas", "duckdb"])
+def test_interrogate_incremental_extracts(tbl_type):
+
+    tbl = pl.DataFrame({"id": [1, 4, 2, 5, 3, 6], "x": [1, -4, -2, 5, 3, -6]})
+
+    def convert(tbl):
+        if tbl_type == "pandas":
+            return tbl.to_pandas()
+        if tbl_type == "duckdb":
+            con = ibis.duckdb.connect()
+            con.create_table("tbl", tbl.to_arrow())
+            return con.table("tbl")
+        return tbl
+
+    validation = Validate(convert(tbl.filter(pl.col("id") <= 3))).col_vals_gt(columns="x", value=0)
+    validation = validation.interrogate(watermark_col="id")
+
+    # The new rows aren't at the end of the table, but the row numbers in the extract refer to
+    # the whole table
+    validation = (
+        Validate(convert(tbl))
+        .col_vals_gt(columns="x", value=0)
+        .interrogate(watermark_col="id", incremental_state=validation.incremental_state)
+    )
+
+    extract = validation.get_data_extracts(i=1, frame=True)
+
+    assert validation.n_failed() == {1: 3}
+    assert list(extract["_row_num_"]) == [2, 6]
+    assert list(extract["x"]) == [-4, -6]
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "pandas"])
+def test_interrogate_incremental_table_dependent_nulls(tbl_type):
+
+    tbl = pl.DataFrame({"id": range(5), "a": [1, 3, 2, None, 3], "d": [None, 1, 2, None, 2]})
+
+    if tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl)
+            .col_vals_ne(columns="a", value=col("d"))
+            .col_vals_eq(columns="a", value=col("d"))
+            .col_vals_ne(columns="a", value=col("d"), na_pass=True)
+            .col_vals_eq(columns="a", value=col("d"), na_pass=True)
+        )
+
+    # The handling of missing values by these steps depends on the whole table, so they are
+    # evaluated on the whole table rather than merged with the previous run
+    validation = validation_plan(tbl[:3]).interrogate(watermark_col="id")
+    validation = validation_plan(tbl).interrogate(
+        watermark_col="id", incremental_state=validation.incremental_state
+    )
+
+    validation_full = validation_plan(tbl).interrogate()
+
+    assert validation.n() == validation_full.n()
+    assert validation.n_passed() == validation_full.n_passed()
+    assert validation.n_failed() == validation_full.n_failed()
+    assert validation._incremental_merged_steps == []
+
+
+def test_interrogate_incremental_row_hash_method():
+
+    tbl = pl.DataFrame({"id": range(1, 7), "y": ["a", None, "b", None, "a", "c"]})
+
+    validation = Validate(tbl[:3]).rows_distinct().rows_distinct(columns_subset="y")
+    incremental_state = validation.interrogate(watermark_col="id").incremental_state
+
+    # Row hashes from another version of the hashing library can't be merged, so the first step
+    # is evaluated on the whole table
+    incremental_state["steps"][1]["key"] = incremental_state["steps"][1]["key"].replace(
+        pl.__version__, "0.0.0"
+    )
+
+    validation = (
+        Validate(tbl)
+        .rows_distinct()
+        .rows_distinct(columns_subset="y")
+        .interrogate(watermark_col="id", incremental_state=incremental_state)
+    )
+
+    assert validation.n_failed() == {1: 0, 2: 4}
+    assert validation._incremental_merged_steps == [2]
+
+
+def test_interrogate_incremental_raises():
+
+    tbl = pl.DataFrame({"id": [1, 2], "x": [1, 2]})
+
+    validation = Validate(tbl).col_vals_gt(columns="x", value=0)
+
+    incremental_state = validation.interrogate(watermark_col="id").incremental_state
+
+    with pytest.raises(ValueError):
+        validation.interrogate(watermark_col="not_present")
+    with pytest.raises(ValueError):
+        validation.interrogate(incremental_state=incremental_state)
+    with pytest.raises(ValueError):
+        validation.interrogate(watermark_col="x", incremental_state=incremental_state)
+    with pytest.raises(ValueError):
+        validation.interrogate(watermark_col="id", test_sample_n=10)
+    with pytest.raises(ValueError):
+        validation.interrogate(watermark_col="id", stop_on_first_stop=True)
+
+
+@pytest.mark.parametrize("tbl_type", ["polars", "pandas", "lazy"])
+def test_interrogate_checked_rows(tbl_type):
+
+    tbl = pl.DataFrame({"x": range(20), "y": [1, 2] * 10})
+
+    if tbl_type == "pandas":
+        tbl = tbl.to_pandas()
+    elif tbl_type == "lazy":
+        tbl = tbl.lazy()
+
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="x", value=4)
+        .col_vals_eq(columns="y", value=1)
+        .col_vals_lt(columns="z", value=30, pre=lambda dfn: dfn.with_columns(z=nw.col("x") * 2))
+        .interrogate()
+    )
+
+    # The results are kept with one bit per row instead of a copy of the table
+    for validation_info in validation.validation_info:
+        assert validation_info.tbl_checked is None
+        assert validation_info.checked_rows.n_rows == 20
+        assert validation_info.checked_rows.bits.nbytes == 3
+        assert validation_info.checked_rows.validity is None
+
+    # The checked tables are rebuilt from the target table (applying any `pre=` function)
+    tbl_checked = nw.from_native(validation._get_tbl_checked(validation.validation_info[2]))
+
+    assert tbl_checked.columns == ["x", "y", "z", "pb_is_good_"]
+    assert tbl_checked["pb_is_good_"].to_list() == [True] * 15 + [False] * 5
+
+    sundered_pass = nw.from_native(validation.get_sundered_data(type="pass"))
+
+    if tbl_type == "lazy":
+        sundered_pass = sundered_pass.collect()
+
+    assert sundered_pass["x"].to_list() == [6, 8, 10, 12, 14]
+
+
+def test_checked_rows_validity():
+
+    results_tbl = pl.DataFrame({"x": [1, 2, 3], "pb_is_good_": [True, None, False]})
+
+    checked_rows = _CheckedRows.from_results_tbl(results_tbl=results_tbl)
+
+    assert checked_rows.get_is_good().tolist() == [True, False, False]
+    assert checked_rows.get_validity().tolist() == [True, False, True]
+
+    validation = Validate(results_tbl.drop("pb_is_good_"))
+    validation_info = _ValidationInfo(i=1, checked_rows=checked_rows)
+
+    assert validation._get_tbl_checked(validation_info)["pb_is_good_"].to_list() == [
+        True,
+        None,
+        False,
+    ]
+
+
+@pytest.mark.parametrize(
+    "interrogate_kwargs",
+    [
+        {},
+        {"fuse_steps": True},
+        {"workers": 2},
+        {"workers": 2, "worker_type": "process"},
+        {"batch_size": 2},
+        {"stop_on_first_stop": True},
+    ],
+)
+@pytest.mark.parametrize("tbl_fixture", ["tbl_missing_pd", "tbl_missing_pl"])
+def test_interrogate_duplicate_steps(request, tbl_fixture, interrogate_kwargs):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    def head_2(df):
+        return df.head(2)
+
+    validation = (
+        Validate(tbl, thresholds=(3, 4, 5))
+        .col_vals_gt(columns="x", value=1)
+        .col_vals_gt(columns="x", value=1, thresholds=2)
+        .col_vals_gt(columns="x", value=1, na_pass=True)
+        .col_vals_gt(columns="x", value=1, pre=head_2)
+        .col_vals_gt(columns="x", value=1, pre=head_2, thresholds=1)
+        .col_vals_in_set(columns="z", set=[8])
+        .col_vals_in_set(columns="z", set=[8])
+        .col_exists(columns="x")
+        .col_exists(columns="x")
+        .interrogate(**interrogate_kwargs)
+    )
+
+    sha1 = [step.sha1 for step in validation.validation_info]
+
+    assert sha1[0] == sha1[1] and sha1[3] == sha1[4] and sha1[5] == sha1[6] and sha1[7] == sha1[8]
+    assert len(set(sha1)) == 5
+
+    # Each step gets the same results as it would on its own, with its own threshold levels
+    for step in validation.validation_info:
+
+        validation_single = Validate(tbl, thresholds=step.thresholds)
+        validation_single.validation_info = [copy.copy(step)]
+        validation_single.interrogate(**interrogate_kwargs)
+
+        step_single = validation_single.validation_info[0]
+
+        for attr in ["n", "n_passed", "n_failed", "all_passed", "warn", "stop", "notify"]:
+            assert getattr(step, attr) == getattr(step_single, attr)
+
+    assert validation.warn(i=[1, 2, 4, 5]) == {1: False, 2: True, 4: False, 5: True}
+
+    extracts = validation.get_data_extracts()
+
+    assert nw.from_native(extracts[1]).rows() == nw.from_native(extracts[2]).rows()
+
+
+def test_step_fingerprint():
+
+    # Functions are only the same as themselves (the values they capture can't all be compared)
+    def head_2(df):
+        return df.head(2)
+
+    def make_pre(n):
+        return lambda df: df.head(n)
+
+    steps = [
+        _ValidationInfo(assertion_type="col_vals_gt", column="x", values=1, pre=pre)
+        for pre in [head_2, head_2, lambda df: df.head(2), make_pre(2), make_pre(2)]
+    ]
+
+    sha1 = [_get_step_fingerprint(validation=step) for step in steps]
+
+    assert sha1[0] == sha1[1] != sha1[2]
+    assert sha1[3] != sha1[4]
+
+    # Values that can't be fingerprinted give no fingerprint
+    assert (
+        _get_step_fingerprint(
+            validation=_ValidationInfo(
+                assertion_type="col_vals_in_set", column="x", values=pl.Series([1, 2])
+            )
+        )
+        is None
+    )
+
+    # Polars expressions are compared by their full text
+    sha1_expr = [
+        _get_step_fingerprint(
+            validation=_ValidationInfo(assertion_type="col_vals_expr", values=expr)
+        )
+        for expr in [pl.col("x") > 1, pl.col("x") > 1, pl.col("x") > 2]
+    ]
+
+    assert sha1_expr[0] == sha1_expr[1] != sha1_expr[2]
+
+    # A column reference isn't the same as a string value
+    assert _get_step_fingerprint(
+        validation=_ValidationInfo(assertion_type="col_vals_eq", column="x", values=col("y"))
+    ) != _get_step_fingerprint(
+        validation=_ValidationInfo(assertion_type="col_vals_eq", column="x", values="y")
+    )
+
+
+def test_interrogate_duplicate_steps_same_repr():
+
+    tbl = pl.DataFrame({"k": range(100), "x": range(100)})
+
+    # The lookup tables have the same (truncated) `repr()` but different values in the middle
+    lookup_1 = pl.DataFrame({"k": range(100), "y": [1] * 100})
+    lookup_2 = pl.DataFrame({"k": range(100), "y": [1] * 50 + [0] + [1] * 49})
+
+    assert repr(lookup_1) == repr(lookup_2)
+
+    validation = Validate(tbl)
+
+    for lookup in [lookup_1, lookup_2]:
+        validation = validation.col_vals_gt(
+            columns="y", value=0, pre=lambda df, lookup=lookup: df.join(lookup, on="k")
+        )
+
+    validation = validation.interrogate()
+
+    assert validation.n_failed() == {1: 0, 2: 1}
+    assert validation.validation_info[0].sha1 != validation.validation_info[1].sha1
+
+
+def test_interrogate_polars_lazyframe(tbl_missing_pl):
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl, thresholds=(1, 2, 3))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_ne(columns="z", value=8)
+            .col_vals_in_set(columns="z", set=[8])
+            .col_vals_gt(columns="x", value=1, pre=lambda df: df.head(2))
+            .col_vals_expr(expr=pl.col("y") > 5)
+            .rows_distinct(columns_subset=["z"])
+            .col_exists(columns="x")
+            .row_count_match(count=4)
+            .col_count_match(count=3)
+        )
+
+    validation_eager = validation_plan(tbl_missing_pl).interrogate()
+    validation_lazy = validation_plan(tbl_missing_pl.lazy()).interrogate()
+
+    for step_eager, step_lazy in zip(
+        validation_eager.validation_info, validation_lazy.validation_info
+    ):
+        for attr in ["n", "n_passed", "n_failed", "all_passed", "warn", "stop", "notify"]:
+            assert getattr(step_eager, attr) == getattr(step_lazy, attr)
+
+    extracts_eager = validation_eager.get_data_extracts()
+    extracts_lazy = validation_lazy.get_data_extracts()
+
+    for i in extracts_eager:
+        if extracts_eager[i] is None:
+            assert extracts_lazy[i] is None
+        else:
+            assert isinstance(extracts_lazy[i], pl.DataFrame)
+            assert extracts_eager[i].equals(extracts_lazy[i])
+
+    # The sundered data of a lazy table is also lazy
+    sundered_lazy = validation_lazy.get_sundered_data(type="fail")
+
+    assert isinstance(sundered_lazy, pl.LazyFrame)
+    assert sundered_lazy.collect().equals(validation_eager.get_sundered_data(type="fail"))
+
+    assert isinstance(validation_lazy.get_tabular_report(), GT.GT)
+
+
+def test_interrogate_polars_lazyframe_no_extracts(tbl_missing_pl):
+
+    validation = (
+        Validate(tbl_missing_pl.lazy())
+        .col_vals_gt(columns="x", value=1)
+        .col_vals_lt(columns="y", value=7)
+        .interrogate(collect_extracts=False)
+    )
+
+    assert validation.n_passed() == {1: 2, 2: 2}
+
+    # Without extracts, the checked tables are left as lazy queries
+    assert all(
+        isinstance(validation_info.tbl_checked, pl.LazyFrame)
+        for validation_info in validation.validation_info
+    )
+    assert validation.get_data_extracts() == {1: None, 2: None}
+
+
+def test_interrogate_polars_scan_parquet():
+
+    file_path = pathlib.Path.cwd() / "tests" / "tbl_files" / "tbl_xyz_missing.parquet"
+
+    validation = (
+        Validate(pl.scan_parquet(file_path))
+        .col_vals_gt(columns="x", value=1)
+        .col_vals_not_null(columns="z")
+        .rows_distinct()
+        .row_count_match(count=4)
+        .interrogate()
+    )
+
+    assert validation.n() == {1: 4, 2: 4, 3: 4, 4: 1}
+    assert validation.n_passed() == {1: 2, 2: 3, 3: 4, 4: 1}
+    assert get_row_count(pl.scan_parquet(file_path)) == 4
+    assert get_column_count(pl.scan_parquet(file_path)) == 3
+
+
+def test_interrogate_polars_scan_parquet_row_groups(tmp_path):
+
+    # Write a file with several row groups, so that the rows of the extracts are collected from
+    # several chunks
+    file_path = tmp_path / "small_table.parquet"
+    load_dataset(dataset="small_table", tbl_type="polars").write_parquet(
+        file_path, row_group_size=3
+    )
+
+    validation = (
+        Validate(pl.scan_parquet(file_path))
+        .col_vals_not_null(columns="c")
+        .col_vals_gt(columns="d", value=1000)
+        .interrogate(use_column_stats=False)
+    )
+
+    assert validation.n_failed() == {1: 2, 2: 6}
+
+    # Every column of the extracts is held in a single chunk
+    for i in [1, 2]:
+        extract = validation.get_data_extracts(i=i, frame=True)
+        assert all(extract[col].n_chunks() == 1 for col in extract.columns)
+
+    validation.get_tabular_report()
+
+
+def test_interrogate_file_path(tbl_missing_pl, tmp_path):
+
+    tbl_missing_pl.write_parquet(tmp_path / "tbl_1.parquet")
+    tbl_missing_pl.write_parquet(tmp_path / "tbl_2.parquet")
+    tbl_missing_pl.write_ipc(tmp_path / "tbl.arrow")
+    tbl_missing_pl.write_csv(tmp_path / "tbl.csv")
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl)
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_not_null(columns="z")
+            .rows_distinct()
+            .interrogate()
+        )
+
+    validation_polars = validation_plan(tbl_missing_pl)
+
+    for path in [
+        tmp_path / "tbl_1.parquet",
+        str(tmp_path / "tbl.arrow"),
+        str(tmp_path / "tbl.csv"),
+    ]:
+
+        validation = validation_plan(path)
+
+        # The files are scanned lazily
+        assert isinstance(validation.data, pl.LazyFrame)
+        assert validation.n_passed() == validation_polars.n_passed()
+        assert validation.get_data_extracts(i=1, frame=True).equals(
+            validation_polars.get_data_extracts(i=1, frame=True)
+        )
+
+        assert get_row_count(path) == 4
+        assert get_column_count(path) == 3
+        assert isinstance(preview(path), GT.GT)
+        assert isinstance(missing_vals_tbl(path), GT.GT)
+
+    # A glob pattern combines the matching files into one table
+    validation = validation_plan(str(tmp_path / "tbl_*.parquet"))
+
+    assert validation.n(i=1, scalar=True) == 8
+    assert validation.n_passed(i=1, scalar=True) == 4
+    assert get_row_count(str(tmp_path / "tbl_*.parquet")) == 8
+
+    # A path that doesn't match any files is an error
+    with pytest.raises(FileNotFoundError):
+        Validate(str(tmp_path / "missing_*.parquet"))
+
+
+def test_interrogate_file_path_projection(tmp_path):
+
+    pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6], "z": [7, 8, 9]}).write_parquet(
+        tmp_path / "tbl.parquet"
+    )
+
+    collect_all = pl.collect_all
+    query_plans = []
+
+    def collect_all_spy(queries, *args, **kwargs):
+        query_plans.extend(query.explain() for query in queries)
+        return collect_all(queries, *args, **kwargs)
+
+    with patch("polars.collect_all", collect_all_spy):
+        validation = (
+            Validate(str(tmp_path / "tbl.parquet"))
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_lt(columns="x", value=3)
+            .interrogate(collect_extracts=False)
+        )
+
+    assert validation.n_passed() == {1: 2, 2: 2}
+
+    # Only the column used by the steps is read from the file
+    assert len(query_plans) == 1
+    assert "PROJECT 1/3 COLUMNS" in query_plans[0]
+
+
+@pytest.mark.parametrize("source", ["path", "ibis"])
+def test_interrogate_parquet_footer_stats(tmp_path, source):
+
+    import pyarrow.parquet as pq
+
+    # In the last of the ten row groups, `a` has negative values and `b` has a missing value
+    tbl = pl.DataFrame(
+        {
+            "a": [i if i <= 90 else -i for i in range(1, 101)],
+            "b": [None if i == 95 else i for i in range(100)],
+            "c": [str(i) for i in range(100)],
+        }
+    )
+
+    pq.write_table(tbl.to_arrow(), tmp_path / "tbl.parquet", row_group_size=10)
+
+    if source == "path":
+        data = str(tmp_path / "tbl.parquet")
+    else:
+        data = ibis.read_parquet(tmp_path / "tbl.parquet")
+
+    def validation_plan(data, **interrogate_kwargs):
+        return (
+            Validate(data)
+            .col_vals_gt(columns="a", value=0)
+            .col_vals_not_null(columns="b")
+            .col_vals_outside(columns="a", left=0, right=0.5)
+            .col_vals_between(columns="b", left=0, right=99, na_pass=True)
+            .row_count_match(count=100)
+            .interrogate(**interrogate_kwargs)
+        )
+
+    read_row_group = pq.ParquetFile.read_row_group
+    row_groups_read = []
+
+    def read_row_group_spy(self, i, *args, **kwargs):
+        row_groups_read.append(i)
+        return read_row_group(self, i, *args, **kwargs)
+
+    with patch.object(pq.ParquetFile, "read_row_group", read_row_group_spy):
+        validation = validation_plan(data)
+
+    validation_reference = validation_plan(tbl)
+
+    assert (
+        validation.n_failed()
+        == validation_reference.n_failed()
+        == {
+            1: 10,
+            2: 1,
+            3: 0,
+            4: 0,
+            5: 0,
+        }
+    )
+
+    for i in range(1, 5):
+        assert_frame_equal(
+            pl.DataFrame(validation.get_data_extracts(i=i, frame=True)),
+            validation_reference.get_data_extracts(i=i, frame=True),
+            check_dtypes=False,
+        )
+
+    # For a file path, the row count comes from the footer and only the last row group is read
+    # for the first two steps (the row groups of the third step are each either all below or all
+    # above the range); the footers aren't used for Ibis tables
+    if source == "path":
+        assert validation._tbl_context.get_parquet_metadata().get_row_count() == 100
+        assert sorted(set(row_groups_read)) == [9]
+    else:
+        assert validation._tbl_context.get_parquet_metadata() is None
+        assert row_groups_read == []
+
+    validation.get_tabular_report()
+    validation.get_step_report(i=1)
+
+    # Without the use of statistics, the whole table is evaluated
+    row_groups_read.clear()
+
+    with patch.object(pq.ParquetFile, "read_row_group", read_row_group_spy):
+        validation = validation_plan(data, use_column_stats=False)
+
+    assert validation.n_failed() == validation_reference.n_failed()
+    assert row_groups_read == []
+
+
+def test_interrogate_pyarrow_data(tbl_missing_pl, tmp_path):
+
+    pa = pytest.importorskip("pyarrow")
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    def validation_plan(tbl):
+        return (
+            Validate(tbl)
+            .col_vals_gt(columns="x", value=1)
+            .col_vals_le(columns="x", value=col("y"), na_pass=True)
+            .col_vals_in_set(columns="z", set=[8])
+            .rows_distinct(columns_subset=["z"])
+            .col_schema_match(schema=Schema(tbl=tbl_missing_pl))
+            .row_count_match(count=4)
+            .interrogate()
+        )
+
+    validation_polars = validation_plan(tbl_missing_pl)
+
+    tbl_arrow = tbl_missing_pl.to_arrow()
+    pq.write_table(tbl_arrow, tmp_path / "tbl.parquet")
+
+    arrow_data = {
+        "table": lambda: tbl_arrow,
+        "record_batch": lambda: tbl_arrow.combine_chunks().to_batches()[0],
+        "record_batch_reader": lambda: pa.RecordBatchReader.from_batches(
+            tbl_arrow.schema, tbl_arrow.to_batches()
+        ),
+        "dataset": lambda: ds.dataset(tmp_path / "tbl.parquet"),
+    }
+
+    for name, get_data in arrow_data.items():
+
+        validation = validation_plan(get_data())
+
+        # Arrow data is handed off to Polars (a dataset is scanned lazily)
+        if name == "dataset":
+            assert isinstance(validation.data, pl.LazyFrame)
+        else:
+            assert isinstance(validation.data, pl.DataFrame)
+
+        assert validation.n() == validation_polars.n()
+        assert validation.n_passed() == validation_polars.n_passed()
+
+        assert get_row_count(get_data()) == 4
+        assert get_column_count(get_data()) == 3
+        assert Schema(tbl=get_data()).columns == Schema(tbl=tbl_missing_pl).columns
+
+        assert isinstance(preview(get_data()), GT.GT)
+        assert isinstance(missing_vals_tbl(get_data()), GT.GT)
+
+    # Dictionary-encoded columns become categorical columns
+    tbl_dictionary = pa.table({"a": pa.array(["x", "y", "x", None]).dictionary_encode()})
+
+    validation = Validate(tbl_dictionary).col_vals_in_set(columns="a", set=["x"]).interrogate()
+
+    assert validation.data.schema["a"] == pl.Categorical
+    assert validation.n_passed(i=1, scalar=True) == 2
+
+    # Numeric columns without nulls share their Arrow buffers with the Polars DataFrame
+    tbl_numeric = pa.table({"a": pa.array(range(10), type=pa.int64())})
+    buffer_address = tbl_numeric.column("a").chunk(0).buffers()[1].address
+
+    validation = Validate(tbl_numeric)
+
+    assert validation.data.to_arrow().column("a").chunk(0).buffers()[1].address == buffer_address
+
+
+@pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
+def test_col_vals_null(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    assert Validate(tbl).col_vals_null(columns="text").interrogate().n_passed(i=1, scalar=True) == 1
+
+
+@pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
+def test_col_vals_not_null(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    assert (
+        Validate(tbl).col_vals_not_null(columns="text").interrogate().n_passed(i=1, scalar=True)
+        == 2
+    )
+
+
+@pytest.mark.parametrize("tbl_fixture", TBL_DATES_TIMES_TEXT_LIST)
+def test_col_exists(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    assert Validate(tbl).col_exists(columns="text").interrogate().n_passed(i=1, scalar=True) == 1
+    assert Validate(tbl).col_exists(columns="invalid").interrogate().n_passed(i=1, scalar=True) == 0
+
+
+@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
+def test_validation_types(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = Validate(tbl).col_vals_gt(columns="x", value=0).interrogate()
+
+    # Check that the `validation` object is a Validate object
+    assert isinstance(validation, Validate)
+
+    # Check that using the `get_tabular_report()` returns a GT object
+    assert isinstance(validation.get_tabular_report(), GT.GT)
+
+
+@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
+def test_interrogate_raise_on_get_first_and_sample(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    with pytest.raises(ValueError):
+        Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(get_first_n=2, sample_n=4)
+    with pytest.raises(ValueError):
+        Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(get_first_n=2, sample_frac=0.5)
+    with pytest.raises(ValueError):
+        Validate(tbl).col_vals_gt(columns="z", value=10).interrogate(sample_n=2, sample_frac=0.5)
+
+
+def test_get_data_extracts(tbl_missing_pd):
+
+    validation = (
+        Validate(tbl_missing_pd)
+        .col_vals_gt(columns="x", value=1)
+        .col_vals_lt(columns="y", value=10)
+        .interrogate()
+    )
+
+    extracts_all = validation.get_data_extracts()
+    extracts_1 = validation.get_data_extracts(i=1)
+    extracts_2 = validation.get_data_extracts(i=2)
+
+    assert isinstance(extracts_all, dict)
+    assert isinstance(extracts_1, dict)
+    assert isinstance(extracts_2, dict)
+    assert len(extracts_all) == 2
+    assert len(extracts_1) == 1
+    assert len(extracts_2) == 1
+
+    extracts_1_df = validation.get_data_extracts(i=1, frame=True)
+    extracts_2_df = validation.get_data_extracts(i=2, frame=True)
+
+    assert isinstance(extracts_1_df, pd.DataFrame)
+    assert isinstance(extracts_2_df, pd.DataFrame)
+
+
+@pytest.mark.parametrize("tbl_fixture", TBL_LIST)
+def test_interrogate_with_active_inactive(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_lt(columns="y", value=10, active=False)
+        .interrogate()
+    )
+
+    assert validation.validation_info[0].active is True
+    assert validation.validation_info[1].active is False
+    assert validation.validation_info[0].proc_duration_s is not None
+    assert validation.validation_info[1].proc_duration_s is not None
+    assert validation.validation_info[0].time_processed is not None
+    assert validation.validation_info[1].time_processed is not None
+    assert validation.validation_info[0].all_passed is True
+    assert validation.validation_info[1].all_passed is None
+    assert validation.validation_info[0].n == 4
+    assert validation.validation_info[1].n is None
+    assert validation.validation_info[0].n_passed == 4
+    assert validation.validation_info[1].n_passed is None
+    assert validation.validation_info[0].n_failed == 0
+    assert validation.validation_info[1].n_failed is None
+    assert validation.validation_info[0].warn is None
+    assert validation.validation_info[1].warn is None
+    assert validation.validation_info[0].stop is None
+    assert validation.validation_info[1].stop is None
+    assert validation.validation_info[0].notify is None
+    assert validation.validation_info[1].notify is None
+    assert validation.validation_info[1].extract is None
+    assert validation.validation_info[1].extract is None
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_get_sundered_data(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    # This validation will:
+    # - pass completely for all rows in the `col_vals_eq()` step
+    # - fail for row 0 in `col_vals_gt()` step
+    # - fail for row 3 in `col_vals_lt()` step
+    # when error rows are considered across all steps, only rows 1 and 2 free of errors;
+    # an 'error row' is a row with a test unit that has failed in any of the row-based steps
+    # and all of the validation steps here are row-based
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate()
+    )
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")  # this is the default
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    assert isinstance(sundered_data_pass, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
+    assert isinstance(sundered_data_fail, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
+
+    # Check properties of the passed data piece
+    assert len(nw.from_native(sundered_data_pass).rows()) == 2
+    assert len(nw.from_native(sundered_data_pass).columns) == 3
+    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+
+    # Check the rows of the passed data piece
+    passed_data_rows = nw.from_native(sundered_data_pass).rows()
+    assert passed_data_rows[0] == (2, 5, 8)
+    assert passed_data_rows[1] == (3, 6, 8)
+
+    # Check properties of the failed data piece
+    assert len(nw.from_native(sundered_data_fail).rows()) == 2
+    assert len(nw.from_native(sundered_data_fail).columns) == 3
+    assert nw.from_native(sundered_data_fail).columns == ["x", "y", "z"]
+
+    # Check the rows of the failed data piece
+    failed_data_rows = nw.from_native(sundered_data_fail).rows()
+    assert failed_data_rows[0] == (1, 4, 8)
+    assert failed_data_rows[1] == (4, 7, 8)
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_get_sundered_data_empty_frame(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    # Remove all rows from the table
+    tbl = tbl.head(0)
+
+    validation = Validate(tbl).col_exists(columns="z").interrogate()
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    # Check properties of the passed data piece
+    assert len(nw.from_native(sundered_data_pass).rows()) == 0
+    assert len(nw.from_native(sundered_data_pass).columns) == 3
+    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+
+    # Check properties of the failed data piece
+    assert len(nw.from_native(sundered_data_fail).rows()) == 0
+    assert len(nw.from_native(sundered_data_fail).columns) == 3
+    assert nw.from_native(sundered_data_fail).columns == ["x", "y", "z"]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_get_sundered_data_no_validation_steps(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = Validate(tbl).interrogate()
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    # Check properties of the passed data piece
+    assert len(nw.from_native(sundered_data_pass).rows()) == 4
+    assert len(nw.from_native(sundered_data_pass).columns) == 3
+    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+
+    # Check properties of the failed data piece
+    assert len(nw.from_native(sundered_data_fail).rows()) == 0
+    assert len(nw.from_native(sundered_data_fail).columns) == 3
+    assert nw.from_native(sundered_data_fail).columns == ["x", "y", "z"]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_pd", "tbl_pl"])
+def test_get_sundered_data_mix_of_step_types(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    # This sundering from this validation will effectively be the same as in the
+    # `test_get_sundered_data()` test; steps 3 and 4 are not included in the sundering process:
+    # - step 3 is not included because it is not row-based (it checks for a column's existence)
+    # - step 4 is not included because it is inactive (if active, it would have failed all rows)
+    # - the remaining steps are row-based the parameters of the steps are the same as in the
+    #   `test_get_sundered_data()` test
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_exists(columns="z")  # <- this step is not row-based so not included when sundering
+        .col_vals_eq(columns="z", value=7, active=False)  # <- this step is inactive so not included
+        .col_vals_lt(columns="x", value=4)
+        .interrogate()
+    )
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    # Check properties of the passed data piece
+    assert isinstance(sundered_data_pass, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
+    assert isinstance(sundered_data_fail, pd.DataFrame if tbl_fixture == "tbl_pd" else pl.DataFrame)
+
+    # Check properties of the passed data piece
+    assert len(nw.from_native(sundered_data_pass).rows()) == 2
+    assert len(nw.from_native(sundered_data_pass).columns) == 3
+    assert nw.from_native(sundered_data_pass).columns == ["x", "y", "z"]
+
+    # Check the rows of the passed data piece
+    passed_data_rows = nw.from_native(sundered_data_pass).rows()
+    assert passed_data_rows[0] == (2, 5, 8)
+    assert passed_data_rows[1] == (3, 6, 8)
 
     # Check properties of the failed data piece
     assert len(nw.from_native(sundered_data_fail).rows()) == 2
@@ -4356,6 +6065,140 @@ def test_get_sundered_data_mix_of_step_types(request, tbl_fixture):
     assert failed_data_rows[1] == (4, 7, 8)
 
 
+@pytest.mark.parametrize("tbl_fixture", ["tbl_parquet", "tbl_duckdb", "tbl_sqlite"])
+def test_get_sundered_data_ibis(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_exists(columns="z")
+        .col_vals_lt(columns="x", value=4)
+        .interrogate()
+    )
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    # The sundering is done with a single filter on the target table (without any joins)
+    sql = str(ibis.to_sql(sundered_data_pass))
+
+    assert sql.count("WHERE") == 1
+    assert "JOIN" not in sql
+
+    assert list(sundered_data_pass.columns) == ["x", "y", "z"]
+    assert sundered_data_pass.order_by("x").to_pandas()["x"].to_list() == [2, 3]
+    assert sundered_data_fail.order_by("x").to_pandas()["x"].to_list() == [1, 4]
+
+
+@pytest.mark.parametrize("tbl_fixture", ["tbl_parquet", "tbl_duckdb", "tbl_sqlite"])
+def test_get_sundered_data_ibis_join(request, tbl_fixture):
+
+    tbl = request.getfixturevalue(tbl_fixture)
+
+    validation = (
+        Validate(tbl)
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate()
+    )
+
+    # If the results can't be inlined as a predicate on the target table (e.g., since the
+    # structure of Ibis expressions changed), the checked tables are joined to the target table
+    # by row numbers that are ordered by all columns (with the same results)
+    with patch("pointblank.validate._get_ibis_base_predicate", return_value=None):
+        sundered_data_pass = validation.get_sundered_data(type="pass")
+        sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    sql = str(ibis.to_sql(sundered_data_pass))
+
+    assert "JOIN" in sql
+    assert "ORDER BY" in sql
+
+    assert list(sundered_data_pass.columns) == ["x", "y", "z"]
+    assert sundered_data_pass.order_by("x").to_pandas()["x"].to_list() == [2, 3]
+    assert sundered_data_fail.order_by("x").to_pandas()["x"].to_list() == [1, 4]
+
+    # The results of a step with a `pre=` function can't be matched to the rows in this way
+    validation = (
+        Validate(tbl)
+        .col_vals_gt(columns="x", value=0, pre=lambda t: t.mutate(w=t.x + 1))
+        .interrogate()
+    )
+
+    with patch("pointblank.validate._get_ibis_base_predicate", return_value=None):
+        with pytest.raises(ValueError):
+            validation.get_sundered_data(type="pass")
+
+
+def test_get_sundered_data_lazy_results(tbl_pl):
+
+    validation = (
+        Validate(tbl_pl.lazy())
+        .col_vals_eq(columns="z", value=8)
+        .col_vals_gt(columns="y", value=4)
+        .col_vals_lt(columns="x", value=4)
+        .interrogate(collect_extracts=False)
+    )
+
+    sundered_data_pass = validation.get_sundered_data(type="pass")
+    sundered_data_fail = validation.get_sundered_data(type="fail")
+
+    assert isinstance(sundered_data_pass, pl.LazyFrame)
+    assert sundered_data_pass.collect().rows() == [(2, 5, 8), (3, 6, 8)]
+    assert sundered_data_fail.collect().rows() == [(1, 4, 8), (4, 7, 8)]
+
+
+def test_get_sundered_data_missing_results(tbl_pl):
+
+    tbl = pl.DataFrame({"x": [1, 2, 3, 4], "pb_is_good_": [True, None, False, True]})
+
+    # Rows with a missing result are in neither piece of the data
+    validation = Validate(tbl.drop("pb_is_good_"))
+    validation.validation_info = [
+        _ValidationInfo(
+            i=1,
+            assertion_type="col_vals_gt",
+            active=True,
+            checked_rows=_CheckedRows.from_results_tbl(results_tbl=tbl),
+        )
+    ]
+
+    assert validation.get_sundered_data(type="pass")["x"].to_list() == [1, 4]
+    assert validation.get_sundered_data(type="fail")["x"].to_list() == [3]
+
+    # Steps evaluated on fewer rows have missing results for the remaining rows
+    validation = (
+        Validate(tbl_pl)
+        .col_vals_gt(columns="x", value=0)
+        .col_vals_gt(columns="x", value=1, pre=lambda df: df.head(2))
+        .interrogate()
+    )
+
+    assert validation.get_sundered_data(type="pass")["x"].to_list() == [2]
+    assert validation.get_sundered_data(type="fail")["x"].to_list() == [1]
+
+    # A `pre=` function that adds rows prevents sundering
+    validation = (
+        Validate(tbl_pl)
+        .col_vals_gt(columns="x", value=1, pre=lambda df: pl.concat([df, df]))
+        .interrogate()
+    )
+
+    with pytest.raises(ValueError):
+        validation.get_sundered_data()
+
+    validation = (
+        Validate(tbl_pl).col_vals_gt(columns="x", value=1).interrogate(collect_tbl_checked=False)
+    )
+
+    with pytest.raises(ValueError):
+        validation.get_sundered_data()
+
+
 def test_comprehensive_validation_report_html_snap(snapshot):
 
     validation = (
@@ -4896,6 +6739,19 @@ def test_get_step_report_no_fail(tbl_type):
         assert isinstance(validation.get_step_report(i=i), GT.GT)
 
 
+def test_get_step_report_lazyframe():
+
+    small_table = load_dataset(dataset="small_table", tbl_type="polars").lazy()
+
+    validation = Validate(small_table).col_vals_gt(columns="d", value=1000).interrogate()
+
+    # The schema of the LazyFrame isn't resolved again to find the position of the column
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", pl.exceptions.PerformanceWarning)
+
+        assert isinstance(validation.get_step_report(i=1), GT.GT)
+
+
 def test_get_step_report_failing_inputs():
 
     small_table = load_dataset(dataset="small_table", tbl_type="pandas")